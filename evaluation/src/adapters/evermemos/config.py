@@ -34,6 +34,9 @@ class ExperimentConfig:
 
     # Retrieval configuration
     use_hybrid_search: bool = True  # Use hybrid retrieval (Embedding + BM25 + RRF)
+    # Embedding index format written by stage2: 'npy' (mmap float32 matrix + JSON sidecar,
+    # vectorized MaxSim) or 'pkl' (legacy pickled lists); stage3 reads either
+    emb_index_format: str = "npy"  # 'npy' | 'pkl'
     emb_recall_top_n: int = 40
     reranker_top_n: int = 20
 
@@ -3,6 +3,7 @@ import os
 import sys
 import pickle
 from pathlib import Path
+from typing import Optional
 
 import nltk
 from nltk.corpus import stopwords
@@ -15,6 +16,8 @@ import asyncio
 
 
 from evaluation.src.adapters.evermemos.config import ExperimentConfig
+from evaluation.src.adapters.evermemos.tools.emb_index import save_emb_index
+from evaluation.src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from agentic_layer import vectorize_service
 
 
@@ -168,24 +171,38 @@ def build_bm25_index(
             pickle.dump(index_data, f)
 
 
-async def build_emb_index(config: ExperimentConfig, data_dir: Path, emb_save_dir: Path):
+async def build_emb_index(
+    config: ExperimentConfig,
+    data_dir: Path,
+    emb_save_dir: Path,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+):
     """
     Build Embedding index (stable version).
     
     Performance optimization strategy:
-    1. Controlled concurrency: strictly follow API Semaphore(5) limit
+    1. Adaptive concurrency: AIMD limiter starting at MAX_CONCURRENT_BATCHES,
+       grows while batches stay fast, halves on 429/5xx/timeouts or latency spikes
     2. Conservative batch size: 256 texts/batch (avoid timeouts)
-    3. Serial batch submission: grouped submission to avoid queue buildup
+    3. All batches submitted at once, the limiter keeps the queue bounded
     4. Progress monitoring: real-time progress and speed display
     
     Optimization effects:
     - Stability first, avoid timeouts and API overload
-    - API concurrency: 5 (controlled by vectorize_service.Semaphore)
+    - API concurrency: also bounded by vectorize_service (VECTORIZE_MAX_CONCURRENT)
     - Batch size: 256 (balance stability and efficiency)
+    
+    Args:
+        limiter: Shared limiter (e.g. restored from checkpoint), created if not given
     """
     # Conservative batch size (avoid timeouts)
     BATCH_SIZE = 256  # Use larger batches (single API call processes more, reduce request count)
-    MAX_CONCURRENT_BATCHES = 5  # Strictly control concurrency (match Semaphore(5))
+    MAX_CONCURRENT_BATCHES = 5  # Starting concurrency (matches vectorize_service default)
+    
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=MAX_CONCURRENT_BATCHES, max_limit=MAX_CONCURRENT_BATCHES * 8, name="embedding"
+        )
     
     import time  # For performance statistics
     
@@ -244,18 +261,27 @@ async def build_emb_index(config: ExperimentConfig, data_dir: Path, emb_save_dir
         print(f"Total texts to embed: {total_texts}")
         print(f"Batch size: {BATCH_SIZE}")
         print(f"Total batches: {total_batches}")
-        print(f"Max concurrent batches: {MAX_CONCURRENT_BATCHES}")
+        print(f"Concurrent batches: {limiter.limit} (adaptive, max {limiter.max_limit})")
         print(f"\nStarting parallel embedding generation...")
         
         # Stable batch processing (avoid timeouts)
         start_time = time.time()
         
+        completed = 0
+        
         async def process_batch_with_retry(batch_idx: int, batch_texts: list, max_retries: int = 3) -> tuple[int, list]:
             """Process single batch (async + retry)."""
+            nonlocal completed
             for attempt in range(max_retries):
                 try:
-                    # Call API to get embeddings (concurrency controlled by Semaphore(5))
-                    batch_embeddings = await vectorize_service.get_text_embeddings(batch_texts)
+                    # Call API to get embeddings (concurrency controlled by the limiter)
+                    batch_embeddings = await limiter.run(
+                        lambda: vectorize_service.get_text_embeddings(batch_texts)
+                    )
+                    completed += 1
+                    if completed % 10 == 0 or completed == total_batches:
+                        progress = (completed / total_batches) * 100
+                        print(f"  Progress: {completed}/{total_batches} batches ({progress:.1f}%), concurrency {limiter.limit}")
                     return (batch_idx, batch_embeddings)
                 except Exception as e:
                     if attempt < max_retries - 1:
@@ -266,36 +292,14 @@ async def build_emb_index(config: ExperimentConfig, data_dir: Path, emb_save_dir
                         print(f"  ❌ Batch {batch_idx + 1}/{total_batches} failed after {max_retries} attempts: {e}")
                         return (batch_idx, [])
         
-        #Grouped serial submission (avoid queue buildup causing timeouts)
-        print(f"Processing {total_batches} batches in groups of {MAX_CONCURRENT_BATCHES}...")
-        
-        batch_results = []
-        completed = 0
-        
-        # Grouped submission, max MAX_CONCURRENT_BATCHES concurrent per group
-        for group_start in range(0, total_texts, BATCH_SIZE * MAX_CONCURRENT_BATCHES):
-            # Calculate batch range for current group
-            group_end = min(group_start + BATCH_SIZE * MAX_CONCURRENT_BATCHES, total_texts)
-            group_tasks = []
-            
-            for j in range(group_start, group_end, BATCH_SIZE):
-                batch_idx = j // BATCH_SIZE
-                batch_texts = texts_to_embed[j : j + BATCH_SIZE]
-                task = process_batch_with_retry(batch_idx, batch_texts)
-                group_tasks.append(task)
-            
-            # Process current group concurrently (max MAX_CONCURRENT_BATCHES)
-            print(f"  Group {group_start//BATCH_SIZE//MAX_CONCURRENT_BATCHES + 1}: Processing {len(group_tasks)} batches concurrently...")
-            group_results = await asyncio.gather(*group_tasks, return_exceptions=False)
-            batch_results.extend(group_results)
-            
-            completed += len(group_tasks)
-            progress = (completed / total_batches) * 100
-            print(f"  Progress: {completed}/{total_batches} batches ({progress:.1f}%)")
-            
-            # Inter-group delay (give API server breathing room)
-            if group_end < total_texts:
-                await asyncio.sleep(1.0)  # 1s inter-group delay
+        # Submit all batches, the limiter bounds how many run concurrently
+        print(f"Processing {total_batches} batches...")
+        batch_results = await asyncio.gather(
+            *[
+                process_batch_with_retry(j // BATCH_SIZE, texts_to_embed[j : j + BATCH_SIZE])
+                for j in range(0, total_texts, BATCH_SIZE)
+            ]
+        )
         
         # Reorganize results by batch order
         all_embeddings = []
@@ -310,6 +314,7 @@ async def build_emb_index(config: ExperimentConfig, data_dir: Path, emb_save_dir
         print(f"   - Time elapsed: {elapsed_time:.2f}s")
         print(f"   - Speed: {speed:.1f} texts/sec")
         print(f"   - Average batch time: {elapsed_time/total_batches:.2f}s")
+        print(f"   - {limiter.summary()}")
         
         # Verify result completeness
         if len(all_embeddings) != total_texts:
@@ -348,6 +353,14 @@ async def build_emb_index(config: ExperimentConfig, data_dir: Path, emb_save_dir
         #     },
         #     ...
         # ]
+        # With emb_index_format == "npy" (default) the same data is stored instead as
+        # embedding_index_conv_{i}.npy (normalized float32 matrix, loaded with mmap) and
+        # embedding_index_conv_{i}.meta.json (per-document row offsets and documents)
+        if getattr(config, "emb_index_format", "npy") == "npy":
+            output_path = save_emb_index(doc_embeddings, emb_save_dir, i)
+            print(f"Saving embeddings to: {output_path}")
+            continue
+
         output_path = emb_save_dir / f"embedding_index_conv_{i}.pkl"
         emb_save_dir.mkdir(parents=True, exist_ok=True)
         print(f"Saving embeddings to: {output_path}")
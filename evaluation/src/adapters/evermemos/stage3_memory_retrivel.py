@@ -24,6 +24,13 @@ from agentic_layer import vectorize_service
 from agentic_layer import rerank_service
 
 from evaluation.src.adapters.evermemos.tools import agentic_utils
+from evaluation.src.adapters.evermemos.tools.emb_index import (
+    NpyEmbeddingIndex,
+    describe_emb_index_paths,
+    emb_index_exists,
+    load_emb_index,
+)
+from evaluation.src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 
 from memory_layer.llm.llm_provider import LLMProvider
 
@@ -450,10 +457,12 @@ async def search_with_emb_index(
     - Take maximum similarity among these fields
     
     Optimization: support pre-computed query embedding to avoid repeated API calls.
+    For NpyEmbeddingIndex, scores of all documents are computed with one matrix
+    product and a segmented max instead of a per-document loop.
     
     Args:
         query: Query text
-        emb_index: Pre-built embedding index
+        emb_index: Pre-built embedding index (NpyEmbeddingIndex or legacy pickle list)
         top_n: Number of results to return
         query_embedding: Optional pre-computed query embedding (avoid redundant computation)
     
@@ -472,6 +481,9 @@ async def search_with_emb_index(
     if query_norm == 0:
         return []
     
+    if isinstance(emb_index, NpyEmbeddingIndex):
+        return emb_index.search(query_vec, top_n)
+    
     # Store MaxSim score for each document
     doc_scores = []
     
@@ -1177,6 +1189,14 @@ async def main():
     else:
         print(f"\n🆕 No checkpoint found, starting from scratch")
 
+    # Per-question retrieval concurrency: adaptive, shared across conversations, bounded by
+    # the former fixed sizes (Agentic retrieval calls the LLM, so a lower bound)
+    max_concurrent = 20 if config.use_agentic_retrieval else 128
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=max_concurrent // 2, max_limit=max_concurrent, name="retrieval"
+    )
+    print(f"Retrieval concurrency: {limiter.limit} (adaptive, max {limiter.max_limit})")
+
     # Iterate through the dataset, assuming the index of the dataset list
     # corresponds to the conversation index number.
     for i, conversation_data in enumerate(dataset):
@@ -1199,14 +1219,12 @@ async def main():
         # If using hybrid search, need to load both Embedding and BM25 indices
         if config.use_hybrid_search:
             # Load Embedding index
-            emb_index_path = emb_index_dir / f"embedding_index_conv_{i}.pkl"
-            if not emb_index_path.exists():
+            if not emb_index_exists(emb_index_dir, i):
                 print(
-                    f"Error: Embedding index not found at {emb_index_path}. Skipping conversation."
+                    f"Error: Embedding index not found at {describe_emb_index_paths(emb_index_dir, i)}. Skipping conversation."
                 )
                 continue
-            with open(emb_index_path, "rb") as f:
-                emb_index = pickle.load(f)
+            emb_index = load_emb_index(emb_index_dir, i)
             
             # Load BM25 index
             bm25_index_path = bm25_index_dir / f"bm25_index_conv_{i}.pkl"
@@ -1224,14 +1242,12 @@ async def main():
         
         elif config.use_emb:
             # Load Embedding index only
-            emb_index_path = emb_index_dir / f"embedding_index_conv_{i}.pkl"
-            if not emb_index_path.exists():
+            if not emb_index_exists(emb_index_dir, i):
                 print(
-                    f"Error: Index file not found at {emb_index_path}. Skipping conversation."
+                    f"Error: Index file not found at {describe_emb_index_paths(emb_index_dir, i)}. Skipping conversation."
                 )
                 continue
-            with open(emb_index_path, "rb") as f:
-                emb_index = pickle.load(f)
+            emb_index = load_emb_index(emb_index_dir, i)
         else:
             # Load BM25 index only
             bm25_index_path = bm25_index_dir / f"bm25_index_conv_{i}.pkl"
@@ -1245,13 +1261,9 @@ async def main():
             bm25 = index_data["bm25"]
             docs = index_data["docs"]
 
-        # Parallelize per-question retrieval with bounded concurrency
-        # Increase concurrency: also use higher concurrency for Agentic retrieval (10 -> 20)
-        max_concurrent = 20 if config.use_agentic_retrieval else 128
-        sem = asyncio.Semaphore(max_concurrent)
-        
+        # Parallelize per-question retrieval with adaptive concurrency
         if config.use_agentic_retrieval:
-            print(f"  🚀 Agentic retrieval enabled with HIGH CONCURRENCY: {max_concurrent} concurrent requests")
+            print(f"  🚀 Agentic retrieval enabled with ADAPTIVE CONCURRENCY: {limiter.limit} concurrent requests (max {limiter.max_limit})")
 
         async def process_single_qa(qa_pair):
             """Process single QA pair (supports multiple retrieval modes)."""
@@ -1266,7 +1278,7 @@ async def main():
             qa_start_time = time.time()
             
             try:
-                async with sem:
+                async with limiter.slot():
                     retrieval_metadata = {}
                     
                     # Retrieval mode selection
@@ -1427,6 +1439,7 @@ async def main():
 
     print(f"✅ Batch search and retrieval complete!")
     print(f"   Total conversations: {len(all_search_results)}")
+    print(limiter.summary())
     
     # Checkpoint resume: delete checkpoint file after completion
     if checkpoint_path.exists():
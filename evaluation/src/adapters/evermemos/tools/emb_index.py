@@ -0,0 +1,186 @@
+"""Memory-mapped embedding index for evaluation.
+
+Stores the embeddings of one conversation as a single float32 ``.npy`` matrix of
+L2-normalized vectors plus a JSON sidecar with the segment offsets of each document
+and the documents themselves. The matrix is opened with ``np.load(mmap_mode='r')``,
+so loading is near-instant, and MaxSim over all documents is one matrix-vector
+product followed by a segmented max (``np.maximum.reduceat``).
+
+Layout of a document's vectors (same choice as the legacy pickle index):
+- atomic_facts embeddings if present and non-empty (MaxSim over facts)
+- otherwise subject/summary/episode embeddings (max over fields)
+Zero vectors are dropped, documents without any vector are not indexed.
+"""
+
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+INDEX_VERSION = 1
+LEGACY_FIELDS = ["subject", "summary", "episode"]
+
+
+def emb_index_paths(save_dir: Path, conv_idx: Union[int, str]) -> Dict[str, Path]:
+    """File paths of the index of one conversation (npy matrix, JSON sidecar, legacy pickle)."""
+    stem = f"embedding_index_conv_{conv_idx}"
+    return {
+        "npy": save_dir / f"{stem}.npy",
+        "meta": save_dir / f"{stem}.meta.json",
+        "pkl": save_dir / f"{stem}.pkl",
+    }
+
+
+def emb_index_exists(save_dir: Path, conv_idx: Union[int, str]) -> bool:
+    """Whether an index of either format exists for the conversation."""
+    paths = emb_index_paths(save_dir, conv_idx)
+    return (paths["npy"].exists() and paths["meta"].exists()) or paths["pkl"].exists()
+
+
+def describe_emb_index_paths(save_dir: Path, conv_idx: Union[int, str]) -> str:
+    """The files load_emb_index() looks for, for error messages."""
+    paths = emb_index_paths(save_dir, conv_idx)
+    return f"{paths['npy']} + {paths['meta'].name} (or legacy {paths['pkl'].name})"
+
+
+def _doc_vectors(embeddings: Dict[str, Any]) -> List[Any]:
+    """Vectors representing one document, following the MaxSim field priority."""
+    if embeddings.get("atomic_facts"):
+        return list(embeddings["atomic_facts"])
+    return [embeddings[field] for field in LEGACY_FIELDS if field in embeddings]
+
+
+def build_emb_matrix(
+    doc_embeddings: List[Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """
+    Flatten per-document embeddings into one normalized matrix.
+
+    Args:
+        doc_embeddings: Legacy index entries [{"doc": {...}, "embeddings": {...}}, ...]
+
+    Returns:
+        (matrix, offsets, doc_ids): float32 matrix (n_vectors, dim) with unit rows,
+        int64 offsets (n_indexed_docs + 1) delimiting each document's rows, and the
+        position of each indexed document in doc_embeddings
+    """
+    rows = []
+    offsets = [0]
+    doc_ids = []
+    for doc_idx, item in enumerate(doc_embeddings):
+        vectors = _doc_vectors(item.get("embeddings") or {})
+        if not vectors:
+            continue
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        norms = np.linalg.norm(matrix, axis=1)
+        valid = norms > 0
+        if not np.any(valid):
+            continue
+        rows.append(matrix[valid] / norms[valid, None])
+        offsets.append(offsets[-1] + int(valid.sum()))
+        doc_ids.append(doc_idx)
+
+    if rows:
+        matrix = np.ascontiguousarray(np.vstack(rows), dtype=np.float32)
+    else:
+        matrix = np.zeros((0, 0), dtype=np.float32)
+    return matrix, np.asarray(offsets, dtype=np.int64), doc_ids
+
+
+def save_emb_index(
+    doc_embeddings: List[Dict[str, Any]], save_dir: Path, conv_idx: Union[int, str]
+) -> Path:
+    """
+    Save a conversation's embeddings as npy matrix + JSON sidecar.
+
+    The matrix is written before the sidecar, so an existing sidecar always refers
+    to a complete matrix.
+
+    Returns:
+        Path of the .npy matrix
+    """
+    paths = emb_index_paths(save_dir, conv_idx)
+    save_dir.mkdir(parents=True, exist_ok=True)
+    matrix, offsets, doc_ids = build_emb_matrix(doc_embeddings)
+
+    np.save(paths["npy"], matrix)
+    meta = {
+        "version": INDEX_VERSION,
+        "dim": int(matrix.shape[1]) if matrix.size else 0,
+        "offsets": offsets.tolist(),
+        "doc_ids": doc_ids,
+        "docs": [doc_embeddings[doc_idx]["doc"] for doc_idx in doc_ids],
+    }
+    with open(paths["meta"], "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return paths["npy"]
+
+
+def load_emb_index(
+    save_dir: Path, conv_idx: Union[int, str]
+) -> Optional[Union["NpyEmbeddingIndex", List[Dict[str, Any]]]]:
+    """
+    Load a conversation's embedding index, preferring the npy format.
+
+    Returns:
+        NpyEmbeddingIndex, legacy pickle entries, or None if no index exists
+    """
+    paths = emb_index_paths(save_dir, conv_idx)
+    if paths["npy"].exists() and paths["meta"].exists():
+        return NpyEmbeddingIndex.load(paths["npy"], paths["meta"])
+    if paths["pkl"].exists():
+        with open(paths["pkl"], "rb") as f:
+            return pickle.load(f)
+    return None
+
+
+class NpyEmbeddingIndex:
+    """Embedding index backed by a memory-mapped normalized float32 matrix."""
+
+    def __init__(self, matrix: np.ndarray, offsets: np.ndarray, docs: List[dict]):
+        """Initialize index.
+
+        Args:
+            matrix: Normalized vectors (n_vectors, dim), may be a read-only memmap
+            offsets: Row offsets of each document (len(docs) + 1)
+            docs: Indexed documents, in matrix order
+        """
+        self.matrix = matrix
+        self.offsets = offsets
+        self.docs = docs
+
+    @classmethod
+    def load(cls, npy_path: Path, meta_path: Path) -> "NpyEmbeddingIndex":
+        """Open the matrix memory-mapped and read the sidecar."""
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        matrix = np.load(npy_path, mmap_mode="r")
+        return cls(matrix, np.asarray(meta["offsets"], dtype=np.int64), meta["docs"])
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def maxsim_scores(self, query_vec: np.ndarray) -> np.ndarray:
+        """Cosine MaxSim score of every document (one matmul + segmented max)."""
+        if not self.docs:
+            return np.zeros(0, dtype=np.float32)
+        query = np.asarray(query_vec, dtype=np.float32).ravel()
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return np.zeros(len(self.docs), dtype=np.float32)
+        sims = self.matrix @ (query / query_norm)
+        return np.maximum.reduceat(sims, self.offsets[:-1])
+
+    def search(self, query_vec: np.ndarray, top_n: int) -> List[Tuple[dict, float]]:
+        """Top-N documents by MaxSim score, sorted descending."""
+        if not self.docs or top_n <= 0 or np.linalg.norm(query_vec) == 0:
+            return []
+        scores = self.maxsim_scores(query_vec)
+        if top_n < len(scores):
+            top = np.argpartition(-scores, top_n - 1)[:top_n]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.docs[i], float(scores[i])) for i in top]
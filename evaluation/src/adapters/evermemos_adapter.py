@@ -24,6 +24,7 @@ from rich.console import Console
 from evaluation.src.adapters.base import BaseAdapter
 from evaluation.src.adapters.registry import register_adapter
 from evaluation.src.core.data_models import Conversation, SearchResult
+from evaluation.src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from common_utils.datetime_utils import to_iso_format
 
 # Import EverMemOS implementation
@@ -33,6 +34,10 @@ from evaluation.src.adapters.evermemos import (
     stage3_memory_retrivel,
     stage4_response,
 )
+from evaluation.src.adapters.evermemos.tools.emb_index import (
+    emb_index_exists,
+    load_emb_index,
+)
 
 # Import Memory Layer components
 from memory_layer.llm.llm_provider import LLMProvider
@@ -123,10 +128,9 @@ class EverMemOSAdapter(BaseAdapter):
         for i in range(num_conv):
             if index_type == "bm25":
                 index_file = index_dir / f"bm25_index_conv_{i}.pkl"
-            else:  # embedding
-                index_file = index_dir / f"embedding_index_conv_{i}.pkl"
-
-            if not index_file.exists():
+                if not index_file.exists():
+                    missing_indexes.append(i)
+            elif not emb_index_exists(index_dir, i):  # embedding (npy or pkl)
                 missing_indexes.append(i)
 
         return missing_indexes
@@ -416,9 +420,24 @@ class EverMemOSAdapter(BaseAdapter):
                     f"\n🔨 Building Embedding index ({emb_to_build} conversations)...",
                     style="yellow",
                 )
+                # Adaptive embedding concurrency, resumed from the previous run if any
+                limiter = AdaptiveConcurrencyLimiter(
+                    initial=5, max_limit=40, name="embedding"
+                )
+                if checkpoint_manager:
+                    limiter.restore(
+                        checkpoint_manager.load_concurrency_state("embedding")
+                    )
                 await stage2_index_building.build_emb_index(
-                    config=exp_config, data_dir=memcells_dir, emb_save_dir=emb_index_dir
+                    config=exp_config,
+                    data_dir=memcells_dir,
+                    emb_save_dir=emb_index_dir,
+                    limiter=limiter,
                 )
+                if checkpoint_manager:
+                    checkpoint_manager.save_concurrency_state(
+                        "embedding", limiter.state()
+                    )
                 console.print("✅ Embedding index building completed", style="green")
             else:
                 console.print(
@@ -485,10 +504,7 @@ class EverMemOSAdapter(BaseAdapter):
         # Load Embedding index on demand (using numeric index)
         emb_index = None
         if index.get("use_hybrid_search"):
-            emb_file = emb_index_dir / f"embedding_index_conv_{conv_index}.pkl"
-            if emb_file.exists():
-                with open(emb_file, "rb") as f:
-                    emb_index = pickle.load(f)
+            emb_index = load_emb_index(emb_index_dir, conv_index)
 
         # Call stage3 retrieval implementation
         search_config = self.config.get("search", {})
@@ -652,6 +668,8 @@ class EverMemOSAdapter(BaseAdapter):
             exp_config.enable_profile_extraction = add_config[
                 "enable_profile_extraction"
             ]
+        if "emb_index_format" in add_config:
+            exp_config.emb_index_format = add_config["emb_index_format"]
 
         # Map Search stage configuration (only override explicitly specified in YAML)
         search_config = self.config.get("search", {})
@@ -10,6 +10,7 @@ from tqdm import tqdm
 from evaluation.src.core.data_models import QAPair, SearchResult, AnswerResult
 from evaluation.src.adapters.base import BaseAdapter
 from evaluation.src.utils.checkpoint import CheckpointManager
+from evaluation.src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 
 
 def build_context(search_result: SearchResult) -> str:
@@ -79,7 +80,8 @@ async def run_answer_stage(
     print(f"{'='*60}")
     
     SAVE_INTERVAL = 400  # Save every 400 tasks
-    MAX_CONCURRENT = 50  # Max concurrency
+    INITIAL_CONCURRENT = 50  # Starting concurrency (adapted at run time)
+    MAX_CONCURRENT = 200  # Max concurrency
     
     # Load fine-grained checkpoint
     all_answer_results = {}
@@ -123,7 +125,12 @@ async def run_answer_stage(
                 ))
         return results
     
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    # Adaptive concurrency: grow while healthy, back off on 429/5xx/timeouts (capped at MAX_CONCURRENT)
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=INITIAL_CONCURRENT, max_limit=MAX_CONCURRENT, name="answer"
+    )
+    if checkpoint_manager:
+        limiter.restore(checkpoint_manager.load_concurrency_state("answer"))
     completed = processed_count
     failed = 0
     start_time = time.time()
@@ -139,33 +146,33 @@ async def run_answer_stage(
     async def answer_single_with_tracking(qa, search_result):
         nonlocal completed, failed
         
-        async with semaphore:
-            try:
-                # Build context
-                context = build_context(search_result)
+        try:
+            # Build context
+            context = build_context(search_result)
+            
+            # Detect multiple-choice and enhance question if needed
+            query = qa.question
+            if "all_options" in qa.metadata:
+                options = qa.metadata["all_options"]
+                options_text = "\n".join([f"{key} {value}" for key, value in options.items()])
                 
-                # Detect multiple-choice and enhance question if needed
-                query = qa.question
-                if "all_options" in qa.metadata:
-                    options = qa.metadata["all_options"]
-                    options_text = "\n".join([f"{key} {value}" for key, value in options.items()])
-                    
-                    # Integrate options and requirements into question
-                    query = f"""{qa.question}
+                # Integrate options and requirements into question
+                query = f"""{qa.question}
 
 OPTIONS:
 {options_text}
 
 IMPORTANT: This is a multiple-choice question. You MUST analyze the context and select the BEST option. In your FINAL ANSWER, return ONLY the option letter like (a), (b), (c), or (d), nothing else."""
-                
-                # Call adapter's answer method with timeout and retry
-                max_retries = 3
-                timeout_seconds = 120.0  # 3 minutes timeout per attempt
-                answer = None
-                
-                for attempt in range(max_retries):
-                    try:
-                        answer = await asyncio.wait_for(
+            
+            # Call adapter's answer method with timeout and retry
+            max_retries = 3
+            timeout_seconds = 120.0  # 3 minutes timeout per attempt
+            answer = None
+            
+            for attempt in range(max_retries):
+                try:
+                    answer = await limiter.run(
+                        lambda: asyncio.wait_for(
                             adapter.answer(
                                 query=query,
                                 context=context,
@@ -173,61 +180,63 @@ IMPORTANT: This is a multiple-choice question. You MUST analyze the context and
                             ),
                             timeout=timeout_seconds
                         )
-                        answer = answer.strip()
-                        break  # Success, exit retry loop
-                        
-                    except asyncio.TimeoutError:
-                        if attempt < max_retries - 1:
-                            tqdm.write(f"  ⏱️  Timeout (180s) for {qa.question_id}, retry {attempt + 1}/{max_retries}...")
-                            await asyncio.sleep(2)  # Short delay before retry
-                        else:
-                            tqdm.write(f"  ❌ Timeout after {max_retries} attempts for {qa.question_id}: {qa.question[:50]}...")
-                            answer = "Error: Answer generation timeout after retries"
-                            failed += 1
-            
-            except Exception as e:
-                tqdm.write(f"  ⚠️ Answer generation failed for {qa.question_id}: {e}")
-                answer = "Error: Failed to generate answer"
-                failed += 1
-            
-            result = AnswerResult(
-                question_id=qa.question_id,
-                question=qa.question,
-                answer=answer,
-                golden_answer=qa.answer,
-                category=qa.category,
-                conversation_id=search_result.conversation_id,
-                formatted_context=context,  # Save actual context used
-                metadata=qa.metadata,  # Pass metadata (contains all_options for multiple-choice)
-            )
-            
-            # Save result
-            all_answer_results[qa.question_id] = {
-                "question_id": result.question_id,
-                "question": result.question,
-                "answer": result.answer,
-                "golden_answer": result.golden_answer,
-                "category": result.category,
-                "conversation_id": result.conversation_id,
-                "formatted_context": result.formatted_context,  # Save formatted_context
-                "metadata": result.metadata,  # Save metadata (contains all_options)
-            }
-            
-            completed += 1
-            pbar.update(1)  # Update progress bar
+                    )
+                    answer = answer.strip()
+                    break  # Success, exit retry loop
+                    
+                except asyncio.TimeoutError:
+                    if attempt < max_retries - 1:
+                        tqdm.write(f"  ⏱️  Timeout (180s) for {qa.question_id}, retry {attempt + 1}/{max_retries}...")
+                        await asyncio.sleep(2)  # Short delay before retry
+                    else:
+                        tqdm.write(f"  ❌ Timeout after {max_retries} attempts for {qa.question_id}: {qa.question[:50]}...")
+                        answer = "Error: Answer generation timeout after retries"
+                        failed += 1
+        
+        except Exception as e:
+            tqdm.write(f"  ⚠️ Answer generation failed for {qa.question_id}: {e}")
+            answer = "Error: Failed to generate answer"
+            failed += 1
+        
+        result = AnswerResult(
+            question_id=qa.question_id,
+            question=qa.question,
+            answer=answer,
+            golden_answer=qa.answer,
+            category=qa.category,
+            conversation_id=search_result.conversation_id,
+            formatted_context=context,  # Save actual context used
+            metadata=qa.metadata,  # Pass metadata (contains all_options for multiple-choice)
+        )
+        
+        # Save result
+        all_answer_results[qa.question_id] = {
+            "question_id": result.question_id,
+            "question": result.question,
+            "answer": result.answer,
+            "golden_answer": result.golden_answer,
+            "category": result.category,
+            "conversation_id": result.conversation_id,
+            "formatted_context": result.formatted_context,  # Save formatted_context
+            "metadata": result.metadata,  # Save metadata (contains all_options)
+        }
+        
+        completed += 1
+        pbar.update(1)  # Update progress bar
+        
+        # Save checkpoint periodically
+        if checkpoint_manager and (completed % SAVE_INTERVAL == 0 or completed == total_qa_count):
+            elapsed = time.time() - start_time
+            speed = completed / elapsed if elapsed > 0 else 0
+            eta = (total_qa_count - completed) / speed if speed > 0 else 0
             
-            # Save checkpoint periodically
-            if checkpoint_manager and (completed % SAVE_INTERVAL == 0 or completed == total_qa_count):
-                elapsed = time.time() - start_time
-                speed = completed / elapsed if elapsed > 0 else 0
-                eta = (total_qa_count - completed) / speed if speed > 0 else 0
-                
-                tqdm.write(f"Progress: {completed}/{total_qa_count} ({completed/total_qa_count*100:.1f}%) | "
-                          f"Speed: {speed:.1f} qa/s | Failed: {failed} | ETA: {eta/60:.1f} min")
-                
-                checkpoint_manager.save_answer_progress(all_answer_results, completed, total_qa_count)
+            tqdm.write(f"Progress: {completed}/{total_qa_count} ({completed/total_qa_count*100:.1f}%) | "
+                      f"Speed: {speed:.1f} qa/s | Failed: {failed} | ETA: {eta/60:.1f} min")
             
-            return result
+            checkpoint_manager.save_answer_progress(all_answer_results, completed, total_qa_count)
+            checkpoint_manager.save_concurrency_state("answer", limiter.state())
+        
+        return result
     
     # Create all pending tasks
     tasks = [
@@ -240,6 +249,7 @@ IMPORTANT: This is a multiple-choice question. You MUST analyze the context and
     
     # Close progress bar
     pbar.close()
+    print(limiter.summary())
     
     # Statistics
     elapsed_time = time.time() - start_time
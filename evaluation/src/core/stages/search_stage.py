@@ -9,6 +9,7 @@ from tqdm import tqdm
 from evaluation.src.core.data_models import QAPair, SearchResult
 from evaluation.src.adapters.base import BaseAdapter
 from evaluation.src.utils.checkpoint import CheckpointManager
+from evaluation.src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 
 
 async def run_search_stage(
@@ -65,10 +66,15 @@ async def run_search_stage(
     # Build conversation_id to conversation mapping (for online API cache rebuild)
     conv_id_to_conv = {conv.conversation_id: conv for conv in conversations}
     
-    # Get concurrency limit from adapter config (fallback to 20 if not specified)
+    # Adaptive concurrency: start from adapter config (fallback to 20 if not specified),
+    # grow while healthy, back off on 429/5xx/timeouts; resume learned limit from checkpoint
     num_workers = getattr(adapter, 'num_workers', 20)
-    semaphore = asyncio.Semaphore(num_workers)
-    print(f"Search concurrency: {num_workers} workers")
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=num_workers, max_limit=max(num_workers, num_workers * 4), name="search"
+    )
+    if checkpoint_manager:
+        limiter.restore(checkpoint_manager.load_concurrency_state("search"))
+    print(f"Search concurrency: {limiter.limit} workers (adaptive, max {limiter.max_limit})")
     
     # Create fine-grained progress bar (track by questions)
     total_questions = len(qa_pairs)
@@ -82,55 +88,56 @@ async def run_search_stage(
     )
     
     async def search_single_with_tracking(qa):
-        async with semaphore:
-            conv_id = qa.metadata.get("conversation_id", "0")
-            conversation = conv_id_to_conv.get(conv_id)
-            
-            # Search with timeout and retry (similar to answer_stage.py)
-            max_retries = 3
-            timeout_seconds = 120.0  # 2 minutes timeout per attempt
-            result = None
-            
-            for attempt in range(max_retries):
-                try:
-                    result = await asyncio.wait_for(
+        conv_id = qa.metadata.get("conversation_id", "0")
+        conversation = conv_id_to_conv.get(conv_id)
+        
+        # Search with timeout and retry (similar to answer_stage.py)
+        max_retries = 3
+        timeout_seconds = 120.0  # 2 minutes timeout per attempt
+        result = None
+        
+        for attempt in range(max_retries):
+            try:
+                result = await limiter.run(
+                    lambda: asyncio.wait_for(
                         adapter.search(qa.question, conv_id, index, conversation=conversation),
                         timeout=timeout_seconds
                     )
-                    break  # Success, exit retry loop
-                    
-                except asyncio.TimeoutError:
-                    if attempt < max_retries - 1:
-                        tqdm.write(f"  ⏱️  Search timeout ({timeout_seconds}s) for question in {conv_id}, retry {attempt + 1}/{max_retries}...")
-                        await asyncio.sleep(2)  # Short delay before retry
-                    else:
-                        tqdm.write(f"  ❌ Search timeout after {max_retries} attempts for question in {conv_id}: {qa.question[:60]}...")
-                        # Return empty search result on timeout
-                        from evaluation.src.core.data_models import SearchResult
-                        result = SearchResult(
-                            query=qa.question,
-                            conversation_id=conv_id,
-                            results=[],
-                            retrieval_metadata={"error": "Search timeout after retries"}
-                        )
+                )
+                break  # Success, exit retry loop
                 
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        tqdm.write(f"  ⚠️  Search failed for question in {conv_id}: {str(e)}, retry {attempt + 1}/{max_retries}...")
-                        await asyncio.sleep(2)
-                    else:
-                        tqdm.write(f"  ❌ Search failed after {max_retries} attempts for question in {conv_id}: {str(e)}")
-                        # Return empty search result on error
-                        from evaluation.src.core.data_models import SearchResult
-                        result = SearchResult(
-                            query=qa.question,
-                            conversation_id=conv_id,
-                            results=[],
-                            retrieval_metadata={"error": f"Search error: {str(e)}"}
-                        )
+            except asyncio.TimeoutError:
+                if attempt < max_retries - 1:
+                    tqdm.write(f"  ⏱️  Search timeout ({timeout_seconds}s) for question in {conv_id}, retry {attempt + 1}/{max_retries}...")
+                    await asyncio.sleep(2)  # Short delay before retry
+                else:
+                    tqdm.write(f"  ❌ Search timeout after {max_retries} attempts for question in {conv_id}: {qa.question[:60]}...")
+                    # Return empty search result on timeout
+                    from evaluation.src.core.data_models import SearchResult
+                    result = SearchResult(
+                        query=qa.question,
+                        conversation_id=conv_id,
+                        results=[],
+                        retrieval_metadata={"error": "Search timeout after retries"}
+                    )
             
-            pbar.update(1)  # Update progress bar after each question
-            return result
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    tqdm.write(f"  ⚠️  Search failed for question in {conv_id}: {str(e)}, retry {attempt + 1}/{max_retries}...")
+                    await asyncio.sleep(2)
+                else:
+                    tqdm.write(f"  ❌ Search failed after {max_retries} attempts for question in {conv_id}: {str(e)}")
+                    # Return empty search result on error
+                    from evaluation.src.core.data_models import SearchResult
+                    result = SearchResult(
+                        query=qa.question,
+                        conversation_id=conv_id,
+                        results=[],
+                        retrieval_metadata={"error": f"Search error: {str(e)}"}
+                    )
+        
+        pbar.update(1)  # Update progress bar after each question
+        return result
     
     # Process by conversation (use numeric sort for conversation IDs like "longmemeval_10")
     def sort_key(item):
@@ -171,9 +178,11 @@ async def run_search_stage(
         # Save checkpoint after each conversation
         if checkpoint_manager:
             checkpoint_manager.save_search_progress(all_search_results_dict)
+            checkpoint_manager.save_concurrency_state("search", limiter.state())
     
     # Close progress bar
     pbar.close()
+    print(limiter.summary())
     
     # Delete fine-grained checkpoint after completion
     if checkpoint_manager:
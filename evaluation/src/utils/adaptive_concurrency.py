@@ -0,0 +1,283 @@
+"""
+Adaptive concurrency control - AIMD limiter shared by evaluation stages.
+
+Replaces fixed Semaphore sizes with a limit that is learned at run time:
+- Additive increase: +1 slot after a full window of healthy calls (one call per slot)
+- Multiplicative decrease: limit * backoff_factor on overload signals
+  (HTTP 429 / 5xx, timeouts, or latency well above the observed baseline)
+
+The latency baseline is the lowest latency EWMA, slowly pulled up towards the current
+EWMA so gradual shifts (longer prompts, another phase of the run) are not taken for
+overload, and re-learned after a latency-triggered decrease.
+
+Only one decrease is applied per congestion episode: calls that started before the
+last decrease do not cut the limit again. The learned limit can be saved with
+CheckpointManager.save_concurrency_state() so a resumed run starts where the
+previous one left off instead of probing again from scratch.
+"""
+
+import asyncio
+import contextlib
+import re
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Status codes only count next to an HTTP/status prefix ("HTTP Error 503", "Error code:
+# 429", "status 502"), so numbers elsewhere in a message (token counts, ids) don't match
+OVERLOAD_MESSAGE_PATTERN = re.compile(
+    r"\b(?:http(?: error)?|status(?: code)?|error code)[\s:=]*(?:429|5\d\d)\b"
+    r"|rate.?limit|too many requests|overloaded|service unavailable|timed? ?out",
+    re.IGNORECASE,
+)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    Check whether an exception signals server overload (backoff) rather than a request bug.
+
+    Recognizes timeouts, HTTP status attributes (openai/httpx `status_code`,
+    aiohttp `status`, `response.status_code`) of 429 / 5xx, and common messages.
+    """
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    for holder in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "status"):
+            status = getattr(holder, attr, None)
+            if isinstance(status, int):
+                return status == 429 or 500 <= status < 600
+
+    return bool(OVERLOAD_MESSAGE_PATTERN.search(str(error)))
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(initial=20, max_limit=128)
+        result = await limiter.run(lambda: adapter.search(...))
+        async with limiter.slot():
+            ...
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        ewma_alpha: float = 0.2,
+        baseline_decay: float = 0.01,
+        name: str = "default",
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            initial: Initial concurrency limit
+            min_limit: Lower bound of the limit
+            max_limit: Upper bound of the limit
+            backoff_factor: Multiplier applied to the limit on overload
+            latency_tolerance: Latency EWMA above baseline * tolerance counts as overload
+            ewma_alpha: Smoothing factor of the latency EWMA
+            baseline_decay: Fraction of the gap to the latency EWMA the baseline
+                follows upwards per successful call
+            name: Name used in logs and checkpoint state
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.ewma_alpha = ewma_alpha
+        self.baseline_decay = baseline_decay
+        self.name = name
+
+        self.limit = self._clamp(initial)
+        self.in_flight = 0
+        self.latency_ewma: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+
+        # Statistics
+        self.successes = 0
+        self.overloads = 0
+        self.increases = 0
+        self.decreases = 0
+
+        self._window_successes = 0
+        # Incremented on each decrease, calls started in an older epoch don't cut again
+        self._epoch = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _clamp(self, limit: int) -> int:
+        return max(self.min_limit, min(self.max_limit, int(limit)))
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> int:
+        """
+        Wait for a free slot.
+
+        Returns:
+            Epoch at acquisition, to be passed to on_success/on_overload
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            return self._epoch
+
+    async def release(self):
+        """Release a slot and wake up waiters (the limit may have changed)."""
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def on_success(self, latency: float, epoch: Optional[int] = None):
+        """
+        Record a successful call (before its slot is released).
+
+        Args:
+            latency: Call latency in seconds
+            epoch: Epoch returned by acquire()
+        """
+        self.successes += 1
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += self.ewma_alpha * (latency - self.latency_ewma)
+        if self.baseline_latency is None or self.latency_ewma < self.baseline_latency:
+            self.baseline_latency = self.latency_ewma
+        else:
+            self.baseline_latency += self.baseline_decay * (
+                self.latency_ewma - self.baseline_latency
+            )
+
+        if self.latency_ewma > self.baseline_latency * self.latency_tolerance:
+            self._decrease(
+                epoch,
+                reason=f"latency {self.latency_ewma * 1000:.0f}ms",
+                relearn_latency=True,
+            )
+            return
+
+        # Only probe upwards while the current limit is actually used
+        if self.in_flight < self.limit:
+            return
+        self._window_successes += 1
+        if self._window_successes >= self.limit:
+            self._window_successes = 0
+            if self.limit < self.max_limit:
+                self.limit += 1
+                self.increases += 1
+
+    def on_overload(
+        self, error: Optional[BaseException] = None, epoch: Optional[int] = None
+    ):
+        """
+        Record an overload signal (429 / 5xx / timeout).
+
+        Args:
+            error: Exception that signaled the overload
+            epoch: Epoch returned by acquire()
+        """
+        self.overloads += 1
+        self._decrease(epoch, reason=type(error).__name__ if error else "overload")
+
+    def _decrease(
+        self, epoch: Optional[int], reason: str, relearn_latency: bool = False
+    ):
+        self._window_successes = 0
+        if epoch is not None and epoch < self._epoch:
+            return
+        new_limit = self._clamp(self.limit * self.backoff_factor)
+        self._epoch += 1
+        if relearn_latency:
+            # Latency that stays high at the lower limit is not caused by concurrency:
+            # learn the baseline again instead of backing off repeatedly
+            self.baseline_latency = None
+            self.latency_ewma = None
+        else:
+            # Latency measured at the old limit no longer describes the system
+            self.latency_ewma = self.baseline_latency
+        if new_limit < self.limit:
+            print(
+                f"  ⬇️  [{self.name}] concurrency {self.limit} -> {new_limit} ({reason})"
+            )
+            self.limit = new_limit
+            self.decreases += 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one slot for the body of an `async with` block.
+
+        The body is measured and classified like a call passed to run().
+        """
+        epoch = await self.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_overload_error(e):
+                self.on_overload(e, epoch)
+            raise
+        else:
+            self.on_success(time.perf_counter() - start, epoch)
+        finally:
+            await self.release()
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run one call under the limiter.
+
+        Overload errors reduce the limit, other errors are neutral; both are re-raised.
+
+        Args:
+            fn: Zero-argument coroutine function (called once, inside the slot)
+        """
+        async with self.slot():
+            return await fn()
+
+    def state(self) -> Dict[str, Any]:
+        """Learned state, saved with CheckpointManager.save_concurrency_state()."""
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_latency": self.baseline_latency,
+            "latency_ewma": self.latency_ewma,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "last_updated": datetime.now().isoformat(),
+        }
+
+    def restore(self, state: Optional[Dict[str, Any]]) -> "AdaptiveConcurrencyLimiter":
+        """
+        Resume from a saved state (bounds of this limiter take precedence).
+
+        Args:
+            state: State returned by state(), or None
+        """
+        if not state:
+            return self
+        if state.get("limit") is not None:
+            self.limit = self._clamp(state["limit"])
+        self.baseline_latency = state.get("baseline_latency")
+        self.latency_ewma = state.get("latency_ewma")
+        return self
+
+    def summary(self) -> str:
+        return (
+            f"[{self.name}] concurrency limit={self.limit} "
+            f"(range {self.min_limit}-{self.max_limit}, +{self.increases}/-{self.decreases}, "
+            f"overloads={self.overloads})"
+        )
@@ -34,6 +34,9 @@ class CheckpointManager:
         self.search_checkpoint = self.output_dir / f"search_results_checkpoint.json"
         self.answer_checkpoint = self.output_dir / f"answer_results_checkpoint.json"
         
+        # Learned concurrency limits (kept across runs, see utils/adaptive_concurrency.py)
+        self.concurrency_checkpoint = self.output_dir / "concurrency_state.json"
+        
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -333,4 +336,45 @@ class CheckpointManager:
                 print(f"  🗑️  Removed checkpoint: {checkpoint_file.name}")
             except Exception as e:
                 print(f"⚠️  Failed to remove checkpoint {checkpoint_file.name}: {e}")
-
+    
+    # ==================== Adaptive Concurrency State ====================
+    
+    def save_concurrency_state(self, name: str, state: Dict[str, Any]):
+        """
+        Save learned concurrency state of one limiter (merged with other limiters).
+        
+        Args:
+            name: Limiter name (e.g. "search", "answer", "embedding")
+            state: AdaptiveConcurrencyLimiter.state()
+        """
+        states = self._read_concurrency_states()
+        states[name] = state
+        try:
+            tmp_path = self.concurrency_checkpoint.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(states, f, indent=2, ensure_ascii=False)
+            tmp_path.replace(self.concurrency_checkpoint)
+        except Exception as e:
+            print(f"⚠️  Failed to save concurrency state: {e}")
+    
+    def load_concurrency_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load learned concurrency state of one limiter.
+        
+        Returns:
+            Saved state, or None if not exists
+        """
+        state = self._read_concurrency_states().get(name)
+        if state:
+            print(f"🔄 Resuming {name} concurrency limit: {state.get('limit')}")
+        return state
+    
+    def _read_concurrency_states(self) -> Dict[str, Any]:
+        if not self.concurrency_checkpoint.exists():
+            return {}
+        try:
+            with open(self.concurrency_checkpoint, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️  Failed to load concurrency state: {e}")
+            return {}
@@ -15,6 +15,9 @@ paths_registry.add_scan_path(
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "core/lifespan"))
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "core/lock"))
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "core/cache"))
+paths_registry.add_scan_path(
+    os.path.join(get_base_scan_path(), "core/queue/redis_group_queue")
+)
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "core/tenants"))
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "core/events"))
 paths_registry.add_scan_path(os.path.join(get_base_scan_path(), "component"))
@@ -301,13 +301,18 @@ class VectorizeService(VectorizeServiceInterface):
             response = await self._make_request(texts, instruction, is_query)
             return self._parse_embeddings_response(response)
 
+        # Chunks are sent concurrently, _make_request bounds them to max_concurrent_requests
+        responses = await asyncio.gather(
+            *(
+                self._make_request(
+                    texts[i : i + self.config.batch_size], instruction, is_query
+                )
+                for i in range(0, len(texts), self.config.batch_size)
+            )
+        )
         embeddings = []
-        for i in range(0, len(texts), self.config.batch_size):
-            batch_texts = texts[i : i + self.config.batch_size]
-            response = await self._make_request(batch_texts, instruction, is_query)
+        for response in responses:
             embeddings.extend(self._parse_embeddings_response(response))
-            if i + self.config.batch_size < len(texts):
-                await asyncio.sleep(0.1)
         return embeddings
 
     def _parse_embeddings_response(self, response) -> List[np.ndarray]:
@@ -287,6 +287,9 @@ async def _trigger_profile_extraction(
 ) -> None:
     """Trigger Profile extraction
 
+    The memcell is handed to ProfileUpdateScheduler, which coalesces the memcells of a
+    group over a debounce window and extracts profiles once per batch.
+
     Args:
         group_id: Group ID
         cluster_id: The cluster to which the current memcell was assigned
@@ -296,13 +299,8 @@ async def _trigger_profile_extraction(
         config: Memory extraction configuration
     """
     try:
-        from memory_layer.profile_manager import ProfileManager, ProfileManagerConfig
-        from infra_layer.adapters.out.persistence.repository.user_profile_raw_repository import (
-            UserProfileRawRepository,
-        )
-        from memory_layer.llm.llm_provider import LLMProvider
+        from biz_layer.profile_update_scheduler import ProfileUpdateScheduler
         from core.di import get_bean_by_type
-        import os
 
         # Get the number of memcells in the current cluster
         cluster_memcell_count = cluster_state.cluster_counts.get(cluster_id)
@@ -313,99 +311,17 @@ async def _trigger_profile_extraction(
             )
             return
 
-        logger.info(
-            f"[Profile] Start extracting Profile: cluster={cluster_id}, memcells={cluster_memcell_count}"
-        )
-
-        # Get Profile storage
-        profile_storage = get_bean_by_type(UserProfileRawRepository)
-
-        # Create LLM Provider
-        llm_provider = LLMProvider(
-            provider_type=os.getenv("LLM_PROVIDER", "openai"),
-            model=os.getenv("LLM_MODEL", "gpt-4"),
-            base_url=os.getenv("LLM_BASE_URL"),
-            api_key=os.getenv("LLM_API_KEY"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "16384")),
-        )
-
-        # Determine scenario
-        profile_scenario = (
-            "assistant"
-            if scene and scene.lower() in ["assistant", "companion"]
-            else "group_chat"
-        )
-
-        # Create ProfileManager (pure computation component)
-        profile_config = ProfileManagerConfig(
-            scenario=profile_scenario,
-            min_confidence=config.profile_min_confidence,
-            enable_versioning=config.profile_enable_versioning,
-            auto_extract=True,
-        )
-        profile_manager = ProfileManager(
-            llm_provider=llm_provider,
-            config=profile_config,
+        await get_bean_by_type(ProfileUpdateScheduler).schedule(
             group_id=group_id,
-            group_name=None,
-        )
-
-        # Get participant list (exclude robots)
-        user_id_list = [
-            u
-            for u in (memcell.participants or [])
-            if "robot" not in u.lower() and "assistant" not in u.lower()
-        ]
-
-        # Load existing profiles
-        old_profiles_dict = await profile_storage.get_all_profiles()
-        old_profiles = list(old_profiles_dict.values()) if old_profiles_dict else []
-
-        # Perform Profile extraction (pass MemCell objects directly, not dictionaries)
-        new_profiles = await profile_manager.extract_profiles(
-            memcells=[memcell],  # Pass MemCell object
-            old_profiles=old_profiles,
-            user_id_list=user_id_list,
-        )
-
-        # Save newly extracted profiles
-        for profile in new_profiles:
-            if isinstance(profile, dict):
-                user_id = profile.get('user_id')
-            else:
-                user_id = getattr(profile, 'user_id', None)
-
-            if user_id:
-                await profile_storage.save_profile(
-                    user_id,
-                    profile,
-                    metadata={
-                        "group_id": group_id,
-                        "scenario": profile_scenario,
-                        "cluster_id": cluster_id,
-                        "memcell_count": cluster_memcell_count,
-                        "confidence": config.profile_min_confidence,
-                    },
-                )
-                logger.info(
-                    f"[Profile] ✅ Saved Profile: user_id={user_id}, group_id={group_id}, cluster={cluster_id}"
-                )
-            else:
-                logger.warning(
-                    f"[Profile] ⚠️ Profile has no user_id, skipping save: {type(profile)}"
-                )
-
-        logger.info(
-            f"[Profile] ✅ Profile extraction completed: extracted {len(new_profiles)} profiles"
+            cluster_id=cluster_id,
+            memcell=memcell,
+            memcell_count=cluster_memcell_count,
+            scene=scene,
+            config=config,
         )
 
     except Exception as e:
-        import traceback
-
         logger.error(f"[Profile] ❌ Profile extraction failed: {e}", exc_info=True)
-        print(f"[Profile] ❌ Profile extraction failed: {e}")
-        print(traceback.format_exc())
         # Profile extraction failure should not block main flow
 
 
@@ -542,6 +458,18 @@ async def _extract_episodes(state: ExtractionState, memory_manager: MemoryManage
     if state.is_assistant_scene:
         logger.info("[MemCell Processing] assistant scene, only extract group Episode")
         tasks = [_create_episode_task(state, memory_manager, None)]
+    elif _use_combined_episode_extraction(state):
+        logger.info(
+            f"[MemCell Processing] non-assistant scene, extract group + {len(state.participants)} personal Episodes with one combined call"
+        )
+        results = await memory_manager.extract_multi_perspective_episodes(
+            memcell=state.memcell,
+            user_ids=state.participants,
+            group_id=state.request.group_id,
+            group_name=state.request.group_name,
+        )
+        _process_episode_results(state, results)
+        return
     else:
         logger.info(
             f"[MemCell Processing] non-assistant scene, extract group + {len(state.participants)} personal Episodes"
@@ -558,6 +486,17 @@ async def _extract_episodes(state: ExtractionState, memory_manager: MemoryManage
     _process_episode_results(state, results)
 
 
+def _use_combined_episode_extraction(state: ExtractionState) -> bool:
+    """
+    Whether to extract group and personal Episodes with one combined LLM call
+
+    EPISODE_EXTRACTION_MODE=combined sends the conversation once instead of once per
+    participant plus once for the group; per_user (default) keeps one call per Episode.
+    """
+    mode = os.getenv("EPISODE_EXTRACTION_MODE", "per_user").lower()
+    return mode == "combined" and bool(state.participants)
+
+
 def _create_episode_task(
     state: ExtractionState, memory_manager: MemoryManager, user_id: Optional[str]
 ):
@@ -723,45 +662,35 @@ async def _extract_foresight_and_eventlog(
         f"[MemCell Processing] Extracting Foresight/EventLog, total {len(episodic_source)} Episodes"
     )
 
-    tasks = []
-    metadata = []
+    episodes = [ep for ep in episodic_source if ep.event_id]
+    if not episodes:
+        return [], []
 
-    for ep in episodic_source:
-        if not ep.event_id:
-            continue
-        tasks.append(
-            memory_manager.extract_memory(
-                memcell=state.memcell,
-                memory_type=MemoryType.FORESIGHT,
-                user_id=ep.user_id,
-                episode_memory=ep,
-            )
+    # Foresight of all Episodes is generated in one batch (shared embedding call)
+    tasks = [memory_manager.extract_foresights_for_episodes(episodes)]
+    tasks.extend(
+        memory_manager.extract_memory(
+            memcell=state.memcell,
+            memory_type=MemoryType.EVENT_LOG,
+            user_id=ep.user_id,
+            episode_memory=ep,
         )
-        metadata.append({'type': MemoryType.FORESIGHT, 'ep': ep})
-        tasks.append(
-            memory_manager.extract_memory(
-                memcell=state.memcell,
-                memory_type=MemoryType.EVENT_LOG,
-                user_id=ep.user_id,
-                episode_memory=ep,
-            )
-        )
-        metadata.append({'type': MemoryType.EVENT_LOG, 'ep': ep})
-
-    if not tasks:
-        return [], []
+        for ep in episodes
+    )
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    foresight_result, *event_log_results = await asyncio.gather(
+        *tasks, return_exceptions=True
+    )
 
     foresight_memories = []
     event_logs = []
 
-    for meta, result in zip(metadata, results):
-        if isinstance(result, Exception) or not result:
-            continue
-
-        ep = meta['ep']
-        if meta['type'] == MemoryType.FORESIGHT:
+    if isinstance(foresight_result, Exception):
+        logger.error(
+            f"[MemCell Processing] Foresight extraction failed: {foresight_result}"
+        )
+    else:
+        for ep, result in zip(episodes, foresight_result):
             for mem in result:
                 mem.parent_event_id = ep.event_id
                 mem.user_id = ep.user_id
@@ -769,13 +698,16 @@ async def _extract_foresight_and_eventlog(
                 mem.group_name = ep.group_name
                 mem.user_name = ep.user_name
                 foresight_memories.append(mem)
-        elif meta['type'] == MemoryType.EVENT_LOG:
-            result.parent_event_id = ep.event_id
-            result.user_id = ep.user_id
-            result.group_id = ep.group_id
-            result.group_name = ep.group_name
-            result.user_name = ep.user_name
-            event_logs.append(result)
+
+    for ep, result in zip(episodes, event_log_results):
+        if isinstance(result, Exception) or not result:
+            continue
+        result.parent_event_id = ep.event_id
+        result.user_id = ep.user_id
+        result.group_id = ep.group_id
+        result.group_name = ep.group_name
+        result.user_name = ep.user_name
+        event_logs.append(result)
 
     return foresight_memories, event_logs
 
@@ -1125,16 +1057,12 @@ async def load_core_memories(
     # Initialize Repository instance
     core_memory_repo = get_bean_by_type(CoreMemoryRawRepository)
 
-    # Read user CoreMemory data
-    user_core_memories = {}
-    for user_id in participants:
-        try:
-            core_memory = await core_memory_repo.get_by_user_id(user_id)
-            if core_memory:
-                user_core_memories[user_id] = core_memory
-            # Remove individual user success/failure logs
-        except Exception as e:
-            logger.error(f"Failed to get user {user_id} CoreMemory: {e}")
+    # Read user CoreMemory data (latest version per user, one query for all participants)
+    try:
+        user_core_memories = await core_memory_repo.get_by_user_ids(participants)
+    except Exception as e:
+        logger.error(f"Failed to get CoreMemory of users {participants}: {e}")
+        user_core_memories = {}
 
     logger.info(f"[mem_memorize] Retrieved {len(user_core_memories)} users' CoreMemory")
 
@@ -0,0 +1,292 @@
+"""
+Memorize ingest queue
+
+Opt-in ingest mode that routes memorize requests through RedisGroupQueueManager
+instead of processing them inline in the API process.
+
+- The API enqueues the raw single-message payload keyed by group_id and returns immediately
+- Messages of one group hash to the same partition, so a single consumer owns them
+  and processes them in order
+- Different groups are spread over the fixed partitions and scale out across consumers
+
+Failed messages are requeued with their original score, so they go back to the head
+of their group, together with the group's later messages of the same batch. After
+MEMORIZE_QUEUE_MAX_ATTEMPTS attempts a message is moved to the dead-letter list
+({key_prefix}:dead_letter) and the group moves on.
+
+Delivery is still at-most-once for consumer crashes: RedisGroupQueueManager.get_messages
+removes messages from the queue when it returns them (ZPOPMIN), so messages fetched by
+a consumer that is killed before processing them are lost. Inline mode, the default,
+has no such window. Only enable the queue where that is acceptable.
+
+Enable with MEMORIZE_INGEST_MODE=queue and start consumers with:
+    python src/run.py --longjob memorize_queue_consumer
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import bson
+
+from common_utils.datetime_utils import to_timestamp_ms_universal
+from core.di import get_bean_by_type
+from core.observation.logger import get_logger
+from core.queue.redis_group_queue.redis_group_queue_item import (
+    RedisGroupQueueItem,
+    SerializationMode,
+)
+from core.queue.redis_group_queue.redis_msg_group_queue_manager import (
+    RedisGroupQueueManager,
+)
+from core.queue.redis_group_queue.redis_msg_group_queue_manager_factory import (
+    RedisGroupQueueConfig,
+    RedisGroupQueueManagerFactory,
+)
+
+logger = get_logger(__name__)
+
+# Ingest mode environment variable and values
+MEMORIZE_INGEST_MODE_ENV = "MEMORIZE_INGEST_MODE"
+INGEST_MODE_INLINE = "inline"  # Process in the API request (default)
+INGEST_MODE_QUEUE = "queue"  # Enqueue and let memorize_queue_consumer process
+
+# Default Redis key prefix of the ingest queue
+DEFAULT_MEMORIZE_QUEUE_KEY_PREFIX = "memorize_ingest"
+
+# Group key used for messages without group_id
+UNGROUPED_KEY_PREFIX = "__ungrouped__"
+
+# Rejection reason returned by ENQUEUE_SCRIPT when an identical item is still pending
+DUPLICATE_MESSAGE_REASON = "Message already exists"
+
+# Processing attempts of a message before it is moved to the dead-letter list
+DEFAULT_MEMORIZE_QUEUE_MAX_ATTEMPTS = 3
+
+# Dead-letter list of messages that kept failing, capped to the newest entries
+DEAD_LETTER_KEY_SUFFIX = "dead_letter"
+MAX_DEAD_LETTER_MESSAGES = 10000
+
+
+def is_queue_ingest_enabled() -> bool:
+    """Whether memorize requests should be enqueued instead of processed inline"""
+    return (
+        os.getenv(MEMORIZE_INGEST_MODE_ENV, INGEST_MODE_INLINE).lower()
+        == INGEST_MODE_QUEUE
+    )
+
+
+def get_memorize_queue_max_attempts() -> int:
+    """Processing attempts of a message before it is dead-lettered"""
+    return max(
+        1,
+        int(
+            os.getenv(
+                "MEMORIZE_QUEUE_MAX_ATTEMPTS", str(DEFAULT_MEMORIZE_QUEUE_MAX_ATTEMPTS)
+            )
+        ),
+    )
+
+
+@dataclass
+class MemorizeQueueItem(RedisGroupQueueItem):
+    """
+    Memorize ingest queue item
+
+    Carries the raw single-message payload received by the memorize API, so the
+    consumer replays exactly the same conversion path as the inline mode.
+    Identical payloads of the same group are deduplicated by the queue while pending.
+    attempts counts the failed processing attempts of a requeued item.
+    """
+
+    group_key: str
+    message: Dict[str, Any]
+    attempts: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "group_key": self.group_key,
+            "message": self.message,
+            "attempts": self.attempts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MemorizeQueueItem':
+        return cls(
+            group_key=data["group_key"],
+            message=data["message"],
+            attempts=int(data.get("attempts", 0)),
+        )
+
+    @classmethod
+    def from_json_str(cls, json_str: str) -> 'MemorizeQueueItem':
+        try:
+            return cls.from_dict(json.loads(json_str))
+        except (json.JSONDecodeError, KeyError) as e:
+            raise ValueError(f"Invalid JSON data: {e}") from e
+
+    @classmethod
+    def from_bson_bytes(cls, bson_bytes: bytes) -> 'MemorizeQueueItem':
+        try:
+            return cls.from_dict(bson.decode(bson_bytes))
+        except (Exception, KeyError) as e:
+            raise ValueError(f"Invalid BSON data: {e}") from e
+
+
+def get_group_key(message_data: Dict[str, Any]) -> str:
+    """
+    Get the ordering key of a single-message payload
+
+    Messages without group_id are private conversations of the sender,
+    so they are serialized per sender.
+    """
+    group_id = message_data.get("group_id")
+    if group_id:
+        return str(group_id)
+    return f"{UNGROUPED_KEY_PREFIX}:{message_data.get('sender', '')}"
+
+
+def memorize_queue_sort_key(item: MemorizeQueueItem) -> int:
+    """
+    Sort key of the ingest queue: message create_time in milliseconds
+
+    Ordering by create_time instead of arrival time keeps a group's messages in
+    conversation order even when they reach different API replicas out of order.
+    Falls back to arrival time when create_time cannot be parsed.
+    """
+    create_time_ms = to_timestamp_ms_universal(item.message.get("create_time"))
+    return create_time_ms or int(time.time() * 1000)
+
+
+def build_memorize_queue_config() -> RedisGroupQueueConfig:
+    """Build the ingest queue configuration from environment variables"""
+    key_prefix = os.getenv(
+        "MEMORIZE_QUEUE_KEY_PREFIX", DEFAULT_MEMORIZE_QUEUE_KEY_PREFIX
+    )
+    global_redis_prefix = os.getenv("GLOBAL_REDIS_PREFIX", "")
+    if global_redis_prefix:
+        key_prefix = f"{global_redis_prefix}:{key_prefix}"
+
+    return RedisGroupQueueConfig(
+        key_prefix=key_prefix,
+        serialization_mode=SerializationMode.JSON,
+        sort_key_func=memorize_queue_sort_key,
+        max_total_messages=int(os.getenv("MEMORIZE_QUEUE_MAX_TOTAL_MESSAGES", "20000")),
+        queue_expire_seconds=int(
+            os.getenv("MEMORIZE_QUEUE_EXPIRE_SECONDS", str(24 * 3600))
+        ),
+        activity_expire_seconds=int(
+            os.getenv("MEMORIZE_QUEUE_ACTIVITY_EXPIRE_SECONDS", str(24 * 3600))
+        ),
+    )
+
+
+async def get_memorize_queue_manager() -> RedisGroupQueueManager:
+    """Get the (cached) ingest queue manager"""
+    factory = get_bean_by_type(RedisGroupQueueManagerFactory)
+    return await factory.get_manager(
+        config=build_memorize_queue_config(), item_class=MemorizeQueueItem
+    )
+
+
+async def enqueue_memorize_message(
+    message_data: Dict[str, Any],
+) -> tuple[bool, Optional[str]]:
+    """
+    Enqueue a single-message memorize payload
+
+    Args:
+        message_data: Raw single-message payload received by the memorize API
+
+    Returns:
+        tuple[bool, Optional[str]]: (whether enqueued, group key or rejection reason)
+    """
+    group_key = get_group_key(message_data)
+    manager = await get_memorize_queue_manager()
+    item = MemorizeQueueItem(group_key=group_key, message=message_data)
+
+    success, reason = await manager.deliver_message(
+        group_key, item, return_mode="reject_reason"
+    )
+    if not success and reason == DUPLICATE_MESSAGE_REASON:
+        # Client retry of a message that is still pending, treat as accepted
+        logger.info(
+            "[MemorizeQueue] Duplicate message ignored: group_key=%s", group_key
+        )
+        return True, group_key
+    if not success:
+        logger.warning(
+            "[MemorizeQueue] Enqueue rejected: group_key=%s, reason=%s",
+            group_key,
+            reason,
+        )
+        return False, reason
+
+    logger.debug("[MemorizeQueue] Enqueued message: group_key=%s", group_key)
+    return True, group_key
+
+
+async def requeue_memorize_items(
+    manager: RedisGroupQueueManager, items: List[MemorizeQueueItem]
+) -> None:
+    """
+    Put fetched items back into the queue
+
+    The sort key is the message create_time, so the items return to the head of their
+    group. They were counted against max_total_messages before they were fetched,
+    so the limit is raised by their number. Items that cannot be requeued are dead-lettered.
+
+    Args:
+        manager: Ingest queue manager
+        items: Items to requeue
+    """
+    for item in items:
+        success, reason = await manager.deliver_message(
+            item.group_key,
+            item,
+            return_mode="reject_reason",
+            max_total_messages=manager.max_total_messages + len(items),
+        )
+        if not success and reason != DUPLICATE_MESSAGE_REASON:
+            await dead_letter_memorize_item(
+                manager, item, f"Requeue rejected: {reason}"
+            )
+
+
+async def dead_letter_memorize_item(
+    manager: RedisGroupQueueManager, item: MemorizeQueueItem, error: str
+) -> None:
+    """
+    Move an item that kept failing to the dead-letter list
+
+    Args:
+        manager: Ingest queue manager
+        item: Failed item
+        error: Last error
+    """
+    key = f"{manager.key_prefix}:{DEAD_LETTER_KEY_SUFFIX}"
+    entry = json.dumps(
+        {"item": item.to_dict(), "error": error, "failed_at": time.time()},
+        ensure_ascii=False,
+        default=str,
+    )
+    try:
+        await manager.redis_client.lpush(key, entry)
+        await manager.redis_client.ltrim(key, 0, MAX_DEAD_LETTER_MESSAGES - 1)
+    except Exception as e:
+        logger.error(
+            "[MemorizeQueue] Dead-letter write failed, message dropped: group_key=%s, message_id=%s, error=%s",
+            item.group_key,
+            item.message.get("message_id"),
+            e,
+        )
+        return
+    logger.error(
+        "[MemorizeQueue] Message dead-lettered: group_key=%s, message_id=%s, attempts=%d, error=%s",
+        item.group_key,
+        item.message.get("message_id"),
+        item.attempts,
+        error,
+    )
@@ -0,0 +1,302 @@
+"""
+Debounced profile update scheduler
+
+Profile extraction used to run once per clustered memcell: every run built an LLMProvider,
+loaded the group's profiles, extracted over that single memcell and saved the profiles one
+by one. The scheduler gathers the memcells of a group and runs one extraction per batch:
+
+- Each new memcell of a group restarts the debounce window (PROFILE_UPDATE_DEBOUNCE_SECONDS);
+  a batch never waits longer than PROFILE_UPDATE_MAX_WAIT_SECONDS after its first memcell
+- Extractions of one group run one at a time; memcells arriving meanwhile form the next batch
+- The LLM provider is shared, the group's profiles are loaded once per batch and the updated
+  profiles are written in one bulk operation
+- Pending batches are flushed on shutdown (ProfileUpdateLifespanProvider)
+
+With a window of 0 (default) the caller waits for the extraction as before, but memcells of
+a group that arrive while its extraction is running are still coalesced into one batch.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from api_specs.memory_types import MemCell
+from biz_layer.memorize_config import DEFAULT_MEMORIZE_CONFIG, MemorizeConfig
+from core.di import get_bean_by_type
+from core.di.decorators import component
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PendingProfileUpdate:
+    """Memcells of one group waiting for profile extraction"""
+
+    group_id: str
+    scene: Optional[str]
+    config: MemorizeConfig
+    first_scheduled_at: float
+    memcells: List[MemCell] = field(default_factory=list)
+    # Ordered set of participants to extract profiles for
+    user_ids: Dict[str, None] = field(default_factory=dict)
+    cluster_ids: List[str] = field(default_factory=list)
+    memcell_count: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+    def add(
+        self,
+        memcell: MemCell,
+        cluster_id: str,
+        memcell_count: int,
+        scene: Optional[str],
+    ) -> None:
+        if all(m.event_id != memcell.event_id for m in self.memcells):
+            self.memcells.append(memcell)
+        for user_id in memcell.participants or []:
+            # Exclude robots
+            if "robot" not in user_id.lower() and "assistant" not in user_id.lower():
+                self.user_ids[user_id] = None
+        if cluster_id not in self.cluster_ids:
+            self.cluster_ids.append(cluster_id)
+        self.memcell_count = memcell_count
+        self.scene = scene
+
+
+@component(name="profile_update_scheduler")
+class ProfileUpdateScheduler:
+    """Per-group debounced and coalesced profile extraction"""
+
+    def __init__(self):
+        self.debounce_seconds = float(os.getenv("PROFILE_UPDATE_DEBOUNCE_SECONDS", "0"))
+        self.max_wait_seconds = float(
+            os.getenv("PROFILE_UPDATE_MAX_WAIT_SECONDS", "60")
+        )
+
+        self._pending: Dict[str, PendingProfileUpdate] = {}
+        # Per-group locks, removed when no flush of the group is running or waiting
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._llm_provider = None
+        self._profile_managers: Dict[str, Any] = {}
+
+        self._stats = {
+            "scheduled_memcells": 0,
+            "extractions": 0,
+            "extracted_memcells": 0,
+            "saved_profiles": 0,
+            "failed_extractions": 0,
+        }
+
+    async def schedule(
+        self,
+        group_id: str,
+        cluster_id: str,
+        memcell: MemCell,
+        memcell_count: int,
+        scene: Optional[str] = None,
+        config: MemorizeConfig = DEFAULT_MEMORIZE_CONFIG,
+    ) -> None:
+        """
+        Add a clustered memcell to the group's next profile extraction
+
+        Args:
+            group_id: Group ID
+            cluster_id: The cluster to which the memcell was assigned
+            memcell: The clustered MemCell
+            memcell_count: Number of memcells in the cluster
+            scene: Conversation scene
+            config: Memory extraction configuration
+        """
+        pending = self._pending.get(group_id)
+        if pending is None:
+            pending = PendingProfileUpdate(
+                group_id=group_id,
+                scene=scene,
+                config=config,
+                first_scheduled_at=time.monotonic(),
+            )
+            self._pending[group_id] = pending
+        pending.add(memcell, cluster_id, memcell_count, scene)
+        self._stats["scheduled_memcells"] += 1
+
+        if self.debounce_seconds <= 0:
+            await self.flush(group_id)
+            return
+
+        # Restart the debounce window, bounded by the maximum wait of the batch
+        if pending.timer is not None:
+            pending.timer.cancel()
+        remaining = (
+            pending.first_scheduled_at + self.max_wait_seconds - time.monotonic()
+        )
+        delay = max(0.0, min(self.debounce_seconds, remaining))
+        pending.timer = asyncio.get_running_loop().call_later(
+            delay, self._start_flush, group_id
+        )
+        logger.debug(
+            "[Profile] Scheduled memcell %s for group %s, %d pending, flush in %.1fs",
+            memcell.event_id,
+            group_id,
+            len(pending.memcells),
+            delay,
+        )
+
+    async def flush(self, group_id: str) -> None:
+        """
+        Extract profiles for the pending memcells of a group now
+
+        Args:
+            group_id: Group ID
+        """
+        lock = self._locks.setdefault(group_id, asyncio.Lock())
+        self._lock_users[group_id] = self._lock_users.get(group_id, 0) + 1
+        try:
+            async with lock:
+                pending = self._pending.pop(group_id, None)
+                if pending is None:
+                    # Already extracted by a concurrent flush
+                    return
+                if pending.timer is not None:
+                    pending.timer.cancel()
+                await self._extract(pending)
+        finally:
+            self._lock_users[group_id] -= 1
+            if self._lock_users[group_id] == 0:
+                del self._lock_users[group_id]
+                del self._locks[group_id]
+
+    async def flush_all(self) -> None:
+        """Extract all pending batches and wait for running extractions"""
+        group_ids = list(self._pending)
+        if group_ids:
+            logger.info(
+                "[Profile] Flushing pending profile updates of %d groups",
+                len(group_ids),
+            )
+        await asyncio.gather(*(self.flush(group_id) for group_id in group_ids))
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler counters"""
+        return {
+            **self._stats,
+            "pending_groups": len(self._pending),
+            "pending_memcells": sum(len(p.memcells) for p in self._pending.values()),
+        }
+
+    def _start_flush(self, group_id: str) -> None:
+        task = asyncio.create_task(self.flush(group_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _get_llm_provider(self):
+        if self._llm_provider is None:
+            from memory_layer.llm.llm_provider import LLMProvider
+
+            self._llm_provider = LLMProvider(
+                provider_type=os.getenv("LLM_PROVIDER", "openai"),
+                model=os.getenv("LLM_MODEL", "gpt-4"),
+                base_url=os.getenv("LLM_BASE_URL"),
+                api_key=os.getenv("LLM_API_KEY"),
+                temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),
+                max_tokens=int(os.getenv("LLM_MAX_TOKENS", "16384")),
+            )
+        return self._llm_provider
+
+    def _get_profile_manager(self, scenario: str, config: MemorizeConfig):
+        from memory_layer.profile_manager import ProfileManager, ProfileManagerConfig
+
+        key = (
+            f"{scenario}:{config.profile_min_confidence}:"
+            f"{config.profile_enable_versioning}"
+        )
+        if key not in self._profile_managers:
+            self._profile_managers[key] = ProfileManager(
+                llm_provider=self._get_llm_provider(),
+                config=ProfileManagerConfig(
+                    scenario=scenario,
+                    min_confidence=config.profile_min_confidence,
+                    enable_versioning=config.profile_enable_versioning,
+                    auto_extract=True,
+                ),
+            )
+        return self._profile_managers[key]
+
+    async def _extract(self, pending: PendingProfileUpdate) -> None:
+        """Run one profile extraction over the batch and save the profiles in bulk"""
+        from infra_layer.adapters.out.persistence.repository.user_profile_raw_repository import (
+            UserProfileRawRepository,
+        )
+
+        group_id = pending.group_id
+        config = pending.config
+        try:
+            logger.info(
+                f"[Profile] Start extracting Profile: group={group_id}, "
+                f"batch={len(pending.memcells)} memcells, clusters={pending.cluster_ids}"
+            )
+            profile_storage = get_bean_by_type(UserProfileRawRepository)
+
+            # Determine scenario
+            profile_scenario = (
+                "assistant"
+                if pending.scene and pending.scene.lower() in ["assistant", "companion"]
+                else "group_chat"
+            )
+            profile_manager = self._get_profile_manager(profile_scenario, config)
+
+            # Load existing profiles of the group once per batch
+            old_profiles_dict = await profile_storage.get_all_profiles(group_id)
+            old_profiles = list(old_profiles_dict.values()) if old_profiles_dict else []
+
+            memcells = sorted(pending.memcells, key=lambda m: m.timestamp)
+            new_profiles = await profile_manager.extract_profiles(
+                memcells=memcells,
+                old_profiles=old_profiles,
+                user_id_list=list(pending.user_ids),
+                group_id=group_id,
+            )
+            self._stats["extractions"] += 1
+            self._stats["extracted_memcells"] += len(memcells)
+
+            profiles_by_user = {}
+            for profile in new_profiles:
+                if isinstance(profile, dict):
+                    user_id = profile.get('user_id')
+                else:
+                    user_id = getattr(profile, 'user_id', None)
+
+                if user_id:
+                    profiles_by_user[user_id] = profile
+                else:
+                    logger.warning(
+                        f"[Profile] ⚠️ Profile has no user_id, skipping save: {type(profile)}"
+                    )
+
+            saved = await profile_storage.save_profiles(
+                profiles_by_user,
+                metadata={
+                    "group_id": group_id,
+                    "scenario": profile_scenario,
+                    "cluster_ids": pending.cluster_ids,
+                    "cluster_id": pending.cluster_ids[-1],
+                    "memcell_count": pending.memcell_count,
+                    "confidence": config.profile_min_confidence,
+                },
+            )
+            self._stats["saved_profiles"] += saved
+
+            logger.info(
+                f"[Profile] ✅ Profile extraction completed: group={group_id}, "
+                f"extracted {len(new_profiles)} profiles, saved {saved}"
+            )
+
+        except Exception as e:
+            self._stats["failed_extractions"] += 1
+            logger.error(f"[Profile] ❌ Profile extraction failed: {e}", exc_info=True)
+            # Profile extraction failure should not block main flow
@@ -10,6 +10,7 @@ from typing import Optional, Dict
 from hashlib import md5
 
 from pymilvus import MilvusClient
+from pymilvus.orm.connections import connections
 from core.di.decorators import component
 from core.observation.logger import get_logger
 
@@ -153,6 +154,23 @@ class MilvusClientFactory:
             alias=name,  # Use name as cache key
         )
 
+    def close_client(self, alias: str) -> None:
+        """
+        Close the client registered under alias and remove its connection
+
+        Args:
+            alias: Connection alias
+        """
+        client = self._clients.pop(alias, None)
+        try:
+            if client is not None:
+                client.close()
+            else:
+                connections.remove_connection(alias)
+            logger.info("Milvus client closed (alias=%s)", alias)
+        except Exception as e:
+            logger.error("Error closing Milvus client (alias=%s): %s", alias, e)
+
     def close_all_clients(self):
         """Close all client connections"""
         for _, client in self._clients.items():
@@ -11,17 +11,38 @@ Depends on AppLogicProvider:
 Background mode configuration:
 - Background mode is enabled by default (automatically switches to background on timeout)
 - Can disable background mode by passing sync_mode=true in request params (synchronously wait for execution to complete)
+
+Bounded execution (BackgroundTaskExecutor):
+- At most TIMEOUT_BACKGROUND_MAX_IN_FLIGHT tasks run at the same time, up to
+  TIMEOUT_BACKGROUND_MAX_QUEUED further requests wait for a slot, the rest get 503
+- Running tasks are drained on shutdown (BackgroundTaskLifespanProvider)
+- Optional durable handoff (TIMEOUT_BACKGROUND_DURABLE_HANDOFF=true): overflow requests and
+  tasks still running when the drain times out are enqueued to the arq TaskManager instead
 """
 
-from typing import Any, Callable, Coroutine, TypeVar, ParamSpec, Union, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    TypeVar,
+    ParamSpec,
+    Union,
+    Optional,
+)
+from dataclasses import dataclass
 from functools import wraps
 import asyncio
+import contextvars
+import os
 import traceback
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from core.observation.logger import get_logger
+from core.di.decorators import component
 from core.di.utils import get_bean_by_type
 from core.context.context import get_current_request
 
@@ -36,6 +57,192 @@ DEFAULT_BLOCKING_TIMEOUT = 5.0
 # Sync mode parameter name (used to disable background mode)
 SYNC_MODE_PARAM = "sync_mode"
 
+# Retry-After header value (seconds) of the overflow response
+OVERFLOW_RETRY_AFTER_SECONDS = 5
+
+# Durable handoff: called with the endpoint's arguments, enqueues the work to a durable
+# queue and returns the task ID (None if not handed off). Must be idempotent, since the
+# work may be re-executed from the start.
+DurableHandoff = Callable[..., Awaitable[Optional[str]]]
+
+
+@dataclass
+class _TrackedTask:
+    """Background-capable task tracked by the executor"""
+
+    task_name: str
+    handoff: Optional[Callable[[], Awaitable[Optional[str]]]] = None
+    context: Optional[contextvars.Context] = None
+
+
+@component(name="background_task_executor")
+class BackgroundTaskExecutor:
+    """
+    Bounded executor of timeout_to_background tasks
+
+    Limits the number of tasks started by timeout_to_background (running within the
+    blocking timeout or in background), queues a bounded number of extra requests and
+    rejects the rest, so a traffic spike of slow requests cannot grow memory without limit.
+    """
+
+    def __init__(self):
+        self.max_in_flight = int(os.getenv("TIMEOUT_BACKGROUND_MAX_IN_FLIGHT", "100"))
+        self.max_queued = int(os.getenv("TIMEOUT_BACKGROUND_MAX_QUEUED", "100"))
+        self.drain_timeout = float(os.getenv("TIMEOUT_BACKGROUND_DRAIN_TIMEOUT", "30"))
+        self.durable_handoff_enabled = (
+            os.getenv("TIMEOUT_BACKGROUND_DURABLE_HANDOFF", "false").lower() == "true"
+        )
+
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._waiting = 0
+        self._accepting = True
+        self._tasks: Dict[asyncio.Task, _TrackedTask] = {}
+
+        self._stats = {
+            "total_accepted": 0,
+            "total_rejected": 0,
+            "total_background": 0,
+            "total_handed_off": 0,
+        }
+
+    async def acquire(self) -> bool:
+        """
+        Acquire an execution slot, waiting in the bounded queue if all slots are taken
+
+        Returns:
+            bool: False if the executor is draining or the queue is full
+        """
+        if not self._accepting or (
+            self._semaphore.locked() and self._waiting >= self.max_queued
+        ):
+            self._stats["total_rejected"] += 1
+            return False
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._stats["total_accepted"] += 1
+        return True
+
+    def track(
+        self,
+        task: asyncio.Task,
+        task_name: str,
+        handoff: Optional[Callable[[], Awaitable[Optional[str]]]] = None,
+    ) -> None:
+        """
+        Track a task started after acquire(), its slot is released when it finishes
+
+        Args:
+            task: Task running the endpoint logic
+            task_name: Task name (for logging)
+            handoff: Durable handoff of this task's work, used when draining times out
+        """
+        self._tasks[task] = _TrackedTask(
+            task_name=task_name, handoff=handoff, context=contextvars.copy_context()
+        )
+        task.add_done_callback(self._on_task_done)
+
+    def mark_background(self) -> None:
+        """Record that a tracked task switched to background execution"""
+        self._stats["total_background"] += 1
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.pop(task, None)
+        self._semaphore.release()
+
+    async def handoff(
+        self,
+        handoff: Callable[[], Awaitable[Optional[str]]],
+        task_name: str,
+        context: Optional[contextvars.Context] = None,
+    ) -> Optional[str]:
+        """
+        Hand work over to the durable task queue
+
+        Args:
+            handoff: Bound durable handoff
+            task_name: Task name (for logging)
+            context: Context to run the handoff in (keeps the request's app_info)
+
+        Returns:
+            Optional[str]: Durable task ID, None if disabled or failed
+        """
+        if not self.durable_handoff_enabled:
+            return None
+
+        try:
+            task_id = await asyncio.create_task(handoff(), context=context)
+        except Exception as e:
+            logger.error(
+                "[TimeoutBackground] Durable handoff of task '%s' failed: %s",
+                task_name,
+                e,
+            )
+            return None
+
+        if task_id:
+            self._stats["total_handed_off"] += 1
+            logger.info(
+                "[TimeoutBackground] Task '%s' handed off to durable task: %s",
+                task_name,
+                task_id,
+            )
+        return task_id
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting new tasks and wait for running tasks to finish
+
+        Tasks still running after the timeout are cancelled; tasks with a durable
+        handoff are enqueued to the durable task queue first so their work is not lost.
+
+        Args:
+            timeout: Maximum wait time in seconds, default uses drain_timeout
+        """
+        self._accepting = False
+        timeout = self.drain_timeout if timeout is None else timeout
+
+        if not self._tasks:
+            return
+
+        logger.info(
+            "[TimeoutBackground] Draining %d running tasks (timeout: %ss)",
+            len(self._tasks),
+            timeout,
+        )
+        _, pending = await asyncio.wait(list(self._tasks), timeout=timeout)
+        if not pending:
+            logger.info("[TimeoutBackground] All running tasks completed")
+            return
+
+        logger.warning(
+            "[TimeoutBackground] %d tasks still running after drain timeout, cancelling",
+            len(pending),
+        )
+        for task in pending:
+            tracked = self._tasks.get(task)
+            task.cancel()
+            if tracked is not None and tracked.handoff is not None:
+                await self.handoff(
+                    tracked.handoff, tracked.task_name, context=tracked.context
+                )
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics"""
+        return {
+            **self._stats,
+            "in_flight": len(self._tasks),
+            "waiting": self._waiting,
+            "max_in_flight": self.max_in_flight,
+            "max_queued": self.max_queued,
+            "accepting": self._accepting,
+        }
+
 
 def is_background_mode_enabled(request: Optional[Request] = None) -> bool:
     """
@@ -73,6 +280,7 @@ def is_background_mode_enabled(request: Optional[Request] = None) -> bool:
 def timeout_to_background(
     timeout: float = DEFAULT_BLOCKING_TIMEOUT,
     accepted_message: str = "Request accepted, processing in background",
+    durable_handoff: Optional[DurableHandoff] = None,
 ) -> Callable[
     [Callable[P, Coroutine[Any, Any, T]]],
     Callable[P, Coroutine[Any, Any, Union[T, JSONResponse]]],
@@ -93,6 +301,10 @@ def timeout_to_background(
     - Background mode is enabled by default (automatically switches to background on timeout)
     - Can disable background mode by passing sync_mode=true in request params (synchronously wait for completion)
 
+    Bounded execution:
+    - Tasks are admitted by BackgroundTaskExecutor, a request that cannot be admitted gets 503
+      (or is handed off to durable_handoff when durable handoff is enabled)
+
     Usage example:
     ```python
     @router.post("/memorize")
@@ -108,13 +320,15 @@ def timeout_to_background(
     Args:
         timeout: Timeout for blocking wait (seconds), default 5s
         accepted_message: Message content for 202 response
+        durable_handoff: Optional async function called with the endpoint's arguments that
+            enqueues the work to the arq TaskManager and returns the task ID
 
     Returns:
         Decorator function
     """
 
     def decorator(
-        func: Callable[P, Coroutine[Any, Any, T]]
+        func: Callable[P, Coroutine[Any, Any, T]],
     ) -> Callable[P, Coroutine[Any, Any, Union[T, JSONResponse]]]:
 
         @wraps(func)
@@ -137,8 +351,41 @@ def timeout_to_background(
                 )
                 return await func(*args, **kwargs)
 
-            # Background mode: create task and set timeout
+            # Background mode: admit the task into the bounded executor
+            executor = get_bean_by_type(BackgroundTaskExecutor)
+            handoff = (
+                (lambda: durable_handoff(*args, **kwargs)) if durable_handoff else None
+            )
+            if not await executor.acquire():
+                task_id = (
+                    await executor.handoff(handoff, task_name) if handoff else None
+                )
+                if task_id:
+                    return JSONResponse(
+                        status_code=202,
+                        content={
+                            "message": accepted_message,
+                            "request_id": request_id,
+                            "task_id": task_id,
+                        },
+                    )
+
+                logger.warning(
+                    "[TimeoutBackground] Task '%s' rejected, background executor is full or draining",
+                    task_name,
+                )
+                return JSONResponse(
+                    status_code=503,
+                    content={
+                        "message": "Server is busy, please retry later",
+                        "request_id": request_id,
+                    },
+                    headers={"Retry-After": str(OVERFLOW_RETRY_AFTER_SECONDS)},
+                )
+
+            # Create task and set timeout
             task = asyncio.create_task(func(*args, **kwargs))
+            executor.track(task, task_name, handoff=handoff)
 
             try:
                 # First block and wait for specified time
@@ -160,6 +407,7 @@ def timeout_to_background(
                 )
 
                 # Create background task to continue execution
+                executor.mark_background()
                 asyncio.create_task(_run_background_task(task, task_name, provider))
 
                 # Return 202 Accepted
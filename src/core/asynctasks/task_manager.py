@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 import uuid
 import importlib
 import pkgutil
@@ -10,7 +12,7 @@ from dataclasses import dataclass, field
 
 from arq import create_pool, ArqRedis
 from arq.connections import RedisSettings
-from arq.jobs import Job
+from arq.jobs import Job, JobResult
 from arq.worker import Worker, Function, func as arq_func
 
 from core.asynctasks.task_scan_registry import TaskScanDirectoriesRegistry
@@ -22,6 +24,102 @@ from core.authorize.enums import Role
 
 logger = get_logger(__name__)
 
+# Redis key prefix of the task index (sorted sets of task ids scored by enqueue time)
+TASK_INDEX_PREFIX = "task_index"
+
+# Sorted set of indexed task ids scored by the time (ms) their index entry expires
+TASK_INDEX_EXPIRY_KEY = f"{TASK_INDEX_PREFIX}:expiry"
+
+# Finished tasks leave the index with their arq result (WorkerSettings.keep_result)
+DEFAULT_KEEP_RESULT_SECONDS = 3600
+
+# Unfinished tasks leave the index with their arq job, which expires one day after enqueue
+DEFAULT_INDEX_RETENTION_SECONDS = 24 * 3600
+
+# Upper bound of expired entries removed per purge
+INDEX_PURGE_BATCH_SIZE = 1000
+
+# Lua script: move an indexed task to the sorted sets of its new status
+# The current status is read from the task entry inside the script, so concurrent moves
+# (e.g. RUNNING on execution start and CANCELLED on abort) leave the task in exactly one
+# status set. Key layout matches TaskManager._task_index_key.
+# KEYS[1]: task entry hash, KEYS[2]: expiry set
+# ARGV: task_id, new status, index prefix, expiry (ms) of a finished task or '' while
+# unfinished, retention (ms) of an unfinished task counted from enqueue
+# Returns 1 when the task was moved, 0 when it is not indexed or already has the status
+TASK_INDEX_MOVE_SCRIPT = """
+    local meta_key = KEYS[1]
+    local expiry_key = KEYS[2]
+    local task_id = ARGV[1]
+    local new_status = ARGV[2]
+    local prefix = ARGV[3]
+
+    local meta = redis.call('HMGET', meta_key, 'status', 'user_id', 'score')
+    local old_status, user_id, score = meta[1], meta[2], meta[3]
+    if not old_status or not score or old_status == new_status then
+        return 0
+    end
+
+    redis.call('ZREM', prefix .. ':status:' .. old_status, task_id)
+    redis.call('ZADD', prefix .. ':status:' .. new_status, score, task_id)
+    if user_id and user_id ~= '' then
+        local user_prefix = prefix .. ':user:' .. user_id .. ':status:'
+        redis.call('ZREM', user_prefix .. old_status, task_id)
+        redis.call('ZADD', user_prefix .. new_status, score, task_id)
+    end
+    redis.call('HSET', meta_key, 'status', new_status)
+
+    if ARGV[4] ~= '' then
+        redis.call('ZADD', expiry_key, ARGV[4], task_id)
+    else
+        redis.call('ZADD', expiry_key, tonumber(score) + tonumber(ARGV[5]), task_id)
+    end
+    return 1
+"""
+
+# Lua script: remove index entries whose expiry has passed from every sorted set
+# KEYS[1]: expiry set; ARGV: now (ms), index prefix, batch size, every status value
+# Returns the number of removed entries
+TASK_INDEX_PURGE_SCRIPT = """
+    local expiry_key = KEYS[1]
+    local prefix = ARGV[2]
+    local expired = redis.call(
+        'ZRANGEBYSCORE', expiry_key, '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3])
+    )
+
+    for _, task_id in ipairs(expired) do
+        local meta_key = prefix .. ':task:' .. task_id
+        local meta = redis.call('HMGET', meta_key, 'status', 'user_id')
+        local user_id = meta[2]
+        if user_id == '' then
+            user_id = false
+        end
+        -- Without an entry the status is unknown: remove from every status set
+        local statuses = {}
+        if meta[1] then
+            statuses = {meta[1]}
+        else
+            for i = 4, #ARGV do
+                table.insert(statuses, ARGV[i])
+            end
+        end
+
+        redis.call('ZREM', prefix .. ':all', task_id)
+        if user_id then
+            redis.call('ZREM', prefix .. ':user:' .. user_id, task_id)
+        end
+        for _, status in ipairs(statuses) do
+            redis.call('ZREM', prefix .. ':status:' .. status, task_id)
+            if user_id then
+                redis.call('ZREM', prefix .. ':user:' .. user_id .. ':status:' .. status, task_id)
+            end
+        end
+        redis.call('DEL', meta_key)
+        redis.call('ZREM', expiry_key, task_id)
+    end
+    return #expired
+"""
+
 
 class TaskStatus(Enum):
     """Task status enumeration"""
@@ -91,11 +189,22 @@ class TaskManager:
 
     Implements asynchronous task management based on the arq framework, providing functions such as task addition, result retrieval, and task deletion.
     Uses ContextManager to automatically inject database sessions and user context.
+
+    Tasks are indexed in Redis sorted sets scored by enqueue time, one per status, per user
+    and per user and status, so listing and counting are paginated O(log N) reads instead of
+    a KEYS scan. The index is updated on enqueue, on execution start/end, on cancellation and
+    on deletion. Every entry has an expiry matching its arq data: a finished task leaves the
+    index when its result expires (keep_result), an unfinished one when its job would expire.
+    Expired entries are purged before every read, so counts and listings agree. Reads also
+    correct entries whose arq status has moved on (e.g. worker killed) and drop entries
+    whose job is gone.
     """
 
     def __init__(self, context_manager: ContextManager):
         """Initialize task manager"""
         self._pool: Optional[ArqRedis] = None
+        self._index_move_script = None
+        self._index_purge_script = None
         self._worker: Optional[Worker] = None
         self._redis_settings = self._get_redis_settings()
         self._context_manager = context_manager
@@ -106,8 +215,24 @@ class TaskManager:
         # Default retry configuration
         self._default_retry_config = RetryConfig()
 
+        # arq keeps results this long, finished tasks leave the index with them
+        self._keep_result_seconds = int(
+            os.getenv("TASK_KEEP_RESULT_SECONDS", str(DEFAULT_KEEP_RESULT_SECONDS))
+        )
+        # Unfinished tasks leave the index this long after enqueue
+        self._index_retention_seconds = int(
+            os.getenv(
+                "TASK_INDEX_RETENTION_SECONDS", str(DEFAULT_INDEX_RETENTION_SECONDS)
+            )
+        )
+
         logger.info("Task manager initialization completed")
 
+    @property
+    def keep_result_seconds(self) -> int:
+        """How long arq workers keep task results (WorkerSettings.keep_result)"""
+        return self._keep_result_seconds
+
     def _get_current_user_info(self) -> Optional[Dict[str, Any]]:
         """Get current user information"""
         return get_current_user_info()
@@ -149,6 +274,8 @@ class TaskManager:
         if self._pool is not None:
             await self._pool.close()
             self._pool = None
+            self._index_move_script = None
+            self._index_purge_script = None
         logger.info("Task manager connection closed")
 
     def register_task(self, task_function: TaskFunction) -> None:
@@ -341,6 +468,13 @@ class TaskManager:
         )
 
         user_id_for_log = user_data.get("user_id") if user_data else "unknown"
+        if job is not None:
+            # arq returns None when a job with this id already exists
+            await self._index_task(
+                task_id,
+                TaskStatus.PENDING,
+                user_data.get("user_id") if user_data else None,
+            )
         logger.info(
             f"Task added to queue: {task_id}, task name: {task_name}, user: {user_id_for_log}"
         )
@@ -379,19 +513,30 @@ class TaskManager:
             set_current_app_info(app_info)
             logger.debug(f"🔧 app_info_context restored: {app_info}")
 
-        # Use ContextManager to execute task, automatically injecting user context and database session
-        # 🔧 Configurable session isolation: Only force new session when explicitly needed
-        result = await self._context_manager.run_with_full_context(
-            task_func,
-            *args,
-            user_data=user_data,
-            auto_inherit_user=False,
-            auto_commit=True,
-            force_new_session=force_new_session,  # 🔑 Key: Configurable session isolation
-            **kwargs,
-        )
-
         task_id = task_context.get("task_id")
+        await self._update_task_index_status(task_id, TaskStatus.RUNNING)
+
+        try:
+            # Use ContextManager to execute task, automatically injecting user context and database session
+            # 🔧 Configurable session isolation: Only force new session when explicitly needed
+            result = await self._context_manager.run_with_full_context(
+                task_func,
+                *args,
+                user_data=user_data,
+                auto_inherit_user=False,
+                auto_commit=True,
+                force_new_session=force_new_session,  # 🔑 Key: Configurable session isolation
+                **kwargs,
+            )
+        except asyncio.CancelledError:
+            # Aborted, or timed out and possibly retried by arq: reconciled on read
+            await self._update_task_index_status(task_id, TaskStatus.CANCELLED)
+            raise
+        except Exception:
+            await self._update_task_index_status(task_id, TaskStatus.FAILED)
+            raise
+
+        await self._update_task_index_status(task_id, TaskStatus.SUCCESS)
         user_id = user_data.get("user_id") if user_data else "unknown"
         logger.info(
             f"Task execution completed (independent session): {task_id}, user: {user_id}"
@@ -405,6 +550,23 @@ class TaskManager:
         Args:
             task_id: Task ID
 
+        Returns:
+            Optional[TaskResult]: Task result, returns None if task does not exist
+        """
+        pool = await self._get_pool()
+        meta = self._decode_hash(await pool.hgetall(self._task_meta_key(task_id)))
+        return await self._load_task_result(task_id, meta)
+
+    async def _load_task_result(
+        self, task_id: str, meta: Dict[str, str]
+    ) -> Optional[TaskResult]:
+        """
+        Build the task result from arq job information and the task index entry
+
+        Args:
+            task_id: Task ID
+            meta: Task index entry (status, user_id, score), empty if not indexed
+
         Returns:
             Optional[TaskResult]: Task result, returns None if task does not exist
         """
@@ -419,23 +581,34 @@ class TaskManager:
                 return None
 
             # Construct task result
-            status = self._map_arq_status_to_task_status(info.job_status)
+            if isinstance(info, JobResult):
+                if info.success:
+                    status = TaskStatus.SUCCESS
+                elif isinstance(info.result, asyncio.CancelledError):
+                    status = TaskStatus.CANCELLED
+                else:
+                    status = TaskStatus.FAILED
+            else:
+                status = self._map_arq_status_to_task_status((await job.status()).value)
 
-            # Try to get user information from task context (this may not be available as arq does not save our custom context)
-            user_id = None
-            user_context_data = None
+            # arq does not save our custom context, the user comes from the task index
+            user_id = self._parse_user_id(meta.get("user_id"))
 
             result = TaskResult(
                 task_id=task_id,
                 status=status,
                 result=info.result if status == TaskStatus.SUCCESS else None,
-                error=str(info.result) if status == TaskStatus.FAILED else None,
+                error=(
+                    str(info.result)
+                    if status in (TaskStatus.FAILED, TaskStatus.CANCELLED)
+                    else None
+                ),
                 created_at=info.enqueue_time,
-                started_at=info.start_time,
-                finished_at=info.finish_time,
+                started_at=getattr(info, "start_time", None),
+                finished_at=getattr(info, "finish_time", None),
                 retry_count=info.job_try or 0,
                 user_id=user_id,
-                user_context=user_context_data,
+                user_context=None,
             )
 
             return result
@@ -479,6 +652,7 @@ class TaskManager:
         try:
             job = Job(task_id, pool)
             await job.abort()
+            await self._update_task_index_status(task_id, TaskStatus.CANCELLED)
             logger.info(f"Task cancelled: {task_id}")
             return True
         except Exception as e:
@@ -500,6 +674,7 @@ class TaskManager:
         try:
             # Delete task record
             await pool.delete(f"arq:job:{task_id}")
+            await self._remove_from_task_index(task_id)
             logger.info(f"Task deleted: {task_id}")
             return True
         except Exception as e:
@@ -511,43 +686,63 @@ class TaskManager:
         status: Optional[TaskStatus] = None,
         user_id: Optional[int] = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> List[TaskResult]:
         """
-        List tasks
+        List tasks, newest first
 
-        Note: Due to arq limitations, filtering tasks by user ID is not effective.
-        This method returns all tasks and filters at the application layer.
-        In production environments, it is recommended to use a dedicated task status storage system.
+        Reads one page of the task index, then loads the page's job information concurrently.
+        Entries whose job has expired are removed from the index, and entries whose arq
+        status no longer matches the index are corrected and left out of a status-filtered
+        page, so a page may hold fewer than `limit` tasks.
 
         Args:
             status: Task status filter (optional)
-            user_id: User ID filter (optional, may be ineffective due to arq limitations)
+            user_id: User ID filter (optional)
             limit: Limit on number of returned items
+            offset: Number of index entries to skip
 
         Returns:
             List[TaskResult]: List of tasks
         """
+        if limit <= 0:
+            return []
         pool = await self._get_pool()
 
         try:
-            # Get all task keys
-            keys = await pool.keys("arq:job:*")
-            tasks = []
-
-            for key in keys[:limit]:
-                task_id = key.decode().split(":")[-1]
-                task_result = await self.get_task_result(task_id)
-
-                if task_result is not None:
-                    # Apply filter conditions
-                    if status is not None and task_result.status != status:
-                        continue
-
-                    # Note: Due to arq limitations, user_id filtering may not be accurate
-                    if user_id is not None and task_result.user_id != user_id:
-                        continue
+            await self._purge_expired_index_entries()
+            index_key = self._task_index_key(status=status, user_id=user_id)
+            task_ids = [
+                self._decode(member)
+                for member in await pool.zrevrange(
+                    index_key, offset, offset + limit - 1
+                )
+            ]
+            if not task_ids:
+                return []
+
+            async with pool.pipeline(transaction=False) as pipe:
+                for task_id in task_ids:
+                    pipe.hgetall(self._task_meta_key(task_id))
+                metas = [self._decode_hash(meta) for meta in await pipe.execute()]
+
+            results = await asyncio.gather(
+                *(
+                    self._load_task_result(task_id, meta)
+                    for task_id, meta in zip(task_ids, metas)
+                )
+            )
 
-                    tasks.append(task_result)
+            tasks = []
+            for task_id, meta, task_result in zip(task_ids, metas, results):
+                if task_result is None:
+                    await self._remove_from_task_index(task_id, meta)
+                    continue
+                if meta and meta.get("status") != task_result.status.value:
+                    await self._update_task_index_status(task_id, task_result.status)
+                if status is not None and task_result.status != status:
+                    continue
+                tasks.append(task_result)
 
             return tasks
 
@@ -555,18 +750,224 @@ class TaskManager:
             logger.error(f"Failed to list tasks: {str(e)}")
             return []
 
-    async def get_task_count(self, status: Optional[TaskStatus] = None) -> int:
+    async def get_task_count(
+        self, status: Optional[TaskStatus] = None, user_id: Optional[int] = None
+    ) -> int:
         """
-        Get task count
+        Get task count from the task index
+
+        Expired index entries are purged first, the count is a ZCARD.
 
         Args:
             status: Task status filter (optional)
+            user_id: User ID filter (optional)
 
         Returns:
             int: Number of tasks
         """
-        tasks = await self.list_tasks(status=status)
-        return len(tasks)
+        pool = await self._get_pool()
+
+        try:
+            await self._purge_expired_index_entries()
+            return await pool.zcard(
+                self._task_index_key(status=status, user_id=user_id)
+            )
+        except Exception as e:
+            logger.error(f"Failed to count tasks: {str(e)}")
+            return 0
+
+    # ========== Task index ==========
+
+    @staticmethod
+    def _task_meta_key(task_id: str) -> str:
+        return f"{TASK_INDEX_PREFIX}:task:{task_id}"
+
+    @staticmethod
+    def _task_index_key(
+        status: Optional[TaskStatus] = None, user_id: Optional[Any] = None
+    ) -> str:
+        """Sorted set answering a status/user filter combination"""
+        key = TASK_INDEX_PREFIX
+        if user_id is not None:
+            key += f":user:{user_id}"
+        if status is not None:
+            key += f":status:{status.value}"
+        return key if key != TASK_INDEX_PREFIX else f"{TASK_INDEX_PREFIX}:all"
+
+    def _task_index_keys(self, status: TaskStatus, user_id: Optional[Any]) -> List[str]:
+        """All sorted sets a task with this status and user belongs to"""
+        keys = [self._task_index_key(), self._task_index_key(status=status)]
+        if user_id is not None:
+            keys.append(self._task_index_key(user_id=user_id))
+            keys.append(self._task_index_key(status=status, user_id=user_id))
+        return keys
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    def _decode_hash(self, value: Optional[Dict[Any, Any]]) -> Dict[str, str]:
+        return {self._decode(k): self._decode(v) for k, v in (value or {}).items()}
+
+    @staticmethod
+    def _parse_user_id(value: Optional[str]) -> Optional[Any]:
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return value
+
+    async def _index_task(
+        self, task_id: str, status: TaskStatus, user_id: Optional[Any]
+    ) -> None:
+        """
+        Add a newly enqueued task to the index
+
+        Index failures are logged and never fail the enqueue.
+
+        Args:
+            task_id: Task ID
+            status: Initial status
+            user_id: User ID (optional)
+        """
+        try:
+            pool = await self._get_pool()
+            score = time.time() * 1000
+            meta_key = self._task_meta_key(task_id)
+
+            async with pool.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    meta_key,
+                    mapping={
+                        "status": status.value,
+                        "user_id": "" if user_id is None else str(user_id),
+                        "score": str(score),
+                    },
+                )
+                # Outlives the index entry, the purge needs it to find the sets
+                pipe.expire(
+                    meta_key, self._index_retention_seconds + self._keep_result_seconds
+                )
+                for key in self._task_index_keys(status, user_id):
+                    pipe.zadd(key, {task_id: score})
+                pipe.zadd(
+                    TASK_INDEX_EXPIRY_KEY,
+                    {task_id: score + self._index_retention_seconds * 1000},
+                )
+                await pipe.execute()
+            await self._purge_expired_index_entries()
+        except Exception as e:
+            logger.warning(f"Failed to index task: {task_id}, error: {str(e)}")
+
+    async def _update_task_index_status(
+        self, task_id: Optional[str], status: TaskStatus
+    ) -> None:
+        """
+        Move an indexed task to the sorted sets of its new status
+
+        The read of the current status and the move run in one Lua script.
+        Tasks that are not indexed (expired, or enqueued before the index existed) are ignored.
+
+        Args:
+            task_id: Task ID
+            status: New status
+        """
+        if not task_id:
+            return
+        try:
+            pool = await self._get_pool()
+            if self._index_move_script is None:
+                self._index_move_script = pool.register_script(TASK_INDEX_MOVE_SCRIPT)
+            finished = status in (
+                TaskStatus.SUCCESS,
+                TaskStatus.FAILED,
+                TaskStatus.CANCELLED,
+            )
+            expire_at = (
+                time.time() * 1000 + self._keep_result_seconds * 1000
+                if finished
+                else ""
+            )
+            await self._index_move_script(
+                keys=[self._task_meta_key(task_id), TASK_INDEX_EXPIRY_KEY],
+                args=[
+                    task_id,
+                    status.value,
+                    TASK_INDEX_PREFIX,
+                    expire_at,
+                    self._index_retention_seconds * 1000,
+                ],
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to update task index: {task_id}, status: {status.value}, error: {str(e)}"
+            )
+
+    async def _remove_from_task_index(
+        self, task_id: str, meta: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Remove a task from the index
+
+        Args:
+            task_id: Task ID
+            meta: Task index entry, read from Redis if not provided
+        """
+        try:
+            pool = await self._get_pool()
+            meta_key = self._task_meta_key(task_id)
+            if meta is None:
+                meta = self._decode_hash(await pool.hgetall(meta_key))
+
+            async with pool.pipeline(transaction=True) as pipe:
+                # Without an entry the status is unknown: remove from every status set
+                statuses = [TaskStatus(meta["status"])] if meta else list(TaskStatus)
+                user_id = (meta.get("user_id") or None) if meta else None
+                keys = {self._task_index_key()}
+                for status in statuses:
+                    keys.update(self._task_index_keys(status, user_id))
+                for key in keys:
+                    pipe.zrem(key, task_id)
+                pipe.zrem(TASK_INDEX_EXPIRY_KEY, task_id)
+                pipe.delete(meta_key)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                f"Failed to remove task from index: {task_id}, error: {str(e)}"
+            )
+
+    async def _purge_expired_index_entries(self) -> int:
+        """
+        Remove index entries whose expiry has passed
+
+        Runs in one Lua script and removes at most INDEX_PURGE_BATCH_SIZE entries per call.
+        Failures are logged, reads then see the unpurged index.
+
+        Returns:
+            int: Number of removed entries
+        """
+        try:
+            pool = await self._get_pool()
+            if self._index_purge_script is None:
+                self._index_purge_script = pool.register_script(TASK_INDEX_PURGE_SCRIPT)
+            removed = int(
+                await self._index_purge_script(
+                    keys=[TASK_INDEX_EXPIRY_KEY],
+                    args=[
+                        time.time() * 1000,
+                        TASK_INDEX_PREFIX,
+                        INDEX_PURGE_BATCH_SIZE,
+                        *(status.value for status in TaskStatus),
+                    ],
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to purge expired task index entries: {str(e)}")
+            return 0
+        if removed:
+            logger.debug(f"🧹 Purged {removed} expired task index entries")
+        return removed
 
     def get_worker_functions(self) -> List[Function]:
         """
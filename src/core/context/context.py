@@ -1,5 +1,5 @@
 from contextvars import ContextVar, Token
-from typing import Optional, Dict, Any, TypedDict, TYPE_CHECKING
+from typing import Callable, Optional, Dict, Any, TypedDict, TYPE_CHECKING, Union
 from sqlmodel.ext.asyncio.session import AsyncSession
 import logging
 
@@ -9,8 +9,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class LazySession:
+    """
+    Database session created on first access
+
+    DatabaseSessionMiddleware stores one per request, so requests that never touch the
+    database do not create a session.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        self._factory = factory
+        self.session: Optional[AsyncSession] = None
+
+    @property
+    def created(self) -> bool:
+        """Whether the session has been created"""
+        return self.session is not None
+
+    def get(self) -> AsyncSession:
+        """Return the session, creating it on first call"""
+        if self.session is None:
+            self.session = self._factory()
+        return self.session
+
+
 # Create a ContextVar to store the current request's database session
-db_session_context: ContextVar[Optional[AsyncSession]] = ContextVar(
+db_session_context: ContextVar[Optional[Union[AsyncSession, LazySession]]] = ContextVar(
     "db_session_context", default=None
 )
 
@@ -46,15 +70,17 @@ def get_current_session() -> AsyncSession:
         raise RuntimeError(
             "Database session is not set in the current context. Ensure the session is properly initialized in the request middleware."
         )
+    if isinstance(session, LazySession):
+        return session.get()
     return session
 
 
-def set_current_session(session: AsyncSession) -> Token:
+def set_current_session(session: Union[AsyncSession, LazySession]) -> Token:
     """
     Set the database session for the current request
 
     Args:
-        session: The database session to set
+        session: The database session to set, or a LazySession creating it on first access
     """
     return db_session_context.set(session)
 
@@ -6,10 +6,13 @@ Lock usage strategy:
 - Read-only operations (e.g., is_mock_mode, contains_bean*): no lock, because reading immutable attributes
 - Operations modifying container state: protected by self._lock
 - Bean retrieval operations: require lock, because they may create and cache singleton instances
+- Resolved singleton lookups: no lock, served from an immutable snapshot that is only replaced
+  (copy-on-write) under the lock, and reset whenever registrations or mock mode change
 - Global container creation: use _container_lock to ensure singleton
 """
 
 import inspect
+import importlib
 import abc
 from typing import (
     Dict,
@@ -84,6 +87,20 @@ class DIContainer:
         # Cache invalidation flag
         self._cache_dirty = False
 
+        # Lock-free lookup snapshots of resolved singletons, never mutated after publication
+        # {bean_type: instance}
+        self._type_snapshot: Dict[Type, Any] = {}
+        # {bean_name: instance}
+        self._name_snapshot: Dict[str, Any] = {}
+        # {bean_type: (instance, ...)}
+        self._beans_snapshot: Dict[Type, tuple] = {}
+
+        # Modules registered from the scan manifest but not imported yet
+        # {bean_name: module_name}
+        self._lazy_modules_by_name: Dict[str, str] = {}
+        # {type_qualifier: frozenset(module_name)}
+        self._lazy_modules_by_qualifier: Dict[str, frozenset] = {}
+
     def enable_mock_mode(self):
         """Enable mock mode"""
         with self._lock:
@@ -262,29 +279,122 @@ class DIContainer:
 
             return self
 
+    def register_lazy_module(
+        self, module_name: str, bean_names: List[str], qualifiers: List[str]
+    ) -> 'DIContainer':
+        """
+        Register a module whose Beans are registered on first lookup
+
+        The module is imported (which registers its Beans through the decorators) the
+        first time a Bean is requested by one of its names or by a type whose qualifier
+        ("module.QualName" of the Bean type or any of its base classes) it provides.
+
+        Args:
+            module_name: Module to import
+            bean_names: Names of the Beans registered by the module
+            qualifiers: Type qualifiers of the Beans registered by the module
+        """
+        with self._lock:
+            lazy_modules_by_name = dict(self._lazy_modules_by_name)
+            for bean_name in bean_names:
+                lazy_modules_by_name[bean_name] = module_name
+            lazy_modules_by_qualifier = dict(self._lazy_modules_by_qualifier)
+            for qualifier in qualifiers:
+                lazy_modules_by_qualifier[qualifier] = lazy_modules_by_qualifier.get(
+                    qualifier, frozenset()
+                ) | {module_name}
+            self._lazy_modules_by_name = lazy_modules_by_name
+            self._lazy_modules_by_qualifier = lazy_modules_by_qualifier
+            self._invalidate_cache()
+            return self
+
+    def _load_lazy_modules(self, module_names: Set[str]):
+        """Import lazy modules, their Beans register themselves"""
+        with self._lock:
+            # Replace the indexes instead of mutating them, they are read without lock
+            self._lazy_modules_by_name = {
+                bean_name: name
+                for bean_name, name in self._lazy_modules_by_name.items()
+                if name not in module_names
+            }
+            lazy_modules_by_qualifier = {}
+            for qualifier, names in self._lazy_modules_by_qualifier.items():
+                remaining = names - module_names
+                if remaining:
+                    lazy_modules_by_qualifier[qualifier] = remaining
+            self._lazy_modules_by_qualifier = lazy_modules_by_qualifier
+
+        # Import outside the container lock to avoid lock-order inversion with the import lock
+        for module_name in sorted(module_names):
+            importlib.import_module(module_name)
+
+    def _load_lazy_modules_for_name(self, bean_name: str):
+        """Import the lazy module providing the named Bean"""
+        module_name = self._lazy_modules_by_name.get(bean_name)
+        if module_name:
+            self._load_lazy_modules({module_name})
+
+    def _load_lazy_modules_for_type(self, bean_type: Type):
+        """Import all lazy modules providing implementations of the type"""
+        if not self._lazy_modules_by_qualifier:
+            return
+        qualifier = f"{bean_type.__module__}.{getattr(bean_type, '__qualname__', '')}"
+        module_names = self._lazy_modules_by_qualifier.get(qualifier)
+        if module_names:
+            self._load_lazy_modules(set(module_names))
+
+    def _load_all_lazy_modules(self):
+        """Import all lazy modules"""
+        module_names = set(self._lazy_modules_by_name.values())
+        for names in self._lazy_modules_by_qualifier.values():
+            module_names.update(names)
+        if module_names:
+            self._load_lazy_modules(module_names)
+
     def get_bean(self, bean_name: str) -> Any:
         """Get Bean by name"""
+        # Fast path: lock-free snapshot read
+        snapshot = self._name_snapshot
+        if bean_name in snapshot:
+            return snapshot[bean_name]
+        self._load_lazy_modules_for_name(bean_name)
+        return self._resolve_bean(bean_name)
+
+    def _resolve_bean(self, bean_name: str) -> Any:
+        """Resolve Bean by name under lock and publish singletons to the snapshot"""
         with self._lock:
             if bean_name not in self._named_beans:
                 raise BeanNotFoundError(bean_name=bean_name)
 
             bean_def = self._named_beans[bean_name]
-            return self._create_instance(bean_def)
+            instance = self._create_instance(bean_def)
+            if bean_def.scope == BeanScope.SINGLETON:
+                self._name_snapshot = {**self._name_snapshot, bean_name: instance}
+            return instance
 
     def get_bean_by_type(self, bean_type: Type[T]) -> T:
         """Get Bean by type (return Primary or unique implementation)"""
+        # Fast path: lock-free snapshot read
+        snapshot = self._type_snapshot
+        if bean_type in snapshot:
+            return snapshot[bean_type]
+        self._load_lazy_modules_for_type(bean_type)
+        return self._resolve_bean_by_type(bean_type)
+
+    def _resolve_bean_by_type(self, bean_type: Type[T]) -> T:
+        """Resolve Bean by type under lock and publish singletons to the snapshot"""
         with self._lock:
             candidates = self._get_candidates_with_priority(bean_type)
 
             if not candidates:
                 raise BeanNotFoundError(bean_type=bean_type)
 
-            # If only one candidate, return it
-            if len(candidates) == 1:
-                return self._create_instance(candidates[0])
-
-            # Multiple candidates, return the highest priority one
-            return self._create_instance(candidates[0])
+            # Return the highest priority candidate (the only one if unique)
+            bean_def = candidates[0]
+            instance = self._create_instance(bean_def)
+            if bean_def.scope == BeanScope.SINGLETON:
+                self._type_snapshot = {**self._type_snapshot, bean_type: instance}
+            return instance
 
     def _get_candidates_with_priority(self, bean_type: Type) -> List[BeanDefinition]:
         """
@@ -339,12 +449,28 @@ class DIContainer:
 
     def get_beans_by_type(self, bean_type: Type[T]) -> List[T]:
         """Get all Bean implementations by type"""
+        # Fast path: lock-free snapshot read
+        snapshot = self._beans_snapshot
+        if bean_type in snapshot:
+            return list(snapshot[bean_type])
+        self._load_lazy_modules_for_type(bean_type)
+        return self._resolve_beans_by_type(bean_type)
+
+    def _resolve_beans_by_type(self, bean_type: Type[T]) -> List[T]:
+        """Resolve all Beans by type under lock and publish them if all are singletons"""
         with self._lock:
             candidates = self._get_candidates_with_priority(bean_type)
-            return [self._create_instance(bean_def) for bean_def in candidates]
+            instances = [self._create_instance(bean_def) for bean_def in candidates]
+            if all(bean_def.scope == BeanScope.SINGLETON for bean_def in candidates):
+                self._beans_snapshot = {
+                    **self._beans_snapshot,
+                    bean_type: tuple(instances),
+                }
+            return instances
 
     def get_beans(self) -> Dict[str, Any]:
         """Get all registered Beans"""
+        self._load_all_lazy_modules()
         with self._lock:
             result = {}
             for name, bean_def in self._named_beans.items():
@@ -358,10 +484,12 @@ class DIContainer:
 
     def contains_bean(self, bean_name: str) -> bool:
         """Check if container contains Bean with specified name"""
-        return bean_name in self._named_beans
+        return bean_name in self._named_beans or bean_name in self._lazy_modules_by_name
 
     def contains_bean_by_type(self, bean_type: Type) -> bool:
         """Check if container contains Bean with specified type"""
+        if bean_type not in self._bean_definitions:
+            self._load_lazy_modules_for_type(bean_type)
         return bean_type in self._bean_definitions
 
     def clear(self):
@@ -371,6 +499,8 @@ class DIContainer:
             self._named_beans.clear()
             self._singleton_instances.clear()
             self._resolving_stack.clear()
+            self._lazy_modules_by_name = {}
+            self._lazy_modules_by_qualifier = {}
             self._invalidate_cache()
 
     def list_all_beans_info(self) -> List[Dict[str, Any]]:
@@ -386,6 +516,7 @@ class DIContainer:
             - is_mock: Whether it is a Mock Bean
         """
         beans_info = []
+        self._load_all_lazy_modules()
 
         # Collect all Bean information
         for name, bean_def in self._named_beans.items():
@@ -407,6 +538,10 @@ class DIContainer:
         self._inheritance_cache.clear()
         self._candidates_cache.clear()
         self._cache_dirty = True
+        # Swap in empty snapshots, readers holding the old ones are unaffected
+        self._type_snapshot = {}
+        self._name_snapshot = {}
+        self._beans_snapshot = {}
 
     def _is_bean_available(self, bean_def: BeanDefinition) -> bool:
         """Check if Bean is available in current mode"""
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Component scan manifest
+
+Records, for every scanned module, the Beans it registers and the type qualifiers
+(qualified names of the Bean type and its base classes) they can be looked up by,
+keyed by the content hashes of all scanned files.
+
+On later boots ComponentScanner imports only eager modules (modules without Beans, or
+defining non-Bean subclasses of project classes such as documents discovered via
+get_all_subclasses) and registers the rest with the container as lazy modules, which
+are imported on the first lookup that may need them. Any change to the scanned files
+or the scanner configuration makes the manifest stale and triggers a full scan.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from core.di.bean_definition import BeanDefinition, BeanScope
+
+MANIFEST_VERSION = 1
+
+# Generic base classes that never serve as lookup qualifiers
+_IGNORED_QUALIFIERS = {"builtins.object", "abc.ABC", "typing.Generic"}
+
+
+def type_qualifier(cls: type) -> str:
+    """Stable string identifier of a type, used as lookup qualifier"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def bean_qualifiers(bean_def: BeanDefinition) -> List[str]:
+    """Qualifiers a Bean can be looked up by: its type and all base classes"""
+    try:
+        mro = bean_def.bean_type.__mro__
+    except AttributeError:
+        mro = (bean_def.bean_type,)
+    qualifiers = []
+    for cls in mro:
+        qualifier = type_qualifier(cls)
+        if qualifier not in _IGNORED_QUALIFIERS:
+            qualifiers.append(qualifier)
+    return qualifiers
+
+
+def bean_module(bean_def: BeanDefinition) -> str:
+    """Module whose import registers the Bean (factory function module for factories)"""
+    if bean_def.scope == BeanScope.FACTORY and bean_def.factory_method is not None:
+        return getattr(bean_def.factory_method, "__module__", "")
+    return getattr(bean_def.bean_type, "__module__", "")
+
+
+def hash_file(file_path: Path) -> str:
+    """Content hash of a scanned file"""
+    return hashlib.sha1(file_path.read_bytes()).hexdigest()
+
+
+class ScanManifest:
+    """Component scan manifest"""
+
+    def __init__(
+        self, signature: str, files: Dict[str, str], modules: Dict[str, Dict[str, Any]]
+    ):
+        """
+        Initialize scan manifest
+
+        Args:
+            signature: Hash of scanner configuration and Python version
+            files: Content hash of each scanned file {file_path: sha1}
+            modules: Scan result of each module
+                {module_name: {"eager": bool, "beans": [bean_name], "qualifiers": [qualifier]}}
+        """
+        self.signature = signature
+        self.files = files
+        self.modules = modules
+
+    @staticmethod
+    def compute_signature(config: Iterable[Any]) -> str:
+        """Hash scanner configuration together with the Python version"""
+        payload = json.dumps(
+            [list(sys.version_info[:2]), *config], sort_keys=True, default=str
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def hash_files(python_files: Iterable[Path]) -> Dict[str, str]:
+        """Content hash of each file"""
+        return {
+            str(file_path.resolve()): hash_file(file_path) for file_path in python_files
+        }
+
+    def is_fresh(self, signature: str, files: Dict[str, str]) -> bool:
+        """Whether the manifest matches the current configuration and file contents"""
+        return self.signature == signature and self.files == files
+
+    def eager_modules(self) -> List[str]:
+        """Modules that must be imported at boot"""
+        return [name for name, info in self.modules.items() if info["eager"]]
+
+    def lazy_modules(self) -> Dict[str, Dict[str, Any]]:
+        """Modules that can be imported on first lookup"""
+        return {name: info for name, info in self.modules.items() if not info["eager"]}
+
+    @classmethod
+    def build(
+        cls,
+        signature: str,
+        files: Dict[str, str],
+        scanned_modules: Set[str],
+        beans_by_module: Dict[str, List[BeanDefinition]],
+        project_packages: Set[str],
+    ) -> 'ScanManifest':
+        """
+        Build manifest from a full scan
+
+        Args:
+            signature: Hash of scanner configuration
+            files: Content hash of each scanned file
+            scanned_modules: Names of all scanned modules
+            beans_by_module: Beans registered by each scanned module
+            project_packages: Top-level packages of the project, used to detect non-Bean
+                subclasses of project classes whose import must not be deferred
+
+        Returns:
+            ScanManifest: Manifest instance
+        """
+        modules: Dict[str, Dict[str, Any]] = {}
+        for module_name in sorted(scanned_modules):
+            bean_defs = beans_by_module.get(module_name, [])
+            qualifiers: List[str] = []
+            for bean_def in bean_defs:
+                for qualifier in bean_qualifiers(bean_def):
+                    if qualifier not in qualifiers:
+                        qualifiers.append(qualifier)
+
+            eager = not bean_defs or cls._defines_non_bean_subclasses(
+                module_name,
+                {bean_def.bean_type for bean_def in bean_defs},
+                project_packages,
+            )
+            modules[module_name] = {
+                "eager": eager,
+                "beans": [bean_def.bean_name for bean_def in bean_defs],
+                "qualifiers": qualifiers,
+            }
+        return cls(signature, files, modules)
+
+    @staticmethod
+    def _defines_non_bean_subclasses(
+        module_name: str, bean_types: Set[type], project_packages: Set[str]
+    ) -> bool:
+        """Whether the module defines classes derived from project classes that are not Beans"""
+        module = sys.modules.get(module_name)
+        if module is None:
+            return True
+
+        for value in vars(module).values():
+            if (
+                not isinstance(value, type)
+                or value.__module__ != module_name
+                or value in bean_types
+            ):
+                continue
+            for base in value.__mro__[1:]:
+                if base.__module__.split(".")[0] in project_packages:
+                    return True
+        return False
+
+    @classmethod
+    def load(cls, path: str) -> Optional['ScanManifest']:
+        """Load manifest, returns None when missing, unreadable or of another version"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        try:
+            return cls(data["signature"], data["files"], data["modules"])
+        except KeyError:
+            return None
+
+    def save(self, path: str) -> None:
+        """Write manifest atomically"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "signature": self.signature,
+                    "files": self.files,
+                    "modules": self.modules,
+                },
+                f,
+                ensure_ascii=False,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, path)
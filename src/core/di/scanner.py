@@ -5,6 +5,7 @@ Component Scanner
 
 import os
 import sys
+import time
 import importlib
 from pathlib import Path
 from typing import List, Set, Optional, Dict, Any
@@ -12,7 +13,10 @@ import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from core.observation.logger import get_logger
+from core.di.bean_definition import BeanDefinition
+from core.di.container import get_container
 from core.di.scan_context import ScanContextRegistry, get_scan_context_registry
+from core.di.scan_manifest import ScanManifest, bean_module
 
 
 class ComponentScanner:
@@ -35,6 +39,8 @@ class ComponentScanner:
         # self.parallel = True if os.getenv("ENV") == 'dev' else False
         self.parallel = False
         self.max_workers = 8
+        # Scan manifest file, enables importing only eager modules at boot (None disables)
+        self.manifest_path: Optional[str] = os.getenv("DI_SCAN_MANIFEST_PATH") or None
 
         # Create a dedicated logger
         self.logger = get_logger(__name__)
@@ -108,6 +114,11 @@ class ComponentScanner:
         self.max_workers = max_workers
         return self
 
+    def set_manifest_path(self, manifest_path: Optional[str]) -> 'ComponentScanner':
+        """Set scan manifest file path, None disables the manifest"""
+        self.manifest_path = manifest_path
+        return self
+
     def _preload_critical_modules(self):
         """
         Preload critical modules to avoid circular dependency issues during parallel import.
@@ -183,6 +194,7 @@ class ComponentScanner:
     def scan(self) -> 'ComponentScanner':
         """Execute scanning"""
         self.logger.info("🔍 Starting component scan...")
+        start_time = time.perf_counter()
 
         # Collect all Python files
         python_files = self._collect_python_files()
@@ -193,6 +205,15 @@ class ComponentScanner:
             return self
 
         # Scan components
+        if self.manifest_path:
+            mode = self._manifest_scan(python_files)
+            self.logger.info(
+                "✅ Component scan completed in %.2fs (manifest %s)",
+                time.perf_counter() - start_time,
+                mode,
+            )
+            return self
+
         if self.parallel and len(python_files) > 1:
             self.logger.info(
                 "⚡ Using parallel scan mode (max %d worker threads)", self.max_workers
@@ -204,9 +225,100 @@ class ComponentScanner:
             self.logger.info("📝 Using sequential scan mode")
             self._sequential_scan(python_files)
 
-        self.logger.info("✅ Component scan completed")
+        self.logger.info(
+            "✅ Component scan completed in %.2fs", time.perf_counter() - start_time
+        )
         return self
 
+    def _manifest_signature(self) -> str:
+        """Hash of the scanner configuration that affects scan results"""
+        return ScanManifest.compute_signature(
+            [
+                sorted(str(Path(path).resolve()) for path in self.scan_paths),
+                sorted(self.scan_packages),
+                sorted(self.exclude_paths),
+                sorted(self.exclude_patterns),
+                sorted(self.include_patterns),
+                self.recursive,
+            ]
+        )
+
+    def _manifest_scan(self, python_files: List[Path]) -> str:
+        """
+        Scan using the manifest: import eager modules and register the rest lazily
+        if the manifest is fresh, otherwise do a full scan and rewrite the manifest
+
+        Returns:
+            str: "hit" or "rebuilt"
+        """
+        signature = self._manifest_signature()
+        files = ScanManifest.hash_files(python_files)
+        manifest = ScanManifest.load(self.manifest_path)
+
+        if manifest is not None and manifest.is_fresh(signature, files):
+            container = get_container()
+            lazy_modules = manifest.lazy_modules()
+            for module_name, info in lazy_modules.items():
+                container.register_lazy_module(
+                    module_name, info["beans"], info["qualifiers"]
+                )
+            eager_modules = manifest.eager_modules()
+            for module_name in eager_modules:
+                self._import_module(module_name, module_name)
+            self.logger.info(
+                "📦 Scan manifest hit: imported %d eager modules, deferred %d modules",
+                len(eager_modules),
+                len(lazy_modules),
+            )
+            return "hit"
+
+        self.logger.info("📝 Scan manifest missing or stale, running full scan")
+        manifest = self._recording_scan(python_files, signature, files)
+        try:
+            manifest.save(self.manifest_path)
+        except OSError as e:
+            self.logger.warning(
+                "Failed to write scan manifest %s: %s", self.manifest_path, e
+            )
+        return "rebuilt"
+
+    def _recording_scan(
+        self, python_files: List[Path], signature: str, files: Dict[str, str]
+    ) -> ScanManifest:
+        """Sequential scan that records which Beans each module registers"""
+        container = get_container()
+        module_names = {
+            file_path: self._file_to_module_name(file_path)
+            for file_path in python_files
+        }
+        scanned_modules = {name for name in module_names.values() if name}
+        beans_by_module: Dict[str, List[BeanDefinition]] = {}
+
+        for file_path, module_name in module_names.items():
+            if not module_name:
+                continue
+            known = {
+                id(bean_def)
+                for bean_defs in container._bean_definitions.values()
+                for bean_def in bean_defs
+            }
+            self._import_module(module_name, file_path)
+
+            for bean_defs in list(container._bean_definitions.values()):
+                for bean_def in bean_defs:
+                    if id(bean_def) in known:
+                        continue
+                    # Beans of modules outside the scan roots belong to the module importing them
+                    owner = bean_module(bean_def)
+                    if owner not in scanned_modules:
+                        owner = module_name
+                    beans_by_module.setdefault(owner, []).append(bean_def)
+
+        project_packages = {name.split(".")[0] for name in scanned_modules}
+        return ScanManifest.build(
+            signature, files, scanned_modules, beans_by_module, project_packages
+        )
+
     def _collect_python_files(self) -> List[Path]:
         """Collect all Python files"""
         python_files = []
@@ -325,7 +437,10 @@ class ComponentScanner:
         module_name = self._file_to_module_name(file_path)
         if not module_name:
             return
+        self._import_module(module_name, file_path)
 
+    def _import_module(self, module_name: str, file_path: Any):
+        """Import a scanned module, exiting on failure like a regular scan"""
         try:
             importlib.import_module(module_name)
         except ImportError as e:
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+PYTHONPATH=src python src/core/di/tests/benchmark_scan_manifest.py [--modules 400]
+
+DI scan manifest startup benchmark
+
+Generates a package of Bean modules (each importing a few stdlib modules, as real
+repositories and services do) and measures cold-process scan time without the manifest,
+on the first run that writes it, and on later runs that hit it.
+For the real application: set DI_SCAN_MANIFEST_PATH and compare the
+"Component scan completed in ...s" log lines of two consecutive boots.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[3]
+
+MODULE_TEMPLATE = '''
+import {stdlib}
+from core.di.decorators import component
+from bench_scan_pkg.interfaces import Service{group}
+
+
+@component(name="service_{index}")
+class ServiceImpl{index}(Service{group}):
+    def run(self):
+        return {index}
+'''
+
+SCAN_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+from core.di.scanner import ComponentScanner
+scanner = ComponentScanner().add_scan_path(sys.argv[1])
+scanner.set_manifest_path(sys.argv[2] or None)
+scanner.scan()
+from bench_scan_pkg.interfaces import Service0
+from core.di.utils import get_bean_by_type
+get_bean_by_type(Service0)
+print(time.perf_counter() - start)
+'''
+
+STDLIB_MODULES = [
+    "json",
+    "decimal",
+    "email.mime.text",
+    "http.client",
+    "xml.dom.minidom",
+    "asyncio",
+    "sqlite3",
+    "csv",
+]
+
+
+def generate_package(root: Path, modules: int, groups: int = 10):
+    package_dir = root / "bench_scan_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "interfaces.py").write_text(
+        "from abc import ABC, abstractmethod\n\n"
+        + "".join(
+            f"\nclass Service{group}(ABC):\n"
+            "    @abstractmethod\n"
+            "    def run(self): ...\n"
+            for group in range(groups)
+        )
+    )
+    for index in range(modules):
+        (package_dir / f"service_{index}.py").write_text(
+            MODULE_TEMPLATE.format(
+                stdlib=STDLIB_MODULES[index % len(STDLIB_MODULES)],
+                group=index % groups,
+                index=index,
+            )
+        )
+    return package_dir
+
+
+def run_scan(root: Path, package_dir: Path, manifest_path: str) -> float:
+    env = dict(os.environ, PYTHONPATH=f"{SRC_DIR}{os.pathsep}{root}")
+    env.pop("DI_SCAN_MANIFEST_PATH", None)
+    output = subprocess.run(
+        [sys.executable, "-c", SCAN_SCRIPT, str(package_dir), manifest_path],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=400)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        package_dir = generate_package(root, args.modules)
+        manifest_path = str(root / "manifest.json")
+
+        full = min(run_scan(root, package_dir, "") for _ in range(args.runs))
+        first = run_scan(root, package_dir, manifest_path)
+        hit = min(run_scan(root, package_dir, manifest_path) for _ in range(args.runs))
+
+    print(f"modules: {args.modules}")
+    print(f"full scan (no manifest):   {full:.3f}s")
+    print(f"first run (write manifest): {first:.3f}s")
+    print(f"manifest hit:              {hit:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
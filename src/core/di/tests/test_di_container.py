@@ -8,6 +8,8 @@ DI Container integration tests
 Test core Container functionalities such as Bean registration, resolution, and priority selection
 """
 
+import threading
+
 import pytest
 from abc import ABC, abstractmethod
 from typing import List
@@ -585,6 +587,122 @@ class TestComplexScenarios:
         assert repo2.call_count == 3
 
 
+class TestLookupSnapshot:
+    """Test lock-free lookup snapshot of resolved singletons"""
+
+    def setup_method(self):
+        """Create a new container before each test"""
+        self.container = DIContainer()
+        PrototypeService.reset_counter()
+
+    def test_resolved_singleton_is_served_from_snapshot(self):
+        """Test warm singleton lookups bypass the lock"""
+        self.container.register_bean(
+            bean_type=MySQLUserRepository, bean_name="mysql_repo"
+        )
+        repo = self.container.get_bean_by_type(UserRepository)
+        assert self.container.get_bean("mysql_repo") is repo
+
+        # Lookups must not need the lock once warm
+        lock_acquired = self.container._lock.acquire(blocking=False)
+        assert lock_acquired
+        try:
+            result = []
+            worker = threading.Thread(
+                target=lambda: result.extend(
+                    [
+                        self.container.get_bean_by_type(UserRepository),
+                        self.container.get_bean("mysql_repo"),
+                    ]
+                )
+            )
+            worker.start()
+            worker.join(timeout=2)
+            assert not worker.is_alive(), "warm lookup blocked on the container lock"
+            assert result == [repo, repo]
+        finally:
+            self.container._lock.release()
+
+    def test_registration_swaps_snapshot(self):
+        """Test registering a new Bean refreshes warm lookups"""
+        self.container.register_bean(
+            bean_type=MySQLUserRepository, bean_name="mysql_repo"
+        )
+        assert isinstance(
+            self.container.get_bean_by_type(UserRepository), MySQLUserRepository
+        )
+        assert len(self.container.get_beans_by_type(UserRepository)) == 1
+
+        self.container.register_bean(
+            bean_type=PostgreSQLUserRepository,
+            bean_name="postgres_repo",
+            is_primary=True,
+        )
+
+        assert isinstance(
+            self.container.get_bean_by_type(UserRepository), PostgreSQLUserRepository
+        )
+        assert len(self.container.get_beans_by_type(UserRepository)) == 2
+
+    def test_mock_mode_toggle_swaps_snapshot(self):
+        """Test toggling mock mode refreshes warm lookups"""
+        self.container.register_bean(
+            bean_type=MySQLUserRepository, bean_name="mysql_repo"
+        )
+        self.container.register_bean(
+            bean_type=MockUserRepository, bean_name="mock_repo", is_mock=True
+        )
+        assert isinstance(
+            self.container.get_bean_by_type(UserRepository), MySQLUserRepository
+        )
+
+        self.container.enable_mock_mode()
+        assert isinstance(
+            self.container.get_bean_by_type(UserRepository), MockUserRepository
+        )
+
+        self.container.disable_mock_mode()
+        assert isinstance(
+            self.container.get_bean_by_type(UserRepository), MySQLUserRepository
+        )
+
+    def test_prototype_is_not_snapshotted(self):
+        """Test non-singleton scopes still create instances on every lookup"""
+        self.container.register_bean(
+            bean_type=PrototypeService,
+            bean_name="prototype_service",
+            scope=BeanScope.PROTOTYPE,
+        )
+
+        service1 = self.container.get_bean_by_type(PrototypeService)
+        service2 = self.container.get_bean_by_type(PrototypeService)
+        services = self.container.get_beans_by_type(PrototypeService)
+
+        assert service1 is not service2
+        assert services[0] is not service2
+
+    def test_concurrent_first_lookup_creates_single_instance(self):
+        """Test concurrent cold lookups from many threads share one singleton"""
+        self.container.register_bean(
+            bean_type=MySQLUserRepository, bean_name="mysql_repo"
+        )
+        results = []
+        barrier = threading.Barrier(8)
+
+        def lookup():
+            barrier.wait()
+            results.append(self.container.get_bean_by_type(UserRepository))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "-s", "--tb=short"])
@@ -408,6 +408,147 @@ class TestRealWorldScanningScenario:
         assert memory_cache.cache_type == "memory"
 
 
+class TestScanManifest:
+    """Test scan manifest: lazy module loading and staleness detection"""
+
+    PACKAGE = "manifest_scan_pkg"
+
+    FILES = {
+        "__init__.py": "",
+        "interfaces.py": (
+            "from abc import ABC, abstractmethod\n\n\n"
+            "class Greeter(ABC):\n"
+            "    @abstractmethod\n"
+            "    def greet(self) -> str: ...\n"
+        ),
+        "greeters.py": (
+            "from core.di.decorators import component\n"
+            "from manifest_scan_pkg.interfaces import Greeter\n\n\n"
+            "@component(name='english_greeter')\n"
+            "class EnglishGreeter(Greeter):\n"
+            "    def greet(self) -> str:\n"
+            "        return 'hello'\n"
+        ),
+        "models.py": (
+            "from manifest_scan_pkg.interfaces import Greeter\n\n\n"
+            "class SilentGreeter(Greeter):\n"
+            "    def greet(self) -> str:\n"
+            "        return ''\n"
+        ),
+    }
+
+    def setup_method(self):
+        """Create a temporary package and an isolated global container"""
+        import sys
+        import core.di.container as container_module
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        package_dir = self.temp_dir / self.PACKAGE
+        package_dir.mkdir()
+        for name, content in self.FILES.items():
+            (package_dir / name).write_text(content)
+        self.package_dir = package_dir
+        self.manifest_path = str(self.temp_dir / "manifest.json")
+
+        sys.path.insert(0, str(self.temp_dir))
+        self._original_container = container_module._global_container
+        self._reset_boot()
+
+    def teardown_method(self):
+        """Restore sys.path, modules and global container"""
+        import sys
+        import core.di.container as container_module
+
+        sys.path.remove(str(self.temp_dir))
+        self._unload_package()
+        container_module._global_container = self._original_container
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _unload_package(self):
+        import sys
+
+        for module_name in list(sys.modules):
+            if module_name.split(".")[0] == self.PACKAGE:
+                del sys.modules[module_name]
+
+    def _reset_boot(self):
+        """Simulate a fresh process: unload modules and use a new global container"""
+        import core.di.container as container_module
+
+        self._unload_package()
+        container_module._global_container = DIContainer()
+        return container_module._global_container
+
+    def _scan(self) -> ComponentScanner:
+        return (
+            ComponentScanner()
+            .add_scan_path(str(self.package_dir))
+            .set_manifest_path(self.manifest_path)
+            .scan()
+        )
+
+    def test_first_scan_writes_manifest(self):
+        """Test full scan records Beans, qualifiers and eager modules"""
+        import json
+
+        self._scan()
+
+        container = get_container()
+        assert container.get_bean("english_greeter").greet() == "hello"
+
+        modules = json.loads(Path(self.manifest_path).read_text())["modules"]
+        greeters = modules[f"{self.PACKAGE}.greeters"]
+        assert greeters["eager"] is False
+        assert greeters["beans"] == ["english_greeter"]
+        assert f"{self.PACKAGE}.interfaces.Greeter" in greeters["qualifiers"]
+        # Modules without Beans, or defining non-Bean subclasses, stay eager
+        assert modules[f"{self.PACKAGE}.interfaces"]["eager"] is True
+        assert modules[f"{self.PACKAGE}.models"]["eager"] is True
+
+    def test_fresh_manifest_defers_bean_modules(self):
+        """Test later boots import Bean modules only on first lookup"""
+        import sys
+
+        self._scan()
+        container = self._reset_boot()
+        self._scan()
+
+        assert f"{self.PACKAGE}.models" in sys.modules
+        assert f"{self.PACKAGE}.greeters" not in sys.modules
+        assert container.contains_bean("english_greeter")
+
+        from manifest_scan_pkg.interfaces import Greeter
+
+        assert container.get_bean_by_type(Greeter).greet() == "hello"
+        assert f"{self.PACKAGE}.greeters" in sys.modules
+        assert container.get_bean("english_greeter") is container.get_bean_by_type(
+            Greeter
+        )
+
+    def test_lazy_bean_resolved_by_name(self):
+        """Test lookup by name imports the lazy module"""
+        self._scan()
+        container = self._reset_boot()
+        self._scan()
+
+        assert container.get_bean("english_greeter").greet() == "hello"
+
+    def test_changed_file_triggers_full_scan(self):
+        """Test a modified file makes the manifest stale"""
+        import sys
+
+        self._scan()
+        (self.package_dir / "greeters.py").write_text(
+            self.FILES["greeters.py"].replace("'hello'", "'hi'")
+        )
+        self._reset_boot()
+        self._scan()
+
+        # Full scan imports every module
+        assert f"{self.PACKAGE}.greeters" in sys.modules
+        assert get_container().get_bean("english_greeter").greet() == "hi"
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "-s", "--tb=short"])
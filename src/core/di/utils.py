@@ -443,6 +443,9 @@ def get_all_subclasses(base_class: Type[T]) -> List[Type[T]]:
     Returns:
         List[Type[T]]: List of all subclasses, including direct and indirect subclasses
     """
+    # Beans deferred by the scan manifest must be imported to be visible as subclasses
+    get_container()._load_lazy_modules_for_type(base_class)
+
     subclasses = []
     for subclass in base_class.__subclasses__():
         if subclass != base_class:
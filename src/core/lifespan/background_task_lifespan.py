@@ -0,0 +1,59 @@
+"""
+Background task lifecycle provider implementation
+
+Drains the timeout_to_background executor on shutdown, so requests that switched to
+background execution are not silently lost on deploys.
+"""
+
+from fastapi import FastAPI
+from typing import Any
+
+from core.observation.logger import get_logger
+from core.di.utils import get_bean_by_type
+from core.di.decorators import component
+from component.timeout_background import BackgroundTaskExecutor
+from .lifespan_interface import LifespanProvider
+
+logger = get_logger(__name__)
+
+
+@component(name="background_task_lifespan_provider")
+class BackgroundTaskLifespanProvider(LifespanProvider):
+    """Background task lifecycle provider"""
+
+    def __init__(self, name: str = "background_task", order: int = 90):
+        """
+        Initialize background task lifecycle provider
+
+        Args:
+            name (str): Provider name
+            order (int): Execution order; shuts down before business and database providers
+        """
+        super().__init__(name, order)
+
+    async def startup(self, app: FastAPI) -> Any:
+        """
+        Log background executor limits
+
+        Args:
+            app (FastAPI): FastAPI application instance
+        """
+        executor = get_bean_by_type(BackgroundTaskExecutor)
+        logger.info(
+            "Background task executor ready: max_in_flight=%d, max_queued=%d, durable_handoff=%s",
+            executor.max_in_flight,
+            executor.max_queued,
+            executor.durable_handoff_enabled,
+        )
+        return None
+
+    async def shutdown(self, app: FastAPI) -> None:
+        """
+        Stop accepting background tasks and wait for running ones
+
+        Args:
+            app (FastAPI): FastAPI application instance
+        """
+        executor = get_bean_by_type(BackgroundTaskExecutor)
+        await executor.drain()
+        logger.info("✅ Background task executor drained: %s", executor.get_stats())
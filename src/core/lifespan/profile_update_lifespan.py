@@ -0,0 +1,62 @@
+"""
+Profile update lifecycle provider implementation
+
+Flushes the debounced profile update scheduler on shutdown, so memcells waiting in a
+debounce window still update the user profiles.
+"""
+
+from fastapi import FastAPI
+from typing import Any
+
+from core.observation.logger import get_logger
+from core.di.utils import get_bean_by_type
+from core.di.decorators import component
+from .lifespan_interface import LifespanProvider
+
+logger = get_logger(__name__)
+
+
+@component(name="profile_update_lifespan_provider")
+class ProfileUpdateLifespanProvider(LifespanProvider):
+    """Profile update lifecycle provider"""
+
+    def __init__(self, name: str = "profile_update", order: int = 85):
+        """
+        Initialize profile update lifecycle provider
+
+        Args:
+            name (str): Provider name
+            order (int): Execution order; shuts down after the background task executor
+                (which may still schedule updates) and before business and database providers
+        """
+        super().__init__(name, order)
+
+    async def startup(self, app: FastAPI) -> Any:
+        """
+        Log the debounce settings
+
+        Args:
+            app (FastAPI): FastAPI application instance
+        """
+        from biz_layer.profile_update_scheduler import ProfileUpdateScheduler
+
+        scheduler = get_bean_by_type(ProfileUpdateScheduler)
+        logger.info(
+            "Profile update scheduler ready: debounce=%.1fs, max_wait=%.1fs",
+            scheduler.debounce_seconds,
+            scheduler.max_wait_seconds,
+        )
+        return None
+
+    async def shutdown(self, app: FastAPI) -> None:
+        """
+        Extract the pending profile updates
+
+        Args:
+            app (FastAPI): FastAPI application instance
+        """
+        from biz_layer.profile_update_scheduler import ProfileUpdateScheduler
+
+        scheduler = get_bean_by_type(ProfileUpdateScheduler)
+        await scheduler.flush_all()
+        logger.info("✅ Profile update scheduler flushed: %s", scheduler.get_stats())
@@ -6,9 +6,14 @@ Using contextvar to manage coroutine context, ensuring thread safety and corouti
 """
 
 import asyncio
-from typing import Optional, Union
+import os
+import random
+import time
+from typing import Dict, Optional, Tuple, Union
 from contextlib import asynccontextmanager
 
+import redis
+
 from core.di.decorators import component
 from core.observation.logger import get_logger
 from component.redis_provider import RedisProvider
@@ -20,6 +25,17 @@ logger = get_logger(__name__)
 DEFAULT_LOCK_TIMEOUT = 60.0  # Default lock timeout (seconds)
 DEFAULT_BLOCKING_TIMEOUT = 80.0  # Default blocking timeout for acquiring lock (seconds)
 DEFAULT_RETRY_INTERVAL = 3  # Default retry interval (seconds)
+# Default lock timeout when the lease watchdog is enabled (seconds); the watchdog keeps
+# extending it while the owner is alive, so a crashed owner blocks waiters only this long
+DEFAULT_WATCHDOG_LOCK_TIMEOUT = 10.0
+# Release notification token TTL, bounds how long a stale wakeup can linger (milliseconds)
+DEFAULT_NOTIFY_TTL_MS = 10000
+# Upper bound of a single blocking wait, must stay below the Redis socket timeout (seconds)
+MAX_BLOCK_TIMEOUT_SECONDS = 10.0
+# Smallest blocking wait worth a round trip (seconds)
+MIN_BLOCK_TIMEOUT_SECONDS = 0.01
+# Default cap of waiters blocked in BLPOP per process; each holds a pooled connection
+DEFAULT_MAX_BLOCKING_WAITERS = 16
 
 
 class DistributedLockError(Exception):
@@ -48,7 +64,10 @@ class RedisDistributedLock:
 
     @asynccontextmanager
     async def acquire(
-        self, timeout: Optional[float] = None, blocking_timeout: Optional[float] = None
+        self,
+        timeout: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+        watchdog: Optional[bool] = None,
     ):
         """
         Asynchronous context manager for acquiring lock
@@ -56,11 +75,18 @@ class RedisDistributedLock:
         Args:
             timeout: Lock timeout (seconds)
             blocking_timeout: Blocking timeout for acquiring lock (seconds)
+            watchdog: Whether to extend the lock in background while the owning coroutine
+                is alive, default uses DISTRIBUTED_LOCK_WATCHDOG_ENABLED
 
         Yields:
             bool: Whether the lock was successfully acquired
         """
-        timeout = timeout or DEFAULT_LOCK_TIMEOUT
+        if watchdog is None:
+            watchdog = self.lock_manager.watchdog_enabled
+        default_timeout = (
+            DEFAULT_WATCHDOG_LOCK_TIMEOUT if watchdog else DEFAULT_LOCK_TIMEOUT
+        )
+        timeout = timeout or default_timeout
         blocking_timeout = blocking_timeout or DEFAULT_BLOCKING_TIMEOUT
 
         acquired = False
@@ -71,6 +97,10 @@ class RedisDistributedLock:
             )
             if acquired:
                 self._acquired = True
+                if watchdog:
+                    self.lock_manager._start_watchdog(  # pylint: disable=protected-access
+                        self.resource, timeout
+                    )
 
             yield acquired
 
@@ -110,6 +140,8 @@ class RedisDistributedLockManager:
 
     # Lock key template
     LOCK_KEY_TEMPLATE = "reentrant_lock:{resource}"
+    # Release notification list template, waiters BLPOP on it
+    NOTIFY_KEY_TEMPLATE = "reentrant_lock_notify:{resource}"
 
     # Lua script: Acquire reentrant lock
     LUA_ACQUIRE_SCRIPT = """
@@ -138,9 +170,14 @@ class RedisDistributedLockManager:
     """
 
     # Lua script: Release reentrant lock
+    # On full release a single wakeup token is pushed to the notify list, so exactly one
+    # blocked waiter is woken per release. The list is capped at one token and expires,
+    # a token left without waiters only causes one spurious (harmless) retry.
     LUA_RELEASE_SCRIPT = """
         local lock_key = KEYS[1]
+        local notify_key = KEYS[2]
         local owner_id = ARGV[1]
+        local notify_ttl_ms = tonumber(ARGV[2])
         
         -- Get current lock information
         -- Note: When lock_key does not exist, HMGET returns {false, false}
@@ -157,6 +194,10 @@ class RedisDistributedLockManager:
         if new_count <= 0 then
             -- Reentry count reaches zero, completely release the lock
             redis.call('DEL', lock_key)
+            -- Wake up one waiter
+            redis.call('RPUSH', notify_key, '1')
+            redis.call('LTRIM', notify_key, -1, -1)
+            redis.call('PEXPIRE', notify_key, notify_ttl_ms)
             return -1
         else
             -- Decrease reentry count but keep the lock
@@ -185,6 +226,19 @@ class RedisDistributedLockManager:
         end
     """
 
+    # Lua script: Extend lock lease, only while still held by the given owner
+    LUA_RENEW_SCRIPT = """
+        local lock_key = KEYS[1]
+        local owner_id = ARGV[1]
+        local timeout_ms = tonumber(ARGV[2])
+
+        if redis.call('HGET', lock_key, 'owner') == owner_id then
+            redis.call('PEXPIRE', lock_key, timeout_ms)
+            return 1
+        end
+        return 0
+    """
+
     def __init__(self, redis_provider: RedisProvider):
         """
         Initialize Redis distributed lock manager
@@ -194,10 +248,35 @@ class RedisDistributedLockManager:
         """
         self.redis_provider = redis_provider
 
+        # Waiter mode: block on release notifications (default), or poll with jittered backoff
+        self.notify_enabled = (
+            os.getenv("DISTRIBUTED_LOCK_NOTIFY_ENABLED", "true").lower() == "true"
+        )
+        # Waiters blocked in BLPOP hold a connection of the shared pool for the whole wait,
+        # beyond this many per process the others poll so the pool stays usable
+        self.max_blocking_waiters = max(
+            1,
+            int(
+                os.getenv(
+                    "DISTRIBUTED_LOCK_MAX_BLOCKING_WAITERS",
+                    str(DEFAULT_MAX_BLOCKING_WAITERS),
+                )
+            ),
+        )
+        self._blocking_waiters = asyncio.Semaphore(self.max_blocking_waiters)
+        # Lease watchdog default for locks acquired without an explicit watchdog flag
+        self.watchdog_enabled = (
+            os.getenv("DISTRIBUTED_LOCK_WATCHDOG_ENABLED", "false").lower() == "true"
+        )
+
+        # Running lease watchdogs: (resource, owner_id) -> watchdog task
+        self._watchdogs: Dict[Tuple[str, str], asyncio.Task] = {}
+
         # Lua script cache
         self._lua_acquire = None
         self._lua_release = None
         self._lua_status = None
+        self._lua_renew = None
 
     def get_lock(self, resource: str) -> RedisDistributedLock:
         """
@@ -218,6 +297,7 @@ class RedisDistributedLockManager:
             self._lua_acquire = redis_client.register_script(self.LUA_ACQUIRE_SCRIPT)
             self._lua_release = redis_client.register_script(self.LUA_RELEASE_SCRIPT)
             self._lua_status = redis_client.register_script(self.LUA_STATUS_SCRIPT)
+            self._lua_renew = redis_client.register_script(self.LUA_RENEW_SCRIPT)
 
     def _get_owner_id(self) -> str:
         """
@@ -266,11 +346,11 @@ class RedisDistributedLockManager:
         lock_key = self.LOCK_KEY_TEMPLATE.format(resource=resource)
         owner_id = self._get_owner_id()
         timeout_ms = int(timeout * 1000) if timeout > 0 else 0
+        deadline = time.monotonic() + max(blocking_timeout, 0.0)
 
-        # Calculate retry count
-        retry_count = max(1, int(blocking_timeout / DEFAULT_RETRY_INTERVAL))
-
-        for attempt in range(retry_count):
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 redis_client = await self.redis_provider.get_client()
                 result = await self._lua_acquire(
@@ -283,22 +363,22 @@ class RedisDistributedLockManager:
                         resource,
                         owner_id,
                         result,
-                        attempt + 1,
+                        attempt,
                     )
                     return True
-                else:
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(DEFAULT_RETRY_INTERVAL)
 
-            except (ConnectionError, TimeoutError, OSError) as e:
+            except (ConnectionError, TimeoutError, OSError, redis.RedisError) as e:
                 logger.debug(
                     "Failed to acquire lock (attempt %s): %s, error: %s",
-                    attempt + 1,
+                    attempt,
                     resource,
                     e,
                 )
-                if attempt < retry_count - 1:
-                    await asyncio.sleep(DEFAULT_RETRY_INTERVAL)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await self._wait_for_release(resource, remaining)
 
         logger.warning(
             "Timed out acquiring reentrant distributed lock: %s, coroutine: %s",
@@ -307,6 +387,142 @@ class RedisDistributedLockManager:
         )
         return False
 
+    async def _wait_for_release(self, resource: str, remaining: float) -> bool:
+        """
+        Internal method: Wait until the lock may be free
+
+        Blocks on the release notification list, so a waiter wakes up as soon as the holder
+        releases. The wait is bounded by a jittered backoff interval, which remains the
+        fallback for locks that expire (crashed holder) or are released without notification.
+        Each blocked waiter holds a pooled connection, so at most max_blocking_waiters block
+        at once, further waiters poll with the backoff interval instead.
+
+        Args:
+            resource: Resource name
+            remaining: Remaining blocking time (seconds)
+
+        Returns:
+            bool: Whether a release notification was received
+        """
+        backoff = DEFAULT_RETRY_INTERVAL * random.uniform(0.5, 1.0)
+        wait_timeout = min(remaining, backoff, MAX_BLOCK_TIMEOUT_SECONDS)
+
+        if (
+            self.notify_enabled
+            and wait_timeout >= MIN_BLOCK_TIMEOUT_SECONDS
+            and not self._blocking_waiters.locked()
+        ):
+            notify_key = self.NOTIFY_KEY_TEMPLATE.format(resource=resource)
+            async with self._blocking_waiters:
+                try:
+                    redis_client = await self.redis_provider.get_client()
+                    result = await redis_client.blpop(
+                        [notify_key], timeout=wait_timeout
+                    )
+                    return result is not None
+                except (ConnectionError, TimeoutError, OSError, redis.RedisError) as e:
+                    logger.debug(
+                        "Failed to wait for lock release: %s, error: %s", resource, e
+                    )
+
+        await asyncio.sleep(wait_timeout)
+        return False
+
+    def _start_watchdog(self, resource: str, timeout: float):
+        """
+        Internal method: Start the lease watchdog for a lock held by the current coroutine
+
+        Reentrant acquisitions share the watchdog started by the outermost one.
+
+        Args:
+            resource: Resource name
+            timeout: Lock timeout (seconds), renewed every third of it
+        """
+        owner_id = self._get_owner_id()
+        key = (resource, owner_id)
+        if key in self._watchdogs:
+            return
+
+        watchdog_task = asyncio.create_task(
+            self._run_watchdog(resource, owner_id, asyncio.current_task(), timeout),
+            name=f"lock_watchdog:{resource}",
+        )
+        self._watchdogs[key] = watchdog_task
+
+        def _on_done(task: asyncio.Task):
+            if self._watchdogs.get(key) is task:
+                del self._watchdogs[key]
+
+        watchdog_task.add_done_callback(_on_done)
+
+    def _stop_watchdog(self, resource: str, owner_id: Optional[str] = None):
+        """
+        Internal method: Stop lease watchdogs of a resource
+
+        Args:
+            resource: Resource name
+            owner_id: Only stop the watchdog of this owner, default stops all owners
+        """
+        for key in list(self._watchdogs):
+            if key[0] == resource and (owner_id is None or key[1] == owner_id):
+                self._watchdogs.pop(key).cancel()
+
+    async def _run_watchdog(
+        self,
+        resource: str,
+        owner_id: str,
+        owner_task: Optional[asyncio.Task],
+        timeout: float,
+    ):
+        """
+        Internal method: Extend the lock lease while the owning coroutine is alive
+
+        Stops when the lock is released (cancelled by _release_lock), when the owning
+        task finishes or is cancelled, or when the lock is no longer held by the owner.
+
+        Args:
+            resource: Resource name
+            owner_id: Owner identifier of the lock holder
+            owner_task: Task holding the lock
+            timeout: Lock timeout (seconds)
+        """
+        lock_key = self.LOCK_KEY_TEMPLATE.format(resource=resource)
+        timeout_ms = int(timeout * 1000)
+        interval = max(timeout / 3, 0.1)
+
+        while True:
+            await asyncio.sleep(interval)
+            if owner_task is None or owner_task.done():
+                logger.debug(
+                    "Lock owner finished, stopping watchdog: %s, coroutine: %s",
+                    resource,
+                    owner_id,
+                )
+                return
+
+            try:
+                redis_client = await self.redis_provider.get_client()
+                renewed = await self._lua_renew(
+                    keys=[lock_key], args=[owner_id, timeout_ms], client=redis_client
+                )
+            except (ConnectionError, TimeoutError, OSError, redis.RedisError) as e:
+                # Retry on next interval, the lease still has two intervals left
+                logger.warning(
+                    "Failed to extend lock lease: %s, coroutine: %s, error: %s",
+                    resource,
+                    owner_id,
+                    e,
+                )
+                continue
+
+            if not renewed:
+                logger.warning(
+                    "Lock lost before release, stopping watchdog: %s, coroutine: %s",
+                    resource,
+                    owner_id,
+                )
+                return
+
     async def _release_lock(self, resource: str):
         """
         Internal method: Release lock
@@ -315,12 +531,16 @@ class RedisDistributedLockManager:
             resource: Resource name
         """
         lock_key = self.LOCK_KEY_TEMPLATE.format(resource=resource)
+        notify_key = self.NOTIFY_KEY_TEMPLATE.format(resource=resource)
         owner_id = self._get_owner_id()
+        result = None
 
         try:
             redis_client = await self.redis_provider.get_client()
             result = await self._lua_release(
-                keys=[lock_key], args=[owner_id], client=redis_client
+                keys=[lock_key, notify_key],
+                args=[owner_id, DEFAULT_NOTIFY_TTL_MS],
+                client=redis_client,
             )
 
             if result == -1:
@@ -343,13 +563,18 @@ class RedisDistributedLockManager:
                     owner_id,
                 )
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except (ConnectionError, TimeoutError, OSError, redis.RedisError) as e:
             logger.error(
                 "Exception occurred while releasing reentrant lock: %s, coroutine: %s, error: %s",
                 resource,
                 owner_id,
                 e,
             )
+        finally:
+            # Keep the watchdog only while a reentrant acquisition still holds the lock,
+            # after a failed release let the lease expire instead of extending it
+            if result is None or result <= 0:
+                self._stop_watchdog(resource, owner_id)
 
     async def is_locked(self, resource: str) -> bool:
         """
@@ -451,7 +676,16 @@ class RedisDistributedLockManager:
         try:
             redis_client = await self.redis_provider.get_client()
             lock_key = self.LOCK_KEY_TEMPLATE.format(resource=resource)
+            self._stop_watchdog(resource)
             result = await redis_client.delete(lock_key)
+            if result > 0:
+                # Wake up one waiter, same as a normal release
+                notify_key = self.NOTIFY_KEY_TEMPLATE.format(resource=resource)
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    pipe.rpush(notify_key, "1")
+                    pipe.ltrim(notify_key, -1, -1)
+                    pipe.pexpire(notify_key, DEFAULT_NOTIFY_TTL_MS)
+                    await pipe.execute()
 
             logger.warning(
                 "Forcibly released reentrant lock: %s, result: %s", resource, result
@@ -470,6 +704,7 @@ class RedisDistributedLockManager:
         resource: str,
         timeout: Optional[float] = None,
         blocking_timeout: Optional[float] = None,
+        watchdog: Optional[bool] = None,
     ):
         """
         Asynchronous context manager for acquiring reentrant distributed lock (compatible with old interface)
@@ -478,16 +713,20 @@ class RedisDistributedLockManager:
             resource: Name of the lock resource (key name)
             timeout: Lock timeout (seconds)
             blocking_timeout: Blocking timeout for acquiring lock (seconds)
+            watchdog: Whether to extend the lock lease in background while held
 
         Yields:
             bool: Whether the lock was successfully acquired
         """
         lock = self.get_lock(resource)
-        async with lock.acquire(timeout, blocking_timeout) as acquired:
+        async with lock.acquire(timeout, blocking_timeout, watchdog) as acquired:
             yield acquired
 
     async def close(self):
         """Close service and clean up resources"""
+        for watchdog_task in list(self._watchdogs.values()):
+            watchdog_task.cancel()
+        self._watchdogs.clear()
         logger.info("Redis distributed lock manager closed")
 
 
@@ -497,6 +736,7 @@ async def distributed_lock(
     resource: str,
     timeout: Optional[float] = None,
     blocking_timeout: Optional[float] = None,
+    watchdog: Optional[bool] = None,
 ):
     """
     Convenient distributed lock context manager, used within functions
@@ -505,6 +745,8 @@ async def distributed_lock(
         resource: Name of the lock resource
         timeout: Lock timeout (seconds)
         blocking_timeout: Blocking timeout for acquiring lock (seconds)
+        watchdog: Whether to extend the lock lease in background while the current
+            coroutine holds it (allows short timeouts for long critical sections)
 
     Yields:
         bool: Whether the lock was successfully acquired
@@ -526,6 +768,12 @@ async def distributed_lock(
                     async with distributed_lock("resource:123") as acquired2:
                         if acquired2:
                             print("Second level acquired lock (reentrant)")
+
+        # Short lease kept alive by the watchdog during a slow step
+        async def slow_function():
+            async with distributed_lock("group:123", timeout=10, watchdog=True) as acquired:
+                if acquired:
+                    await call_llm()
     """
 
     # Get lock manager
@@ -534,7 +782,7 @@ async def distributed_lock(
     # Acquire lock and execute
     lock = lock_manager.get_lock(resource)
     async with lock.acquire(
-        timeout=timeout, blocking_timeout=blocking_timeout
+        timeout=timeout, blocking_timeout=blocking_timeout, watchdog=watchdog
     ) as acquired:
         yield acquired
 
@@ -542,16 +790,19 @@ async def distributed_lock(
 # Convenient decorator function
 def with_distributed_lock(
     resource_key: Union[str, callable],
-    timeout: float = DEFAULT_LOCK_TIMEOUT,
+    timeout: Optional[float] = None,
     blocking_timeout: float = DEFAULT_BLOCKING_TIMEOUT,
+    watchdog: Optional[bool] = None,
 ):
     """
     Distributed lock decorator (supports reentrancy)
 
     Args:
         resource_key: Lock resource key, can be string or function returning string
-        timeout: Lock timeout
+        timeout: Lock timeout, default DEFAULT_LOCK_TIMEOUT
+            (DEFAULT_WATCHDOG_LOCK_TIMEOUT with watchdog)
         blocking_timeout: Blocking timeout for acquiring lock
+        watchdog: Whether to extend the lock lease in background while the function runs
 
     Example:
         @with_distributed_lock("user:balance:{user_id}")
@@ -581,7 +832,7 @@ def with_distributed_lock(
             # Acquire lock and execute function
             lock = lock_manager.get_lock(resource)
             async with lock.acquire(
-                timeout=timeout, blocking_timeout=blocking_timeout
+                timeout=timeout, blocking_timeout=blocking_timeout, watchdog=watchdog
             ) as acquired:
                 if acquired:
                     return await func(*args, **kwargs)
@@ -222,6 +222,8 @@ class ConsumerConfig:
         timeout: float = 600.0,
         retry_config: Optional[RetryConfig] = None,
         error_handler: Optional[ErrorHandler] = None,
+        max_in_flight: int = 1,
+        idle_wait_timeout: float = 0.1,
     ):
         """
         Initialize consumer configuration
@@ -230,7 +232,13 @@ class ConsumerConfig:
             timeout: Timeout for consuming a single message (seconds), including retries
             retry_config: Retry configuration
             error_handler: Error handler
+            max_in_flight: Maximum number of message batches processed concurrently,
+                1 keeps strictly sequential processing
+            idle_wait_timeout: Maximum time (seconds) to wait for a new message
+                notification when there are no messages
         """
         self.timeout = timeout
         self.retry_config = retry_config or RetryConfig()
         self.error_handler = error_handler
+        self.max_in_flight = max(1, max_in_flight)
+        self.idle_wait_timeout = idle_wait_timeout
@@ -6,8 +6,10 @@ Base implementation of recycle consumer.
 import asyncio
 import logging
 import random
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
+from collections import deque
+from typing import Optional, Any, Deque, Dict, Set, Tuple
 from datetime import datetime
 
 from core.longjob.interfaces import (
@@ -48,8 +50,16 @@ class RecycleConsumerBase(LongJobInterface, ABC):
     """
     Base implementation of recycle consumer
     Provides a basic framework for continuous consumption, including error handling, retry logic, timeout handling, etc.
+
+    - When idle, the loop waits in _wait_for_messages() until notify() is called (or a
+      subclass's own blocking source returns) instead of polling
+    - Up to consumer_config.max_in_flight message batches are processed concurrently,
+      _ack_message() is still called in fetch order
     """
 
+    # Time window (seconds) used to compute throughput in get_stats()
+    THROUGHPUT_WINDOW_SECONDS = 60.0
+
     def __init__(
         self,
         job_id: str,
@@ -72,15 +82,44 @@ class RecycleConsumerBase(LongJobInterface, ABC):
             self.logger
         )
 
+        # Set by notify() and request_stop() to wake up an idle consumer
+        self._message_event = asyncio.Event()
+
+        # In-flight message batches and ordered-ack state
+        self._in_flight_tasks: Set[asyncio.Task] = set()
+        self._next_sequence = 0
+        self._next_ack_sequence = 0
+        self._settled_batches: Dict[int, Tuple[MessageBatch, bool]] = {}
+        self._ack_lock = asyncio.Lock()
+
+        # Completion times (monotonic) within the throughput window
+        self._recent_completions: Deque[float] = deque()
+
         # Statistics
         self.stats = {
             'total_processed': 0,
             'total_errors': 0,
             'total_timeouts': 0,
+            'total_acked': 0,
             'start_time': None,
             'last_processed_time': None,
+            'lag_seconds': None,
         }
 
+    def notify(self) -> None:
+        """
+        Notify the consumer that new messages may be available
+
+        Producers in the same process (or a listener owned by the subclass) call this
+        to wake up an idle consumer immediately instead of after idle_wait_timeout.
+        """
+        self._message_event.set()
+
+    def request_stop(self) -> None:
+        """Request to stop the job, waking up an idle consumer"""
+        super().request_stop()
+        self._message_event.set()
+
     async def start(self) -> None:
         """Start consumer"""
         if self.status in [LongJobStatus.RUNNING, LongJobStatus.STARTING]:
@@ -182,123 +221,236 @@ class RecycleConsumerBase(LongJobInterface, ABC):
         """Main consumption loop"""
         self.logger.info("Consumer %s entering consume loop", self.job_id)
 
-        while not self.should_stop():
-            try:
-                # Check if there are messages to consume
-                if not await self._has_messages():
-                    await asyncio.sleep(0.1)  # Brief sleep to avoid high CPU usage
-                    continue
-
-                # Consume messages
-                await self._consume_messages()
+        try:
+            while not self.should_stop():
+                try:
+                    # Wait for a free in-flight slot
+                    if len(self._in_flight_tasks) >= self.consumer_config.max_in_flight:
+                        await asyncio.wait(
+                            self._in_flight_tasks, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        continue
 
-            except Exception as e:
-                # Error handling
-                context = {
-                    'job_id': self.job_id,
-                    'timestamp': datetime.now().isoformat(),
-                    'stats': self.stats.copy(),
-                }
+                    # Check if there are messages to consume
+                    if not await self._has_messages():
+                        await self._wait_for_messages(
+                            self.consumer_config.idle_wait_timeout
+                        )
+                        continue
 
-                self.stats['total_errors'] += 1
+                    # Consume messages
+                    await self._consume_messages()
 
-                try:
-                    should_continue = await self._error_handler.handle_error(e, context)
-                    if not should_continue:
-                        self.logger.error(
-                            "Error handler requested stop for consumer %s", self.job_id
-                        )
+                except Exception as e:
+                    if not await self._handle_consume_error(e):
                         break
-                except Exception as handler_error:
-                    self.logger.error(
-                        "Error in error handler for consumer %s: %s",
-                        self.job_id,
-                        str(handler_error),
-                        exc_info=True,
-                    )
-                    # If error handler itself fails, sleep briefly and continue
-                    await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            for task in self._in_flight_tasks:
+                task.cancel()
+            raise
+
+        # Let in-flight message batches finish
+        if self._in_flight_tasks:
+            await asyncio.gather(*self._in_flight_tasks, return_exceptions=True)
 
         self.logger.info("Consumer %s exiting consume loop", self.job_id)
 
+    async def _handle_consume_error(self, error: Exception) -> bool:
+        """
+        Pass a consume error to the error handler
+
+        Returns:
+            bool: Whether consumption should continue
+        """
+        context = {
+            'job_id': self.job_id,
+            'timestamp': datetime.now().isoformat(),
+            'stats': self.stats.copy(),
+        }
+
+        self.stats['total_errors'] += 1
+
+        try:
+            should_continue = await self._error_handler.handle_error(error, context)
+            if not should_continue:
+                self.logger.error(
+                    "Error handler requested stop for consumer %s", self.job_id
+                )
+                return False
+        except Exception as handler_error:
+            self.logger.error(
+                "Error in error handler for consumer %s: %s",
+                self.job_id,
+                str(handler_error),
+                exc_info=True,
+            )
+            # If error handler itself fails, sleep briefly and continue
+            await asyncio.sleep(1.0)
+
+        return True
+
+    async def _handle_timeout_error(self, timeout: float) -> bool:
+        """
+        Pass a message processing timeout to the error handler
+
+        Returns:
+            bool: Whether consumption should continue
+        """
+        self.stats['total_timeouts'] += 1
+        self.logger.warning(
+            "Message processing timeout in consumer %s (timeout: %ss)",
+            self.job_id,
+            timeout,
+        )
+        # Timeout is also treated as an error, handled by error handler
+        timeout_error = TimeoutError(f"Message processing timeout ({timeout}s)")
+        context = {
+            'job_id': self.job_id,
+            'error_type': 'timeout',
+            'timeout': timeout,
+            'timestamp': datetime.now().isoformat(),
+        }
+
+        try:
+            return await self._error_handler.handle_error(timeout_error, context)
+        except Exception as handler_error:
+            self.logger.error(
+                "Error in timeout error handler: %s", str(handler_error), exc_info=True
+            )
+            return True
+
+    async def _wait_for_messages(self, timeout: float) -> None:
+        """
+        Wait until new messages may be available
+        Called when _has_messages() returns False. The default implementation waits for
+        notify() with a timeout, so message sources that cannot notify degrade to polling.
+        Subclasses can override it to block on their message source (e.g. Redis BLPOP
+        or pub/sub, Kafka poll); returning early is always safe since the loop checks
+        _has_messages() again.
+
+        Args:
+            timeout: Maximum wait time in seconds
+        """
+        try:
+            await asyncio.wait_for(self._message_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._message_event.clear()
+
     async def _consume_messages(self) -> None:
         """Core logic for consuming messages"""
-        timeout = self.consumer_config.timeout
-
-        # Business logic handles batch processing itself; here only process single message
+        # Business logic handles batch processing itself; here only process single message batch
         if self.should_stop():
             return
 
+        message_batch = await self._fetch_message_batch()
+        if message_batch is None:
+            return  # No message to process
+
+        sequence = self._next_sequence
+        self._next_sequence += 1
+
+        if self.consumer_config.max_in_flight <= 1:
+            await self._consume_message_batch(sequence, message_batch)
+            return
+
+        task = asyncio.create_task(self._consume_message_batch(sequence, message_batch))
+        self._in_flight_tasks.add(task)
+        task.add_done_callback(self._in_flight_tasks.discard)
+
+    async def _consume_message_batch(
+        self, sequence: int, message_batch: MessageBatch
+    ) -> None:
+        """Process a fetched message batch under timeout, then settle it for ordered ack"""
+        timeout = self.consumer_config.timeout
+        success = False
+
         try:
-            # Use timeout to control processing time for a single message
-            await asyncio.wait_for(self._process_single_message(), timeout=timeout)
+            # Use timeout to control processing time for a single message batch
+            await asyncio.wait_for(
+                self._process_message_batch(message_batch), timeout=timeout
+            )
+            success = True
 
             self.stats['total_processed'] += 1
             self.stats['last_processed_time'] = datetime.now()
+            self._record_completion()
 
         except asyncio.TimeoutError:
-            self.stats['total_timeouts'] += 1
-            self.logger.warning(
-                "Message processing timeout in consumer %s (timeout: %ss)",
-                self.job_id,
-                timeout,
-            )
-            # Timeout is also treated as an error, handled by error handler
-            timeout_error = TimeoutError(f"Message processing timeout ({timeout}s)")
-            context = {
-                'job_id': self.job_id,
-                'error_type': 'timeout',
-                'timeout': timeout,
-                'timestamp': datetime.now().isoformat(),
-            }
+            should_continue = await self._handle_timeout_error(timeout)
+        except Exception as e:
+            should_continue = await self._handle_consume_error(e)
+        else:
+            should_continue = True
 
-            try:
-                should_continue = await self._error_handler.handle_error(
-                    timeout_error, context
-                )
-                if not should_continue:
-                    raise timeout_error
-            except Exception as handler_error:
-                self.logger.error(
-                    "Error in timeout error handler: %s",
-                    str(handler_error),
-                    exc_info=True,
+        if not should_continue:
+            # Leave the batch unacked so the message source can redeliver it
+            self.request_stop()
+            return
+
+        await self._settle_message_batch(sequence, message_batch, success)
+
+    async def _settle_message_batch(
+        self, sequence: int, message_batch: MessageBatch, success: bool
+    ) -> None:
+        """Mark a message batch as settled and ack the settled batches in fetch order"""
+        self._settled_batches[sequence] = (message_batch, success)
+
+        async with self._ack_lock:
+            while self._next_ack_sequence in self._settled_batches:
+                batch, batch_success = self._settled_batches.pop(
+                    self._next_ack_sequence
                 )
+                self._next_ack_sequence += 1
 
-        except Exception as e:
-            # Other exceptions will be caught and handled in the outer loop
-            raise
+                try:
+                    await self._ack_message(batch, batch_success)
+                    self.stats['total_acked'] += 1
+                except Exception as e:
+                    self.logger.error(
+                        "Failed to ack message batch %s in consumer %s: %s",
+                        batch.batch_id,
+                        self.job_id,
+                        str(e),
+                        exc_info=True,
+                    )
+
+                enqueued_at = batch.metadata.get('enqueued_at')
+                if enqueued_at is not None:
+                    self.stats['lag_seconds'] = max(0.0, time.time() - enqueued_at)
+
+    async def _fetch_message_batch(self) -> Optional[MessageBatch]:
+        """Fetch a message and wrap it as MessageBatch, return None if there is nothing to process"""
+        raw_message = await self._fetch_message()
+        if raw_message is None:
+            return None
+
+        # If not MessageBatch, wrap automatically
+        if isinstance(raw_message, MessageBatch):
+            message_batch = raw_message
+        else:
+            message_batch = MessageBatch(
+                data=raw_message,
+                batch_id=f"auto_wrapped_{id(raw_message)}",
+                metadata={'auto_wrapped': True},
+            )
+
+        if message_batch.is_empty:
+            return None
 
-    async def _process_single_message(self) -> None:
+        return message_batch
+
+    async def _process_message_batch(self, message_batch: MessageBatch) -> None:
         """
-        Process a single message with enhanced retry logic
-        First fetch the message, then pass the same message batch during retries
+        Process a message batch with enhanced retry logic
+        The same message batch is passed during retries
         """
         retry_config = self.consumer_config.retry_config
         last_error = None
-        message_batch = None
 
         for attempt in range(retry_config.max_retries + 1):
             try:
-                # Fetch message on first attempt, use same batch on retries
-                if attempt == 0:
-                    raw_message = await self._fetch_message()
-                    if raw_message is None:
-                        return  # No message to process
-
-                    # If not MessageBatch, wrap automatically
-                    if isinstance(raw_message, MessageBatch):
-                        message_batch = raw_message
-                    else:
-                        message_batch = MessageBatch(
-                            data=raw_message,
-                            batch_id=f"auto_wrapped_{id(raw_message)}",
-                            metadata={'auto_wrapped': True},
-                        )
-
-                    if message_batch.is_empty:
-                        return  # No message to process
-
                 # Call subclass's specific message handling logic, passing message batch
                 await self._handle_message(message_batch)
                 return  # Successfully processed, return directly
@@ -387,6 +539,20 @@ class RecycleConsumerBase(LongJobInterface, ABC):
 
         return delay
 
+    def _record_completion(self) -> None:
+        """Record a completed message batch for throughput, dropping entries outside the window"""
+        now = time.monotonic()
+        self._recent_completions.append(now)
+        self._prune_completions(now)
+
+    def _prune_completions(self, now: float) -> None:
+        """Drop completion times older than the throughput window"""
+        while (
+            self._recent_completions
+            and now - self._recent_completions[0] > self.THROUGHPUT_WINDOW_SECONDS
+        ):
+            self._recent_completions.popleft()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get consumer statistics"""
         stats = self.stats.copy()
@@ -397,6 +563,20 @@ class RecycleConsumerBase(LongJobInterface, ABC):
             uptime = datetime.now() - stats['start_time']
             stats['uptime'] = uptime.total_seconds()
 
+        # Throughput over the recent window (message batches per second)
+        self._prune_completions(time.monotonic())
+        window = self.THROUGHPUT_WINDOW_SECONDS
+        if stats['uptime'] is not None:
+            window = min(window, max(stats['uptime'], 1.0))
+        stats['throughput_per_second'] = len(self._recent_completions) / window
+
+        # Fetched but not yet settled / settled but waiting for an earlier batch's ack
+        stats['max_in_flight'] = self.consumer_config.max_in_flight
+        stats['pending_ack'] = len(self._settled_batches)
+        stats['in_flight'] = (
+            self._next_sequence - self._next_ack_sequence - stats['pending_ack']
+        )
+
         return stats
 
     @abstractmethod
@@ -429,11 +609,24 @@ class RecycleConsumerBase(LongJobInterface, ABC):
         Fetch message data
         Subclasses need to implement this method to retrieve messages from the message source, can return any type of data
         The framework will automatically determine the type and wrap it if it's not a MessageBatch
+        Set metadata['enqueued_at'] (epoch seconds) on a MessageBatch to report lag_seconds in get_stats()
 
         Returns:
             Optional[Any]: Retrieved message data, can be any type, return None if no message
         """
 
+    async def _ack_message(self, message_batch: MessageBatch, success: bool) -> None:
+        """
+        Acknowledge a settled message batch
+        Called in fetch order even when batches complete out of order (max_in_flight > 1),
+        so subclasses can safely commit offsets or delete source messages here.
+        Default implementation does nothing.
+
+        Args:
+            message_batch: Settled message batch
+            success: False if processing failed and the error handler chose to continue
+        """
+
     @abstractmethod
     async def _handle_message(self, message_batch: MessageBatch) -> None:
         """
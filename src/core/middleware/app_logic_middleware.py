@@ -3,24 +3,27 @@ Application logic middleware
 Responsible for extracting and setting application-level context information, and handling application-related logic (e.g., reporting)
 """
 
-from typing import Callable, Dict, Any, Optional
+from typing import Optional
 
 from fastapi import Request
-from starlette.responses import Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.observation.logger import get_logger
-from core.context.context import set_current_app_info, set_current_request
+from core.context.context import (
+    set_current_app_info,
+    set_current_request,
+    clear_current_app_info,
+    clear_current_request,
+)
 from core.di.utils import get_bean_by_type
 from component.app_logic_provider import AppLogicProvider
 
 logger = get_logger(__name__)
 
 
-class AppLogicMiddleware(BaseHTTPMiddleware):
+class AppLogicMiddleware:
     """
-    Application logic middleware
+    Application logic middleware (pure ASGI)
 
     Responsible for managing the request lifecycle and invoking callback methods of AppLogicProvider:
     - setup_app_context(): Extract and set application context (called on every request)
@@ -29,34 +32,55 @@ class AppLogicMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         self._app_logic_provider = get_bean_by_type(AppLogicProvider)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+
         # ========== Extract and set application context (called on every request) ==========
         app_info = self._app_logic_provider.setup_app_context(request)
 
         # Set context
-        set_current_request(request)
-        if app_info:
-            set_current_app_info(app_info)
+        request_token = set_current_request(request)
+        app_info_token = set_current_app_info(app_info) if app_info else None
+
+        try:
+            await self._process(request, scope, receive, send)
+        finally:
+            if app_info_token is not None:
+                clear_current_app_info(app_info_token)
+            clear_current_request(request_token)
 
+    async def _process(
+        self, request: Request, scope: Scope, receive: Receive, send: Send
+    ) -> None:
         # ========== Check whether to process business logic for this request ==========
         should_process = self._app_logic_provider.should_process_request(request)
         if not should_process:
             # Skip business logic processing, directly call the next middleware
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        response: Optional[Response] = None
+        http_code: Optional[int] = None
         error_message: Optional[str] = None
 
+        async def send_with_status(message: Message) -> None:
+            nonlocal http_code
+            if message["type"] == "http.response.start":
+                http_code = message["status"]
+            await send(message)
+
         try:
             # ========== Request begins: call on_request_begin ==========
             await self._app_logic_provider.on_request_begin(request)
 
             # ========== Call next layer processing ==========
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_with_status)
 
         except Exception as e:
             logger.error("Exception in application logic middleware: %s", e)
@@ -65,10 +89,8 @@ class AppLogicMiddleware(BaseHTTPMiddleware):
 
         finally:
             # ========== Request ends: call on_request_complete ==========
-            # Determine HTTP status code
-            if response is not None:
-                http_code = response.status_code
-            else:
+            # Determine HTTP status code (no response started means the request failed)
+            if http_code is None or error_message is not None:
                 http_code = 500
 
             try:
@@ -2,11 +2,10 @@ import hmac
 import hashlib
 import time
 import os
-from typing import Callable, Optional
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from core.authorize.enums import Role
 from core.context.context import set_current_user_info, clear_current_user_context
@@ -17,13 +16,14 @@ from core.di import get_bean_by_type
 logger = get_logger(__name__)
 
 
-class HMACSignatureMiddleware(BaseHTTPMiddleware):
+class HMACSignatureMiddleware:
     """
     HMAC signature verification middleware
 
     Verifies the HMAC signature of requests to ensure request integrity and authenticity.
     Uses HTTP method, URL path, and timestamp as signing data.
     The time window is 5 minutes; requests exceeding this window will be rejected.
+    Implemented as pure ASGI middleware.
     """
 
     def __init__(
@@ -42,7 +42,7 @@ class HMACSignatureMiddleware(BaseHTTPMiddleware):
             time_window_minutes: Time window (in minutes), default is 5 minutes
             redis_provider: Redis provider, used for replay attack prevention
         """
-        super().__init__(app)
+        self.app = app
         self.secret_key = secret_key.encode('utf-8')
         self.time_window_seconds = time_window_minutes * 60
         self._redis_provider = redis_provider
@@ -51,7 +51,7 @@ class HMACSignatureMiddleware(BaseHTTPMiddleware):
     def redis_provider(self) -> RedisProvider:
         return self._redis_provider or get_bean_by_type(RedisProvider)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Handle HMAC signature verification and set user context
 
@@ -63,12 +63,16 @@ class HMACSignatureMiddleware(BaseHTTPMiddleware):
         Signature data format: {METHOD}|{URL_PATH}|{TIMESTAMP}|{NONCE}
 
         Args:
-            request: FastAPI request object
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response: Response object
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Clear any existing user context
         clear_current_user_context()
 
@@ -122,8 +126,7 @@ class HMACSignatureMiddleware(BaseHTTPMiddleware):
 
         # Step 2: Execute business logic
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
 
         except Exception as e:
             logger.error(f"Exception in business logic processing: {str(e)}")
@@ -20,24 +20,21 @@ Usage:
 """
 
 import os
-from typing import Callable, Optional
-
-from fastapi import Request
 from fastapi.responses import HTMLResponse
-from starlette.responses import Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class ProfileMiddleware(BaseHTTPMiddleware):
+class ProfileMiddleware:
     """
     Performance profiling middleware
 
-    Enables performance profiling when the request URL contains the ?profile=true parameter and returns an HTML-formatted analysis report
+    Enables performance profiling when the request URL contains the ?profile=true parameter and returns an HTML-formatted analysis report.
+    Implemented as pure ASGI middleware.
     """
 
     def __init__(self, app: ASGIApp):
@@ -47,7 +44,7 @@ class ProfileMiddleware(BaseHTTPMiddleware):
         Args:
             app: ASGI application instance
         """
-        super().__init__(app)
+        self.app = app
 
         # Read from environment variable whether profiling is enabled
         profiling_env = os.getenv(
@@ -77,31 +74,35 @@ class ProfileMiddleware(BaseHTTPMiddleware):
                 "Performance profiling is not enabled (set environment variable PROFILING_ENABLED=true to enable)"
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Handle HTTP requests and perform performance profiling when needed
 
         Args:
-            request: FastAPI request object
-            call_next: next middleware or route handler
-
-        Returns:
-            Response: response object (normal response or profiling report)
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
         # If feature is not enabled, pass through directly
-        if not self._profiling_enabled or not self._profiler_available:
-            return await call_next(request)
+        if (
+            scope["type"] != "http"
+            or not self._profiling_enabled
+            or not self._profiler_available
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # Check if profiling is required
-        profiling = request.query_params.get("profile", "").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        query_params = QueryParams(scope.get("query_string", b""))
+        profiling = query_params.get("profile", "").lower() in ("true", "1", "yes")
 
         if not profiling:
             # No profiling needed, process request normally
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method")
+        path = scope.get("path")
 
         # Profiling is needed
         try:
@@ -112,11 +113,15 @@ class ProfileMiddleware(BaseHTTPMiddleware):
             profiler = Profiler()
             profiler.start()
 
-            logger.info("Profiling started: %s %s", request.method, request.url.path)
+            logger.info("Profiling started: %s %s", method, path)
+
+            async def discard(message: Message) -> None:
+                # Original response is discarded and replaced with profiler report
+                pass
 
             try:
-                # Execute request (note: original response will be discarded and replaced with profiler report)
-                await call_next(request)
+                # Execute request
+                await self.app(scope, receive, discard)
             except Exception as e:
                 # Even if the request fails, stop profiler and return profiling report
                 logger.error("Request failed during profiling: %s", str(e))
@@ -128,12 +133,14 @@ class ProfileMiddleware(BaseHTTPMiddleware):
             # Generate HTML report
             html_output = profiler.output_html()
 
-            logger.info("Profiling completed: %s %s", request.method, request.url.path)
-
-            # Return HTML-formatted profiling report
-            return HTMLResponse(content=html_output, status_code=200)
+            logger.info("Profiling completed: %s %s", method, path)
 
         except Exception as e:
             logger.error("Error occurred during profiling: %s", str(e))
             # If profiling fails, re-execute normal request
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        # Return HTML-formatted profiling report
+        response = HTMLResponse(content=html_output, status_code=200)
+        await response(scope, receive, send)
@@ -1,8 +1,6 @@
 from core.authorize.enums import Role
-from fastapi import Request, Response, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from typing import Callable
+from fastapi import Request, HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from core.context.context import set_current_user_info, clear_current_user_context
 from component.auth_provider import AuthProvider
@@ -12,30 +10,34 @@ from core.observation.logger import get_logger
 logger = get_logger(__name__)
 
 
-class UserContextMiddleware(BaseHTTPMiddleware):
+class UserContextMiddleware:
     """
     User context middleware
 
     Extract user information from each HTTP request and set it into the context variable,
     so that user information can be accessed via context throughout the entire request processing,
-    without explicitly passing the request parameter.
+    without explicitly passing the request parameter. Implemented as pure ASGI middleware.
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         self.auth_provider = get_bean_by_type(AuthProvider)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Set user context for each request
 
         Args:
-            request: FastAPI request object
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response: Response object
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Clear any existing user context
         clear_current_user_context()
 
@@ -89,8 +91,7 @@ class UserContextMiddleware(BaseHTTPMiddleware):
 
         # Step 2: Execute business logic
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
 
         except Exception as e:
             logger.error("Business logic processing exception: %s", str(e))
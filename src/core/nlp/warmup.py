@@ -0,0 +1,35 @@
+"""
+NLP asset warm-up
+
+Loads tokenizer dictionaries and stopword lists that are otherwise loaded lazily on the
+first request: the jieba prefix dictionary, the HIT Chinese stopwords and the NLTK data
+used by BM25. Called before forking workers so the assets are loaded once and shared.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def preload_nlp_assets() -> None:
+    """Load jieba, stopwords and NLTK data into the current process (best effort)"""
+    import jieba
+
+    jieba.initialize()
+
+    # Stopwords are loaded when the module is imported
+    from core.nlp import stopwords_utils  # noqa: F401
+
+    try:
+        from nltk.corpus import stopwords
+        from nltk.stem import PorterStemmer
+        from nltk.tokenize import word_tokenize
+
+        stopwords.words("english")
+        word_tokenize("warm up")
+        PorterStemmer().stem("warming")
+    except (ImportError, LookupError) as e:
+        # Missing NLTK data is downloaded on first use by retrieval_utils
+        logger.info("NLTK assets not preloaded: %s", e)
+
+    logger.info("✅ NLP assets preloaded")
@@ -7,14 +7,19 @@ using Beanie as the underlying migration engine.
 
 import os
 import logging
+import socket
 import subprocess
 import sys
-from datetime import datetime
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from common_utils.project_path import CURRENT_DIR
 from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError
 
 # Module-level logger for this file
 logger = logging.getLogger(__name__)
@@ -25,6 +30,13 @@ class MigrationManager:
 
     MIGRATIONS_DIR = CURRENT_DIR / "migrations" / "mongodb"
 
+    # Startup lease: only one instance runs pending migrations, the others wait
+    LEASE_COLLECTION = "migrations_lease"
+    LEASE_ID = "startup"
+    DEFAULT_LEASE_TTL = 300
+    DEFAULT_LEASE_WAIT = 900
+    LEASE_POLL_INTERVAL = 2.0
+
     # Default migration template
     MIGRATION_TEMPLATE = '''"""
 {description}
@@ -360,6 +372,164 @@ class Backward:
                 after_current or "<none>",
             )
 
+    # ---------- Startup fast path and lease ----------
+    def _migration_file_names(self) -> List[str]:
+        """Migration file names in Beanie execution order (underscore files are ignored)"""
+        return sorted(path.name for path in self.migrations_path.glob("[!_]*.py"))
+
+    def get_pending_migrations(self) -> Optional[List[str]]:
+        """
+        Migration files Beanie would run forward, computed in-process from migrations_log
+
+        Beanie runs the files after the current pointer (all files when there is none).
+
+        Returns:
+            Pending file names (empty when at head), None if migrations_log cannot be read
+        """
+        file_names = self._migration_file_names()
+        if not file_names:
+            return []
+
+        names, current = self._snapshot_migration_log()
+        if names is None:
+            return None
+
+        if current in file_names:
+            pending = file_names[file_names.index(current) + 1 :]
+        else:
+            pending = file_names
+
+        skipped = [
+            name for name in file_names if name not in names and name not in pending
+        ]
+        if skipped:
+            logger.warning(
+                "⚠️ Migration files older than the current pointer were never applied: %s",
+                ", ".join(skipped),
+            )
+        return pending
+
+    def _acquire_migration_lease(self, owner: str, ttl: int) -> bool:
+        """Take or renew the startup lease, returns False while another instance holds it"""
+        now = datetime.now(timezone.utc)
+        with self._get_sync_mongo_client() as client:
+            coll = client[self.database][self.LEASE_COLLECTION]
+            try:
+                coll.find_one_and_update(
+                    {
+                        "_id": self.LEASE_ID,
+                        "$or": [{"expires_at": {"$lte": now}}, {"owner": owner}],
+                    },
+                    {
+                        "$set": {
+                            "owner": owner,
+                            "expires_at": now + timedelta(seconds=ttl),
+                        }
+                    },
+                    upsert=True,
+                )
+                return True
+            except DuplicateKeyError:
+                # Lease document exists, is not expired and belongs to another instance
+                return False
+
+    def _release_migration_lease(self, owner: str) -> None:
+        """Release the startup lease if still held by this instance"""
+        try:
+            with self._get_sync_mongo_client() as client:
+                client[self.database][self.LEASE_COLLECTION].delete_one(
+                    {"_id": self.LEASE_ID, "owner": owner}
+                )
+        except Exception as e:
+            logger.warning("Failed to release migration lease: %s", str(e))
+
+    def _keep_migration_lease(
+        self, owner: str, ttl: int, stop_event: threading.Event
+    ) -> None:
+        """Renew the lease every ttl/3 seconds while the migration runs"""
+        while not stop_event.wait(ttl / 3):
+            try:
+                if not self._acquire_migration_lease(owner, ttl):
+                    logger.warning(
+                        "⚠️ Migration lease was taken over by another instance"
+                    )
+                    return
+            except Exception as e:
+                logger.warning("Failed to renew migration lease: %s", str(e))
+
+    def run_pending_migrations(
+        self, lease_ttl: Optional[int] = None, lease_wait: Optional[int] = None
+    ) -> int:
+        """
+        Run pending migrations once across all instances
+
+        Returns immediately without starting Beanie when migrations_log is already at
+        head. Otherwise one instance takes the lease and runs `beanie migrate`, the others
+        poll until the log reaches head or the lease frees up.
+
+        Args:
+            lease_ttl: Lease expiry in seconds (renewed while migrating),
+                defaults to MONGODB_MIGRATION_LEASE_TTL
+            lease_wait: Maximum seconds to wait for the lease,
+                defaults to MONGODB_MIGRATION_LEASE_WAIT
+
+        Returns:
+            Exit code, 0 means up to date or migrated successfully
+        """
+        pending = self.get_pending_migrations()
+        if pending is not None and not pending:
+            logger.info("✅ MongoDB migrations are up to date, skipping Beanie")
+            return 0
+        if pending:
+            logger.info("📄 Pending migrations: %s", ", ".join(pending))
+
+        lease_ttl = lease_ttl or int(
+            os.getenv("MONGODB_MIGRATION_LEASE_TTL", self.DEFAULT_LEASE_TTL)
+        )
+        lease_wait = lease_wait or int(
+            os.getenv("MONGODB_MIGRATION_LEASE_WAIT", self.DEFAULT_LEASE_WAIT)
+        )
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        deadline = time.monotonic() + lease_wait
+
+        try:
+            while not self._acquire_migration_lease(owner, lease_ttl):
+                if time.monotonic() >= deadline:
+                    logger.error(
+                        "❌ Timed out after %ss waiting for the migration lease",
+                        lease_wait,
+                    )
+                    return 1
+                logger.info("⏳ Another instance is running migrations, waiting...")
+                time.sleep(self.LEASE_POLL_INTERVAL)
+                if self.get_pending_migrations() == []:
+                    logger.info("✅ MongoDB migrations completed by another instance")
+                    return 0
+        except Exception as e:
+            logger.warning(
+                "Failed to acquire migration lease, migrating without it: %s", str(e)
+            )
+            return self.run_migration()
+
+        stop_event = threading.Event()
+        keeper = threading.Thread(
+            target=self._keep_migration_lease,
+            args=(owner, lease_ttl, stop_event),
+            name="migration-lease",
+            daemon=True,
+        )
+        keeper.start()
+        try:
+            # Another instance may have finished while we were waiting
+            if self.get_pending_migrations() == []:
+                logger.info("✅ MongoDB migrations are up to date, skipping Beanie")
+                return 0
+            return self.run_migration()
+        finally:
+            stop_event.set()
+            keeper.join()
+            self._release_migration_lease(owner)
+
     # ---------- Public utility for manual query ----------
     def get_migration_history(self):
         """Return full migration history from migrations_log (sorted by ts asc)."""
@@ -395,7 +565,9 @@ class Backward:
         """
         Run MongoDB database migrations on application startup
 
-        Execute all pending migration scripts using default configuration (connection info from environment variables)
+        Execute all pending migration scripts using default configuration (connection info from environment variables).
+        Skips Beanie when migrations_log is already at head, and lets a single instance
+        migrate when several start at once (see run_pending_migrations)
 
         Args:
             enabled: Whether to enable migration, False to skip migration step
@@ -422,7 +594,7 @@ class Backward:
 
             # Execute migration
             logger.info("Starting MongoDB migration operation...")
-            exit_code = migration_manager.run_migration()
+            exit_code = migration_manager.run_pending_migrations()
 
             if exit_code != 0:
                 logger.warning(
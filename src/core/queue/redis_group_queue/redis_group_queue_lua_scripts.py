@@ -7,11 +7,16 @@ Provides atomic operation Lua scripts to ensure queue state consistency.
 # Common rebalance function definition
 REBALANCE_FUNCTION = """
 -- rebalance partition function
-local function rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+-- partition_owner_key: hash partition -> owner_id, used by enqueue scripts to wake up the owner
+-- wakeup_prefix: prefix of each owner's wakeup list (BLPOP-style notification)
+local function rebalance_partitions(owner_zset_key, queue_list_prefix, partition_owner_key, wakeup_prefix, total_partitions, owner_expire)
     -- Get all active owners
     local active_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
     local owner_count = #active_owners
     
+    -- Reset partition owner mapping
+    redis.call('DEL', partition_owner_key)
+    
     if owner_count == 0 then
         return {0, {}}
     end
@@ -43,6 +48,7 @@ local function rebalance_partitions(owner_zset_key, queue_list_prefix, total_par
         for j = 1, partitions_for_this_owner do
             local partition_name = string.format("%03d", partition_index)
             redis.call('LPUSH', queue_list_key, partition_name)
+            redis.call('HSET', partition_owner_key, partition_name, owner_id)
             table.insert(owner_partitions, partition_name)
             partition_index = partition_index + 1
         end
@@ -50,33 +56,66 @@ local function rebalance_partitions(owner_zset_key, queue_list_prefix, total_par
         -- Set expiration time
         redis.call('EXPIRE', queue_list_key, owner_expire)
         
+        -- Wake up owner: its partitions changed and may already hold messages
+        local wakeup_key = wakeup_prefix .. owner_id
+        redis.call('LPUSH', wakeup_key, 'rebalance')
+        redis.call('LTRIM', wakeup_key, 0, 0)
+        redis.call('EXPIRE', wakeup_key, owner_expire)
+        
         -- Add owner_id and partition list to flat array
         table.insert(assigned_partitions_flat, owner_id)
         table.insert(assigned_partitions_flat, owner_partitions)
     end
     
+    redis.call('EXPIRE', partition_owner_key, owner_expire)
+    
     return {owner_count, assigned_partitions_flat}
 end
 """
 
+# Common wakeup notification function definition
+NOTIFY_FUNCTION = """
+-- Wake up the owner of a partition by pushing a token to its wakeup list.
+-- The list is trimmed to a single token, so bursts of enqueues coalesce into one wakeup.
+local function notify_partition_owner(partition_owner_key, wakeup_prefix, partition, wakeup_expire)
+    local owner_id = redis.call('HGET', partition_owner_key, partition)
+    if owner_id then
+        local wakeup_key = wakeup_prefix .. owner_id
+        redis.call('LPUSH', wakeup_key, partition)
+        redis.call('LTRIM', wakeup_key, 0, 0)
+        redis.call('EXPIRE', wakeup_key, wakeup_expire)
+    end
+end
+"""
+
 # Lua script for adding message to queue
 ENQUEUE_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: queue key (zset)
 -- KEYS[2]: total counter key
+-- KEYS[3]: partition_owner key (optional, hash partition -> owner_id)
+-- KEYS[4]: wakeup_prefix (optional, used to construct each owner's wakeup list key)
 -- ARGV[1]: message content (supports JSON string or BSON binary data)
 -- ARGV[2]: sort score
 -- ARGV[3]: queue expiration time (seconds)
 -- ARGV[4]: activity expiration time (seconds, 7 days)
 -- ARGV[5]: maximum total limit
+-- ARGV[6]: partition name (optional, required for wakeup notification)
+-- ARGV[7]: wakeup list expiration time (seconds, optional)
+
+__NOTIFY_FUNCTION__
 
 local queue_key = KEYS[1]
 local counter_key = KEYS[2]
+local partition_owner_key = KEYS[3]
+local wakeup_prefix = KEYS[4]
 local message = ARGV[1]
 local score = tonumber(ARGV[2])
 local queue_expire = tonumber(ARGV[3])
 local activity_expire = tonumber(ARGV[4])
 local max_total = tonumber(ARGV[5])
+local partition = ARGV[6]
+local wakeup_expire = tonumber(ARGV[7] or '0')
 
 -- Check total limit
 local current_count = tonumber(redis.call('GET', counter_key) or '0')
@@ -94,17 +133,94 @@ if added == 1 then
     local new_count = redis.call('INCR', counter_key)
     redis.call('EXPIRE', counter_key, activity_expire)
     
+    -- Wake up the consumer owning this partition
+    if partition_owner_key and partition then
+        notify_partition_owner(partition_owner_key, wakeup_prefix, partition, wakeup_expire)
+    end
+    
     return {1, new_count, "Added successfully"}
 else
     return {0, current_count, "Message already exists"}
 end
 """
 
+# Lua script for adding multiple messages in one round trip
+BATCH_ENQUEUE_SCRIPT = """
+-- Parameters:
+-- KEYS[1]: queue_prefix (used to construct partition queue key)
+-- KEYS[2]: total counter key
+-- KEYS[3]: partition_owner key (hash partition -> owner_id)
+-- KEYS[4]: wakeup_prefix (used to construct each owner's wakeup list key)
+-- ARGV[1]: queue expiration time (seconds)
+-- ARGV[2]: activity expiration time (seconds)
+-- ARGV[3]: maximum total limit
+-- ARGV[4]: wakeup list expiration time (seconds)
+-- ARGV[5..]: (partition, sort score, message content) triples, grouped by partition
+-- Returns: {added count, current total, per-item results}
+--   per-item result: 1 added, 0 message already exists, -1 exceeded maximum total limit
+
+__NOTIFY_FUNCTION__
+
+local queue_prefix = KEYS[1]
+local counter_key = KEYS[2]
+local partition_owner_key = KEYS[3]
+local wakeup_prefix = KEYS[4]
+local queue_expire = tonumber(ARGV[1])
+local activity_expire = tonumber(ARGV[2])
+local max_total = tonumber(ARGV[3])
+local wakeup_expire = tonumber(ARGV[4])
+
+local current_count = tonumber(redis.call('GET', counter_key) or '0')
+local added_count = 0
+local results = {}
+local touched_partitions = {}
+local touched_order = {}
+
+for i = 5, #ARGV, 3 do
+    local partition = ARGV[i]
+    local score = tonumber(ARGV[i + 1])
+    local message = ARGV[i + 2]
+
+    if current_count + added_count >= max_total then
+        table.insert(results, -1)
+    else
+        local queue_key = queue_prefix .. partition
+        local added = redis.call('ZADD', queue_key, score, message)
+        if added == 1 then
+            added_count = added_count + 1
+            table.insert(results, 1)
+            if not touched_partitions[partition] then
+                touched_partitions[partition] = true
+                table.insert(touched_order, partition)
+            end
+        else
+            table.insert(results, 0)
+        end
+    end
+end
+
+-- Renew expiration and wake up each touched partition's owner once
+for _, partition in ipairs(touched_order) do
+    redis.call('EXPIRE', queue_prefix .. partition, queue_expire)
+    notify_partition_owner(partition_owner_key, wakeup_prefix, partition, wakeup_expire)
+end
+
+local new_count = current_count
+if added_count > 0 then
+    new_count = redis.call('INCRBY', counter_key, added_count)
+    redis.call('EXPIRE', counter_key, activity_expire)
+end
+
+return {added_count, new_count, results}
+"""
+
 # Lua script for rebalance repartitioning
 REBALANCE_PARTITIONS_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: partition_owner key (hash partition -> owner_id)
+-- KEYS[4]: wakeup_prefix (used to construct each owner's wakeup list key)
 -- ARGV[1]: total number of partitions
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 
@@ -112,11 +228,13 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local partition_owner_key = KEYS[3]
+local wakeup_prefix = KEYS[4]
 local total_partitions = tonumber(ARGV[1])
 local owner_expire = tonumber(ARGV[2])
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, partition_owner_key, wakeup_prefix, total_partitions, owner_expire)
 """
 
 # Lua script for joining consumer
@@ -124,6 +242,8 @@ JOIN_CONSUMER_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: partition_owner key (hash partition -> owner_id)
+-- KEYS[4]: wakeup_prefix (used to construct each owner's wakeup list key)
 -- ARGV[1]: owner_id
 -- ARGV[2]: current timestamp
 -- ARGV[3]: owner expiration time (seconds, default 1 hour)
@@ -133,6 +253,8 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local partition_owner_key = KEYS[3]
+local wakeup_prefix = KEYS[4]
 local owner_id = ARGV[1]
 local current_time = tonumber(ARGV[2])
 local owner_expire = tonumber(ARGV[3])
@@ -143,7 +265,7 @@ redis.call('ZADD', owner_zset_key, current_time, owner_id)
 redis.call('EXPIRE', owner_zset_key, owner_expire)
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, partition_owner_key, wakeup_prefix, total_partitions, owner_expire)
 """
 
 # Lua script for consumer exit
@@ -151,6 +273,8 @@ EXIT_CONSUMER_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: partition_owner key (hash partition -> owner_id)
+-- KEYS[4]: wakeup_prefix (used to construct each owner's wakeup list key)
 -- ARGV[1]: owner_id
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 -- ARGV[3]: total number of partitions
@@ -159,6 +283,8 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local partition_owner_key = KEYS[3]
+local wakeup_prefix = KEYS[4]
 local owner_id = ARGV[1]
 local owner_expire = tonumber(ARGV[2])
 local total_partitions = tonumber(ARGV[3])
@@ -166,18 +292,20 @@ local total_partitions = tonumber(ARGV[3])
 -- Remove from owner_activate_time_zset
 redis.call('ZREM', owner_zset_key, owner_id)
 
--- Delete corresponding queue_list
+-- Delete corresponding queue_list and wakeup list
 local queue_list_key = queue_list_prefix .. owner_id
 redis.call('DEL', queue_list_key)
+redis.call('DEL', wakeup_prefix .. owner_id)
 
 -- Check if there are remaining owners, if so call rebalance function
 local remaining_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
 if #remaining_owners == 0 then
+    redis.call('DEL', partition_owner_key)
     return {0, {}}
 end
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, partition_owner_key, wakeup_prefix, total_partitions, owner_expire)
 """
 
 # Lua script for consumer keepalive
@@ -217,6 +345,8 @@ CLEANUP_INACTIVE_OWNERS_SCRIPT = """
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
 -- KEYS[3]: queue_prefix (used to construct partition queue key)
 -- KEYS[4]: counter_key (message total counter key)
+-- KEYS[5]: partition_owner key (hash partition -> owner_id)
+-- KEYS[6]: wakeup_prefix (used to construct each owner's wakeup list key)
 -- ARGV[1]: inactive threshold timestamp (5 minutes ago)
 -- ARGV[2]: current timestamp
 -- ARGV[3]: owner expiration time (seconds, default 1 hour)
@@ -228,6 +358,8 @@ local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
 local queue_prefix = KEYS[3]
 local counter_key = KEYS[4]
+local partition_owner_key = KEYS[5]
+local wakeup_prefix = KEYS[6]
 local inactive_threshold = tonumber(ARGV[1])
 local current_time = tonumber(ARGV[2])
 local owner_expire = tonumber(ARGV[3])
@@ -242,9 +374,10 @@ for _, owner_id in ipairs(inactive_owners) do
     -- Remove from zset
     redis.call('ZREM', owner_zset_key, owner_id)
     
-    -- Delete corresponding queue_list
+    -- Delete corresponding queue_list and wakeup list
     local queue_list_key = queue_list_prefix .. owner_id
     redis.call('DEL', queue_list_key)
+    redis.call('DEL', wakeup_prefix .. owner_id)
     
     cleaned_count = cleaned_count + 1
 end
@@ -268,11 +401,12 @@ end
 -- Check if there are remaining owners
 local remaining_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
 if #remaining_owners == 0 then
+    redis.call('DEL', partition_owner_key)
     return {cleaned_count, 0, {}}
 end
 
 -- Call rebalance function
-local owner_count, assigned_partitions = unpack(rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire))
+local owner_count, assigned_partitions = unpack(rebalance_partitions(owner_zset_key, queue_list_prefix, partition_owner_key, wakeup_prefix, total_partitions, owner_expire))
 return {cleaned_count, owner_count, assigned_partitions}
 """
 
@@ -283,6 +417,8 @@ FORCE_CLEANUP_SCRIPT = """
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
 -- KEYS[3]: queue_prefix (used to construct partition queue key)
 -- KEYS[4]: counter_key (message total counter key)
+-- KEYS[5]: partition_owner key (hash partition -> owner_id)
+-- KEYS[6]: wakeup_prefix (used to construct each owner's wakeup list key)
 -- ARGV[1]: total number of partitions
 -- ARGV[2]: purge_all flag ("1" to empty all partition queues and set counter to 0; otherwise only recalculate counter)
 
@@ -290,6 +426,8 @@ local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
 local queue_prefix = KEYS[3]
 local counter_key = KEYS[4]
+local partition_owner_key = KEYS[5]
+local wakeup_prefix = KEYS[6]
 local total_partitions = tonumber(ARGV[1])
 local purge_all = ARGV[2]
 
@@ -297,15 +435,17 @@ local purge_all = ARGV[2]
 local all_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
 local cleaned_count = 0
 
--- Delete queue_list for all owners
+-- Delete queue_list and wakeup list for all owners
 for _, owner_id in ipairs(all_owners) do
     local queue_list_key = queue_list_prefix .. owner_id
     redis.call('DEL', queue_list_key)
+    redis.call('DEL', wakeup_prefix .. owner_id)
     cleaned_count = cleaned_count + 1
 end
 
--- Delete owner_activate_time_zset
+-- Delete owner_activate_time_zset and partition owner mapping
 redis.call('DEL', owner_zset_key)
+redis.call('DEL', partition_owner_key)
 
 if purge_all == '1' then
     -- Empty all partition queues and set counter to 0
@@ -330,7 +470,7 @@ else
 end
 """
 
-# Lua script for getting messages (traverse all partitions and attempt to get one from each)
+# Lua script for getting messages (traverse all partitions and attempt to get up to N from each)
 GET_MESSAGES_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
@@ -341,6 +481,9 @@ GET_MESSAGES_SCRIPT = """
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 -- ARGV[3]: score difference threshold (milliseconds)
 -- ARGV[4]: current score (used for threshold comparison when queue is empty)
+-- ARGV[5]: maximum messages per partition (optional, default 1)
+-- ARGV[6]: maximum messages in total (optional, 0 means unlimited)
+-- ARGV[7]: partition start offset (optional, rotates traversal order for fairness under max_total)
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
@@ -350,6 +493,9 @@ local owner_id = ARGV[1]
 local owner_expire = tonumber(ARGV[2])
 local score_threshold = tonumber(ARGV[3])
 local current_score = tonumber(ARGV[4])
+local max_per_partition = tonumber(ARGV[5] or '1')
+local max_total = tonumber(ARGV[6] or '0')
+local start_offset = tonumber(ARGV[7] or '0')
 
 -- Check if owner exists in zset
 local owner_score = redis.call('ZSCORE', owner_zset_key, owner_id)
@@ -375,29 +521,42 @@ end
 local messages = {}
 local messages_consumed = 0
 
--- Traverse all partitions, attempt to get 1 message from each
-for _, partition in ipairs(owner_queues) do
+-- Traverse all partitions, attempt to get up to max_per_partition messages from each
+local queue_count = #owner_queues
+for n = 0, queue_count - 1 do
+    if max_total > 0 and messages_consumed >= max_total then
+        break
+    end
+
+    local partition = owner_queues[((n + start_offset) % queue_count) + 1]
     local queue_key = queue_prefix .. partition
+    local taken = 0
     
-    -- Check if queue has messages
-    local queue_size = redis.call('ZCARD', queue_key)
-    if queue_size > 0 then
+    while taken < max_per_partition do
+        if max_total > 0 and messages_consumed >= max_total then
+            break
+        end
+        
         -- Get score of earliest message
         local min_result = redis.call('ZRANGE', queue_key, 0, 0, 'WITHSCORES')
+        if #min_result < 2 then
+            break
+        end
         
-        -- Directly compare difference between earliest message and current score
-        if #min_result >= 2 then
-            local earliest_message_score = tonumber(min_result[2])
-            -- Check difference between earliest message score and current score
-            if (current_score - earliest_message_score) >= score_threshold then
-                -- Get earliest message (directly remove)
-                local popped = redis.call('ZPOPMIN', queue_key)
-                if #popped >= 2 then
-                    table.insert(messages, popped[1])  -- Return only message content
-                    messages_consumed = messages_consumed + 1
-                end
-            end
+        -- Check difference between earliest message score and current score
+        local earliest_message_score = tonumber(min_result[2])
+        if (current_score - earliest_message_score) < score_threshold then
+            break
         end
+        
+        -- Get earliest message (directly remove, at-most-once: no in-flight copy is kept)
+        local popped = redis.call('ZPOPMIN', queue_key)
+        if #popped < 2 then
+            break
+        end
+        table.insert(messages, popped[1])  -- Return only message content
+        messages_consumed = messages_consumed + 1
+        taken = taken + 1
     end
 end
 
@@ -520,7 +679,11 @@ return {
 }
 """
 
-# Replace __REBALANCE_FUNCTION__ placeholder when module loads
+# Replace __REBALANCE_FUNCTION__ / __NOTIFY_FUNCTION__ placeholders when module loads
+ENQUEUE_SCRIPT = ENQUEUE_SCRIPT.replace('__NOTIFY_FUNCTION__', NOTIFY_FUNCTION)
+BATCH_ENQUEUE_SCRIPT = BATCH_ENQUEUE_SCRIPT.replace(
+    '__NOTIFY_FUNCTION__', NOTIFY_FUNCTION
+)
 REBALANCE_PARTITIONS_SCRIPT = REBALANCE_PARTITIONS_SCRIPT.replace(
     '__REBALANCE_FUNCTION__', REBALANCE_FUNCTION
 )
@@ -7,6 +7,7 @@ Core features:
 2. group_key routed to fixed partition via hash
 3. Supports concurrent consumption of multiple queues, prevents conflicts using owner mechanism
 4. Uses Redis sorted sets (ZSET) to store messages, supports sorting by score and time filtering
+5. Batch deliver/consume APIs, idle consumers block on a per-owner wakeup list instead of polling
 
 ⚠️ Warning: Partition count is fixed at 50. Modifying this configuration will cause severe data routing errors and message loss!
 """
@@ -15,6 +16,7 @@ import asyncio
 import time
 import random
 import hashlib
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Callable, Type
 from dataclasses import dataclass, field
 from enum import Enum
@@ -30,6 +32,7 @@ from core.queue.redis_group_queue.redis_group_queue_item import (
 )
 from core.queue.redis_group_queue.redis_group_queue_lua_scripts import (
     ENQUEUE_SCRIPT,
+    BATCH_ENQUEUE_SCRIPT,
     GET_QUEUE_STATS_SCRIPT,
     GET_ALL_PARTITIONS_STATS_SCRIPT,
     REBALANCE_PARTITIONS_SCRIPT,
@@ -153,11 +156,19 @@ class RedisGroupQueueManager:
     7. Supports forced cleanup and reset
     8. Checks score difference threshold when consuming messages
     9. All operations ensure atomicity through Lua scripts
+    10. Enqueue pushes a coalesced token to the partition owner's wakeup list,
+        consumers wait on it with BLPOP instead of polling
     """
 
     # Fixed partition count, configurable but recommended to keep at 50
     FIXED_PARTITION_COUNT = 50
 
+    # Maximum number of messages per batch enqueue script call
+    DELIVER_BATCH_CHUNK_SIZE = 500
+
+    # Upper bound of a single blocking wait, must stay below the Redis socket timeout
+    MAX_BLOCK_TIMEOUT_SECONDS = 10.0
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -224,6 +235,10 @@ class RedisGroupQueueManager:
             f"{key_prefix}:queue_list:"  # owner's queue_list prefix
         )
         self.counter_key = f"{key_prefix}:counter"
+        self.partition_owner_key = f"{key_prefix}:partition_owner"  # partition -> owner hash, maintained by rebalance
+        self.wakeup_prefix = (
+            f"{key_prefix}:wakeup:"  # owner's wakeup list prefix (BLPOP notification)
+        )
 
         # Process-level owner ID (generated at startup, globally unique)
         self.owner_id = (
@@ -259,6 +274,7 @@ class RedisGroupQueueManager:
 
         # Pre-compiled Lua scripts
         self._enqueue_script = None
+        self._batch_enqueue_script = None
         self._get_stats_script = None
         self._get_all_partitions_stats_script = None
         self._rebalance_partitions_script = None
@@ -314,6 +330,18 @@ class RedisGroupQueueManager:
             owner_id = self.owner_id
         return f"{self.queue_list_prefix}{owner_id}"
 
+    def _get_wakeup_key(self, owner_id: Optional[str] = None) -> str:
+        """Get owner's wakeup list Redis key"""
+        if owner_id is None:
+            owner_id = self.owner_id
+        return f"{self.wakeup_prefix}{owner_id}"
+
+    def _serialize_item(self, item: RedisGroupQueueItem) -> Any:
+        """Serialize message based on serialization mode"""
+        if self.serialization_mode == SerializationMode.BSON:
+            return item.to_bson_bytes()
+        return item.to_json_str()
+
     def _parse_rebalance_result(
         self, result: Any, expected_count: int
     ) -> Tuple[bool, Tuple]:
@@ -468,6 +496,9 @@ class RedisGroupQueueManager:
         """Ensure Lua scripts are loaded"""
         if self._enqueue_script is None:
             self._enqueue_script = self.redis_client.register_script(ENQUEUE_SCRIPT)
+            self._batch_enqueue_script = self.redis_client.register_script(
+                BATCH_ENQUEUE_SCRIPT
+            )
             self._get_stats_script = self.redis_client.register_script(
                 GET_QUEUE_STATS_SCRIPT
             )
@@ -524,17 +555,19 @@ class RedisGroupQueueManager:
             sort_score = self.sort_key_func(item)
 
             # Serialize message based on serialization mode
-            if self.serialization_mode == SerializationMode.BSON:
-                message_data = item.to_bson_bytes()
-            else:  # JSON mode
-                message_data = item.to_json_str()
+            message_data = self._serialize_item(item)
 
             # Get queue key
             queue_key = self._get_queue_key(partition)
 
-            # Execute Lua script to deliver message
+            # Execute Lua script to deliver message (also wakes up the partition owner)
             result = await self._enqueue_script(
-                keys=[queue_key, self.counter_key],
+                keys=[
+                    queue_key,
+                    self.counter_key,
+                    self.partition_owner_key,
+                    self.wakeup_prefix,
+                ],
                 args=[
                     message_data,
                     sort_score,
@@ -545,6 +578,8 @@ class RedisGroupQueueManager:
                         if max_total_messages is not None
                         else self.max_total_messages
                     ),
+                    partition,
+                    self.owner_expire_seconds,
                 ],
             )
 
@@ -611,31 +646,219 @@ class RedisGroupQueueManager:
             else:
                 return False, "Delivery error"
 
-    @rate_limit(
-        max_rate=4, time_period=1, key_func=lambda owner_id: f"get_messages_{owner_id}"
-    )
+    async def deliver_messages(
+        self,
+        items: List[Tuple[str, RedisGroupQueueItem]],
+        max_total_messages: int = None,
+    ) -> List[bool]:
+        """
+        Deliver multiple messages in batch
+
+        Messages are grouped by partition and enqueued by one Lua script call per
+        DELIVER_BATCH_CHUNK_SIZE messages; each touched partition's owner is woken up once.
+
+        Args:
+            items: List of (group_key, item) tuples
+            max_total_messages: Maximum total message count, default uses self.max_total_messages
+
+        Returns:
+            List[bool]: Whether each message was delivered, in input order
+        """
+        if not items:
+            return []
+
+        results: List[bool] = [False] * len(items)
+        try:
+            await self._ensure_scripts_loaded()
+
+            # Group by partition, keeping input order within each partition
+            indexes_by_partition: Dict[str, List[int]] = defaultdict(list)
+            for index, (group_key, _item) in enumerate(items):
+                partition = self._hash_group_key_to_partition(group_key)
+                indexes_by_partition[partition].append(index)
+            ordered = [
+                (partition, index)
+                for partition, indexes in indexes_by_partition.items()
+                for index in indexes
+            ]
+
+            max_total = (
+                max_total_messages
+                if max_total_messages is not None
+                else self.max_total_messages
+            )
+            total_delivered = 0
+            total_rejected = 0
+            new_count = None
+
+            for start in range(0, len(ordered), self.DELIVER_BATCH_CHUNK_SIZE):
+                chunk = ordered[start : start + self.DELIVER_BATCH_CHUNK_SIZE]
+                args = [
+                    self.queue_expire_seconds,
+                    self.activity_expire_seconds,
+                    max_total,
+                    self.owner_expire_seconds,
+                ]
+                for partition, index in chunk:
+                    item = items[index][1]
+                    args.extend(
+                        [
+                            partition,
+                            self.sort_key_func(item),
+                            self._serialize_item(item),
+                        ]
+                    )
+
+                added_count, new_count, item_results = await self._batch_enqueue_script(
+                    keys=[
+                        self.queue_prefix,
+                        self.counter_key,
+                        self.partition_owner_key,
+                        self.wakeup_prefix,
+                    ],
+                    args=args,
+                )
+
+                for (_partition, index), item_result in zip(chunk, item_results):
+                    results[index] = int(item_result) == 1
+                total_delivered += int(added_count)
+                total_rejected += len(chunk) - int(added_count)
+
+            # Update statistics
+            async with self._stats_lock:
+                self._manager_stats.total_delivered_messages += total_delivered
+                self._manager_stats.total_rejected_messages += total_rejected
+                if new_count is not None:
+                    self._manager_stats.total_current_messages = new_count
+
+            logger.debug(
+                "✅ RedisGroupQueueManager[%s] Batch delivery completed: partitions=%d, delivered=%d, rejected=%d",
+                self.key_prefix,
+                len(indexes_by_partition),
+                total_delivered,
+                total_rejected,
+            )
+            return results
+
+        except (redis.RedisError, ValueError, TypeError) as e:
+            logger.error(
+                "❌ RedisGroupQueueManager[%s] Batch delivery failed: count=%d, error=%s",
+                self.key_prefix,
+                len(items),
+                e,
+            )
+            return results
+
+    async def wait_for_messages(
+        self, timeout: float, owner_id: Optional[str] = None
+    ) -> bool:
+        """
+        Block until the owner is woken up or the timeout expires
+
+        Enqueue scripts push a token to the wakeup list of the partition owner, and
+        rebalance pushes one to every owner, so an idle consumer wakes up as soon as
+        it has work instead of polling. Tokens are coalesced, a wakeup therefore means
+        "at least one message may be available", not a message count.
+
+        Args:
+            timeout: Maximum wait time (seconds), capped at MAX_BLOCK_TIMEOUT_SECONDS
+            owner_id: Consumer ID, default uses self.owner_id
+
+        Returns:
+            bool: Whether a wakeup was received (False on timeout or error)
+        """
+        timeout = min(max(timeout, 0.0), self.MAX_BLOCK_TIMEOUT_SECONDS)
+        if timeout <= 0:
+            return False
+
+        try:
+            result = await self.redis_client.blpop(
+                [self._get_wakeup_key(owner_id)], timeout=timeout
+            )
+            return result is not None
+        except (redis.RedisError, ValueError, TypeError) as e:
+            logger.warning(
+                "⚠️ RedisGroupQueueManager[%s] Wait for messages failed: owner_id=%s, error=%s",
+                self.key_prefix,
+                owner_id or self.owner_id,
+                e,
+            )
+            # Avoid turning a Redis outage into a hot loop
+            await asyncio.sleep(timeout)
+            return False
+
     async def get_messages(
         self,
         score_threshold: int,
         current_score: Optional[int] = None,
         owner_id: Optional[str] = None,
         _retry_depth: int = 2,
+        *,
+        max_per_partition: int = 1,
+        max_total: Optional[int] = None,
+        block_timeout: float = 0.0,
     ) -> List[RedisGroupQueueItem]:
         """
         Get messages
 
-        Iterate through all partitions assigned to this owner, attempt to get 1 message from each partition.
+        Iterate through all partitions assigned to this owner, attempt to get up to
+        max_per_partition messages from each partition (in score order).
         On-demand keepalive mechanism: Check last keepalive time, trigger keepalive if exceeds 30 seconds.
 
+        Instead of a fixed call rate limit, idle consumers should pass block_timeout:
+        when nothing is available the call waits on the owner's wakeup list and
+        retries once, so busy consumers are never throttled and idle ones don't poll.
+
+        Delivery is at-most-once: returned messages are already removed from the queue,
+        a consumer that stops before processing them loses them.
+
         Args:
             score_threshold: Score difference threshold (milliseconds), required parameter
             current_score: Current score, used for threshold comparison when queue is empty, optional parameter
             owner_id: Consumer ID, default uses self.owner_id
             _retry_depth: Internal parameter, recursive retry depth limit, prevents infinite loop
+            max_per_partition: Maximum messages taken from each partition, default 1
+            max_total: Maximum messages returned in total, None means unlimited
+            block_timeout: Seconds to wait for a wakeup when no message is available, 0 returns immediately
 
         Returns:
             List[RedisGroupQueueItem]: Message list
         """
+        messages = await self._get_messages_once(
+            score_threshold,
+            current_score,
+            owner_id,
+            _retry_depth,
+            max_per_partition=max_per_partition,
+            max_total=max_total,
+        )
+        if messages or block_timeout <= 0:
+            return messages
+
+        if not await self.wait_for_messages(block_timeout, owner_id):
+            return []
+
+        # current_score defaults to "now", recompute it after waiting
+        return await self._get_messages_once(
+            score_threshold,
+            current_score,
+            owner_id,
+            _retry_depth,
+            max_per_partition=max_per_partition,
+            max_total=max_total,
+        )
+
+    async def _get_messages_once(
+        self,
+        score_threshold: int,
+        current_score: Optional[int] = None,
+        owner_id: Optional[str] = None,
+        _retry_depth: int = 2,
+        *,
+        max_per_partition: int = 1,
+        max_total: Optional[int] = None,
+    ) -> List[RedisGroupQueueItem]:
+        """Execute the get messages script once (see get_messages)"""
         try:
             await self._ensure_scripts_loaded()
 
@@ -662,6 +885,10 @@ class RedisGroupQueueManager:
                         if current_score is not None
                         else self._default_sort_key(None)
                     ),
+                    max(1, max_per_partition),
+                    max_total or 0,
+                    # Rotate traversal start so max_total does not starve later partitions
+                    random.randint(0, self.FIXED_PARTITION_COUNT - 1),
                 ],
             )
 
@@ -691,8 +918,13 @@ class RedisGroupQueueManager:
                 # Automatically join consumer
                 await self.join_consumer(owner_id)
                 # Re-get messages, decrement retry depth
-                return await self.get_messages(
-                    score_threshold, current_score, owner_id, _retry_depth - 1
+                return await self._get_messages_once(
+                    score_threshold,
+                    current_score,
+                    owner_id,
+                    _retry_depth - 1,
+                    max_per_partition=max_per_partition,
+                    max_total=max_total,
                 )
 
             if status_str == "NO_QUEUES":
@@ -769,7 +1001,12 @@ class RedisGroupQueueManager:
 
             # Execute rebalance script
             result = await self._rebalance_partitions_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.partition_owner_key,
+                    self.wakeup_prefix,
+                ],
                 args=[self.FIXED_PARTITION_COUNT, self.owner_expire_seconds],
             )
 
@@ -824,7 +1061,12 @@ class RedisGroupQueueManager:
 
             # Execute join consumer script
             result = await self._join_consumer_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.partition_owner_key,
+                    self.wakeup_prefix,
+                ],
                 args=[
                     owner_id,
                     current_time,
@@ -888,7 +1130,12 @@ class RedisGroupQueueManager:
 
             # Execute consumer exit script
             result = await self._exit_consumer_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.partition_owner_key,
+                    self.wakeup_prefix,
+                ],
                 args=[owner_id, self.owner_expire_seconds, self.FIXED_PARTITION_COUNT],
             )
 
@@ -1002,6 +1249,8 @@ class RedisGroupQueueManager:
                     self.queue_list_prefix,
                     self.queue_prefix,
                     self.counter_key,
+                    self.partition_owner_key,
+                    self.wakeup_prefix,
                 ],
                 args=[
                     inactive_threshold,
@@ -1065,6 +1314,8 @@ class RedisGroupQueueManager:
                         self.queue_list_prefix,
                         self.queue_prefix,
                         self.counter_key,
+                        self.partition_owner_key,
+                        self.wakeup_prefix,
                     ],
                     args=[self.FIXED_PARTITION_COUNT, "1"],
                 )
@@ -1090,6 +1341,8 @@ class RedisGroupQueueManager:
                         self.queue_list_prefix,
                         self.queue_prefix,
                         self.counter_key,
+                        self.partition_owner_key,
+                        self.wakeup_prefix,
                     ],
                     args=[self.FIXED_PARTITION_COUNT, "0"],
                 )
@@ -2,20 +2,194 @@
 Async rate limiting decorator module based on aiolimiter
 
 Provides rate limiting functionality for async functions with flexible configuration.
+Limiters are per process by default; distributed=True switches to a Redis-backed GCRA
+limiter whose limit holds across all workers and replicas.
 """
 
+import asyncio
+import time
+from collections import deque
 from functools import wraps
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Deque, Dict, Optional, Union
+
+import redis
 from aiolimiter import AsyncLimiter
 
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Redis key template of distributed limiter state (GCRA theoretical arrival time)
+RATE_LIMIT_KEY_TEMPLATE = "rate_limit:{key}:{max_rate}:{time_period}"
+
+# Upper bound of tokens prefetched per Redis round trip
+MAX_PREFETCH = 50
+
+# Lua script: GCRA acquisition of up to ARGV[3] tokens in one call
+# Returns {granted, retry_after_us}; granted may be less than requested when only part
+# of the burst is available, retry_after_us is the wait for the next token when none is.
+GCRA_ACQUIRE_SCRIPT = """
+    local key = KEYS[1]
+    local emission_interval = tonumber(ARGV[1])  -- microseconds per token
+    local burst_offset = tonumber(ARGV[2])  -- microseconds, emission_interval * max_rate
+    local requested = tonumber(ARGV[3])
+
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then
+        tat = now
+    end
+
+    local available = math.floor((now + burst_offset - tat) / emission_interval)
+    if available <= 0 then
+        return {0, math.ceil(tat - burst_offset + emission_interval - now)}
+    end
+
+    local granted = math.min(requested, available)
+    local new_tat = tat + granted * emission_interval
+    redis.call('SET', key, string.format('%.0f', new_tat), 'PX', math.ceil((new_tat - now) / 1000) + 1)
+    return {granted, 0}
+"""
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed GCRA rate limiter shared by all processes
+
+    Each Redis round trip takes a batch of up to `prefetch` tokens which are then handed
+    out locally, so the hot path does not pay a round trip per call. Prefetched tokens
+    are only valid for one emission interval per token, so an idle process cannot hoard
+    quota. If Redis is unavailable the limiter falls back to a per-process AsyncLimiter.
+
+    Usage mirrors AsyncLimiter:
+        async with limiter:
+            ...
+    """
+
+    def __init__(
+        self,
+        key: str,
+        max_rate: int,
+        time_period: Union[int, float],
+        prefetch: Optional[int] = None,
+        redis_provider: Any = None,
+    ):
+        """
+        Initialize distributed rate limiter
+
+        Args:
+            key: Unique identifier for the limiter, shared by all processes
+            max_rate: Maximum number of allowed requests within the time window
+            time_period: Time window size (seconds)
+            prefetch: Tokens taken per Redis round trip, default is max_rate / 20 (1..MAX_PREFETCH)
+            redis_provider: Redis provider, default resolves RedisProvider from the DI container
+        """
+        self.key = key
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.prefetch = prefetch or min(max(1, max_rate // 20), MAX_PREFETCH)
+        self.redis_key = RATE_LIMIT_KEY_TEMPLATE.format(
+            key=key, max_rate=max_rate, time_period=time_period
+        )
+
+        self._emission_interval_us = int(time_period * 1_000_000 / max_rate)
+        self._burst_offset_us = self._emission_interval_us * max_rate
+        self._redis_provider = redis_provider
+        self._script = None
+        # Expiry (monotonic) of each prefetched token
+        self._tokens: Deque[float] = deque()
+        self._fetch_lock = asyncio.Lock()
+        self._fallback = AsyncLimiter(max_rate, time_period)
+
+    async def _get_script(self):
+        """Register the GCRA Lua script on first use"""
+        if self._script is None:
+            if self._redis_provider is None:
+                # pylint: disable=import-outside-toplevel
+                from core.di.utils import get_bean_by_type
+                from component.redis_provider import RedisProvider
+
+                self._redis_provider = get_bean_by_type(RedisProvider)
+            redis_client = await self._redis_provider.get_client()
+            self._script = redis_client.register_script(GCRA_ACQUIRE_SCRIPT)
+        return self._script
+
+    def _take_local_token(self) -> bool:
+        """Take a prefetched token that has not expired"""
+        now = time.monotonic()
+        while self._tokens:
+            if self._tokens.popleft() > now:
+                return True
+        return False
+
+    async def _fetch_tokens(self) -> float:
+        """
+        Take a batch of tokens from Redis
+
+        Returns:
+            float: Seconds to wait before retrying, 0 when tokens were granted
+        """
+        script = await self._get_script()
+        granted, retry_after_us = await script(
+            keys=[self.redis_key],
+            args=[self._emission_interval_us, self._burst_offset_us, self.prefetch],
+        )
+        granted = int(granted)
+        if granted <= 0:
+            return max(int(retry_after_us), 1) / 1_000_000
+
+        now = time.monotonic()
+        interval = self._emission_interval_us / 1_000_000
+        self._tokens.extend(now + interval * (i + 1) for i in range(granted))
+        return 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a token is available"""
+        while True:
+            if self._take_local_token():
+                return
+
+            async with self._fetch_lock:
+                # Another coroutine may have refilled while we waited for the lock
+                if self._take_local_token():
+                    return
+                try:
+                    retry_after = await self._fetch_tokens()
+                except (ConnectionError, TimeoutError, OSError, redis.RedisError) as e:
+                    logger.warning(
+                        "Distributed rate limiter unavailable, falling back to local limit: %s, error: %s",
+                        self.key,
+                        e,
+                    )
+                    await self._fallback.acquire()
+                    return
+
+                if retry_after > 0:
+                    await asyncio.sleep(retry_after)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
 
 class RateLimitManager:
     """Rate limit manager that manages multiple limiter instances"""
 
     def __init__(self):
-        self._limiters: Dict[str, AsyncLimiter] = {}
+        self._limiters: Dict[str, Union[AsyncLimiter, RedisRateLimiter]] = {}
 
-    def get_limiter(self, key: str, max_rate: int, time_period: int) -> AsyncLimiter:
+    def get_limiter(
+        self,
+        key: str,
+        max_rate: int,
+        time_period: int,
+        distributed: bool = False,
+        prefetch: Optional[int] = None,
+    ) -> Union[AsyncLimiter, RedisRateLimiter]:
         """
         Get or create a limiter instance
 
@@ -23,14 +197,23 @@ class RateLimitManager:
             key: Unique identifier for the limiter
             max_rate: Maximum number of allowed requests within the time window
             time_period: Time window size (seconds)
+            distributed: Whether the limit is shared across processes via Redis
+            prefetch: Tokens taken per Redis round trip (distributed only)
 
         Returns:
-            AsyncLimiter: Limiter instance
+            Union[AsyncLimiter, RedisRateLimiter]: Limiter instance
         """
         limiter_key = f"{key}_{max_rate}_{time_period}"
+        if distributed:
+            limiter_key = f"redis_{limiter_key}"
 
         if limiter_key not in self._limiters:
-            self._limiters[limiter_key] = AsyncLimiter(max_rate, time_period)
+            if distributed:
+                self._limiters[limiter_key] = RedisRateLimiter(
+                    key, max_rate, time_period, prefetch=prefetch
+                )
+            else:
+                self._limiters[limiter_key] = AsyncLimiter(max_rate, time_period)
 
         return self._limiters[limiter_key]
 
@@ -43,6 +226,8 @@ def rate_limit(
     max_rate: int = 3,
     time_period: int = 10,
     key_func: Optional[Callable[..., str]] = None,
+    distributed: bool = False,
+    prefetch: Optional[int] = None,
 ):
     """
     Async function rate limiting decorator
@@ -52,6 +237,9 @@ def rate_limit(
         time_period: Time window size (seconds), default is 10 seconds
         key_func: Optional key function to generate different rate limit keys for different parameters
                  If not provided, all calls share the same limiter
+        distributed: Whether the limit is global across all workers and replicas (Redis GCRA),
+                 default is a per-process limit
+        prefetch: Tokens taken per Redis round trip when distributed, default is max_rate / 20
 
     Raises:
         ValueError: Raised when max_rate <= 0 or time_period <= 0
@@ -64,6 +252,11 @@ def rate_limit(
         @rate_limit(max_rate=5, time_period=60, key_func=lambda user_id: f"user_{user_id}")
         async def user_specific_call(user_id: str):
             pass
+
+        # Global cap shared by every replica, e.g. protecting an upstream API
+        @rate_limit(max_rate=100, time_period=1, distributed=True)
+        async def call_upstream():
+            pass
     """
     if max_rate <= 0:
         raise ValueError(f"max_rate must be positive, got {max_rate}")
@@ -87,7 +280,11 @@ def rate_limit(
 
             # Get the limiter
             limiter = _rate_limit_manager.get_limiter(
-                limiter_key, max_rate, time_period
+                limiter_key,
+                max_rate,
+                time_period,
+                distributed=distributed,
+                prefetch=prefetch,
             )
 
             # Wait for the limiter to allow execution
@@ -0,0 +1,178 @@
+"""
+Pre-fork multi-worker server
+
+Runs several uvicorn workers that share one listening socket. The parent process
+performs the expensive startup once (DI scan, application creation, NLP assets), then
+forks the workers, so their memory is shared copy-on-write instead of being rebuilt per
+worker as with `uvicorn --workers` (which spawns fresh interpreters that import the app
+again).
+
+Each worker runs the application lifespan itself, so database clients, event loops and
+background tasks are created after the fork and never shared between processes.
+
+The parent only supervises: it restarts crashed workers and forwards SIGINT/SIGTERM for a
+graceful shutdown. It must not start threads or event loops before run().
+"""
+
+import gc
+import os
+import signal
+import time
+from typing import Any, Dict, Optional
+
+import uvicorn
+
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PreforkServer:
+    """Supervisor forking uvicorn workers from a pre-warmed parent process"""
+
+    # Workers dying sooner than this after start are restarted with a delay
+    MIN_WORKER_UPTIME = 5.0
+    RESTART_DELAY = 1.0
+    POLL_INTERVAL = 0.5
+
+    def __init__(
+        self,
+        app: Any,
+        host: str,
+        port: int,
+        workers: int,
+        graceful_timeout: float = 30.0,
+        uvicorn_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize server
+
+        Args:
+            app: ASGI application, already created in the parent process
+            host: Listening host
+            port: Listening port
+            workers: Number of worker processes
+            graceful_timeout: Seconds to wait for workers on shutdown before SIGKILL
+            uvicorn_kwargs: Extra uvicorn.Config arguments
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.uvicorn_kwargs = uvicorn_kwargs or {}
+
+        self._socket = None
+        self._children: Dict[int, Dict[str, Any]] = {}
+        self._stopping = False
+
+    def _make_config(self) -> uvicorn.Config:
+        return uvicorn.Config(
+            self.app, host=self.host, port=self.port, **self.uvicorn_kwargs
+        )
+
+    def _spawn_worker(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(index)
+            return
+        self._children[pid] = {"index": index, "started_at": time.monotonic()}
+        logger.info("👷 Started worker %d (pid %d)", index, pid)
+
+    def _run_worker(self, index: int) -> None:
+        """Worker process entry, never returns"""
+        # Default handlers until uvicorn installs its own
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            server = uvicorn.Server(self._make_config())
+            server.run(sockets=[self._socket])
+        except BaseException as e:  # Worker must not fall back into the supervisor loop
+            logger.error("❌ Worker %d crashed: %s", index, e)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _handle_stop_signal(self, signum, frame) -> None:
+        if self._stopping:
+            return
+        logger.info("🛑 Received %s, stopping workers", signal.Signals(signum).name)
+        self._stopping = True
+        self._signal_children(signal.SIGTERM)
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+    def _reap(self) -> None:
+        """Collect exited workers and restart them unless stopping"""
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            child = self._children.pop(pid, None)
+            if child is None:
+                continue
+            if self._stopping:
+                logger.info("Worker %d (pid %d) stopped", child["index"], pid)
+                continue
+
+            logger.warning(
+                "⚠️ Worker %d (pid %d) exited with status %s, restarting",
+                child["index"],
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            if time.monotonic() - child["started_at"] < self.MIN_WORKER_UPTIME:
+                time.sleep(self.RESTART_DELAY)
+            self._spawn_worker(child["index"])
+
+    def run(self) -> None:
+        """Bind the socket, fork workers and supervise them until shutdown"""
+        self._socket = self._make_config().bind_socket()
+
+        # Move objects created during warm-up to the permanent generation: the cyclic GC
+        # of the workers then never touches (and copies) those pages
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGINT, self._handle_stop_signal)
+        signal.signal(signal.SIGTERM, self._handle_stop_signal)
+
+        logger.info(
+            "🚀 Pre-fork server on %s:%d with %d workers (supervisor pid %d)",
+            self.host,
+            self.port,
+            self.workers,
+            os.getpid(),
+        )
+        for index in range(self.workers):
+            self._spawn_worker(index)
+
+        stop_deadline = None
+        while self._children:
+            time.sleep(self.POLL_INTERVAL)
+            self._reap()
+            if self._stopping and self._children:
+                if stop_deadline is None:
+                    stop_deadline = time.monotonic() + self.graceful_timeout
+                elif time.monotonic() >= stop_deadline:
+                    logger.warning(
+                        "⚠️ Workers still running after %ss, killing",
+                        self.graceful_timeout,
+                    )
+                    self._signal_children(signal.SIGKILL)
+                    stop_deadline = float("inf")
+
+        self._socket.close()
+        logger.info("👋 All workers stopped")
@@ -21,6 +21,7 @@ class TenantConfig:
     This class manages tenant-related configuration options, including:
     - Non-tenant mode switch: controls whether tenant functionality is enabled
     - Single tenant ID: tenant identifier used to activate single-tenant mode
+    - Tenant connection cache budget: maximum cached connections and idle expiry
     - Other tenant-related configuration options
 
     Configuration items are loaded from environment variables and provide a caching mechanism to improve performance.
@@ -30,6 +31,9 @@ class TenantConfig:
         """Initialize tenant configuration"""
         self._non_tenant_mode: Optional[bool] = None
         self._single_tenant_id: Optional[str] = None
+        self._connection_cache_max_size: Optional[int] = None
+        self._connection_idle_ttl_seconds: Optional[float] = None
+        self._connection_close_grace_seconds: Optional[float] = None
         self._app_ready: bool = (
             False  # Application startup completion status, used for strict tenant checks
         )
@@ -90,6 +94,58 @@ class TenantConfig:
 
         return self._single_tenant_id
 
+    @property
+    def connection_cache_max_size(self) -> int:
+        """
+        Get the maximum number of cached tenant connections per storage type
+
+        Read configuration from environment variable TENANT_CONNECTION_CACHE_MAX_SIZE
+        (default 64, 0 means unbounded). When exceeded, the least recently used tenant
+        connection is closed and re-created on its next use.
+
+        Returns:
+            int: Maximum number of cached connections
+        """
+        if self._connection_cache_max_size is None:
+            self._connection_cache_max_size = int(
+                os.getenv("TENANT_CONNECTION_CACHE_MAX_SIZE", "64")
+            )
+        return self._connection_cache_max_size
+
+    @property
+    def connection_idle_ttl_seconds(self) -> float:
+        """
+        Get the idle time after which a tenant connection is closed
+
+        Read configuration from environment variable TENANT_CONNECTION_IDLE_TTL_SECONDS
+        (default 1800, 0 disables idle expiry).
+
+        Returns:
+            float: Idle time in seconds
+        """
+        if self._connection_idle_ttl_seconds is None:
+            self._connection_idle_ttl_seconds = float(
+                os.getenv("TENANT_CONNECTION_IDLE_TTL_SECONDS", "1800")
+            )
+        return self._connection_idle_ttl_seconds
+
+    @property
+    def connection_close_grace_seconds(self) -> float:
+        """
+        Get the delay before an evicted tenant connection is closed
+
+        Read configuration from environment variable TENANT_CONNECTION_CLOSE_GRACE_SECONDS
+        (default 30), so operations that fetched the connection before eviction can finish.
+
+        Returns:
+            float: Delay in seconds
+        """
+        if self._connection_close_grace_seconds is None:
+            self._connection_close_grace_seconds = float(
+                os.getenv("TENANT_CONNECTION_CLOSE_GRACE_SECONDS", "30")
+            )
+        return self._connection_close_grace_seconds
+
     @property
     def app_ready(self) -> bool:
         """
@@ -137,6 +193,9 @@ class TenantConfig:
         """
         self._non_tenant_mode = None
         self._single_tenant_id = None
+        self._connection_cache_max_size = None
+        self._connection_idle_ttl_seconds = None
+        self._connection_close_grace_seconds = None
         logger.info("🔄 Tenant configuration reloaded")
 
     def reset_app_ready(self) -> None:
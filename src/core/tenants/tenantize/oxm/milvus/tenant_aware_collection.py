@@ -5,7 +5,8 @@ This module implements tenant awareness by inheriting from pymilvus.Collection a
 Core idea: Dynamically return the correct connection handler based on tenant context.
 """
 
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
 from pymilvus import Collection, CollectionSchema
 from pymilvus.orm.connections import connections
 
@@ -19,11 +20,34 @@ from core.tenants.tenantize.oxm.milvus.config_utils import (
     get_tenant_aware_collection_name,
 )
 from core.tenants.tenantize.tenant_cache_utils import get_or_compute_tenant_cache
+from core.tenants.tenantize.tenant_connection_cache import TenantConnectionCache
+from core.tenants.tenant_config import get_tenant_config
 from component.milvus_client_factory import MilvusClientFactory
 from core.di.utils import get_bean_by_type
 
 logger = get_logger(__name__)
 
+# Registered tenant connection aliases: {using: connection handler}
+_tenant_connection_cache: Optional[TenantConnectionCache] = None
+_tenant_connection_cache_lock = threading.Lock()
+
+
+def _get_tenant_connection_cache() -> TenantConnectionCache:
+    """Get the tenant connection alias cache (created on first use from tenant config)"""
+    global _tenant_connection_cache
+    if _tenant_connection_cache is None:
+        with _tenant_connection_cache_lock:
+            if _tenant_connection_cache is None:
+                config = get_tenant_config()
+                _tenant_connection_cache = TenantConnectionCache(
+                    name="Milvus",
+                    close_func=TenantAwareCollection._close_tenant_connection,
+                    max_size=config.connection_cache_max_size,
+                    idle_ttl_seconds=config.connection_idle_ttl_seconds,
+                    close_grace_seconds=config.connection_close_grace_seconds,
+                )
+    return _tenant_connection_cache
+
 
 class TenantAwareCollection(Collection):
     """
@@ -34,7 +58,8 @@ class TenantAwareCollection(Collection):
 
     Key features:
     1. Tenant isolation: Different tenants use different Milvus connections (distinguished by using alias)
-    2. Connection reuse: Tenants with the same configuration share the same connection (cached via cache_key)
+    2. Connection reuse: Tenants with the same configuration share the same connection (cached via cache_key),
+       idle and least recently used tenant connections beyond the budget are closed (see TenantConnectionCache)
     3. Automatic registration: Automatically registers tenant connection upon first access
     4. Fallback connection: Uses default connection when not in tenant mode or without tenant context
 
@@ -155,15 +180,20 @@ class TenantAwareCollection(Collection):
         Note:
             - For "default" connection, assume it's already registered at application startup
             - For tenant connections (tenant_*), register automatically if not already registered
+            - Tenant connections are tracked in the connection cache, evicted ones are re-registered here
         """
         # Check if connection already exists
         try:
-            connections._fetch_handler(using)
-            # Connection exists, return directly
-            return
+            handler = connections._fetch_handler(using)
         except Exception:
             # Connection does not exist, needs registration
-            pass
+            handler = None
+
+        if handler is not None:
+            # Connection exists, mark it as used and return
+            if using != "default":
+                TenantAwareCollection._track_tenant_connection(using, handler)
+            return
 
         # If it's the default connection, try to register from environment variables
         if using == "default":
@@ -193,6 +223,9 @@ class TenantAwareCollection(Collection):
             )
 
             TenantAwareCollection._register_connection(milvus_config, using)
+            TenantAwareCollection._track_tenant_connection(
+                using, connections._fetch_handler(using)
+            )
 
         except Exception as e:
             logger.error(
@@ -200,6 +233,49 @@ class TenantAwareCollection(Collection):
             )
             raise
 
+    @staticmethod
+    def _track_tenant_connection(using: str, handler: Any) -> None:
+        """
+        Record use of a tenant connection in the connection cache
+
+        Args:
+            using: Connection alias
+            handler: Connection handler currently registered under the alias
+        """
+        cache = _get_tenant_connection_cache()
+        if cache.get(using) is not handler:
+            cache.put(using, handler)
+
+    @staticmethod
+    def _close_tenant_connection(using: str, handler: Any) -> None:
+        """
+        Close an evicted tenant connection
+
+        Skipped if the alias has been re-registered with another handler in the meantime.
+
+        Args:
+            using: Connection alias
+            handler: Connection handler that was evicted
+        """
+        try:
+            current = connections._fetch_handler(using)
+        except Exception:
+            # Already removed
+            return
+        if current is not handler:
+            return
+        get_bean_by_type(MilvusClientFactory).close_client(using)
+
+    @classmethod
+    def get_connection_cache_stats(cls) -> Dict[str, Any]:
+        """
+        Get tenant connection cache counters (size, budget, hits, misses, evictions)
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        return _get_tenant_connection_cache().stats()
+
     @staticmethod
     def _register_connection(config: dict, using: str) -> None:
         """
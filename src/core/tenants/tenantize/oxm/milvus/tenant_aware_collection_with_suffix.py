@@ -135,8 +135,13 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
     def using(self) -> str:
         """
         Get the tenant-aware connection alias
+
+        The connection is (re-)registered if needed, as tenant connections may be evicted
+        from the connection cache between uses.
         """
-        return TenantAwareCollection._get_tenant_aware_using()
+        using = TenantAwareCollection._get_tenant_aware_using()
+        TenantAwareCollection._ensure_connection_registered(using)
+        return using
 
     def ensure_connection_registered(self) -> None:
         """
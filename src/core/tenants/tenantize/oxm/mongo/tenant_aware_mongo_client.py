@@ -5,7 +5,7 @@ This module implements tenant-aware proxy versions of AsyncMongoClient and Async
 Core functionality: intercept all method calls and dynamically switch to the corresponding real client/database based on tenant context.
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from pymongo.asynchronous.mongo_client import AsyncMongoClient
 from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.asynchronous.collection import AsyncCollection
@@ -22,9 +22,13 @@ from core.tenants.tenantize.oxm.mongo.config_utils import (
     get_default_database_name,
 )
 from core.tenants.tenantize.tenant_cache_utils import get_or_compute_tenant_cache
+from core.tenants.tenantize.tenant_connection_cache import TenantConnectionCache
 
 logger = get_logger(__name__)
 
+# Cache key standing for the fallback client (non-tenant mode or no tenant context)
+FALLBACK_CLIENT_KEY = "__fallback__"
+
 
 class TenantAwareMongoClient(AsyncMongoClient):
     """
@@ -34,7 +38,8 @@ class TenantAwareMongoClient(AsyncMongoClient):
     dynamically switching to the real MongoDB client corresponding to the current tenant context.
 
     Core features:
-    1. Efficient caching: caches client instances per tenant to avoid redundant creation
+    1. Efficient caching: caches client instances per tenant to avoid redundant creation,
+       bounded by an LRU/idle-TTL budget (see TenantConnectionCache)
     2. Tenant isolation: different tenants use separate client connections
     3. Non-tenant mode support: tenant functionality can be disabled via configuration, falling back to traditional mode
     4. Default client support: in tenant mode, automatically uses the default client (read from environment variables) when no tenant context exists
@@ -80,12 +85,28 @@ class TenantAwareMongoClient(AsyncMongoClient):
         Cache design:
             - self._client_cache: The actual storage location for client instances (main cache)
             - tenant_info_patch: Stores quick references (cache_key) for fast lookup of which cached client to use
+            - Clients are never referenced outside the main cache, so evicted clients can be closed
         """
+        # Configuration object
+        self._config = get_tenant_config()
+
         # Client cache: based on connection parameters (host/port/username/password)
         # This is the main cache that actually stores client instances
         # Different tenants with the same configuration can reuse the same client instance
+        # Idle and least recently used clients beyond the budget are closed
         # {cache_key: AsyncMongoClient}
-        self._client_cache: Dict[str, AsyncMongoClient] = {}
+        self._client_cache: TenantConnectionCache[AsyncMongoClient] = (
+            TenantConnectionCache(
+                name="MongoDB",
+                close_func=self._close_evicted_client,
+                max_size=self._config.connection_cache_max_size,
+                idle_ttl_seconds=self._config.connection_idle_ttl_seconds,
+                close_grace_seconds=self._config.connection_close_grace_seconds,
+            )
+        )
+
+        # Database objects per client: {cache_key: {database_name: AsyncDatabase}}
+        self._database_cache: Dict[str, Dict[str, AsyncDatabase]] = {}
 
         # Fallback client
         # Usage:
@@ -107,9 +128,6 @@ class TenantAwareMongoClient(AsyncMongoClient):
                 **kwargs,
             }
 
-        # Configuration object
-        self._config = get_tenant_config()
-
     def get_real_client(self) -> AsyncMongoClient:
         """
         Get the real MongoDB client (public method)
@@ -121,8 +139,9 @@ class TenantAwareMongoClient(AsyncMongoClient):
 
         Optimization strategy:
         - Main cache: self._client_cache stores actual client instances (based on connection parameters)
-        - Quick reference: tenant_info_patch stores client references for fast access
+        - Quick reference: tenant_info_patch stores the client cache_key for fast access
         - Different tenants with the same connection configuration will reuse the same client instance
+        - Evicted clients (idle or over budget) are re-created here on their next use
 
         Note: Creating an AsyncMongoClient object itself is synchronous; only subsequent method calls are asynchronous.
 
@@ -132,9 +151,18 @@ class TenantAwareMongoClient(AsyncMongoClient):
         Raises:
             RuntimeError: When in non-tenant mode but connection parameters are not provided, or tenant configuration is missing
         """
+        return self._resolve_real_client()[1]
 
-        def compute_client() -> AsyncMongoClient:
-            """Compute (get or create) the tenant's MongoDB client"""
+    def _resolve_real_client(self) -> Tuple[str, AsyncMongoClient]:
+        """
+        Get the real client together with its cache key
+
+        Returns:
+            Tuple[str, AsyncMongoClient]: (cache_key, client), cache_key is FALLBACK_CLIENT_KEY for the fallback client
+        """
+
+        def compute_cache_key() -> str:
+            """Compute the tenant's MongoDB client cache key"""
             # Get MongoDB configuration from tenant configuration
             mongo_config = get_tenant_mongo_config()
             if not mongo_config:
@@ -145,33 +173,73 @@ class TenantAwareMongoClient(AsyncMongoClient):
                 )
 
             # Generate cache key based on connection parameters
-            cache_key = get_mongo_client_cache_key(mongo_config)
+            return get_mongo_client_cache_key(mongo_config)
 
-            # Get from main cache
-            if cache_key in self._client_cache:
-                logger.debug("🔍 Main cache hit [cache_key=%s]", cache_key)
-                return self._client_cache[cache_key]
+        cache_key = get_or_compute_tenant_cache(
+            patch_key=TenantPatchKey.MONGO_CLIENT_CACHE_KEY,
+            compute_func=compute_cache_key,
+            fallback=FALLBACK_CLIENT_KEY,
+            cache_description="MongoDB client cache key",
+        )
+        if cache_key == FALLBACK_CLIENT_KEY:
+            return cache_key, self._get_fallback_client()
+
+        # Get from main cache
+        client = self._client_cache.get(cache_key)
+        if client is not None:
+            logger.debug("🔍 Main cache hit [cache_key=%s]", cache_key)
+            return cache_key, client
+
+        # Create new client (first use, or evicted since)
+        mongo_config = get_tenant_mongo_config()
+        if not mongo_config:
+            tenant_info = get_current_tenant()
+            raise RuntimeError(
+                f"Tenant {tenant_info.tenant_id} is missing MongoDB configuration information. "
+                f"Ensure the tenant information includes storage_info.mongodb configuration."
+            )
+        logger.info("🔧 Creating MongoDB client [cache_key=%s]", cache_key)
+        client = self._create_client_from_config(mongo_config)
 
-            # Double-check (prevent concurrent creation)
-            if cache_key in self._client_cache:
-                return self._client_cache[cache_key]
+        # Cache in main cache
+        self._client_cache.put(cache_key, client)
+        logger.info("✅ MongoDB client cached [cache_key=%s]", cache_key)
 
-            # Create new client
-            logger.info("🔧 Creating MongoDB client [cache_key=%s]", cache_key)
-            client = self._create_client_from_config(mongo_config)
+        return cache_key, client
 
-            # Cache in main cache
-            self._client_cache[cache_key] = client
-            logger.info("✅ MongoDB client cached [cache_key=%s]", cache_key)
+    def get_real_database(self, database_name: str) -> AsyncDatabase:
+        """
+        Get the real database object of the current client (cached per client)
 
-            return client
+        Args:
+            database_name: Database name
 
-        return get_or_compute_tenant_cache(
-            patch_key=TenantPatchKey.MONGO_CLIENT_CACHE_KEY,
-            compute_func=compute_client,
-            fallback=lambda: self._get_fallback_client(),
-            cache_description="MongoDB client",
-        )
+        Returns:
+            AsyncDatabase: The real MongoDB Database object
+        """
+        cache_key, client = self._resolve_real_client()
+        databases = self._database_cache.setdefault(cache_key, {})
+        database = databases.get(database_name)
+        if database is None or database.client is not client:
+            database = client[database_name]
+            databases[database_name] = database
+        return database
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get client cache counters (size, budget, hits, misses, evictions)
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        return self._client_cache.stats()
+
+    def _close_evicted_client(self, cache_key: str, client: AsyncMongoClient):
+        """Close a client evicted from the main cache (returns the close coroutine)"""
+        databases = self._database_cache.get(cache_key)
+        if databases and all(db.client is client for db in databases.values()):
+            self._database_cache.pop(cache_key, None)
+        return client.close()
 
     def _get_fallback_client(self) -> AsyncMongoClient:
         """
@@ -322,7 +390,7 @@ class TenantAwareMongoClient(AsyncMongoClient):
         - tenant_info_patch only stores quick references (cache_key) and does not need cleanup
         """
         # Close all cached clients (main cache)
-        for cache_key, client in self._client_cache.items():
+        for cache_key, client in self._client_cache.pop_all():
             try:
                 await client.close()
                 logger.info("🔌 MongoDB client closed [cache_key=%s]", cache_key)
@@ -331,7 +399,7 @@ class TenantAwareMongoClient(AsyncMongoClient):
                     "❌ Failed to close client [cache_key=%s]: %s", cache_key, e
                 )
 
-        self._client_cache.clear()
+        self._database_cache.clear()
 
         # Close fallback client
         if self._fallback_client:
@@ -386,25 +454,14 @@ class TenantAwareDatabase(AsyncDatabase):
         Obtain the real client through the tenant-aware client, then access the corresponding database.
         The database name is dynamically obtained according to tenant configuration, ensuring each tenant uses the correct database.
 
-        Optimization: The database object is cached in tenant_info_patch to avoid repeated creation
-
-        Note: A tenant has only one database configuration, so a fixed patch_key is used
+        Optimization: The database object is cached per client by the tenant-aware client, not in
+        tenant_info_patch, so it never outlives an evicted client
 
         Returns:
             AsyncDatabase: The real MongoDB Database object
         """
-
-        def compute_database() -> AsyncDatabase:
-            """Compute database object"""
-            actual_database_name = self._get_actual_database_name()
-            real_client = self._tenant_aware_client.get_real_client()
-            return real_client[actual_database_name]
-
-        return get_or_compute_tenant_cache(
-            patch_key=TenantPatchKey.MONGO_REAL_DATABASE,
-            compute_func=compute_database,
-            fallback=compute_database,  # fallback logic is the same, reuse directly
-            cache_description="MongoDB database object",
+        return self._tenant_aware_client.get_real_database(
+            self._get_actual_database_name()
         )
 
     def _get_actual_database_name(self) -> str:
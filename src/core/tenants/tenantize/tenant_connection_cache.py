@@ -0,0 +1,250 @@
+"""
+Tenant connection cache
+
+Bounded LRU cache with idle expiry for per-tenant connection objects (MongoDB clients,
+Milvus connection aliases). Without a bound, every distinct tenant configuration keeps its
+sockets and pool threads open for the lifetime of the process.
+
+Policy:
+- At most `max_size` connections are kept; the least recently used one is evicted first
+- Connections unused for `idle_ttl_seconds` are evicted on the next cache access
+- Evicted connections are closed after `close_grace_seconds`, so operations that fetched the
+  connection just before eviction can finish; a connection re-admitted during the grace
+  period is not closed
+- Evicted connections are re-created on demand by the caller
+
+Hit, miss and eviction counters are available through stats() and
+get_all_connection_cache_stats(), to size the budget for the number of tenants served.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_caches: "weakref.WeakSet[TenantConnectionCache]" = weakref.WeakSet()
+
+
+class TenantConnectionCache(Generic[T]):
+    """LRU/TTL cache of tenant connections with deferred close of evicted entries"""
+
+    def __init__(
+        self,
+        name: str,
+        close_func: Callable[[str, T], Any],
+        max_size: int = 0,
+        idle_ttl_seconds: float = 0,
+        close_grace_seconds: float = 0,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            name: Cache name, used in logs and stats
+            close_func: Called with (key, value) to close an evicted connection, may return an awaitable
+            max_size: Maximum number of cached connections, 0 means unbounded
+            idle_ttl_seconds: Evict connections unused for this long, 0 disables idle expiry
+            close_grace_seconds: Delay before closing an evicted connection
+        """
+        self.name = name
+        self._close_func = close_func
+        self.max_size = max_size
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.close_grace_seconds = close_grace_seconds
+
+        # {key: (value, last_used)}, least recently used first
+        self._entries: "OrderedDict[str, Tuple[T, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._closing: set = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.capacity_evictions = 0
+        self.idle_evictions = 0
+
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[T]:
+        """
+        Get a cached connection and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[T]: Cached connection, None on miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_idle(entry, now):
+                entry = None
+            if entry is None:
+                self.misses += 1
+                value = None
+            else:
+                self.hits += 1
+                value = entry[0]
+                self._entries[key] = (value, now)
+                self._entries.move_to_end(key)
+            evicted = self._collect_evictions(now)
+        self._close_evicted(evicted)
+        return value
+
+    def put(self, key: str, value: T) -> None:
+        """
+        Cache a connection, evicting idle and least recently used ones over budget
+
+        Args:
+            key: Cache key
+            value: Connection
+        """
+        now = time.monotonic()
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+            evicted = self._collect_evictions(now)
+            if previous is not None and previous[0] is not value:
+                evicted.append((key, previous[0], "replaced"))
+        self._close_evicted(evicted)
+
+    def pop_all(self) -> List[Tuple[str, T]]:
+        """
+        Remove all connections without closing them (the caller closes them)
+
+        Returns:
+            List[Tuple[str, T]]: Removed (key, connection) pairs
+        """
+        with self._lock:
+            items = [(key, value) for key, (value, _) in self._entries.items()]
+            self._entries.clear()
+        return items
+
+    def items(self) -> List[Tuple[str, T]]:
+        """Snapshot of cached (key, connection) pairs, least recently used first"""
+        with self._lock:
+            return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters
+
+        Returns:
+            Dict[str, Any]: size, budget and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "idle_ttl_seconds": self.idle_ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "capacity_evictions": self.capacity_evictions,
+                "idle_evictions": self.idle_evictions,
+            }
+
+    def _is_idle(self, entry: Tuple[T, float], now: float) -> bool:
+        return self.idle_ttl_seconds > 0 and now - entry[1] > self.idle_ttl_seconds
+
+    def _collect_evictions(self, now: float) -> List[Tuple[str, T, str]]:
+        """Remove idle entries and entries over budget, must hold the lock"""
+        evicted = []
+        # Entries are ordered by last use, so idle ones are at the front
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if not self._is_idle(entry, now):
+                break
+            del self._entries[key]
+            self.idle_evictions += 1
+            evicted.append((key, entry[0], "idle"))
+        while self.max_size > 0 and len(self._entries) > self.max_size:
+            key, (value, _) = self._entries.popitem(last=False)
+            self.capacity_evictions += 1
+            evicted.append((key, value, "capacity"))
+        return evicted
+
+    def _close_evicted(self, evicted: List[Tuple[str, T, str]]) -> None:
+        if not evicted:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        for key, value, reason in evicted:
+            logger.info(
+                "♻️ Evicting %s connection [cache_key=%s, reason=%s, size=%d/%s]",
+                self.name,
+                key,
+                reason,
+                len(self._entries),
+                self.max_size or "unbounded",
+            )
+            if loop is not None and self.close_grace_seconds > 0:
+                loop.call_later(
+                    self.close_grace_seconds, self._close_now, key, value, loop
+                )
+            else:
+                self._close_now(key, value, loop)
+
+    def _close_now(
+        self, key: str, value: T, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is value:
+                # Re-admitted during the grace period
+                return
+        try:
+            result = self._close_func(key, value)
+        except Exception as e:
+            logger.error(
+                "❌ Failed to close %s connection [cache_key=%s]: %s", self.name, key, e
+            )
+            return
+
+        if inspect.isawaitable(result):
+            if loop is None or loop.is_closed():
+                # No event loop to run the close on, the connection is released when collected
+                if inspect.iscoroutine(result):
+                    result.close()
+                return
+            task = loop.create_task(self._await_close(key, result))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _await_close(self, key: str, result: Any) -> None:
+        try:
+            await result
+            logger.info("🔌 %s connection closed [cache_key=%s]", self.name, key)
+        except Exception as e:
+            logger.error(
+                "❌ Failed to close %s connection [cache_key=%s]: %s", self.name, key, e
+            )
+
+
+def get_all_connection_cache_stats() -> List[Dict[str, Any]]:
+    """
+    Counters of all live tenant connection caches
+
+    Returns:
+        List[Dict[str, Any]]: stats() of each cache
+    """
+    return [cache.stats() for cache in list(_caches)]
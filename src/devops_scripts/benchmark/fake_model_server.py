@@ -0,0 +1,389 @@
+"""
+Fake OpenAI-compatible model server for offline benchmarks
+
+Serves the chat, embedding and rerank endpoints used by OpenAIProvider, VectorizeService
+and RerankService with configurable latency and deterministic outputs, so hot paths can
+be measured without paid remote services.
+
+Endpoints (one port):
+  POST /v1/chat/completions          OpenAI chat completions (LLM_BASE_URL=http://host:port/v1)
+  POST /v1/embeddings                OpenAI embeddings (VECTORIZE_BASE_URL=http://host:port/v1)
+  POST /v1/score                     vLLM rerank (RERANK_PROVIDER=vllm, RERANK_BASE_URL=http://host:port/v1/score)
+  POST /v1/inference/{model}         DeepInfra rerank (RERANK_BASE_URL=http://host:port/v1/inference)
+  GET  /stats, POST /stats/reset     Request counters per endpoint
+
+Chat responses are chosen by the JSON keys the prompt asks for (boundary detection,
+episode, event log, foresight, sufficiency check, multi-query); other prompts get an
+empty profile-shaped object. With --malformed-rate a share of the responses is truncated
+JSON wrapped in prose, like a model ignoring the output format, except for requests with
+a json_schema response_format (constrained decoding always yields valid JSON).
+
+Usage:
+  PYTHONPATH=src python src/devops_scripts/benchmark/fake_model_server.py --port 18080 --chat-latency-ms 500
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import re
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List
+
+import numpy as np
+from aiohttp import web
+
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_]{2,}|[一-鿿]{2,}")
+
+
+@dataclass
+class FakeServerConfig:
+    """Fake server behaviour (latencies in milliseconds)"""
+
+    chat_latency_ms: float = 300.0
+    embedding_latency_ms: float = 20.0
+    embedding_latency_per_text_ms: float = 0.5
+    rerank_latency_ms: float = 30.0
+    rerank_latency_per_doc_ms: float = 1.0
+    dimensions: int = 1024
+    # Boundary detection ends an episode for 1 in N prompts (1 = every call)
+    boundary_every: int = 1
+    # Answer of the agentic sufficiency check (False exercises the multi-query round)
+    sufficient: bool = False
+    # Share of chat responses without a json_schema response_format that are malformed
+    malformed_rate: float = 0.0
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:8], "big")
+
+
+def fake_embedding(text: str, dimensions: int) -> np.ndarray:
+    """Deterministic unit vector for a text"""
+    rng = np.random.default_rng(_digest(text))
+    vector = rng.standard_normal(dimensions).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def fake_rerank_score(query: str, document: str) -> float:
+    """Deterministic relevance score: word overlap plus a small hash tie-breaker"""
+    query_words = set(WORD_PATTERN.findall(query.lower()))
+    document_words = set(WORD_PATTERN.findall(document.lower()))
+    overlap = len(query_words & document_words) / (len(query_words) or 1)
+    return round(0.9 * overlap + 0.1 * (_digest(query + document) % 1000) / 1000, 6)
+
+
+def _prompt_words(prompt: str, count: int) -> List[str]:
+    """Deterministic sample of distinct words from the prompt tail (usually the input content)"""
+    words = list(dict.fromkeys(WORD_PATTERN.findall(prompt[-4000:])))
+    if not words:
+        return ["memory"]
+    start = _digest(prompt) % len(words)
+    return [words[(start + i) % len(words)] for i in range(min(count, len(words)))]
+
+
+def build_chat_response(prompt: str, config: FakeServerConfig) -> str:
+    """Deterministic response matching the output format the prompt asks for"""
+    tag = f"{_digest(prompt) % 100000:05d}"
+    words = _prompt_words(prompt, 24)
+
+    if "is_sufficient" in prompt:
+        return json.dumps(
+            {
+                "is_sufficient": config.sufficient,
+                "reasoning": f"fake sufficiency {tag}",
+                "missing_information": [] if config.sufficient else words[:2],
+            }
+        )
+    if '"queries"' in prompt:
+        return json.dumps(
+            {
+                "queries": [" ".join(words[i : i + 4]) or tag for i in (0, 4, 8)],
+                "reasoning": f"fake queries {tag}",
+            }
+        )
+    if "should_end" in prompt:
+        should_end = _digest(prompt) % max(1, config.boundary_every) == 0
+        return json.dumps(
+            {
+                "reasoning": f"fake boundary {tag}",
+                "should_end": should_end,
+                "should_wait": False,
+                "confidence": 1.0,
+                "topic_summary": " ".join(words[:6]) if should_end else "",
+            }
+        )
+    if "duration_days" in prompt:
+        return json.dumps(
+            [
+                {
+                    "content": f"{' '.join(words[i % len(words):][:3])} foresight {tag}-{i}",
+                    "evidence": " ".join(words[:4]),
+                    "start_time": "2025-01-01",
+                    "end_time": "2025-01-08",
+                    "duration_days": 7,
+                }
+                for i in range(10)
+            ]
+        )
+    if "atomic_fact" in prompt:
+        return json.dumps(
+            {
+                "event_log": {
+                    "time": "January 1, 2025(Wednesday) at 10:00 AM",
+                    "atomic_fact": [
+                        f"{' '.join(words[i:i + 5])} fact {tag}-{i}"
+                        for i in range(0, 20, 5)
+                    ],
+                }
+            }
+        )
+    if '"title"' in prompt:
+        return json.dumps(
+            {
+                "title": f"{' '.join(words[:6])} episode {tag}",
+                "summary": " ".join(words[:16]),
+                "content": f"Episode {tag}: {' '.join(words)}",
+            }
+        )
+    return json.dumps({"user_profiles": [], "topics": [], "roles": {}})
+
+
+def malform_chat_response(content: str) -> str:
+    """Truncated JSON wrapped in prose, as produced by a model ignoring the output format"""
+    return f"Sure, here is the result:\n{content[: len(content) * 2 // 3]}"
+
+
+class FakeModelServer:
+    """aiohttp application serving the fake endpoints"""
+
+    def __init__(self, config: FakeServerConfig):
+        self.config = config
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.app = web.Application(client_max_size=64 * 1024 * 1024)
+        self.app.add_routes(
+            [
+                web.post("/v1/chat/completions", self.chat_completions),
+                web.post("/v1/embeddings", self.embeddings),
+                web.post("/v1/score", self.rerank),
+                web.post("/v1/inference/{model:.*}", self.rerank),
+                web.get("/stats", self.get_stats),
+                web.post("/stats/reset", self.reset_stats),
+            ]
+        )
+        self._runner: web.AppRunner | None = None
+        # Requests seen per prompt, so retries of a prompt get a fresh malformed draw
+        self._chat_attempts: Dict[int, int] = {}
+
+    def _record(self, endpoint: str, items: int) -> None:
+        stats = self.stats.setdefault(endpoint, {"requests": 0, "items": 0})
+        stats["requests"] += 1
+        stats["items"] += items
+
+    async def chat_completions(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        prompt = "\n".join(
+            str(message.get("content", "")) for message in body.get("messages", [])
+        )
+        self._record("chat", 1)
+        await asyncio.sleep(self.config.chat_latency_ms / 1000)
+        content = build_chat_response(prompt, self.config)
+        if self._is_malformed(prompt, body.get("response_format")):
+            self._record("chat_malformed", 1)
+            content = malform_chat_response(content)
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        return web.json_response(
+            {
+                "id": f"chatcmpl-fake-{_digest(prompt) % 10**8}",
+                "object": "chat.completion",
+                "model": body.get("model", "fake-chat"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+        )
+
+    def _is_malformed(self, prompt: str, response_format: Any) -> bool:
+        if self.config.malformed_rate <= 0:
+            return False
+        if (
+            isinstance(response_format, dict)
+            and response_format.get("type") == "json_schema"
+        ):
+            return False
+        key = _digest(prompt)
+        attempt = self._chat_attempts.get(key, 0)
+        self._chat_attempts[key] = attempt + 1
+        draw = _digest(f"{key}:{attempt}") % 10000 / 10000
+        return draw < self.config.malformed_rate
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+        dimensions = int(body.get("dimensions") or self.config.dimensions)
+        self._record("embedding", len(texts))
+        await asyncio.sleep(
+            (
+                self.config.embedding_latency_ms
+                + self.config.embedding_latency_per_text_ms * len(texts)
+            )
+            / 1000
+        )
+
+        data = []
+        for index, text in enumerate(texts):
+            vector = fake_embedding(text, dimensions)
+            if body.get("encoding_format") == "base64":
+                embedding: Any = base64.b64encode(vector.tobytes()).decode("ascii")
+            else:
+                embedding = vector.tolist()
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+        tokens = sum(len(text) for text in texts) // 4
+        return web.json_response(
+            {
+                "object": "list",
+                "data": data,
+                "model": body.get("model", "fake-embedding"),
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            }
+        )
+
+    async def rerank(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        # vLLM sends text_1/text_2, DeepInfra sends queries/documents
+        queries = body.get("text_1", body.get("queries", []))
+        documents = body.get("text_2", body.get("documents", []))
+        if isinstance(queries, str):
+            queries = [queries] * len(documents)
+        self._record("rerank", len(documents))
+        await asyncio.sleep(
+            (
+                self.config.rerank_latency_ms
+                + self.config.rerank_latency_per_doc_ms * len(documents)
+            )
+            / 1000
+        )
+
+        scores = [fake_rerank_score(q, d) for q, d in zip(queries, documents)]
+        tokens = sum(len(q) + len(d) for q, d in zip(queries, documents)) // 4
+        if "text_1" in body:
+            return web.json_response(
+                {
+                    "id": f"score-fake-{len(documents)}",
+                    "data": [
+                        {"index": i, "object": "score", "score": score}
+                        for i, score in enumerate(scores)
+                    ],
+                    "usage": {"prompt_tokens": tokens},
+                }
+            )
+        return web.json_response({"scores": scores, "input_tokens": tokens})
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"config": asdict(self.config), "endpoints": self.stats}
+        )
+
+    async def reset_stats(self, request: web.Request) -> web.Response:
+        self.stats = {}
+        return web.json_response({"ok": True})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving, returns the bound port"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register FakeServerConfig fields as command line options"""
+    defaults = FakeServerConfig()
+    parser.add_argument(
+        "--chat-latency-ms", type=float, default=defaults.chat_latency_ms
+    )
+    parser.add_argument(
+        "--embedding-latency-ms", type=float, default=defaults.embedding_latency_ms
+    )
+    parser.add_argument(
+        "--embedding-latency-per-text-ms",
+        type=float,
+        default=defaults.embedding_latency_per_text_ms,
+    )
+    parser.add_argument(
+        "--rerank-latency-ms", type=float, default=defaults.rerank_latency_ms
+    )
+    parser.add_argument(
+        "--rerank-latency-per-doc-ms",
+        type=float,
+        default=defaults.rerank_latency_per_doc_ms,
+    )
+    parser.add_argument("--dimensions", type=int, default=defaults.dimensions)
+    parser.add_argument("--boundary-every", type=int, default=defaults.boundary_every)
+    parser.add_argument("--sufficient", action="store_true")
+    parser.add_argument(
+        "--malformed-rate",
+        type=float,
+        default=defaults.malformed_rate,
+        help="Share of chat responses without a json_schema response_format that are malformed",
+    )
+
+
+def config_from_args(args: argparse.Namespace) -> FakeServerConfig:
+    return FakeServerConfig(
+        chat_latency_ms=args.chat_latency_ms,
+        embedding_latency_ms=args.embedding_latency_ms,
+        embedding_latency_per_text_ms=args.embedding_latency_per_text_ms,
+        rerank_latency_ms=args.rerank_latency_ms,
+        rerank_latency_per_doc_ms=args.rerank_latency_per_doc_ms,
+        dimensions=args.dimensions,
+        boundary_every=args.boundary_every,
+        sufficient=args.sufficient,
+        malformed_rate=args.malformed_rate,
+    )
+
+
+async def serve(config: FakeServerConfig, host: str, port: int) -> None:
+    server = FakeModelServer(config)
+    bound_port = await server.start(host, port)
+    logger.info("Fake model server listening on http://%s:%d/v1", host, bound_port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible model server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(serve(config_from_args(args), args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Offline hot path benchmark
+
+Measures mem_memorize.memorize, MemoryManager.retrieve_mem_hybrid and
+MemoryManager.retrieve_agentic with the LLM, embedding and rerank providers pointed at a
+local fake model server (see fake_model_server.py), so fan-out, batching and caching
+regressions can be caught without network access or paid APIs.
+
+The fake server runs in a child process so its work does not skew the measured latencies.
+Storage is real: MongoDB, Elasticsearch, Milvus and Redis from docker-compose must be
+reachable through the usual .env settings. Model settings in .env are overridden.
+
+Each stage reports p50/p99 latency, throughput and model calls per operation; compare
+runs with the same fake latencies to spot regressions.
+
+Usage:
+  PYTHONPATH=src python src/devops_scripts/benchmark/hot_path_benchmark.py
+  PYTHONPATH=src python src/devops_scripts/benchmark/hot_path_benchmark.py \\
+      --stages memorize,hybrid,agentic --requests 40 --concurrency 8 --chat-latency-ms 800
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import aiohttp
+
+from devops_scripts.benchmark.fake_model_server import (
+    FakeModelServer,
+    FakeServerConfig,
+    add_config_arguments,
+    config_from_args,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+STAGES = ("memorize", "hybrid", "agentic")
+
+
+@dataclass
+class StageResult:
+    """Latency samples and model call counts of one stage"""
+
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+    model_calls: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Any]:
+        operations = len(self.latencies) + self.errors
+        return {
+            "stage": self.name,
+            "operations": operations,
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50) * 1000, 1),
+            "p99_ms": round(self.percentile(99) * 1000, 1),
+            "throughput_ops": (
+                round(len(self.latencies) / self.elapsed, 2) if self.elapsed else 0.0
+            ),
+            "calls_per_op": {
+                endpoint: round(stats["requests"] / operations, 2)
+                for endpoint, stats in self.model_calls.items()
+                if operations
+            },
+        }
+
+
+def _run_server_process(config: FakeServerConfig, port_queue) -> None:
+    """Child process entry: serve until terminated"""
+
+    async def run():
+        server = FakeModelServer(config)
+        port_queue.put(await server.start("127.0.0.1", 0))
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def start_fake_server(config: FakeServerConfig) -> tuple:
+    """Start the fake model server in a child process, returns (process, base_url)"""
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    process = context.Process(
+        target=_run_server_process, args=(config, port_queue), daemon=True
+    )
+    process.start()
+    port = port_queue.get(timeout=30)
+    return process, f"http://127.0.0.1:{port}"
+
+
+def point_providers_at(base_url: str, config: FakeServerConfig) -> None:
+    """Override model provider settings before the application context loads .env"""
+    os.environ.update(
+        {
+            "LLM_BASE_URL": f"{base_url}/v1",
+            "LLM_API_KEY": "fake",
+            "LLM_MODEL": "fake-chat",
+            "LLM_OPENROUTER_PROVIDER": "default",
+            "VECTORIZE_PROVIDER": "vllm",
+            "VECTORIZE_BASE_URL": f"{base_url}/v1",
+            "VECTORIZE_API_KEY": "EMPTY",
+            "VECTORIZE_MODEL": "fake-embedding",
+            "VECTORIZE_DIMENSIONS": str(config.dimensions),
+            "RERANK_PROVIDER": "vllm",
+            "RERANK_BASE_URL": f"{base_url}/v1/score",
+            "RERANK_API_KEY": "EMPTY",
+            "RERANK_MODEL": "fake-rerank",
+        }
+    )
+
+
+async def fetch_model_calls(base_url: str, reset: bool = False) -> Dict[str, Any]:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/stats") as response:
+            stats = await response.json()
+        if reset:
+            await session.post(f"{base_url}/stats/reset")
+    return stats["endpoints"]
+
+
+async def run_stage(
+    name: str,
+    operation: Callable[[int], Awaitable[Any]],
+    requests: int,
+    concurrency: int,
+    base_url: str,
+) -> StageResult:
+    """Run `requests` operations with bounded concurrency and collect latencies"""
+    result = StageResult(name=name)
+    semaphore = asyncio.Semaphore(concurrency)
+    await fetch_model_calls(base_url, reset=True)
+
+    async def timed(index: int):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await operation(index)
+            except Exception as e:
+                result.errors += 1
+                print(f"  [{name}] operation {index} failed: {e}")
+                return
+            result.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(requests)))
+    result.elapsed = time.perf_counter() - start
+    result.model_calls = await fetch_model_calls(base_url)
+    return result
+
+
+def load_messages(input_path: Path) -> List[Dict[str, Any]]:
+    """Messages of a GroupChatFormat file"""
+    with open(input_path, "r", encoding="utf-8") as f:
+        return json.load(f)["conversation_list"]
+
+
+def build_conversation(
+    messages: List[Dict[str, Any]], index: int, window: int, group_id: str
+) -> Dict[str, Any]:
+    """Memorize payload of a deterministic message window, in the API conversation format"""
+    start = (index * window) % max(1, len(messages) - window)
+    payload_messages = []
+    for offset, message in enumerate(messages[start : start + window]):
+        payload_messages.append(
+            {
+                "_id": f"{group_id}_{index}_{offset}",
+                "fullName": message.get("sender_name"),
+                "createBy": message.get("sender"),
+                "roomId": group_id,
+                "content": message.get("content", ""),
+                "createTime": message.get("create_time"),
+                "updateTime": message.get("create_time"),
+                "msgType": 1,
+                "referList": [],
+            }
+        )
+    return {
+        "messages": payload_messages,
+        "group_id": group_id,
+        "group_name": group_id,
+        "raw_data_type": "Conversation",
+    }
+
+
+async def main_async(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    config = config_from_args(args)
+    process, base_url = start_fake_server(config)
+    try:
+        point_providers_at(base_url, config)
+
+        from bootstrap import setup_project_context
+
+        await setup_project_context(env_file=args.env_file)
+
+        from agentic_layer.memory_manager import MemoryManager
+        from api_specs.dtos.memory_query import RetrieveMemRequest
+        from api_specs.memory_models import RetrieveMethod
+        from api_specs.request_converter import handle_conversation_format
+        from biz_layer.mem_memorize import memorize
+        from memory_layer.llm.llm_provider import LLMProvider
+
+        messages = load_messages(Path(args.input))
+        run_id = uuid.uuid4().hex[:8]
+        stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+        memory_manager = MemoryManager()
+        llm_provider = LLMProvider(
+            "openai",
+            model=os.environ["LLM_MODEL"],
+            base_url=os.environ["LLM_BASE_URL"],
+            api_key=os.environ["LLM_API_KEY"],
+        )
+
+        def query_for(index: int) -> tuple:
+            message = messages[(index * 7) % len(messages)]
+            return message.get("content", "")[:120], message.get("sender")
+
+        async def memorize_op(index: int):
+            group_id = f"bench_{run_id}_{index % args.groups}"
+            payload = build_conversation(messages, index, args.window, group_id)
+            await memorize(await handle_conversation_format(payload))
+
+        async def hybrid_op(index: int):
+            query, user_id = query_for(index)
+            await memory_manager.retrieve_mem_hybrid(
+                RetrieveMemRequest(
+                    user_id=user_id,
+                    query=query,
+                    retrieve_method=RetrieveMethod.HYBRID,
+                    top_k=args.top_k,
+                )
+            )
+
+        async def agentic_op(index: int):
+            query, user_id = query_for(index)
+            await memory_manager.retrieve_agentic(
+                query=query,
+                user_id=user_id,
+                top_k=args.top_k,
+                llm_provider=llm_provider,
+            )
+
+        operations = {
+            "memorize": memorize_op,
+            "hybrid": hybrid_op,
+            "agentic": agentic_op,
+        }
+        summaries = []
+        for stage in stages:
+            if stage not in operations:
+                raise ValueError(f"Unknown stage '{stage}', expected one of {STAGES}")
+            print(f"\n▶ Running stage {stage}: {args.requests} operations")
+            result = await run_stage(
+                stage, operations[stage], args.requests, args.concurrency, base_url
+            )
+            summaries.append(result.summary())
+        return summaries
+    finally:
+        process.terminate()
+        process.join(timeout=5)
+
+
+def print_report(summaries: List[Dict[str, Any]], args: argparse.Namespace) -> None:
+    print(
+        f"\nfake latency: chat={args.chat_latency_ms}ms "
+        f"embedding={args.embedding_latency_ms}ms+{args.embedding_latency_per_text_ms}ms/text "
+        f"rerank={args.rerank_latency_ms}ms+{args.rerank_latency_per_doc_ms}ms/doc, "
+        f"concurrency={args.concurrency}"
+    )
+    print(
+        f"{'stage':<10}{'ops':>6}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}{'ops/s':>9}  calls/op"
+    )
+    for summary in summaries:
+        calls = ", ".join(
+            f"{endpoint}={count}" for endpoint, count in summary["calls_per_op"].items()
+        )
+        print(
+            f"{summary['stage']:<10}{summary['operations']:>6}{summary['errors']:>8}"
+            f"{summary['p50_ms']:>10}{summary['p99_ms']:>10}{summary['throughput_ops']:>9}  {calls}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline hot path benchmark")
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--input", default=str(PROJECT_ROOT / "data" / "group_chat_en.json")
+    )
+    parser.add_argument("--window", type=int, default=10, help="Messages per memorize")
+    parser.add_argument("--groups", type=int, default=4, help="Distinct group ids")
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--env-file", default=".env")
+    parser.add_argument("--json-output", help="Also write the report as JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    summaries = asyncio.run(main_async(args))
+    print_report(summaries, args)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
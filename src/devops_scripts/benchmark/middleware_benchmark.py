@@ -0,0 +1,221 @@
+"""
+Middleware stack throughput benchmark
+
+Measures request throughput of the FastAPI application through its full middleware stack,
+for a no-op route (pure middleware and routing cost) and for
+POST /api/v3/agentic/retrieve_lightweight (model providers pointed at the local fake model
+server, see fake_model_server.py).
+
+Requests are driven in-process at the ASGI level, without sockets or an HTTP client, so
+the numbers isolate the cost of the application stack. The middlewares that are disabled
+in app.py / base_app.py (HMAC signature, user context and, when DATABASE_URL is set,
+database session) are added so every layer is exercised. --legacy-layers wraps the stack
+in additional pass-through BaseHTTPMiddleware layers to show the per-layer overhead the
+pure ASGI middlewares avoid.
+
+Storage for the retrieve stage is real: MongoDB, Elasticsearch, Milvus and Redis from
+docker-compose must be reachable through the usual .env settings.
+
+Usage:
+  PYTHONPATH=src python src/devops_scripts/benchmark/middleware_benchmark.py
+  PYTHONPATH=src python src/devops_scripts/benchmark/middleware_benchmark.py \\
+      --stages noop --requests 5000 --concurrency 64 --legacy-layers 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from typing import Any, Dict, List
+
+from devops_scripts.benchmark.fake_model_server import (
+    add_config_arguments,
+    config_from_args,
+)
+from devops_scripts.benchmark.hot_path_benchmark import (
+    point_providers_at,
+    print_report,
+    run_stage,
+    start_fake_server,
+)
+
+STAGES = ("noop", "retrieve")
+NOOP_PATH = "/benchmark/noop"
+RETRIEVE_PATH = "/api/v3/agentic/retrieve_lightweight"
+
+
+async def call_asgi(
+    app, method: str, path: str, body: bytes = b"", headers: List[tuple] = None
+) -> int:
+    """Send one HTTP request to an ASGI application, returns the response status"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark"), *(headers or [])],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    request_sent = False
+    status = None
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            # Only reached by handlers waiting for a disconnect
+            await asyncio.Event().wait()
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def add_benchmark_layers(app, args: argparse.Namespace) -> List[str]:
+    """Add the no-op route and the middlewares under test, returns the added layer names"""
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    from core.middleware.hmac_signature_middleware import create_hmac_middleware
+    from core.middleware.user_context_middleware import UserContextMiddleware
+
+    async def noop() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_api_route(NOOP_PATH, noop, methods=["GET"])
+
+    # user_middleware is ordered outermost first; these run innermost
+    layers = [
+        ("hmac_signature", Middleware(create_hmac_middleware("benchmark-secret"))),
+        ("user_context", Middleware(UserContextMiddleware)),
+    ]
+    if os.getenv("DATABASE_URL"):
+        from core.middleware.database_session_middleware import (
+            DatabaseSessionMiddleware,
+        )
+
+        layers.insert(0, ("database_session", Middleware(DatabaseSessionMiddleware)))
+    else:
+        print("DATABASE_URL not set, database_session middleware skipped")
+
+    class PassThroughMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            return await call_next(request)
+
+    for index in range(args.legacy_layers):
+        layers.insert(0, (f"legacy_{index}", Middleware(PassThroughMiddleware)))
+
+    for _, middleware in layers:
+        app.user_middleware.append(middleware)
+    return [name for name, _ in layers]
+
+
+async def main_async(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    config = config_from_args(args)
+    process, base_url = start_fake_server(config)
+    try:
+        point_providers_at(base_url, config)
+
+        from bootstrap import setup_project_context
+
+        await setup_project_context(env_file=args.env_file)
+
+        from app import app
+
+        added = add_benchmark_layers(app, args)
+        stack = [
+            getattr(middleware.cls, "__name__", "factory")
+            for middleware in app.user_middleware
+        ]
+        print(f"Middleware stack (outermost first): {stack}, added {added}")
+
+        retrieve_body = json.dumps(
+            {
+                "query": args.query,
+                "user_id": args.user_id,
+                "top_k": args.top_k,
+                "retrieval_mode": "rrf",
+                "data_source": "episode",
+            }
+        ).encode()
+        json_headers = [(b"content-type", b"application/json")]
+
+        def checked(status: int) -> None:
+            if status != 200:
+                raise RuntimeError(f"HTTP {status}")
+
+        async def noop_op(index: int):
+            checked(await call_asgi(app, "GET", NOOP_PATH))
+
+        async def retrieve_op(index: int):
+            checked(
+                await call_asgi(app, "POST", RETRIEVE_PATH, retrieve_body, json_headers)
+            )
+
+        operations = {"noop": noop_op, "retrieve": retrieve_op}
+        stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+        summaries = []
+        async with app.router.lifespan_context(app):
+            for stage in stages:
+                if stage not in operations:
+                    raise ValueError(
+                        f"Unknown stage '{stage}', expected one of {STAGES}"
+                    )
+                requests = args.requests if stage == "noop" else args.retrieve_requests
+                # Warm up routing, middleware construction and connection pools
+                for index in range(min(args.warmup, requests)):
+                    await operations[stage](index)
+                print(f"\n▶ Running stage {stage}: {requests} requests")
+                result = await run_stage(
+                    stage, operations[stage], requests, args.concurrency, base_url
+                )
+                summaries.append(result.summary())
+        return summaries
+    finally:
+        process.terminate()
+        process.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Middleware stack throughput benchmark"
+    )
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--requests", type=int, default=2000, help="No-op requests")
+    parser.add_argument("--retrieve-requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--legacy-layers",
+        type=int,
+        default=0,
+        help="Extra pass-through BaseHTTPMiddleware layers, for comparison",
+    )
+    parser.add_argument("--query", default="What did we plan for the weekend trip?")
+    parser.add_argument("--user-id", default="benchmark_user")
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--env-file", default=".env")
+    parser.add_argument("--json-output", help="Also write the report as JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    summaries = asyncio.run(main_async(args))
+    print_report(summaries, args)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
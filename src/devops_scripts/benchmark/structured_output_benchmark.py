@@ -0,0 +1,183 @@
+"""
+Structured output retry benchmark
+
+Measures how often boundary detection and Episode generation have to re-ask the LLM
+because of malformed output, with and without a json_schema response_format. The LLM is
+the local fake model server (see fake_model_server.py) with --malformed-rate: that share
+of unconstrained responses is truncated JSON wrapped in prose, while requests carrying a
+json_schema response_format always get valid JSON, as with constrained decoding.
+
+No storage or network access is needed. For each mode and stage the report lists the chat
+calls per extraction, the retry rate (extra calls per extraction) and the extractions that
+still failed after all attempts.
+
+Usage:
+  PYTHONPATH=src python src/devops_scripts/benchmark/structured_output_benchmark.py
+  PYTHONPATH=src python src/devops_scripts/benchmark/structured_output_benchmark.py \\
+      --extractions 500 --malformed-rate 0.3 --modes off,json_object,json_schema
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from devops_scripts.benchmark.fake_model_server import (
+    FakeModelServer,
+    add_config_arguments,
+    config_from_args,
+)
+from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.llm.structured_output import StructuredOutputError
+from memory_layer.memcell_extractor.conv_memcell_extractor import ConvMemCellExtractor
+from memory_layer.memory_extractor.episode_memory_extractor import (
+    EpisodeMemoryExtractor,
+    EpisodeOutput,
+)
+
+STAGES = ("boundary", "episode")
+TOPICS = (
+    "the quarterly budget review and the hiring plan",
+    "the weekend hiking trip to Mount Rainier",
+    "the database migration and the rollback checklist",
+    "the product launch date and the press release",
+)
+
+
+def build_messages(index: int, count: int = 6) -> List[Dict[str, Any]]:
+    """Deterministic conversation window about one of the topics"""
+    start = datetime(2025, 1, 1, 9, 0) + timedelta(hours=index)
+    topic = TOPICS[index % len(TOPICS)]
+    return [
+        {
+            "speaker_id": f"user_{offset % 3}",
+            "speaker_name": ("Alice", "Bob", "Carol")[offset % 3],
+            "content": f"Message {index}-{offset} about {topic}",
+            "timestamp": (start + timedelta(minutes=offset)).isoformat(),
+        }
+        for offset in range(count)
+    ]
+
+
+async def run_stage(
+    stage: str, llm: OpenAIProvider, extractions: int, concurrency: int
+) -> int:
+    """Run the extractions of a stage, returns the number of failed extractions"""
+    boundary_extractor = ConvMemCellExtractor(llm)
+    episode_extractor = EpisodeMemoryExtractor(llm)
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def boundary(index: int):
+        messages = build_messages(index)
+        result = await boundary_extractor._detect_boundary(messages[:-2], messages[-2:])
+        return result.reasoning != "Failed to parse LLM response"
+
+    async def episode(index: int):
+        # Same prompt and validation as EpisodeMemoryExtractor._extract_episode
+        prompt = episode_extractor.group_episode_generation_prompt.format(
+            conversation_start_time=f"January 1, 2025 at {index}",
+            conversation=episode_extractor.get_conversation_json_text(
+                build_messages(index)
+            ),
+            custom_instructions=episode_extractor.default_custom_instructions,
+        )
+        try:
+            await llm.generate_structured(prompt, EpisodeOutput, max_attempts=5)
+            return True
+        except StructuredOutputError:
+            return False
+
+    operation = {"boundary": boundary, "episode": episode}[stage]
+
+    async def run(index: int):
+        nonlocal failures
+        async with semaphore:
+            if not await operation(index):
+                failures += 1
+
+    await asyncio.gather(*(run(index) for index in range(extractions)))
+    return failures
+
+
+async def main_async(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    config = config_from_args(args)
+    summaries = []
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        for stage in [s.strip() for s in args.stages.split(",") if s.strip()]:
+            if stage not in STAGES:
+                raise ValueError(f"Unknown stage '{stage}', expected one of {STAGES}")
+            # A fresh server per run, so every run sees the same malformed draws
+            server = FakeModelServer(config)
+            port = await server.start()
+            try:
+                llm = OpenAIProvider(
+                    model="fake-chat",
+                    api_key="fake",
+                    base_url=f"http://127.0.0.1:{port}/v1",
+                    structured_output=mode,
+                )
+                failures = await run_stage(
+                    stage, llm, args.extractions, args.concurrency
+                )
+                calls = server.stats.get("chat", {}).get("requests", 0)
+                malformed = server.stats.get("chat_malformed", {}).get("requests", 0)
+            finally:
+                await server.stop()
+            summaries.append(
+                {
+                    "mode": mode,
+                    "stage": stage,
+                    "extractions": args.extractions,
+                    "chat_calls": calls,
+                    "malformed_responses": malformed,
+                    "calls_per_extraction": round(calls / args.extractions, 3),
+                    "retry_rate": round(
+                        (calls - args.extractions) / args.extractions, 3
+                    ),
+                    "failed_extractions": failures,
+                }
+            )
+    return summaries
+
+
+def print_report(summaries: List[Dict[str, Any]], args: argparse.Namespace) -> None:
+    print(
+        f"\nStructured output benchmark: {args.extractions} extractions per stage, "
+        f"malformed rate {args.malformed_rate:.0%}"
+    )
+    header = (
+        f"{'mode':<12} {'stage':<9} {'calls/op':>9} {'retry rate':>11} {'failed':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for summary in summaries:
+        print(
+            f"{summary['mode']:<12} {summary['stage']:<9} "
+            f"{summary['calls_per_extraction']:>9.3f} "
+            f"{summary['retry_rate']:>10.1%} "
+            f"{summary['failed_extractions']:>7}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structured output retry benchmark")
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--modes", default="off,json_schema")
+    parser.add_argument("--extractions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--json-output", help="Also write the report as JSON")
+    add_config_arguments(parser)
+    parser.set_defaults(chat_latency_ms=0.0, malformed_rate=0.2)
+    args = parser.parse_args()
+
+    summaries = asyncio.run(main_async(args))
+    print_report(summaries, args)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
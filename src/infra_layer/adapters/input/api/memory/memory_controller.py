@@ -9,7 +9,7 @@ Provides complete memory management RESTful API routes, including:
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from fastapi import HTTPException, Request as FastAPIRequest
 
 from core.di.decorators import controller
@@ -35,10 +35,25 @@ from infra_layer.adapters.out.persistence.repository.conversation_meta_raw_repos
 )
 from component.redis_provider import RedisProvider
 from component.timeout_background import timeout_to_background
+from biz_layer.memorize_queue import is_queue_ingest_enabled, enqueue_memorize_message
 
 logger = logging.getLogger(__name__)
 
 
+async def _memorize_durable_handoff(
+    _controller: Any, fastapi_request: FastAPIRequest
+) -> Optional[str]:
+    """Durable handoff of memorize_single_message: replay the request body in an arq worker"""
+    # Delayed import: task registration needs the task manager bean
+    from infra_layer.adapters.input.jobs.memorize_tasks import (
+        enqueue_memorize_message_task,
+    )
+
+    # Starlette caches the parsed body, so this does not re-read the stream
+    message_data = await fastapi_request.json()
+    return await enqueue_memorize_message_task(message_data)
+
+
 @controller("memory_controller", primary=True)
 class MemoryController(BaseController):
     """
@@ -144,6 +159,18 @@ class MemoryController(BaseController):
                                     },
                                 },
                             },
+                            "queued": {
+                                "summary": "Message queued (MEMORIZE_INGEST_MODE=queue)",
+                                "value": {
+                                    "status": "ok",
+                                    "message": "Message queued for background memorization",
+                                    "result": {
+                                        "saved_memories": [],
+                                        "count": 0,
+                                        "status_info": "queued",
+                                    },
+                                },
+                            },
                         }
                     }
                 },
@@ -178,7 +205,7 @@ class MemoryController(BaseController):
             },
         },
     )
-    @timeout_to_background()
+    @timeout_to_background(durable_handoff=_memorize_durable_handoff)
     async def memorize_single_message(
         self, fastapi_request: FastAPIRequest
     ) -> Dict[str, Any]:
@@ -215,6 +242,25 @@ class MemoryController(BaseController):
                 "Conversion completed: group_id=%s, group_name=%s", group_id, group_name
             )
 
+            # Queue ingest mode: hand over to memorize_queue_consumer, which processes
+            # each group's messages in order
+            if is_queue_ingest_enabled():
+                enqueued, detail = await enqueue_memorize_message(message_data)
+                if not enqueued:
+                    raise HTTPException(
+                        status_code=503,
+                        detail=f"Memorize queue is unavailable: {detail}",
+                    )
+                return {
+                    "status": ErrorStatus.OK.value,
+                    "message": "Message queued for background memorization",
+                    "result": {
+                        "saved_memories": [],
+                        "count": 0,
+                        "status_info": "queued",
+                    },
+                }
+
             # 4. Convert to MemorizeRequest object and call memory_manager
             logger.info("Starting to process memory request")
             memorize_request = await handle_conversation_format(memorize_input)
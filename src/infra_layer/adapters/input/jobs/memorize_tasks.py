@@ -0,0 +1,50 @@
+"""
+Memorize async tasks
+
+Durable counterpart of the memorize API: timeout_to_background hands requests over to
+this task (TIMEOUT_BACKGROUND_DURABLE_HANDOFF=true) when the in-process background
+executor is full or shutting down, and any arq worker (python src/task.py) replays them.
+"""
+
+from typing import Any, Dict, Optional
+
+from api_specs.request_converter import handle_conversation_format
+from biz_layer.mem_memorize import memorize
+from core.asynctasks.task_manager import get_task_manager, task
+from infra_layer.adapters.input.api.mapper.group_chat_converter import (
+    convert_simple_message_to_memorize_input,
+)
+
+
+@task(timeout=600)
+async def memorize_message_task(message_data: Dict[str, Any]) -> int:
+    """
+    Run the single-message memorize path of the memorize API
+
+    Args:
+        message_data: Raw single-message payload received by the memorize API
+
+    Returns:
+        int: Number of extracted memories
+    """
+    memorize_input = convert_simple_message_to_memorize_input(message_data)
+    memorize_request = await handle_conversation_format(memorize_input)
+    memories = await memorize(memorize_request)
+    return len(memories) if memories else 0
+
+
+async def enqueue_memorize_message_task(message_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Enqueue a single-message memorize payload to the arq task queue
+
+    The message_id is used as arq job ID, so handing the same message off twice
+    (e.g. overflow and then drain) enqueues it only once.
+
+    Returns:
+        Optional[str]: Task ID
+    """
+    message_id = message_data.get("message_id")
+    task_id = f"memorize_{message_id}" if message_id else None
+    return await get_task_manager().enqueue_task(
+        memorize_message_task, message_data, task_id=task_id
+    )
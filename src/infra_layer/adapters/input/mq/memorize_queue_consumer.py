@@ -0,0 +1,214 @@
+"""
+Memorize ingest queue consumer
+
+Long job that drains the memorize ingest queue (see biz_layer/memorize_queue.py).
+
+Ordering guarantees:
+- RedisGroupQueueManager assigns every partition to exactly one active consumer,
+  and a group always hashes to the same partition
+- Each fetched batch takes messages from a partition in score order, and the next
+  batch is fetched only after the current one has been processed
+- So messages of one group are processed in order by one worker, while different
+  groups in a batch are processed concurrently and scale out across workers
+- A rebalance can move a partition while its batch is still in flight, so a group is
+  processed under a per-group distributed lock; a consumer that cannot get it within
+  MEMORIZE_QUEUE_GROUP_LOCK_WAIT_SECONDS requeues its items of that group
+
+A failing message is requeued at the head of its group together with the group's later
+messages of the batch, and dead-lettered after MEMORIZE_QUEUE_MAX_ATTEMPTS attempts
+(see biz_layer/memorize_queue.py).
+
+An idle consumer blocks on its wakeup list (see RedisGroupQueueManager.wait_for_messages)
+instead of polling, so new messages are picked up immediately. max_in_flight stays 1:
+two batches in flight could contain messages of the same group.
+
+Delivery is at-most-once for crashes: a fetched batch is already removed from Redis,
+so a consumer killed while processing it loses the remaining messages.
+
+Start with:
+    python src/run.py --longjob memorize_queue_consumer
+"""
+
+import asyncio
+import dataclasses
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from api_specs.request_converter import handle_conversation_format
+from biz_layer.mem_memorize import memorize
+from biz_layer.memorize_queue import (
+    MemorizeQueueItem,
+    dead_letter_memorize_item,
+    get_memorize_queue_manager,
+    get_memorize_queue_max_attempts,
+    requeue_memorize_items,
+)
+from common_utils.datetime_utils import to_timestamp_ms_universal
+from core.context.context import set_current_app_info, app_info_context
+from core.di.decorators import component
+from core.di.utils import get_bean_by_type
+from core.lock.redis_distributed_lock import RedisDistributedLockManager
+from core.longjob.interfaces import ConsumerConfig, MessageBatch, RetryConfig
+from core.longjob.recycle_consumer_base import RecycleConsumerBase
+from core.queue.redis_group_queue.redis_msg_group_queue_manager import (
+    RedisGroupQueueManager,
+)
+from infra_layer.adapters.input.api.mapper.group_chat_converter import (
+    convert_simple_message_to_memorize_input,
+)
+
+MEMORIZE_QUEUE_CONSUMER_JOB_ID = "memorize_queue_consumer"
+
+# Batch size and idle wait of one fetch
+MEMORIZE_QUEUE_MAX_PER_PARTITION = 10
+MEMORIZE_QUEUE_MAX_BATCH_SIZE = 200
+MEMORIZE_QUEUE_BLOCK_TIMEOUT_SECONDS = 5.0
+
+# How long a consumer waits for a group another consumer is still processing (seconds)
+MEMORIZE_QUEUE_GROUP_LOCK_WAIT_SECONDS = 1.0
+
+
+@component(name=MEMORIZE_QUEUE_CONSUMER_JOB_ID)
+class MemorizeQueueConsumer(RecycleConsumerBase):
+    """Consumer that replays queued memorize requests group by group"""
+
+    def __init__(self):
+        super().__init__(
+            job_id=MEMORIZE_QUEUE_CONSUMER_JOB_ID,
+            # Failures are handled per message in _handle_message; retrying the whole
+            # batch would re-process groups that already succeeded
+            consumer_config=ConsumerConfig(
+                timeout=600.0,
+                retry_config=RetryConfig(max_retries=0),
+                idle_wait_timeout=MEMORIZE_QUEUE_BLOCK_TIMEOUT_SECONDS,
+            ),
+        )
+        self._queue_manager: Optional[RedisGroupQueueManager] = None
+        self._lock_manager: Optional[RedisDistributedLockManager] = None
+        self._max_attempts = get_memorize_queue_max_attempts()
+        self._pending: List[MemorizeQueueItem] = []
+
+    async def _initialize(self) -> None:
+        self._queue_manager = await get_memorize_queue_manager()
+        self._lock_manager = get_bean_by_type(RedisDistributedLockManager)
+        await self._queue_manager.join_consumer()
+        self.logger.info(
+            "Memorize queue consumer joined: owner_id=%s", self._queue_manager.owner_id
+        )
+        self.logger.warning(
+            "⚠️ Memorize queue delivery is at-most-once: messages fetched by this "
+            "consumer are lost if it stops before processing them"
+        )
+
+    async def _cleanup(self) -> None:
+        if self._queue_manager is None:
+            return
+        # Hand the partitions over to the remaining consumers
+        await self._queue_manager.exit_consumer()
+
+    async def _has_messages(self) -> bool:
+        if not self._pending:
+            self._pending = await self._queue_manager.get_messages(
+                score_threshold=0,
+                max_per_partition=MEMORIZE_QUEUE_MAX_PER_PARTITION,
+                max_total=MEMORIZE_QUEUE_MAX_BATCH_SIZE,
+            )
+        return bool(self._pending)
+
+    async def _wait_for_messages(self, timeout: float) -> None:
+        # Block on the owner's wakeup list instead of waiting for an in-process notify()
+        await self._queue_manager.wait_for_messages(timeout)
+
+    async def _fetch_message(self) -> Optional[Any]:
+        if not self._pending:
+            return None
+        items, self._pending = self._pending, []
+        # The queue score is the message create_time, lag_seconds reports the age of
+        # the oldest message. Not stored separately: identical payloads must stay
+        # identical for the queue to deduplicate client retries.
+        create_times_ms = [
+            to_timestamp_ms_universal(item.message.get("create_time")) for item in items
+        ]
+        create_times_ms = [ms for ms in create_times_ms if ms]
+        return MessageBatch(
+            data=items,
+            batch_id=f"memorize_queue_{uuid.uuid4().hex[:8]}",
+            metadata=(
+                {'enqueued_at': min(create_times_ms) / 1000}
+                if create_times_ms
+                else None
+            ),
+        )
+
+    async def _handle_message(self, message_batch: MessageBatch) -> None:
+        items_by_group: Dict[str, List[MemorizeQueueItem]] = defaultdict(list)
+        for item in message_batch.data:
+            items_by_group[item.group_key].append(item)
+
+        await asyncio.gather(
+            *(
+                self._process_group(group_key, items)
+                for group_key, items in items_by_group.items()
+            )
+        )
+
+    async def _process_group(
+        self, group_key: str, items: List[MemorizeQueueItem]
+    ) -> None:
+        """Process the messages of one group sequentially, in queue order"""
+        lock = self._lock_manager.get_lock(
+            f"{self._queue_manager.key_prefix}:group:{group_key}"
+        )
+        async with lock.acquire(
+            blocking_timeout=MEMORIZE_QUEUE_GROUP_LOCK_WAIT_SECONDS, watchdog=True
+        ) as acquired:
+            if not acquired:
+                # Another consumer still processes a batch of this group (rebalance),
+                # hand the items back so they are fetched again after that batch
+                self.logger.info(
+                    "Memorize queue group busy, requeued: group_key=%s, count=%d",
+                    group_key,
+                    len(items),
+                )
+                await requeue_memorize_items(self._queue_manager, items)
+                return
+
+            for index, item in enumerate(items):
+                try:
+                    await self._process_item(item)
+                except Exception as e:
+                    self.stats['total_errors'] += 1
+                    failed = dataclasses.replace(item, attempts=item.attempts + 1)
+                    if failed.attempts < self._max_attempts:
+                        # Requeue under the lock, before a later batch of the group runs
+                        self.logger.warning(
+                            "Memorize queue message failed, requeued: group_key=%s, message_id=%s, attempt=%d, error=%s",
+                            group_key,
+                            item.message.get("message_id"),
+                            failed.attempts,
+                            e,
+                        )
+                        await requeue_memorize_items(
+                            self._queue_manager, [failed, *items[index + 1 :]]
+                        )
+                        return
+                    self.logger.error(
+                        "Memorize queue message failed: group_key=%s, message_id=%s, error=%s",
+                        group_key,
+                        item.message.get("message_id"),
+                        e,
+                        exc_info=True,
+                    )
+                    await dead_letter_memorize_item(self._queue_manager, failed, str(e))
+
+    async def _process_item(self, item: MemorizeQueueItem) -> None:
+        """Run the same conversion and memorize path as the inline API mode"""
+        request_id = f"memorize_queue_{uuid.uuid4().hex}"
+        token = set_current_app_info({"request_id": request_id})
+        try:
+            memorize_input = convert_simple_message_to_memorize_input(item.message)
+            memorize_request = await handle_conversation_format(memorize_input)
+            await memorize(memorize_request)
+        finally:
+            app_info_context.reset(token)
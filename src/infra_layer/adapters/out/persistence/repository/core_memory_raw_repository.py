@@ -146,6 +146,62 @@ class CoreMemoryRawRepository(BaseRepository[CoreMemory]):
             logger.error("❌ Failed to retrieve core memory by user ID: %s", e)
             return None if version_range is None else []
 
+    async def get_by_user_ids(
+        self, user_ids: List[str], session: Optional[AsyncClientSession] = None
+    ) -> Dict[str, CoreMemory]:
+        """
+        Batch get the latest version of core memory for multiple users
+
+        Same semantics as get_by_user_id without version_range (highest version per user),
+        but served by a single aggregation with $in instead of one query per user.
+
+        Args:
+            user_ids: List of user IDs
+            session: Optional MongoDB session for transaction support
+
+        Returns:
+            Dict[user_id, CoreMemory]: Users without core memory are not included
+        """
+        try:
+            if not user_ids:
+                return {}
+
+            unique_user_ids = list(dict.fromkeys(user_ids))
+
+            # Latest version per user, the sort is served by idx_user_id_version_unique
+            pipeline = [
+                {"$match": {"user_id": {"$in": unique_user_ids}}},
+                {"$sort": {"user_id": 1, "version": -1}},
+                {"$group": {"_id": "$user_id", "doc": {"$first": "$$ROOT"}}},
+                {"$replaceRoot": {"newRoot": "$doc"}},
+            ]
+
+            collection = self.model.get_pymongo_collection()
+            cursor = await collection.aggregate(pipeline, session=session)
+            results = await cursor.to_list(length=None)
+
+            memories_by_user = {}
+            for doc in results:
+                if not doc:
+                    continue
+                memory = CoreMemory.model_validate(doc)
+                memories_by_user[memory.user_id] = memory
+
+            logger.debug(
+                "✅ Batch retrieval of core memory completed: %d user IDs, found %d",
+                len(unique_user_ids),
+                len(memories_by_user),
+            )
+            # Keep the order of the requested user IDs
+            return {
+                user_id: memories_by_user[user_id]
+                for user_id in unique_user_ids
+                if user_id in memories_by_user
+            }
+        except Exception as e:
+            logger.error("❌ Failed to batch retrieve core memory by user IDs: %s", e)
+            return {}
+
     async def update_by_user_id(
         self,
         user_id: str,
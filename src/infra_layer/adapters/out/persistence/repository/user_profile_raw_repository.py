@@ -6,6 +6,10 @@ Provides ProfileStorage compatible interface (duck typing).
 """
 
 from typing import Optional, Dict, Any, List
+
+from pymongo import UpdateOne
+
+from common_utils.datetime_utils import get_now_with_timezone
 from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
@@ -24,6 +28,7 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
 
     Provides ProfileStorage compatible interfaces:
     - save_profile(user_id, profile, metadata) -> bool
+    - save_profiles(profiles, metadata) -> int
     - get_profile(user_id) -> Optional[Any]
     - get_all_profiles() -> Dict[str, Any]
     - get_profile_history(user_id, limit) -> List[Dict]
@@ -40,17 +45,87 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
     ) -> bool:
         metadata = metadata or {}
         group_id = metadata.get("group_id", "default")
-
-        if hasattr(profile, 'to_dict'):
-            profile_data = profile.to_dict()
-        elif isinstance(profile, dict):
-            profile_data = profile
-        else:
-            profile_data = {"data": str(profile)}
+        profile_data = self._to_profile_data(profile)
 
         result = await self.upsert(user_id, group_id, profile_data, metadata)
         return result is not None
 
+    async def save_profiles(
+        self, profiles: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Upsert the profiles of several users of one group in a single bulk write
+
+        Args:
+            profiles: user_id -> profile
+            metadata: Shared metadata (group_id, scenario, confidence, cluster_id,
+                cluster_ids, memcell_count)
+
+        Returns:
+            int: Number of profiles inserted or updated
+        """
+        if not profiles:
+            return 0
+
+        metadata = metadata or {}
+        group_id = metadata.get("group_id", "default")
+        cluster_ids = metadata.get("cluster_ids") or (
+            [metadata["cluster_id"]] if "cluster_id" in metadata else []
+        )
+        now = get_now_with_timezone()
+
+        operations = []
+        for user_id, profile in profiles.items():
+            update_set = {
+                "profile_data": self._to_profile_data(profile),
+                "updated_at": now,
+            }
+            if "confidence" in metadata:
+                update_set["confidence"] = metadata["confidence"]
+            if "cluster_id" in metadata:
+                update_set["last_updated_cluster"] = metadata["cluster_id"]
+            if "memcell_count" in metadata:
+                update_set["memcell_count"] = metadata["memcell_count"]
+
+            update = {
+                "$set": update_set,
+                # Missing version counts from 0, so inserted profiles get version 1
+                "$inc": {"version": 1},
+                "$setOnInsert": {
+                    "scenario": metadata.get("scenario", "group_chat"),
+                    "created_at": now,
+                },
+            }
+            if cluster_ids:
+                update["$addToSet"] = {"cluster_ids": {"$each": cluster_ids}}
+            else:
+                update["$setOnInsert"]["cluster_ids"] = []
+            if "confidence" not in metadata:
+                update["$setOnInsert"]["confidence"] = 0.0
+            if "memcell_count" not in metadata:
+                update["$setOnInsert"]["memcell_count"] = 0
+
+            operations.append(
+                UpdateOne(
+                    {"user_id": user_id, "group_id": group_id}, update, upsert=True
+                )
+            )
+
+        try:
+            collection = self.model.get_pymongo_collection()
+            result = await collection.bulk_write(operations, ordered=False)
+            saved = result.upserted_count + result.matched_count
+            logger.debug(
+                f"Bulk saved user profiles: group_id={group_id}, count={saved} "
+                f"(inserted={result.upserted_count})"
+            )
+            return saved
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk save user profiles: group_id={group_id}, count={len(operations)}, error={e}"
+            )
+            return 0
+
     async def get_profile(
         self, user_id: str, group_id: str = "default"
     ) -> Optional[Any]:
@@ -89,6 +164,14 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
             await self.delete_by_group(group_id)
         return True
 
+    @staticmethod
+    def _to_profile_data(profile: Any) -> Dict[str, Any]:
+        if hasattr(profile, 'to_dict'):
+            return profile.to_dict()
+        if isinstance(profile, dict):
+            return profile
+        return {"data": str(profile)}
+
     # ==================== Native CRUD methods ====================
 
     async def get_by_user_and_group(
@@ -1,6 +1,10 @@
 import os
+from typing import Type, TypeVar
+
 from .openai_provider import OpenAIProvider
 
+T = TypeVar("T")
+
 
 class LLMProvider:
     def __init__(self, provider_type: str, **kwargs):
@@ -24,3 +28,15 @@ class LLMProvider:
         return await self.provider.generate(
             prompt, temperature, max_tokens, extra_body, response_format
         )
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_model: Type[T],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_attempts: int = 3,
+    ) -> T:
+        return await self.provider.generate_structured(
+            prompt, output_model, temperature, max_tokens, max_attempts
+        )
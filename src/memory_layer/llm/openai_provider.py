@@ -12,15 +12,27 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import aiohttp
-from typing import Optional
+from typing import Optional, Type, TypeVar
 import asyncio
 import random
 
 from .protocol import LLMProvider, LLMError
+from .response_cache import LLMResponseCache, build_cache_key, get_llm_response_cache
+from .structured_output import (
+    StructuredOutputError,
+    build_response_format,
+    get_structured_output_mode,
+    is_response_format_rejection,
+    is_response_format_supported,
+    mark_response_format_unsupported,
+    parse_structured_output,
+)
 from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class OpenAIProvider(LLMProvider):
     """
@@ -37,6 +49,8 @@ class OpenAIProvider(LLMProvider):
         temperature: float = 0.3,
         max_tokens: int | None = 100 * 1024,
         enable_stats: bool = False,  # New: optional statistics feature, disabled by default
+        response_cache: LLMResponseCache | None = None,
+        structured_output: str | None = None,
         **kwargs,
     ):
         """
@@ -49,6 +63,9 @@ class OpenAIProvider(LLMProvider):
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             enable_stats: Enable usage statistics accumulation (default: False)
+            response_cache: Response cache, defaults to the one configured by LLM_RESPONSE_CACHE
+            structured_output: response_format mode of generate_structured
+                (json_schema/json_object/off), defaults to LLM_STRUCTURED_OUTPUT
             **kwargs: Additional arguments (ignored for now)
         """
         self.model = model
@@ -59,36 +76,21 @@ class OpenAIProvider(LLMProvider):
         # Use OpenRouter API key and base URL
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         self.base_url = base_url or "https://openrouter.ai/api/v1"
+        self.response_cache = response_cache or get_llm_response_cache()
+        self.structured_output = structured_output or get_structured_output_mode()
 
         # New: optional per-call statistics (disabled by default, does not affect existing usage)
         if self.enable_stats:
             self.current_call_stats = None  # Store statistics for current call
 
-    async def generate(
+    def _build_request_data(
         self,
         prompt: str,
         temperature: float | None = None,
         max_tokens: int | None = None,
-        extra_body: dict | None = None,
         response_format: dict | None = None,
-    ) -> str:
-        """
-        Generate a response for the given prompt.
-
-        Args:
-            prompt: Input prompt
-            temperature: Override temperature for this request
-            max_tokens: Override max tokens for this request
-
-        Returns:
-            Generated response text
-
-        Raises:
-            LLMError: If generation fails
-        """
-        # Use time.perf_counter() for more precise time measurement
-        start_time = time.perf_counter()
-        # Prepare request data
+    ) -> dict:
+        """Chat completion request body, also the input of the response cache key."""
         if os.getenv("LLM_OPENROUTER_PROVIDER", "default") != "default":
             provider_str = os.getenv('LLM_OPENROUTER_PROVIDER')
             provider_list = [p.strip() for p in provider_str.split(',')]
@@ -110,6 +112,56 @@ class OpenAIProvider(LLMProvider):
             data["max_tokens"] = max_tokens
         elif self.max_tokens is not None:
             data["max_tokens"] = self.max_tokens
+        return data
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        extra_body: dict | None = None,
+        response_format: dict | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Generate a response for the given prompt.
+
+        Args:
+            prompt: Input prompt
+            temperature: Override temperature for this request
+            max_tokens: Override max tokens for this request
+            use_cache: Look up and store the response in the response cache; callers
+                that validate responses pass False and cache valid ones themselves
+
+        Returns:
+            Generated response text
+
+        Raises:
+            LLMError: If generation fails, immediately on 4xx responses other than 429
+        """
+        # Use time.perf_counter() for more precise time measurement
+        start_time = time.perf_counter()
+        data = self._build_request_data(
+            prompt, temperature, max_tokens, response_format
+        )
+
+        # Identical requests are answered from the response cache (opt-in)
+        cache_key = None
+        if self.response_cache is not None and use_cache:
+            cache_key = build_cache_key(self.base_url, data)
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"[OpenAI-{self.model}] Response cache hit")
+                if self.enable_stats:
+                    self.current_call_stats = {
+                        'prompt_tokens': 0,
+                        'completion_tokens': 0,
+                        'total_tokens': 0,
+                        'duration': time.perf_counter() - start_time,
+                        'timestamp': time.time(),
+                        'cached': True,
+                    }
+                return cached
 
         # Use asynchronous aiohttp instead of synchronous urllib
         headers = {
@@ -146,7 +198,10 @@ class OpenAIProvider(LLMProvider):
                                 )
                                 await asyncio.sleep(random.randint(5, 20))
 
-                            raise LLMError(f"HTTP Error {response.status}: {error_msg}")
+                            raise LLMError(
+                                f"HTTP Error {response.status}: {error_msg}",
+                                status_code=response.status,
+                            )
 
                         # Use time.perf_counter() for more precise time measurement
                         end_time = time.perf_counter()
@@ -201,7 +256,15 @@ class OpenAIProvider(LLMProvider):
                                 'timestamp': time.time(),
                             }
 
-                        return response_data['choices'][0]['message']['content']
+                        content = response_data['choices'][0]['message']['content']
+                        # Truncated or filtered completions are not cached
+                        if (
+                            cache_key is not None
+                            and finish_reason == 'stop'
+                            and content
+                        ):
+                            await self.response_cache.set(cache_key, content)
+                        return content
 
             except aiohttp.ClientError as e:
                 error_time = time.perf_counter()
@@ -215,12 +278,113 @@ class OpenAIProvider(LLMProvider):
                     raise LLMError(f"Request failed: {str(e)}")
             except Exception as e:
                 error_time = time.perf_counter()
+                status_code = getattr(e, "status_code", None)
                 logger.error("Exception: %s", e)
                 logger.error(f"   ⏱️  Duration: {error_time - start_time:.2f}s")
                 logger.error(f"   💬 Error message: {str(e)}")
                 logger.error(f"retry_num: {retry_num}")
-                if retry_num == max_retries - 1:
-                    raise LLMError(f"Request failed: {str(e)}")
+                # The request itself is rejected (bad request, auth, context length):
+                # retrying the same request cannot succeed
+                client_error = (
+                    status_code is not None
+                    and 400 <= status_code < 500
+                    and status_code != 429
+                )
+                if client_error or retry_num == max_retries - 1:
+                    raise LLMError(f"Request failed: {str(e)}", status_code=status_code)
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_model: Type[T],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_attempts: int = 3,
+    ) -> T:
+        """
+        Generate a response validated into a pydantic model.
+
+        The model's JSON schema is sent as response_format when the backend accepts it,
+        so malformed responses (and the retries they cause) become rare. With a response
+        cache, only responses that validate are stored, and a cached response that no
+        longer validates is invalidated.
+
+        Args:
+            prompt: Input prompt
+            output_model: Pydantic model the response must validate into
+            temperature: Override temperature for this request
+            max_tokens: Override max tokens for this request
+            max_attempts: Attempts before giving up on invalid responses
+
+        Returns:
+            Validated output_model instance
+
+        Raises:
+            StructuredOutputError: No attempt produced a valid response
+            LLMError: If generation fails
+        """
+        last_error: Exception | None = None
+        for attempt in range(max_attempts):
+            response_format = None
+            if is_response_format_supported(self.base_url, self.model):
+                response_format = build_response_format(
+                    output_model, self.structured_output
+                )
+
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = build_cache_key(
+                    self.base_url,
+                    self._build_request_data(
+                        prompt, temperature, max_tokens, response_format
+                    ),
+                )
+                cached = await self.response_cache.get(cache_key, detect_retry=False)
+                if cached is not None:
+                    try:
+                        return parse_structured_output(cached, output_model)
+                    except StructuredOutputError:
+                        # Never serve an invalid response again, from any worker
+                        await self.response_cache.invalidate(cache_key)
+
+            try:
+                content = await self.generate(
+                    prompt,
+                    temperature,
+                    max_tokens,
+                    None,
+                    response_format,
+                    use_cache=False,
+                )
+            except LLMError as e:
+                if response_format is None or not is_response_format_rejection(e):
+                    raise
+                # The backend rejects response_format: plain prompt from now on
+                logger.warning(
+                    f"⚠️ [OpenAI-{self.model}] response_format rejected, "
+                    f"falling back to prompt-only structured output: {e}"
+                )
+                mark_response_format_unsupported(self.base_url, self.model)
+                last_error = e
+                continue
+
+            try:
+                output = parse_structured_output(content or "", output_model)
+            except StructuredOutputError as e:
+                logger.warning(
+                    f"[OpenAI-{self.model}] Structured output retry "
+                    f"{attempt + 1}/{max_attempts}: {e}"
+                )
+                last_error = e
+                continue
+            # Only responses that validate are cached
+            if cache_key is not None:
+                await self.response_cache.set(cache_key, content)
+            return output
+
+        raise StructuredOutputError(
+            f"No valid {output_model.__name__} after {max_attempts} attempts: {last_error}"
+        )
 
     async def test_connection(self) -> bool:
         """
@@ -4,7 +4,9 @@ LLM Provider Protocol for memory layer.
 This module defines the abstract interface that all LLM providers must implement.
 """
 
-from typing import Protocol
+from typing import Optional, Protocol, Type, TypeVar
+
+T = TypeVar("T")
 
 
 class LLMProvider(Protocol):
@@ -37,6 +39,32 @@ class LLMProvider(Protocol):
         """
         ...
 
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_model: Type[T],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_attempts: int = 3,
+    ) -> T:
+        """
+        Generate a response validated into a pydantic model.
+
+        Args:
+            prompt: Input prompt text
+            output_model: Pydantic model the response must validate into
+            temperature: Optional temperature override for this request
+            max_tokens: Optional max tokens override for this request
+            max_attempts: Attempts before giving up on invalid responses
+
+        Returns:
+            Validated output_model instance
+
+        Raises:
+            Exception: If no valid response is generated
+        """
+        ...
+
     async def test_connection(self) -> bool:
         """
         Test the connection to the LLM provider.
@@ -54,4 +82,11 @@ class LLMProvider(Protocol):
 class LLMError(Exception):
     """Exception raised for LLM-related errors."""
 
-    pass
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        """
+        Args:
+            message: Error message
+            status_code: HTTP status of the failed request, if the backend answered
+        """
+        super().__init__(message)
+        self.status_code = status_code
@@ -0,0 +1,335 @@
+"""
+LLM response cache
+
+Content-addressed cache of chat completions, keyed by the hash of the full request (endpoint,
+model, messages and sampling parameters). Retries, reprocessing after a crash, evaluation
+reruns and data-fix scripts send identical requests again; with the cache enabled they are
+answered without a network round trip.
+
+Opt-in via LLM_RESPONSE_CACHE:
+- off (default): no caching
+- disk: one JSON file per entry under LLM_RESPONSE_CACHE_DIR
+- redis: shared by all processes, RedisProvider default client, keys under
+  GLOBAL_REDIS_PREFIX like the other Redis keys
+
+Entries expire after LLM_RESPONSE_CACHE_TTL_SECONDS. Only completed responses
+(finish_reason=stop) are stored. Callers that reject a response (e.g. it fails validation)
+invalidate its entry, OpenAIProvider.generate_structured does so and only stores responses
+that validate. For callers that retry without invalidating, asking for the same request
+again within LLM_RESPONSE_CACHE_RETRY_WINDOW_SECONDS counts as a retry and goes to the
+network. The Redis backend tracks this window in Redis, so a retry in another worker is
+detected too; the disk backend tracks it per process.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_RETRY_WINDOW_SECONDS = 60
+DEFAULT_CACHE_DIR = ".cache/llm_responses"
+REDIS_KEY_PREFIX = "llm_response_cache"
+# Upper bound of remembered recently served keys (retry detection)
+MAX_RECENT_KEYS = 10000
+
+
+def build_cache_key(base_url: str, request_data: Dict[str, Any]) -> str:
+    """
+    Build the cache key of a chat completion request
+
+    Args:
+        base_url: API endpoint the request is sent to
+        request_data: Request body (model, messages, temperature, max_tokens, ...)
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON of endpoint and request
+    """
+    payload = json.dumps(
+        {"base_url": base_url, "request": request_data},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Base class of LLM response cache backends"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        retry_window_seconds: float = DEFAULT_RETRY_WINDOW_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.retry_window_seconds = retry_window_seconds
+        # key -> monotonic time the entry was last served (retry detection)
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "retries": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "errors": 0,
+        }
+
+    async def get(self, key: str, detect_retry: bool = True) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from build_cache_key
+            detect_retry: Treat a repeat within the retry window as a retry; callers that
+                invalidate rejected responses themselves pass False
+
+        Returns:
+            The cached response, None on miss, retry or backend error
+        """
+        try:
+            response = await self._get(key)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ LLM response cache read failed: {e}")
+            return None
+
+        if response is None:
+            self._stats["misses"] += 1
+            return None
+        if detect_retry and await self._claim_serve(key):
+            # Same request again shortly after: the caller is retrying
+            self._stats["retries"] += 1
+            return None
+        self._stats["hits"] += 1
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        Store a response
+
+        Args:
+            key: Cache key from build_cache_key
+            response: Completion content
+        """
+        try:
+            await self._set(key, response)
+            self._stats["stores"] += 1
+            # The caller has just seen this response: asking again is a retry
+            await self._mark_served(key)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ LLM response cache write failed: {e}")
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Remove an entry the caller rejected, so the request goes to the network again
+
+        Args:
+            key: Cache key from build_cache_key
+        """
+        self._recent.pop(key, None)
+        try:
+            await self._delete(key)
+            self._stats["invalidations"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ LLM response cache invalidation failed: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache counters of this process"""
+        return dict(self._stats)
+
+    async def _claim_serve(self, key: str) -> bool:
+        """
+        Record that the entry is served now
+
+        Returns:
+            Whether it was already served within the retry window
+        """
+        now = time.monotonic()
+        served_at = self._recent.get(key)
+        await self._mark_served(key)
+        return served_at is not None and now - served_at < self.retry_window_seconds
+
+    async def _mark_served(self, key: str) -> None:
+        """Start the retry window of an entry (per process)"""
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+        while len(self._recent) > MAX_RECENT_KEYS:
+            self._recent.popitem(last=False)
+
+    async def _get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def _set(self, key: str, response: str) -> None:
+        raise NotImplementedError
+
+    async def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class DiskLLMResponseCache(LLMResponseCache):
+    """One JSON file per entry, sharded by the first two key characters"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry["response"]
+
+    def _write(self, key: str, response: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"created_at": time.time(), "response": response}),
+            encoding="utf-8",
+        )
+        # Atomic replace, concurrent readers never see a partial entry
+        os.replace(tmp_path, path)
+
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def _set(self, key: str, response: str) -> None:
+        await asyncio.to_thread(self._write, key, response)
+
+    async def _delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+
+class RedisLLMResponseCache(LLMResponseCache):
+    """Entries stored as Redis strings with the TTL as expiry"""
+
+    def __init__(self, redis_provider: Any = None, **kwargs):
+        """
+        Args:
+            redis_provider: Redis provider, default resolves RedisProvider from the DI container
+        """
+        super().__init__(**kwargs)
+        self._redis_provider = redis_provider
+        global_redis_prefix = os.getenv("GLOBAL_REDIS_PREFIX", "")
+        self.key_prefix = (
+            f"{global_redis_prefix}:{REDIS_KEY_PREFIX}"
+            if global_redis_prefix
+            else REDIS_KEY_PREFIX
+        )
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def _served_key(self, key: str) -> str:
+        return f"{self.key_prefix}:served:{key}"
+
+    async def _get_client(self):
+        if self._redis_provider is None:
+            # pylint: disable=import-outside-toplevel
+            from core.di.utils import get_bean_by_type
+            from component.redis_provider import RedisProvider
+
+            self._redis_provider = get_bean_by_type(RedisProvider)
+        return await self._redis_provider.get_client()
+
+    async def _claim_serve(self, key: str) -> bool:
+        """Served marker in Redis, shared by every worker process"""
+        if self.retry_window_seconds <= 0:
+            return False
+        try:
+            client = await self._get_client()
+            created = await client.set(
+                self._served_key(key),
+                "1",
+                ex=max(1, int(self.retry_window_seconds)),
+                nx=True,
+            )
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ LLM response cache retry check failed: {e}")
+            return False
+        return not created
+
+    async def _mark_served(self, key: str) -> None:
+        if self.retry_window_seconds <= 0:
+            return
+        client = await self._get_client()
+        await client.set(
+            self._served_key(key), "1", ex=max(1, int(self.retry_window_seconds))
+        )
+
+    async def _get(self, key: str) -> Optional[str]:
+        client = await self._get_client()
+        return await client.get(self._entry_key(key))
+
+    async def _set(self, key: str, response: str) -> None:
+        client = await self._get_client()
+        await client.set(self._entry_key(key), response, ex=int(self.ttl_seconds))
+
+    async def _delete(self, key: str) -> None:
+        client = await self._get_client()
+        await client.delete(self._entry_key(key), self._served_key(key))
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_loaded = False
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM response cache configured by LLM_RESPONSE_CACHE
+
+    Returns:
+        The cache backend, None if caching is off
+    """
+    global _response_cache, _response_cache_loaded
+    if _response_cache_loaded:
+        return _response_cache
+
+    backend = os.getenv("LLM_RESPONSE_CACHE", "off").lower()
+    options = {
+        "ttl_seconds": float(
+            os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+        ),
+        "retry_window_seconds": float(
+            os.getenv(
+                "LLM_RESPONSE_CACHE_RETRY_WINDOW_SECONDS",
+                str(DEFAULT_RETRY_WINDOW_SECONDS),
+            )
+        ),
+    }
+    if backend == "disk":
+        _response_cache = DiskLLMResponseCache(
+            os.getenv("LLM_RESPONSE_CACHE_DIR", DEFAULT_CACHE_DIR), **options
+        )
+    elif backend == "redis":
+        _response_cache = RedisLLMResponseCache(**options)
+    elif backend not in ("off", "false", "none", ""):
+        logger.warning(f"⚠️ Unknown LLM_RESPONSE_CACHE backend: {backend}, cache off")
+
+    if _response_cache is not None:
+        logger.info(
+            f"LLM response cache enabled: backend={backend}, "
+            f"ttl={options['ttl_seconds']:.0f}s"
+        )
+    _response_cache_loaded = True
+    return _response_cache
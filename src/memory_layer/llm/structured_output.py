@@ -0,0 +1,126 @@
+"""
+Structured LLM outputs
+
+Extractors describe the JSON they expect as pydantic models. OpenAIProvider.generate_structured
+sends the model's JSON schema as response_format, so backends with constrained decoding
+only produce valid output, and validates the response into the model. Backends that reject
+response_format (HTTP 400/422 naming response_format or json_schema) are remembered per
+endpoint and model and get the plain prompt, validation still applies.
+
+LLM_STRUCTURED_OUTPUT selects what is sent:
+- json_schema (default): {"type": "json_schema", ...} with the model's schema
+- json_object: {"type": "json_object"}, valid JSON without a schema
+- off: no response_format, only validation
+"""
+
+import os
+import re
+from typing import Any, Dict, Optional, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .protocol import LLMError
+
+T = TypeVar("T", bound=BaseModel)
+
+STRUCTURED_OUTPUT_MODES = ("json_schema", "json_object", "off")
+
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Bad-request messages about response_format itself, not about the prompt (e.g. length)
+_RESPONSE_FORMAT_ERROR_PATTERN = re.compile(
+    r"response_format|json_schema|json_object", re.IGNORECASE
+)
+
+# (base_url, model) of backends that rejected response_format
+_unsupported_backends: Set[Tuple[str, str]] = set()
+
+
+class StructuredOutputError(LLMError):
+    """The LLM response does not match the expected output model"""
+
+    pass
+
+
+def get_structured_output_mode() -> str:
+    """Structured output mode configured by LLM_STRUCTURED_OUTPUT"""
+    mode = os.getenv("LLM_STRUCTURED_OUTPUT", "json_schema").lower()
+    return mode if mode in STRUCTURED_OUTPUT_MODES else "json_schema"
+
+
+def build_response_format(
+    output_model: Type[BaseModel], mode: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the response_format request parameter
+
+    Args:
+        output_model: Expected output model
+        mode: json_schema, json_object or off
+
+    Returns:
+        response_format dict, None for off
+    """
+    if mode == "json_schema":
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": output_model.__name__,
+                "schema": output_model.model_json_schema(),
+                # Non-strict: strict mode requires every field to be required
+                "strict": False,
+            },
+        }
+    if mode == "json_object":
+        return {"type": "json_object"}
+    return None
+
+
+def parse_structured_output(content: str, output_model: Type[T]) -> T:
+    """
+    Validate an LLM response into the output model
+
+    Accepts bare JSON, JSON in a ```json fence and JSON surrounded by prose.
+
+    Args:
+        content: LLM response text
+        output_model: Expected output model
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: No candidate validates
+    """
+    candidates = [content.strip()]
+    fence = _JSON_FENCE_PATTERN.search(content)
+    if fence:
+        candidates.append(fence.group(1).strip())
+    start, end = content.find("{"), content.rfind("}")
+    if 0 <= start < end:
+        candidates.append(content[start : end + 1])
+
+    error: Optional[Exception] = None
+    for candidate in candidates:
+        try:
+            return output_model.model_validate_json(candidate)
+        except ValidationError as e:
+            error = e
+    raise StructuredOutputError(
+        f"Response does not match {output_model.__name__}: {error}"
+    )
+
+
+def is_response_format_rejection(error: LLMError) -> bool:
+    """Whether a failed request was rejected because of its response_format"""
+    return error.status_code in (400, 422) and bool(
+        _RESPONSE_FORMAT_ERROR_PATTERN.search(str(error))
+    )
+
+
+def is_response_format_supported(base_url: str, model: str) -> bool:
+    return (base_url, model) not in _unsupported_backends
+
+
+def mark_response_format_unsupported(base_url: str, model: str) -> None:
+    _unsupported_backends.add((base_url, model))
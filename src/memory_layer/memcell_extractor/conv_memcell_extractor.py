@@ -18,7 +18,9 @@ from common_utils.datetime_utils import (
     from_timestamp as dt_from_timestamp,
     get_now_with_timezone,
 )
+from pydantic import BaseModel
 from ..llm.llm_provider import LLMProvider
+from ..llm.structured_output import StructuredOutputError
 from api_specs.memory_types import RawDataType
 from ..prompts.zh.conv_prompts import CONV_BOUNDARY_DETECTION_PROMPT
 
@@ -37,6 +39,16 @@ from core.observation.logger import get_logger
 logger = get_logger(__name__)
 
 
+class BoundaryDetectionOutput(BaseModel):
+    """JSON output of the boundary detection prompt"""
+
+    reasoning: str = "No reason provided"
+    should_end: bool = False
+    should_wait: bool = True
+    confidence: float = 1.0
+    topic_summary: Optional[str] = ""
+
+
 @dataclass
 class BoundaryDetectionResult:
     """Boundary detection result."""
@@ -260,38 +272,30 @@ class ConvMemCellExtractor(MemCellExtractor):
             new_messages=new_text,
             time_gap_info=time_gap_info,
         )
-        for i in range(5):
-            try:
-                resp = await self.llm_provider.generate(prompt)
-                print(
-                    f"[ConversationEpisodeBuilder] Boundary response length: {len(resp)} chars"
-                )
-
-                # Parse JSON response from LLM boundary detection
-                json_match = re.search(r"\{[^{}]*\}", resp, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                    return BoundaryDetectionResult(
-                        should_end=data.get("should_end", False),
-                        should_wait=data.get("should_wait", True),
-                        reasoning=data.get("reasoning", "No reason provided"),
-                        confidence=data.get("confidence", 1.0),
-                        topic_summary=data.get("topic_summary", ""),
-                    )
-                else:
-                    return BoundaryDetectionResult(
-                        should_end=False,
-                        should_wait=True,
-                        reasoning="Failed to parse LLM response",
-                        confidence=1.0,
-                        topic_summary="",
-                    )
-                break
-            except Exception as e:
-                print('retry: ', i)
-                if i == 4:
-                    raise Exception("Boundary detection failed")
-                continue
+        # The JSON schema is sent as response_format, invalid responses are retried
+        try:
+            data = await self.llm_provider.generate_structured(
+                prompt, BoundaryDetectionOutput, max_attempts=5
+            )
+        except StructuredOutputError as e:
+            logger.warning(f"[ConversationEpisodeBuilder] Boundary output invalid: {e}")
+            return BoundaryDetectionResult(
+                should_end=False,
+                should_wait=True,
+                reasoning="Failed to parse LLM response",
+                confidence=1.0,
+                topic_summary="",
+            )
+        except Exception as e:
+            raise Exception("Boundary detection failed") from e
+
+        return BoundaryDetectionResult(
+            should_end=data.should_end,
+            should_wait=data.should_wait,
+            reasoning=data.reasoning,
+            confidence=data.confidence,
+            topic_summary=data.topic_summary or "",
+        )
 
     async def extract_memcell(
         self, request: ConversationMemCellExtractRequest
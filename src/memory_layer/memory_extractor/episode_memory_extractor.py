@@ -6,15 +6,17 @@ from boundary detection results (BoundaryResult).
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import re, json, asyncio, uuid
 
+from pydantic import BaseModel, Field
 
 # Import dynamic language prompts (automatically select based on MEMORY_LANGUAGE environment variable)
 from ..prompts import (
     EPISODE_GENERATION_PROMPT,
     GROUP_EPISODE_GENERATION_PROMPT,
+    MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT,
     DEFAULT_CUSTOM_INSTRUCTIONS,
 )
 
@@ -39,6 +41,14 @@ from core.observation.logger import get_logger
 logger = get_logger(__name__)
 
 
+class EpisodeOutput(BaseModel):
+    """JSON output of the Episode generation prompts"""
+
+    title: str = Field(min_length=1)
+    content: str = Field(min_length=1)
+    summary: Optional[str] = None
+
+
 @dataclass
 class EpisodeMemoryExtractRequest(MemoryExtractRequest):
     """Episode extraction request (inherited from base class)"""
@@ -70,9 +80,14 @@ class EpisodeMemoryExtractor(MemoryExtractor):
             self.episode_generation_prompt = EVAL_EPISODE_GENERATION_PROMPT
             self.group_episode_generation_prompt = EVAL_GROUP_EPISODE_GENERATION_PROMPT
             self.default_custom_instructions = EVAL_DEFAULT_CUSTOM_INSTRUCTIONS
+            # No evaluation variant, evaluation always uses one call per episode
+            self.multi_perspective_episode_generation_prompt = None
         else:
             self.episode_generation_prompt = EPISODE_GENERATION_PROMPT
             self.group_episode_generation_prompt = GROUP_EPISODE_GENERATION_PROMPT
+            self.multi_perspective_episode_generation_prompt = (
+                MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT
+            )
             self.default_custom_instructions = DEFAULT_CUSTOM_INSTRUCTIONS
 
     def _parse_timestamp(self, timestamp) -> datetime:
@@ -151,22 +166,18 @@ class EpisodeMemoryExtractor(MemoryExtractor):
                 timestamp = data['timestamp']
 
             if timestamp:
-                lines.append(
-                    f"""
+                lines.append(f"""
                 {{
                     "timestamp": {timestamp},
                     "speaker": {speaker},
                     "content": {content}
-                }}"""
-                )
+                }}""")
             else:
-                lines.append(
-                    f"""
+                lines.append(f"""
                 {{
                     "speaker": {speaker},
                     "content": {content}
-                }}"""
-                )
+                }}""")
         return "\n".join(lines)
 
     def get_speaker_name_map(self, data_list: List[Dict[str, Any]]) -> Dict[str, str]:
@@ -265,44 +276,16 @@ class EpisodeMemoryExtractor(MemoryExtractor):
                 user_name = participants_name_map.get(user_id, user_id)
                 format_params["user_name"] = user_name
 
-        # Call LLM (with retry)
-        data = None
-        for i in range(5):
-            try:
-                prompt = prompt_template.format(**format_params)
-                response = await self.llm_provider.generate(prompt)
-
-                # Parse JSON
-                if '```json' in response:
-                    start = response.find('```json') + 7
-                    end = response.find('```', start)
-                    if end > start:
-                        json_str = response[start:end].strip()
-                        data = json.loads(json_str)
-                    else:
-                        data = json.loads(response)
-                else:
-                    json_match = re.search(
-                        r'\{[^{}]*"title"[^{}]*"content"[^{}]*\}', response, re.DOTALL
-                    )
-                    if json_match:
-                        data = json.loads(json_match.group())
-                    else:
-                        data = json.loads(response)
-
-                # Validate required fields: title and content must exist
-                if "title" not in data or not data["title"]:
-                    raise ValueError("LLM response missing title field")
-                if "content" not in data or not data["content"]:
-                    raise ValueError("LLM response missing content field")
-
-                # Validation passed, exit retry loop
-                break
-            except Exception as e:
-                logger.warning(f"Episode extraction retry {i+1}/5: {e}")
-                if i == 4:
-                    raise Exception("Episode memory extraction failed after 5 retries")
-                continue
+        # Call LLM, the JSON schema is sent as response_format and invalid responses are retried
+        prompt = prompt_template.format(**format_params)
+        try:
+            output = await self.llm_provider.generate_structured(
+                prompt, EpisodeOutput, max_attempts=5
+            )
+        except Exception as e:
+            logger.warning(f"Episode extraction failed: {e}")
+            raise Exception("Episode memory extraction failed after 5 retries") from e
+        data = output.model_dump()
 
         # Use first 200 characters of content as default summary if summary is missing
         if "summary" not in data or not data["summary"]:
@@ -383,6 +366,161 @@ class EpisodeMemoryExtractor(MemoryExtractor):
             use_group_prompt=is_group_episode,  # Group uses group prompt, personal uses personal prompt
         )
 
+    async def extract_multi_perspective_episodes(
+        self, request: MemoryExtractRequest, user_ids: List[str]
+    ) -> Optional[Tuple[Memory, Dict[str, Memory]]]:
+        """
+        Extract the group Episode and the personal Episodes of participants with one LLM call
+
+        The conversation is sent once and the response carries the group episode plus one
+        perspective per participant. Perspectives are validated against user_ids: unknown
+        user_ids and incomplete entries are dropped, so the caller can fall back to
+        per-user extraction for the participants missing from the result.
+
+        Args:
+            request: Memory extraction request (memcell, group_id, group_name)
+            user_ids: Participants to extract personal Episodes for
+
+        Returns:
+            (group Episode, {user_id: personal Episode}), or None if the prompt is not
+            available or the response cannot be parsed
+        """
+        memcell = request.memcell
+        if (
+            not memcell
+            or memcell.type != RawDataType.CONVERSATION
+            or not self.multi_perspective_episode_generation_prompt
+        ):
+            return None
+
+        start_time = self._parse_timestamp(memcell.timestamp)
+        participants_name_map = self.get_speaker_name_map(memcell.original_data)
+        participants_name_map.update(
+            self._extract_participant_name_map(memcell.original_data)
+        )
+        user_names = {
+            user_id: participants_name_map.get(user_id) or user_id
+            for user_id in user_ids
+        }
+
+        prompt = self.multi_perspective_episode_generation_prompt.format(
+            conversation_start_time=self._format_timestamp(start_time),
+            conversation=self.get_conversation_json_text(memcell.original_data),
+            participants="\n".join(
+                f"- {user_id}: {user_name}" for user_id, user_name in user_names.items()
+            ),
+            custom_instructions=self.default_custom_instructions,
+        )
+
+        # A single attempt: on failure the caller falls back to one call per episode
+        try:
+            response = await self.llm_provider.generate(prompt)
+            group_data, personal_data = self._parse_multi_perspective_response(
+                response, user_ids
+            )
+        except Exception as e:
+            logger.warning(f"Multi-perspective Episode extraction failed: {e}")
+            return None
+
+        texts = [group_data["content"]] + [
+            personal_data[user_id]["content"] for user_id in personal_data
+        ]
+        embeddings = await self._compute_embeddings(texts)
+        participants = memcell.participants if memcell.participants else []
+
+        def build(data: Dict[str, Any], user_id: Optional[str], embedding_data):
+            return Memory(
+                memory_type=MemoryType.EPISODIC_MEMORY,
+                user_id=user_id,
+                user_name=user_names.get(user_id) if user_id else None,
+                ori_event_id_list=[memcell.event_id],
+                timestamp=start_time,
+                subject=data["title"],
+                summary=data["summary"],
+                episode=data["content"],
+                group_id=request.group_id,
+                participants=participants,
+                type=memcell.type,
+                memcell_event_id_list=[memcell.event_id],
+                extend=embedding_data,
+            )
+
+        group_episode = build(group_data, None, embeddings[0])
+        personal_episodes = {
+            user_id: build(data, user_id, embedding_data)
+            for (user_id, data), embedding_data in zip(
+                personal_data.items(), embeddings[1:]
+            )
+        }
+
+        logger.debug(
+            f"✅ Multi-perspective Episode extraction completed: "
+            f"{len(personal_episodes)}/{len(user_ids)} personal Episodes"
+        )
+        return group_episode, personal_episodes
+
+    @staticmethod
+    def _parse_multi_perspective_response(
+        response: str, user_ids: List[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Parse and validate a multi-perspective Episode response
+
+        Args:
+            response: Raw LLM response
+            user_ids: Expected participants
+
+        Returns:
+            (group episode fields, {user_id: personal episode fields} in user_ids order)
+
+        Raises:
+            ValueError: The response is not JSON or the group episode is incomplete
+        """
+        if '```json' in response:
+            start = response.find('```json') + 7
+            end = response.find('```', start)
+            json_str = response[start:end].strip() if end > start else response
+        else:
+            start = response.find('{')
+            end = response.rfind('}')
+            json_str = response[start : end + 1] if 0 <= start < end else response
+        data = json.loads(json_str)
+        if not isinstance(data, dict):
+            raise ValueError("LLM response is not a JSON object")
+
+        def valid(item: Any) -> bool:
+            return (
+                isinstance(item, dict)
+                and bool(item.get("title"))
+                and bool(item.get("content"))
+            )
+
+        group_data = data.get("group")
+        if not valid(group_data):
+            raise ValueError("LLM response missing group title or content")
+
+        expected = set(user_ids)
+        found: Dict[str, Dict[str, Any]] = {}
+        for item in data.get("participants") or []:
+            if not valid(item):
+                continue
+            user_id = str(item.get("user_id") or "")
+            if user_id not in expected:
+                logger.warning(
+                    f"Multi-perspective Episode has unknown user_id: {user_id}"
+                )
+                continue
+            found.setdefault(user_id, item)
+
+        for item in [group_data, *found.values()]:
+            # Use first 200 characters of content as default summary if summary is missing
+            if not item.get("summary"):
+                item["summary"] = item["content"][:200]
+
+        return group_data, {
+            user_id: found[user_id] for user_id in user_ids if user_id in found
+        }
+
     async def _compute_embedding(self, text: str) -> Optional[dict]:
         """Compute embedding for Episode text"""
         try:
@@ -399,3 +537,29 @@ class EpisodeMemoryExtractor(MemoryExtractor):
         except Exception as e:
             logger.error(f"Episode Embedding computation failed: {e}")
             return None
+
+    async def _compute_embeddings(self, texts: List[str]) -> List[Optional[dict]]:
+        """
+        Compute embeddings for many Episode texts with one batch call
+
+        get_embeddings sends the VECTORIZE_BATCH_SIZE chunks of a large group concurrently,
+        so the call costs about one request round trip like the per-user path did.
+        """
+        try:
+            vs = get_vectorize_service()
+            vectors = await vs.get_embeddings(texts)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"Embedding count mismatch: {len(vectors)} != {len(texts)}"
+                )
+            vector_model = vs.get_model_name()
+            return [
+                {
+                    "embedding": vec.tolist() if hasattr(vec, "tolist") else list(vec),
+                    "vector_model": vector_model,
+                }
+                for vec in vectors
+            ]
+        except Exception as e:
+            logger.error(f"Episode Embedding batch computation failed: {e}")
+            return [None] * len(texts)
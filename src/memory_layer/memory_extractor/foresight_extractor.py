@@ -3,7 +3,9 @@ Foresight Extractor - Based on associative prediction method
 Generate predictions of potential impacts on user's future life and decisions from MemCell
 """
 
+import asyncio
 import json
+import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -20,6 +22,12 @@ from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default number of episodes whose foresights are generated concurrently in batch mode
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Base delay between foresight embedding attempts, doubled after each failure (seconds)
+EMBEDDING_RETRY_BACKOFF_SECONDS = 0.5
+
 
 class ForesightExtractor(MemoryExtractor):
     """
@@ -37,6 +45,8 @@ class ForesightExtractor(MemoryExtractor):
     Main methods:
     - generate_foresights_for_memcell(): Generate foresights for MemCell
     - generate_foresights_for_episode(): Generate foresights for EpisodeMemory
+    - generate_foresights_for_episodes(): Generate foresights for many EpisodeMemory objects,
+      LLM calls run with bounded concurrency and all foresights are embedded in one call
     """
 
     def __init__(self, llm_provider: LLMProvider):
@@ -162,6 +172,56 @@ class ForesightExtractor(MemoryExtractor):
         Returns:
             List of foresight items (10 items), including time information
         """
+        results = await self.generate_foresights_for_episodes([episode])
+        return results[0]
+
+    async def generate_foresights_for_episodes(
+        self, episodes: List[Memory], max_concurrency: Optional[int] = None
+    ) -> List[List[ForesightItem]]:
+        """
+        Generate foresight association predictions for many EpisodeMemory objects
+
+        LLM generation runs per episode with bounded concurrency (each with its own retries),
+        then the foresights of all episodes are embedded with a single coalesced
+        get_embeddings call instead of one call per episode.
+
+        Args:
+            episodes: EpisodeMemory objects
+            max_concurrency: Maximum concurrent LLM calls, default FORESIGHT_BATCH_CONCURRENCY
+
+        Returns:
+            Foresight items of each episode, in input order (empty list on failure)
+        """
+        if not episodes:
+            return []
+
+        if max_concurrency is None:
+            max_concurrency = int(
+                os.getenv("FORESIGHT_BATCH_CONCURRENCY", str(DEFAULT_BATCH_CONCURRENCY))
+            )
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def generate(episode: Memory) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._generate_foresight_items_for_episode(episode)
+
+        items_per_episode = await asyncio.gather(
+            *(generate(episode) for episode in episodes)
+        )
+        return await self._embed_foresight_items(items_per_episode)
+
+    async def _generate_foresight_items_for_episode(
+        self, episode: Memory
+    ) -> List[Dict[str, Any]]:
+        """
+        Call the LLM and parse foresight items for one EpisodeMemory (without embeddings)
+
+        Args:
+            episode: EpisodeMemory object
+
+        Returns:
+            Parsed foresight item dicts (at most 10), empty list after 5 failed retries
+        """
         # Maximum 5 retries
         for retry in range(5):
             try:
@@ -187,29 +247,29 @@ class ForesightExtractor(MemoryExtractor):
                     episode.ori_event_id_list[0] if episode.ori_event_id_list else None
                 )
                 start_time = self._extract_start_time_from_timestamp(episode.timestamp)
-                foresights = await self._parse_foresights_response(
+                items = self._parse_foresight_items(
                     response, source_episode_id, start_time
                 )
 
                 # Validate at least 1 item is returned
-                if len(foresights) == 0:
+                if len(items) == 0:
                     raise ValueError("LLM returned empty foresight list")
 
                 # Ensure exactly 10 items are returned (warn if insufficient, but do not retry)
-                if len(foresights) > 10:
-                    foresights = foresights[:10]
-                elif len(foresights) < 10:
+                if len(items) > 10:
+                    items = items[:10]
+                elif len(items) < 10:
                     logger.warning(
-                        f"Generated foresight associations less than 10, actual count: {len(foresights)}"
+                        f"Generated foresight associations less than 10, actual count: {len(items)}"
                     )
 
                 logger.info(
-                    f"✅ Successfully generated {len(foresights)} foresight associations"
+                    f"✅ Successfully generated {len(items)} foresight associations"
                 )
-                for i, memory in enumerate(foresights[:3], 1):
-                    logger.info(f"  Association {i}: {memory.content}")
+                for i, item in enumerate(items[:3], 1):
+                    logger.info(f"  Association {i}: {item['content']}")
 
-                return foresights
+                return items
 
             except Exception as e:
                 logger.warning(f"Foresight generation retry {retry+1}/5: {e}")
@@ -220,6 +280,97 @@ class ForesightExtractor(MemoryExtractor):
 
         return []
 
+    async def _embed_foresight_items(
+        self, items_per_episode: List[List[Dict[str, Any]]]
+    ) -> List[List[ForesightItem]]:
+        """
+        Embed foresight items of many episodes with one coalesced get_embeddings call
+
+        get_embeddings sends the VECTORIZE_BATCH_SIZE chunks of the call concurrently,
+        so all episodes are embedded in about one request round trip.
+        If the coalesced call keeps failing (e.g. one episode's text is rejected),
+        each episode is embedded on its own, so only the failing episodes are lost.
+
+        Args:
+            items_per_episode: Parsed foresight item dicts of each episode
+
+        Returns:
+            ForesightItem objects of each episode, an empty list for an episode whose
+            embedding keeps failing
+        """
+        contents = [item['content'] for items in items_per_episode for item in items]
+        if not contents:
+            return [[] for _ in items_per_episode]
+
+        vs = get_vectorize_service()
+        # Maximum 5 retries, the LLM output is kept so only the embedding is retried
+        vectors_batch = await self._embed_contents(vs, contents, max_retries=5)
+        if vectors_batch is None and len(items_per_episode) > 1:
+            logger.warning(
+                f"Falling back to per-episode foresight embedding for {len(items_per_episode)} episodes"
+            )
+            vectors_per_episode = await asyncio.gather(
+                *(
+                    self._embed_contents(
+                        vs, [item['content'] for item in items], max_retries=1
+                    )
+                    for items in items_per_episode
+                )
+            )
+        elif vectors_batch is None:
+            vectors_per_episode = [None]
+        else:
+            vectors = iter(vectors_batch)
+            vectors_per_episode = [
+                [next(vectors) for _ in items] for items in items_per_episode
+            ]
+
+        vector_model = vs.get_model_name()
+        return [
+            (
+                [
+                    self._build_foresight_item(item_data, vector, vector_model)
+                    for item_data, vector in zip(items, vectors)
+                ]
+                if vectors is not None
+                else []
+            )
+            for items, vectors in zip(items_per_episode, vectors_per_episode)
+        ]
+
+    async def _embed_contents(
+        self, vs: Any, contents: List[str], max_retries: int
+    ) -> Optional[List[List[float]]]:
+        """
+        Embed texts with get_embeddings, retrying on failure
+
+        Args:
+            vs: Vectorize service
+            contents: Texts to embed
+            max_retries: Maximum number of attempts
+
+        Returns:
+            One vector per text, None if every attempt failed
+        """
+        if not contents:
+            return []
+        for retry in range(max_retries):
+            try:
+                vectors = await vs.get_embeddings(contents)
+                if len(vectors) != len(contents):
+                    raise ValueError(
+                        f"Embedding count mismatch: {len(vectors)} != {len(contents)}"
+                    )
+                return vectors
+            except Exception as e:
+                logger.warning(
+                    f"Foresight embedding retry {retry+1}/{max_retries}: {e}"
+                )
+                if retry < max_retries - 1:
+                    await asyncio.sleep(EMBEDDING_RETRY_BACKOFF_SECONDS * 2**retry)
+        logger.error(f"Foresight embedding failed after {max_retries} retries")
+        return None
+
     @staticmethod
     def _clean_date_string(date_str: Optional[str]) -> Optional[str]:
         """Clean date string, remove invalid characters and validate date validity
@@ -272,6 +423,47 @@ class ForesightExtractor(MemoryExtractor):
         Returns:
             List of foresight association items
         """
+        items_to_process = self._parse_foresight_items(
+            response, source_episode_id, start_time
+        )
+        if not items_to_process:
+            return []
+
+        try:
+            # Batch compute embeddings for all content (performance optimization)
+            vs = get_vectorize_service()
+            contents = [item['content'] for item in items_to_process]
+            vectors_batch = await vs.get_embeddings(
+                contents
+            )  # Use get_embeddings (List[str])
+
+            # Create ForesightItem objects
+            return [
+                self._build_foresight_item(item_data, vector, vs.get_model_name())
+                for item_data, vector in zip(items_to_process, vectors_batch)
+            ]
+
+        except Exception as e:
+            logger.error(f"Error parsing foresight response: {e}")
+            return []
+
+    def _parse_foresight_items(
+        self,
+        response: str,
+        source_episode_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse LLM's JSON response into foresight item dicts (without embeddings)
+
+        Args:
+            response: LLM response text
+            source_episode_id: Source event ID
+            start_time: Start time, format YYYY-MM-DD
+
+        Returns:
+            List of foresight item dicts
+        """
         try:
             # First try to extract JSON from code block
             if '```json' in response:
@@ -287,84 +479,53 @@ class ForesightExtractor(MemoryExtractor):
                 data = json.loads(response)
 
             # Ensure data is a list
-            if isinstance(data, list):
-                foresights = []
-
-                # First collect all data to be processed
-                items_to_process = []
-                for item in data:
-                    content = item.get('content', '')
-                    evidence = item.get('evidence', '')
-
-                    # Use passed start_time or LLM-provided time
-                    item_start_time = item.get('start_time', start_time)
-                    item_end_time = item.get('end_time')
-                    item_duration_days = item.get('duration_days')
-
-                    # Clean time format (prevent LLM outputting incorrect format)
-                    item_start_time = self._clean_date_string(item_start_time)
-                    item_end_time = self._clean_date_string(item_end_time)
-
-                    # Smart time calculation: prioritize LLM-provided time information
-                    if item_start_time:
-                        # If LLM provides duration_days but no end_time, calculate end_time
-                        if item_duration_days and not item_end_time:
-                            item_end_time = self._calculate_end_time_from_duration(
-                                item_start_time, item_duration_days
-                            )
-                        # If LLM provides end_time but no duration_days, calculate duration_days
-                        elif item_end_time and not item_duration_days:
-                            item_duration_days = self._calculate_duration_days(
-                                item_start_time, item_end_time
-                            )
-                        # If LLM provides neither, keep as None (no additional extraction)
-
-                    items_to_process.append(
-                        {
-                            'content': content,
-                            'evidence': evidence,
-                            'start_time': item_start_time,
-                            'end_time': item_end_time,
-                            'duration_days': item_duration_days,
-                            'source_episode_id': item.get(
-                                'source_episode_id', source_episode_id
-                            ),
-                        }
-                    )
-
-                # Batch compute embeddings for all content (performance optimization)
-                vs = get_vectorize_service()
-                contents = [item['content'] for item in items_to_process]
-                vectors_batch = await vs.get_embeddings(
-                    contents
-                )  # Use get_embeddings (List[str])
-
-                # Create ForesightItem objects
-                for i, item_data in enumerate(items_to_process):
-                    # Handle embedding: could be numpy array or already list
-                    vector = vectors_batch[i]
-                    if hasattr(vector, 'tolist'):
-                        vector = vector.tolist()
-                    elif not isinstance(vector, list):
-                        vector = list(vector)
-
-                    memory_item = ForesightItem(
-                        content=item_data['content'],
-                        evidence=item_data['evidence'],
-                        start_time=item_data['start_time'],
-                        end_time=item_data['end_time'],
-                        duration_days=item_data['duration_days'],
-                        source_episode_id=item_data['source_episode_id'],
-                        vector=vector,
-                        vector_model=vs.get_model_name(),
-                    )
-                    foresights.append(memory_item)
-
-                return foresights
-            else:
+            if not isinstance(data, list):
                 logger.error(f"Response is not in JSON array format: {data}")
                 return []
 
+            items_to_process = []
+            for item in data:
+                content = item.get('content', '')
+                evidence = item.get('evidence', '')
+
+                # Use passed start_time or LLM-provided time
+                item_start_time = item.get('start_time', start_time)
+                item_end_time = item.get('end_time')
+                item_duration_days = item.get('duration_days')
+
+                # Clean time format (prevent LLM outputting incorrect format)
+                item_start_time = self._clean_date_string(item_start_time)
+                item_end_time = self._clean_date_string(item_end_time)
+
+                # Smart time calculation: prioritize LLM-provided time information
+                if item_start_time:
+                    # If LLM provides duration_days but no end_time, calculate end_time
+                    if item_duration_days and not item_end_time:
+                        item_end_time = self._calculate_end_time_from_duration(
+                            item_start_time, item_duration_days
+                        )
+                    # If LLM provides end_time but no duration_days, calculate duration_days
+                    elif item_end_time and not item_duration_days:
+                        item_duration_days = self._calculate_duration_days(
+                            item_start_time, item_end_time
+                        )
+                    # If LLM provides neither, keep as None (no additional extraction)
+
+                items_to_process.append(
+                    {
+                        'content': content,
+                        'evidence': evidence,
+                        'start_time': item_start_time,
+                        'end_time': item_end_time,
+                        'duration_days': item_duration_days,
+                        'source_episode_id': item.get(
+                            'source_episode_id', source_episode_id
+                        ),
+                    }
+                )
+
+            return items_to_process
+
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing JSON response: {e}")
             logger.debug(f"Response content: {response[:200]}...")
@@ -373,6 +534,28 @@ class ForesightExtractor(MemoryExtractor):
             logger.error(f"Error parsing foresight response: {e}")
             return []
 
+    @staticmethod
+    def _build_foresight_item(
+        item_data: Dict[str, Any], vector: Any, vector_model: str
+    ) -> ForesightItem:
+        """Create a ForesightItem from a parsed item dict and its embedding"""
+        # Handle embedding: could be numpy array or already list
+        if hasattr(vector, 'tolist'):
+            vector = vector.tolist()
+        elif not isinstance(vector, list):
+            vector = list(vector)
+
+        return ForesightItem(
+            content=item_data['content'],
+            evidence=item_data['evidence'],
+            start_time=item_data['start_time'],
+            end_time=item_data['end_time'],
+            duration_days=item_data['duration_days'],
+            source_episode_id=item_data['source_episode_id'],
+            vector=vector,
+            vector_model=vector_model,
+        )
+
     def _extract_start_time_from_timestamp(self, timestamp: datetime) -> str:
         """
         Extract start time from MemCell's timestamp field
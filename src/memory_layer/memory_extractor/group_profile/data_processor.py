@@ -356,9 +356,61 @@ class GroupProfileDataProcessor:
                     "summary": getattr(memory, "summary", ""),
                     "subject": getattr(memory, "subject", ""),
                     "roles": existing_roles,  # includes evidences and confidence
+                    # includes the record of processed memcells
+                    "extend": getattr(memory, "extend", None) or {},
                 }
         return None
 
+    def select_unprocessed_memcells(
+        self,
+        memcell_list: List,
+        processed_event_ids: Optional[Set[str]] = None,
+        floor_timestamp: Optional[Any] = None,
+        last_event_id: Optional[str] = None,
+        last_timestamp: Optional[Any] = None,
+    ) -> List:
+        """
+        Select memcells not yet reflected in the profile
+
+        When the profile records the ids of processed memcells, every memcell outside that
+        set is new, whatever its timestamp (backfills, replays and out-of-order delivery),
+        except memcells at or before floor_timestamp, the newest memcell evicted from the
+        bounded id set. Profiles written before the id set existed only have the last
+        processed memcell: the memcells after it (by event_id, else by timestamp) are new.
+        Without any record all memcells are new.
+
+        Args:
+            memcell_list: current memcell list
+            processed_event_ids: event_ids of processed memcells
+            floor_timestamp: memcells at or before this timestamp count as processed
+            last_event_id: event_id of the last processed memcell (legacy profiles)
+            last_timestamp: timestamp of the last processed memcell (legacy profiles)
+
+        Returns:
+            Unprocessed memcells, ordered by timestamp
+        """
+        from ..group_profile_memory_extractor import convert_to_datetime
+
+        ordered = sorted(memcell_list, key=lambda mc: convert_to_datetime(mc.timestamp))
+        if processed_event_ids is not None:
+            floor = convert_to_datetime(floor_timestamp) if floor_timestamp else None
+            return [
+                mc
+                for mc in ordered
+                if str(getattr(mc, 'event_id', '')) not in processed_event_ids
+                and (floor is None or convert_to_datetime(mc.timestamp) > floor)
+            ]
+        if last_event_id:
+            event_ids = [str(getattr(mc, 'event_id', '')) for mc in ordered]
+            if str(last_event_id) in event_ids:
+                return ordered[event_ids.index(str(last_event_id)) + 1 :]
+        if last_timestamp:
+            watermark = convert_to_datetime(last_timestamp)
+            return [
+                mc for mc in ordered if convert_to_datetime(mc.timestamp) > watermark
+            ]
+        return ordered
+
     def get_user_name(
         self, user_id: str, speaker_mapping: Optional[Dict[str, Dict[str, str]]] = None
     ) -> str:
@@ -117,6 +117,55 @@ class GroupProfileLLMHandler:
             existing_profile,
         )
 
+    async def execute_combined_analysis(
+        self,
+        conversation_text: str,
+        group_id: str,
+        group_name: str,
+        memcell_list: List,
+        existing_profile: Optional[Dict],
+        user_organization: Optional[List],
+        timespan: str,
+    ) -> Optional[Dict]:
+        """
+        Execute content and behavior analysis in a single LLM call
+
+        Same result format and fallbacks as execute_parallel_analysis, for small
+        increments where one prompt over the new memcells is enough.
+
+        Args:
+            conversation_text: Conversation text of the new memcells
+            group_id: Group ID
+            group_name: Group name
+            memcell_list: List of new memcells
+            existing_profile: Historical profile data
+            user_organization: User organization information
+            timespan: Time span
+
+        Returns:
+            Parsed result dictionary containing topics, roles, summary, subject
+        """
+        prompt = self.build_combined_analysis_prompt(
+            conversation_text,
+            group_id,
+            group_name,
+            memcell_list,
+            existing_profile,
+            user_organization,
+            timespan,
+        )
+
+        logger.info(f"[LLMHandler] Executing combined analysis for group: {group_name}")
+        response = await self._execute_with_retry(
+            "Combined Analysis",
+            lambda: self.llm_provider.generate(prompt, temperature=0.3),
+        )
+
+        # The combined JSON carries both the content and the behavior fields
+        return self._merge_parallel_analysis_results(
+            response, response, group_id, group_name, memcell_list, existing_profile
+        )
+
     def build_content_analysis_prompt(
         self,
         conversation_text: str,
@@ -137,27 +186,7 @@ class GroupProfileLLMHandler:
 
         # Build existing_profile for LLM, including only required fields, excluding evidences
         existing_profile_for_llm = {
-            "topics": (
-                [
-                    {
-                        "id": t.id if hasattr(t, 'id') else t.get("id"),
-                        "name": t.name if hasattr(t, 'name') else t.get("name"),
-                        "summary": (
-                            t.summary if hasattr(t, 'summary') else t.get("summary")
-                        ),
-                        "status": t.status if hasattr(t, 'status') else t.get("status"),
-                        "confidence": (
-                            t.confidence
-                            if hasattr(t, 'confidence')
-                            else t.get("confidence", "strong")
-                        ),
-                        # Exclude evidences field
-                    }
-                    for t in existing_topics
-                ]
-                if existing_topics
-                else []
-            ),
+            "topics": self._existing_topics_for_llm(existing_topics),
             "summary": existing_summary,
             "subject": existing_subject,
         }
@@ -192,27 +221,111 @@ class GroupProfileLLMHandler:
 
         # Build existing_profile for LLM, including only roles, excluding evidences
         existing_profile_for_llm = {
-            "roles": (
-                {
-                    role_name: [
-                        {
-                            "user_id": a.get("user_id"),
-                            "user_name": a.get("user_name"),
-                            "confidence": a.get("confidence", "strong"),
-                            # Exclude evidences field
-                        }
-                        for a in assignments
-                    ]
-                    for role_name, assignments in existing_roles.items()
-                }
-                if existing_roles
-                else {}
-            )
+            "roles": self._existing_roles_for_llm(existing_roles)
         }
 
         existing_profile_json = json.dumps(existing_profile_for_llm, ensure_ascii=False)
 
-        # Build speaker info (requires help from data_processor, extract from conversation_text here)
+        speaker_info = self._build_speaker_info(
+            conversation_text, memcell_list, existing_roles, user_organizations
+        )
+
+        return BEHAVIOR_ANALYSIS_PROMPT.format(
+            conversation=conversation_text,
+            group_id=group_id or "",
+            group_name=group_name or "",
+            existing_profile=existing_profile_json,
+            speaker_info=speaker_info,
+        )
+
+    def build_combined_analysis_prompt(
+        self,
+        conversation_text: str,
+        group_id: str,
+        group_name: str,
+        memcell_list: List,
+        existing_profile: Optional[Dict],
+        user_organizations: Optional[List],
+        timespan: str,
+    ) -> str:
+        """
+        Build single-call prompt for topics, summary, subject and roles extraction.
+
+        Used for small increments: the conversation contains only memcells newer than the
+        existing profile, which is passed without evidences (but keeping confidence).
+        """
+        # Use dynamic language prompt import (automatically selected based on MEMORY_LANGUAGE environment variable)
+        from ...prompts import COMBINED_ANALYSIS_PROMPT
+
+        existing_profile = existing_profile or {}
+        existing_roles = existing_profile.get("roles", {})
+        existing_profile_for_llm = {
+            "topics": self._existing_topics_for_llm(existing_profile.get("topics", [])),
+            "summary": existing_profile.get("summary", ""),
+            "subject": existing_profile.get("subject", ""),
+            "roles": self._existing_roles_for_llm(existing_roles),
+        }
+
+        existing_profile_json = json.dumps(existing_profile_for_llm, ensure_ascii=False)
+        speaker_info = self._build_speaker_info(
+            conversation_text, memcell_list, existing_roles, user_organizations
+        )
+
+        return COMBINED_ANALYSIS_PROMPT.format(
+            conversation=conversation_text,
+            group_id=group_id or "",
+            group_name=group_name or "",
+            existing_profile=existing_profile_json,
+            timespan=timespan,
+            max_topics=self.max_topics,
+            speaker_info=speaker_info,
+        )
+
+    def _existing_topics_for_llm(self, existing_topics: List) -> List[Dict]:
+        """Existing topics without evidences (TopicInfo objects or dicts)."""
+        if not existing_topics:
+            return []
+        return [
+            {
+                "id": t.id if hasattr(t, 'id') else t.get("id"),
+                "name": t.name if hasattr(t, 'name') else t.get("name"),
+                "summary": t.summary if hasattr(t, 'summary') else t.get("summary"),
+                "status": t.status if hasattr(t, 'status') else t.get("status"),
+                "confidence": (
+                    t.confidence
+                    if hasattr(t, 'confidence')
+                    else t.get("confidence", "strong")
+                ),
+                # Exclude evidences field
+            }
+            for t in existing_topics
+        ]
+
+    def _existing_roles_for_llm(self, existing_roles: Dict) -> Dict:
+        """Existing role assignments without evidences."""
+        if not existing_roles:
+            return {}
+        return {
+            role_name: [
+                {
+                    "user_id": a.get("user_id"),
+                    "user_name": a.get("user_name"),
+                    "confidence": a.get("confidence", "strong"),
+                    # Exclude evidences field
+                }
+                for a in assignments
+            ]
+            for role_name, assignments in existing_roles.items()
+        }
+
+    def _build_speaker_info(
+        self,
+        conversation_text: str,
+        memcell_list: List,
+        existing_roles: Dict,
+        user_organizations: Optional[List] = None,
+    ) -> str:
+        """Build the available speakers section from the conversation and historical roles."""
         # Extract current speakers from conversation
         current_speakers = set()
         for line in conversation_text.split('\n'):
@@ -279,13 +392,7 @@ class GroupProfileLLMHandler:
                 "\nNote: Organization context not available for this analysis.\n"
             )
 
-        return BEHAVIOR_ANALYSIS_PROMPT.format(
-            conversation=conversation_text,
-            group_id=group_id or "",
-            group_name=group_name or "",
-            existing_profile=existing_profile_json,
-            speaker_info=speaker_info,
-        )
+        return speaker_info
 
     async def _execute_with_retry(
         self, task_name: str, task_func, max_retries: int = 1
@@ -27,6 +27,7 @@ class RoleProcessor:
         existing_roles: Dict,
         valid_memcell_ids: Set[str],
         memcell_list: List,
+        keep_existing: bool = False,
     ) -> Dict[str, List[Dict[str, str]]]:
         """
         Process all roles (including weak ones), merge historical evidences, and sort by confidence (strong first)
@@ -37,6 +38,8 @@ class RoleProcessor:
             existing_roles: Historical role data (includes evidences and confidence)
             valid_memcell_ids: Set of valid memcell_ids
             memcell_list: Current list of memcells (used to get timestamps for sorting)
+            keep_existing: Carry over historical assignments the LLM did not output
+                (incremental analysis only reports assignments supported by new memcells)
 
         Returns:
             Processed roles, formatted as role -> [{"user_id": "xxx", "user_name": "xxx", "confidence": "strong|weak", "evidences": [...]}]
@@ -155,12 +158,33 @@ class RoleProcessor:
                     }
                 )
 
-            # Sort assignments: strong first, then weak
+            if processed_assignments:
+                processed_roles[role_name] = processed_assignments
+
+        # 4. Carry over historical assignments not mentioned by the LLM
+        if keep_existing:
+            for role_name, assignments in existing_roles.items():
+                assigned = {a["user_id"] for a in processed_roles.get(role_name, [])}
+                for assignment in assignments:
+                    user_id = assignment.get("user_id", "")
+                    if user_id and user_id not in assigned:
+                        processed_roles.setdefault(role_name, []).append(
+                            {
+                                "user_id": user_id,
+                                "user_name": assignment.get("user_name")
+                                or self.data_processor.get_user_name(
+                                    user_id, speaker_mapping
+                                ),
+                                "confidence": assignment.get("confidence", "weak"),
+                                "evidences": assignment.get("evidences", []),
+                            }
+                        )
+                        assigned.add(user_id)
+
+        # Sort assignments: strong first, then weak
+        for processed_assignments in processed_roles.values():
             processed_assignments.sort(
                 key=lambda x: (x["confidence"] != "strong", x["user_name"])
             )
 
-            if processed_assignments:
-                processed_roles[role_name] = processed_assignments
-
         return processed_roles
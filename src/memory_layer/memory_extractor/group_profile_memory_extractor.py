@@ -14,12 +14,24 @@ from common_utils.datetime_utils import (
     get_now_with_timezone,
     from_timestamp,
     from_iso_format,
+    to_iso_format,
     timezone,
 )
 from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keys in GroupProfileMemory.extend recording the memcells reflected in the profile
+LAST_PROCESSED_EVENT_ID_KEY = "last_processed_event_id"
+LAST_PROCESSED_TIMESTAMP_KEY = "last_processed_timestamp"
+# [event_id, ISO timestamp] pairs of the newest processed memcells
+PROCESSED_MEMCELLS_KEY = "processed_memcells"
+# Newest timestamp evicted from PROCESSED_MEMCELLS_KEY, older memcells count as processed
+PROCESSED_FLOOR_TIMESTAMP_KEY = "processed_floor_timestamp"
+
+# Upper bound of memcells recorded in PROCESSED_MEMCELLS_KEY
+MAX_PROCESSED_MEMCELLS = 2000
+
 
 # ============================================================================
 # Utility functions
@@ -207,6 +219,9 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
         llm_provider: LLMProvider | None = None,
         conversation_source: str = "original",
         max_topics: int = 10,
+        incremental: Optional[bool] = None,
+        single_call_max_memcells: Optional[int] = None,
+        single_call_max_chars: Optional[int] = None,
     ):
         """
         Initialize group profile extractor
@@ -215,11 +230,32 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
             llm_provider: LLM provider instance
             conversation_source: Conversation source, "original" or "episode"
             max_topics: Maximum number of topics
+            incremental: Only analyze memcells newer than the existing profile
+                (env GROUP_PROFILE_INCREMENTAL, default true)
+            single_call_max_memcells: Use one combined prompt when the analyzed memcells
+                are at most this many (env GROUP_PROFILE_SINGLE_CALL_MAX_MEMCELLS, default 10, 0 disables)
+            single_call_max_chars: Maximum conversation text length for the combined prompt
+                (env GROUP_PROFILE_SINGLE_CALL_MAX_CHARS, default 12000)
         """
         super().__init__(MemoryType.GROUP_PROFILE)
         self.llm_provider = llm_provider
         self.conversation_source = conversation_source
         self.max_topics = max_topics
+        self.incremental = (
+            incremental
+            if incremental is not None
+            else os.getenv("GROUP_PROFILE_INCREMENTAL", "true").lower() == "true"
+        )
+        self.single_call_max_memcells = (
+            single_call_max_memcells
+            if single_call_max_memcells is not None
+            else int(os.getenv("GROUP_PROFILE_SINGLE_CALL_MAX_MEMCELLS", "10"))
+        )
+        self.single_call_max_chars = (
+            single_call_max_chars
+            if single_call_max_chars is not None
+            else int(os.getenv("GROUP_PROFILE_SINGLE_CALL_MAX_CHARS", "12000"))
+        )
 
         # Lazy initialization of helper processors
         self._data_processor = None
@@ -294,6 +330,83 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
                 return False
             return True
 
+    def _select_memcells_to_analyze(
+        self, memcell_list: List[MemCell], existing_profile: Optional[Dict]
+    ) -> List[MemCell]:
+        """
+        Select the memcells to send to the LLM.
+
+        In incremental mode only memcells the profile has not processed yet are
+        analyzed, so tokens scale with new activity instead of history.
+        """
+        if not self.incremental or not existing_profile:
+            return memcell_list
+
+        extend = existing_profile.get("extend") or {}
+        processed = extend.get(PROCESSED_MEMCELLS_KEY)
+        return self.data_processor.select_unprocessed_memcells(
+            memcell_list,
+            processed_event_ids=(
+                {str(event_id) for event_id, _ in processed}
+                if processed is not None
+                else None
+            ),
+            floor_timestamp=extend.get(PROCESSED_FLOOR_TIMESTAMP_KEY),
+            last_event_id=extend.get(LAST_PROCESSED_EVENT_ID_KEY),
+            last_timestamp=extend.get(LAST_PROCESSED_TIMESTAMP_KEY),
+        )
+
+    def _use_single_call(
+        self, memcell_list: List[MemCell], conversation_text: str
+    ) -> bool:
+        """Whether the increment is small enough for one combined prompt."""
+        return (
+            0 < len(memcell_list) <= self.single_call_max_memcells
+            and len(conversation_text) <= self.single_call_max_chars
+        )
+
+    def _build_extend(
+        self, memcell_list: List[MemCell], existing_profile: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """
+        Carry over the existing extend fields and record the analyzed memcells.
+
+        The newest MAX_PROCESSED_MEMCELLS memcells are kept; the newest evicted
+        timestamp becomes the floor below which memcells count as processed.
+        """
+        extend = dict((existing_profile or {}).get("extend") or {})
+        floor = extend.get(PROCESSED_FLOOR_TIMESTAMP_KEY)
+        processed = extend.get(PROCESSED_MEMCELLS_KEY)
+        if processed is None:
+            processed = []
+            # Legacy profile: everything up to its watermark was processed
+            floor = floor or extend.get(LAST_PROCESSED_TIMESTAMP_KEY)
+
+        entries = {str(event_id): timestamp for event_id, timestamp in processed}
+        for mc in memcell_list:
+            entries[str(mc.event_id)] = to_iso_format(convert_to_datetime(mc.timestamp))
+        ordered = sorted(
+            entries.items(),
+            key=lambda entry: convert_to_datetime(entry[1]),
+            reverse=True,
+        )
+        kept = ordered[:MAX_PROCESSED_MEMCELLS]
+        evicted = ordered[MAX_PROCESSED_MEMCELLS:]
+        if evicted:
+            newest_evicted = evicted[0][1]
+            if not floor or convert_to_datetime(newest_evicted) > convert_to_datetime(
+                floor
+            ):
+                floor = newest_evicted
+
+        extend[PROCESSED_MEMCELLS_KEY] = [list(entry) for entry in kept]
+        if floor:
+            extend[PROCESSED_FLOOR_TIMESTAMP_KEY] = floor
+        last_event_id, last_timestamp = kept[0]
+        extend[LAST_PROCESSED_EVENT_ID_KEY] = last_event_id
+        extend[LAST_PROCESSED_TIMESTAMP_KEY] = last_timestamp
+        return extend
+
     # ========== Core extraction method ==========
 
     async def extract_memory(
@@ -329,6 +442,19 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
         existing_profile = self.data_processor.extract_existing_group_profile(
             request.old_memory_list
         )
+        memcell_list = self._select_memcells_to_analyze(memcell_list, existing_profile)
+        # Only unprocessed memcells are sent: the LLM cannot see earlier role evidence
+        incremental = self.incremental and bool(existing_profile)
+        if not memcell_list:
+            logger.info(
+                f"[GroupProfileMemoryExtractor] No memcells newer than the profile of group '{group_name}', skipping"
+            )
+            return None
+        if len(memcell_list) < len(request.memcell_list):
+            logger.info(
+                f"[GroupProfileMemoryExtractor] Incremental update: {len(memcell_list)}/{len(request.memcell_list)} memcells are new"
+            )
+
         conversation_text = self.data_processor.combine_conversation_text_with_ids(
             memcell_list
         )
@@ -339,12 +465,20 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
         timespan = f"{start_time.date()} to {end_time.date()}"
 
         try:
-            # ===== 4. Execute LLM parallel analysis =====
-            logger.info(
-                f"[GroupProfileMemoryExtractor] Executing parallel analysis for group: {group_name}"
-            )
+            # ===== 4. Execute LLM analysis (single call for small increments) =====
+            single_call = self._use_single_call(memcell_list, conversation_text)
+            if single_call:
+                logger.info(
+                    f"[GroupProfileMemoryExtractor] Executing combined analysis for group: {group_name}"
+                )
+                analyze = self.llm_handler.execute_combined_analysis
+            else:
+                logger.info(
+                    f"[GroupProfileMemoryExtractor] Executing parallel analysis for group: {group_name}"
+                )
+                analyze = self.llm_handler.execute_parallel_analysis
 
-            parsed_data = await self.llm_handler.execute_parallel_analysis(
+            parsed_data = await analyze(
                 conversation_text=conversation_text,
                 group_id=group_id,
                 group_name=group_name,
@@ -403,6 +537,7 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
                 existing_roles=existing_roles,
                 valid_memcell_ids=valid_memcell_ids,
                 memcell_list=memcell_list,
+                keep_existing=incremental,
             )
             logger.info(
                 f"[extract_memory] Processed roles with {sum(len(v) for v in all_roles.values())} total assignments"
@@ -422,6 +557,7 @@ class GroupProfileMemoryExtractor(MemoryExtractor):
                 roles=all_roles,  # All roles (strong + weak, strong first) with evidences
                 summary=parsed_data.get("summary", ""),
                 subject=parsed_data.get("subject", "not_found"),
+                extend=self._build_extend(memcell_list, existing_profile),
             )
 
             return [group_profile]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import ast
 import json
+import os
 import re
 from datetime import datetime
 from typing import AbstractSet, Any, Dict, List, Optional, Set
@@ -65,9 +66,24 @@ class ProfileMemoryExtractor(MemoryExtractor):
 
     _conversation_date_map: Dict[str, str] = {}
 
-    def __init__(self, llm_provider: LLMProvider | None = None):
+    def __init__(
+        self,
+        llm_provider: LLMProvider | None = None,
+        concurrent_extraction: bool | None = None,
+    ):
+        """
+        Args:
+            llm_provider: LLM provider
+            concurrent_extraction: Send the independent personal/project profile prompts
+                at the same time; defaults to PROFILE_EXTRACTION_CONCURRENT (true)
+        """
         super().__init__(MemoryType.PROFILE)
         self.llm_provider = llm_provider
+        if concurrent_extraction is None:
+            concurrent_extraction = (
+                os.getenv("PROFILE_EXTRACTION_CONCURRENT", "true").lower() == "true"
+            )
+        self.concurrent_extraction = concurrent_extraction
 
     async def extract_memory(
         self, request: ProfileMemoryExtractRequest
@@ -260,9 +276,17 @@ class ProfileMemoryExtractor(MemoryExtractor):
 
             return parsed_profiles
 
-        # Serially invoke two LLMs
-        profiles_part1 = await invoke_llm(prompt_part1, "personal profile part")
-        profiles_part2 = await invoke_llm(prompt_part2, "project profile part")
+        if self.concurrent_extraction:
+            # The two parts do not depend on each other, invoke both LLMs concurrently;
+            # invoke_llm handles failures and repair per part and never raises
+            profiles_part1, profiles_part2 = await asyncio.gather(
+                invoke_llm(prompt_part1, "personal profile part"),
+                invoke_llm(prompt_part2, "project profile part"),
+            )
+        else:
+            # Serially invoke two LLMs
+            profiles_part1 = await invoke_llm(prompt_part1, "personal profile part")
+            profiles_part2 = await invoke_llm(prompt_part2, "project profile part")
 
         # Merge results
         if not profiles_part1 and not profiles_part2:
@@ -3,7 +3,7 @@ from datetime import datetime
 import time
 import os
 import asyncio
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from core.observation.logger import get_logger
 
@@ -29,7 +29,6 @@ from .memory_extractor.event_log_extractor import EventLogExtractor
 from .memory_extractor.foresight_extractor import ForesightExtractor
 from .memcell_extractor.base_memcell_extractor import StatusResult
 
-
 logger = get_logger(__name__)
 
 
@@ -207,6 +206,81 @@ class MemoryManager:
 
         return await self._episode_extractor.extract_memory(request)
 
+    async def extract_multi_perspective_episodes(
+        self,
+        memcell: MemCell,
+        user_ids: List[str],
+        group_id: Optional[str] = None,
+        group_name: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Extract the group Episode and the personal Episodes with one combined LLM call
+
+        Falls back to one call per Episode when the combined response cannot be parsed,
+        and to per-user calls for the participants missing from the combined response.
+
+        Args:
+            memcell: Single MemCell
+            user_ids: Participants to extract personal Episodes for
+            group_id: Group ID
+            group_name: Group name
+
+        Returns:
+            [group Episode, *personal Episodes in user_ids order]; failed extractions are
+            returned as exceptions (same shape as asyncio.gather(..., return_exceptions=True))
+        """
+        if self._episode_extractor is None:
+            self._episode_extractor = EpisodeMemoryExtractor(self.llm_provider)
+
+        from .memory_extractor.base_memory_extractor import MemoryExtractRequest
+
+        request = MemoryExtractRequest(
+            memcell=memcell, group_id=group_id, group_name=group_name
+        )
+        combined = await self._episode_extractor.extract_multi_perspective_episodes(
+            request, user_ids
+        )
+
+        group_episode, personal_episodes = combined if combined else (None, {})
+        missing_user_ids = [uid for uid in user_ids if uid not in personal_episodes]
+        if combined is None:
+            logger.warning(
+                "[MemoryManager] Combined Episode extraction failed, "
+                "falling back to per-user extraction"
+            )
+        elif missing_user_ids:
+            logger.warning(
+                f"[MemoryManager] Combined Episode extraction missed users "
+                f"{missing_user_ids}, extracting them separately"
+            )
+
+        fallback_user_ids = ([None] if group_episode is None else []) + missing_user_ids
+        fallback_results = await asyncio.gather(
+            *(
+                self.extract_memory(
+                    memcell=memcell,
+                    memory_type=MemoryType.EPISODIC_MEMORY,
+                    user_id=user_id,
+                    group_id=group_id,
+                    group_name=group_name,
+                )
+                for user_id in fallback_user_ids
+            ),
+            return_exceptions=True,
+        )
+        fallback = dict(zip(fallback_user_ids, fallback_results))
+
+        results: List[Any] = [
+            fallback[None] if group_episode is None else group_episode
+        ]
+        for user_id in user_ids:
+            results.append(
+                personal_episodes[user_id]
+                if user_id in personal_episodes
+                else fallback[user_id]
+            )
+        return results
+
     async def _extract_foresight(
         self, episode_memory: Optional[Memory]
     ) -> List[ForesightItem]:
@@ -224,6 +298,20 @@ class MemoryManager:
         extractor = ForesightExtractor(llm_provider=self.llm_provider)
         return await extractor.generate_foresights_for_episode(episode_memory)
 
+    async def extract_foresights_for_episodes(
+        self, episode_memories: List[Memory]
+    ) -> List[List[ForesightItem]]:
+        """Extract Foresight for many Episodes, embeddings are computed in one batch"""
+        if not episode_memories:
+            return []
+
+        logger.debug(
+            f"[MemoryManager] Extracting Foresight for {len(episode_memories)} Episodes"
+        )
+
+        extractor = ForesightExtractor(llm_provider=self.llm_provider)
+        return await extractor.generate_foresights_for_episodes(episode_memories)
+
     async def _extract_event_log(self, episode_memory: Optional[Memory]):
         """Extract Event Log"""
         if not episode_memory:
@@ -38,6 +38,7 @@ if MEMORY_LANGUAGE == 'zh':
     from .zh.episode_mem_prompts import (
         EPISODE_GENERATION_PROMPT,
         GROUP_EPISODE_GENERATION_PROMPT,
+        MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT,
         DEFAULT_CUSTOM_INSTRUCTIONS,
     )
 
@@ -60,6 +61,7 @@ if MEMORY_LANGUAGE == 'zh':
     from .zh.group_profile_prompts import (
         CONTENT_ANALYSIS_PROMPT,
         BEHAVIOR_ANALYSIS_PROMPT,
+        COMBINED_ANALYSIS_PROMPT,
     )
 
     # Foresight related
@@ -80,6 +82,7 @@ else:
     from .en.episode_mem_prompts import (
         EPISODE_GENERATION_PROMPT,
         GROUP_EPISODE_GENERATION_PROMPT,
+        MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT,
         DEFAULT_CUSTOM_INSTRUCTIONS,
     )
 
@@ -102,6 +105,7 @@ else:
     from .en.group_profile_prompts import (
         CONTENT_ANALYSIS_PROMPT,
         BEHAVIOR_ANALYSIS_PROMPT,
+        COMBINED_ANALYSIS_PROMPT,
     )
 
     # Foresight related
@@ -66,3 +66,46 @@ Requirements:
 
 Return only the JSON object, do not add any other text:
 """
+
+MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT = """
+You are an episodic memory generation expert. Please convert the following conversation into one group episodic memory plus one personal episodic memory for each listed participant.
+
+Conversation start time: {conversation_start_time}
+Conversation content:
+{conversation}
+
+Participants (user_id: name):
+{participants}
+
+Custom instructions:
+{custom_instructions}
+
+Please return only a JSON object with the following structure:
+{{
+    "group": {{
+        "title": "A concise, descriptive title that accurately summarizes the theme (10-20 words)",
+        "summary": "A brief and clear summary of the main points and outcomes from the conversation (50-100 words)",
+        "content": "A detailed factual record of the conversation in third-person narrative: who participated at what time, what was discussed, what decisions were made, what emotions were expressed, and what plans or outcomes were formed"
+    }},
+    "participants": [
+        {{
+            "user_id": "The user_id exactly as listed above",
+            "title": "A concise title of what this participant did, said or learned in the conversation (10-20 words)",
+            "summary": "A brief summary from this participant's perspective (50-100 words)",
+            "content": "A detailed factual record of the events related to this participant, in third-person narrative using the participant's name"
+        }}
+    ]
+}}
+
+Requirements:
+1. The group episode covers the whole conversation; each personal episode focuses on what the participant saw, heard, said and did, keeping only the context needed to understand it.
+2. Return exactly one entry in "participants" for every listed user_id and do not add user_ids that are not listed.
+3. Record the participant's actual role objectively: if they only asked or received information, say so instead of presenting them as leading the discussion.
+4. Convert the dialogue format into a narrative description, maintain chronological order and causal relationships.
+5. Include specific details that aid keyword search, especially concrete activities, places, and objects.
+6. For time references, use the dual format: "relative time (absolute date)". Use the provided conversation start time as the base time.
+7. Use specific names consistently rather than pronouns to avoid ambiguity in retrieval.
+8. The language of all titles, summaries and contents must match the input content language.
+
+Return only the JSON object, do not add any other text:
+"""
@@ -264,6 +264,108 @@ Now analyze the provided conversation and extract role assignments following the
 """
 
 
+# ======================================
+# SINGLE-CALL INCREMENTAL PROMPT
+# ======================================
+
+COMBINED_ANALYSIS_PROMPT = """
+You are a group analysis expert. You update an existing group profile from a small batch of NEW group conversation segments, covering both content (topics, summary, subject) and behavior (roles) in one pass.
+
+**IMPORTANT LANGUAGE REQUIREMENT:**
+- Extract content (summary, subject, topic names/summaries) in the SAME LANGUAGE as the conversation
+- Keep enum values (topic status, role names, confidence) in English as specified
+
+**IMPORTANT EVIDENCE EXTRACTION:**
+- Each conversation segment is prefixed with "=== MEMCELL_ID: xxxx ===" to identify the memcell
+- When providing evidences, use ONLY the exact memcell IDs from these "=== MEMCELL_ID: xxx ===" markers
+- DO NOT use timestamps as memcell IDs
+- Only reference memcell IDs that appear in the conversation input
+
+<principles>
+- **Incremental**: The transcript contains ONLY conversations that happened after the existing profile was built. The existing profile already reflects everything earlier.
+- **Evidence-Based**: Only extract information explicitly mentioned or clearly implied in the new conversations
+- **Conservative**: Small batches rarely justify big changes. Keep existing information unless the new conversations clearly update or contradict it.
+- **Quality Over Quantity**: An empty topics list and empty roles are acceptable when the new conversations contain nothing substantial
+</principles>
+
+<input>
+- **new_conversation_transcript**: {conversation}
+- **group_id**: {group_id}
+- **group_name**: {group_name}
+- **existing_group_profile**: {existing_profile}
+- **conversation_timespan**: {timespan}
+{speaker_info}
+</input>
+
+<output_format>
+You MUST output a single JSON object with the following structure:
+
+```json
+{{
+  "topics": [
+    {{
+      "name": "short_phrase_topic_name",
+      "summary": "one sentence about what group is discussing on this topic (max 3 sentences)",
+      "status": "exploring|disagreement|consensus|implemented",
+      "update_type": "new|update",
+      "old_topic_id": "topic_abc12345",
+      "evidences": ["memcell_id_1"],
+      "confidence": "strong|weak"
+    }}
+  ],
+  "summary": "one sentence focusing on current stage based on existing and new topics",
+  "subject": "long_term_group_positioning_or_not_found",
+  "roles": {{
+    "decision_maker": [
+      {{
+        "speaker": "speaker_id1",
+        "evidences": ["memcell_id_2"],
+        "confidence": "strong|weak"
+      }}
+    ],
+    "opinion_leader": [...],
+    "topic_initiator": [...],
+    "execution_promoter": [...],
+    "core_contributor": [...],
+    "coordinator": [...],
+    "info_summarizer": [...]
+  }}
+}}
+```
+</output_format>
+
+<extraction_rules>
+### Topics (0-{max_topics})
+- Only output topics that the NEW conversations start or advance; existing topics that are not discussed are kept by the system
+- **"update"**: The new conversations continue an existing topic (provide its id as old_topic_id, with the updated summary and status)
+- **"new"**: A substantial new discussion thread (old_topic_id=null)
+- **DO NOT generate topic IDs**
+- **Name**: Short phrase (2-4 words); **Summary**: at most 3 sentences
+- **Status**: "exploring" (gathering information), "disagreement" (debate ongoing), "consensus" (decision made), "implemented" (already done)
+- Exclude administrative tasks, social chat, system notifications, logistics and simple confirmations
+
+### Summary
+- One sentence describing the current group focus, based on existing and new topics
+
+### Subject
+- Keep the existing subject unless the new conversations clearly contradict it; "not_found" if still unknown
+
+### Roles (7 Key Roles)
+- **decision_maker**: makes final calls, approves/rejects proposals
+- **opinion_leader**: others reference and follow their views
+- **topic_initiator**: starts new discussion threads
+- **execution_promoter**: pushes for action and follows up on tasks
+- **core_contributor**: provides knowledge, resources and substantial input
+- **coordinator**: facilitates collaboration, aligns people, manages process
+- **info_summarizer**: writes summaries, notes and wrap-ups
+- Only output assignments supported by the NEW conversations; existing assignments are kept by the system
+- Use ONLY speaker_ids from the Available Speakers list, at most 3 people per role
+- **Evidence & Confidence**: memcell IDs supporting each topic and assignment; "strong" for multiple clear signals, "weak" for limited evidence
+</extraction_rules>
+
+Now analyze the new conversations and return only the JSON object as specified in the output format.
+"""
+
 AGGREGATION_PROMPT = """
 You are a group profile aggregation expert. Your task is to analyze multiple daily group profiles and conversation data to create a consolidated group profile.
 
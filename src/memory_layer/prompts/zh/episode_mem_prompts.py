@@ -118,3 +118,46 @@ EPISODE_GENERATION_PROMPT = """
 
 仅返回JSON对象，不要添加任何其他文本：
 """
+
+
+MULTI_PERSPECTIVE_EPISODE_GENERATION_PROMPT = """
+你是一位出色的事件记录与提炼专家。请根据以下对话，一次性生成一段群组情景记忆，以及每位列出参与者各自视角的个人情景记忆。
+
+对话开始时间：{conversation_start_time}
+对话内容：
+{conversation}
+
+参与者（user_id: 名称）：
+{participants}
+
+自定义指令：
+{custom_instructions}
+
+请遵循以下指导原则：
+
+1.  **群组情景记忆**：以第三人称视角，像讲故事一样叙述整个对话的来龙去脉，融入核心议题、关键决策、各方观点和最终共识。
+2.  **个人情景记忆**：聚焦于该参与者所见、所闻、所言、所行，过滤与其无直接关联的内容，但保留理解事件所必需的上下文。
+3.  **严格区分角色**：如果参与者只是信息的接收者或提问者，记录必须清晰地反映这一点，而不是暗示他/她主导了讨论。
+4.  **客观且忠于原文**：不添加原文未提及的主观评价或推断，禁止出现“这体现了...”、“这表明...”等评价性语句。
+5.  **为检索优化**：保留关键的实体名词、项目名、技术术语、URL、文件路径等，使用具体名称而非代词。
+6.  **完整覆盖**：`participants` 中必须为每个列出的 user_id 恰好返回一条记录，不得添加未列出的 user_id。
+
+请仅返回如下结构的JSON对象：
+{{
+    "group": {{
+        "title": "（精炼、概括性的标题，包含核心事件与日期 YYYY-MM-DD）",
+        "summary": "（50-100字的简要总结）",
+        "content": "（一段连贯的叙事性文本，关键的结论或待办事项自然地融入其中。）"
+    }},
+    "participants": [
+        {{
+            "user_id": "（与上方列出的 user_id 完全一致）",
+            "title": "（关于该参与者的[核心事件]的记录 YYYY-MM-DD）",
+            "summary": "（该参与者视角的简要总结）",
+            "content": "（一段以该参与者为中心、使用其名称的客观、连贯的叙事性文本。）"
+        }}
+    ]
+}}
+
+仅返回JSON对象，不要添加任何其他文本：
+"""
@@ -264,6 +264,108 @@ BEHAVIOR_ANALYSIS_PROMPT = """
 """
 
 
+# ======================================
+# 单次调用增量提示词
+# ======================================
+
+COMBINED_ANALYSIS_PROMPT = """
+你是一位群组分析专家。你需要根据一小批**新增**的群组对话片段更新已有的群组档案，在一次分析中同时完成内容分析（话题、摘要、主题定位）和行为分析（角色）。
+
+**重要语言要求：**
+- 提取的内容（摘要、主题、话题名称/摘要）使用与对话**相同的语言**
+- 枚举值（话题状态、角色名称、置信度）保持英文
+
+**重要证据提取：**
+- 每个对话片段都以"=== MEMCELL_ID: xxxx ==="作为前缀来标识 memcell
+- 提供证据时，仅使用这些"=== MEMCELL_ID: xxx ==="标记中的确切 memcell ID
+- 不要使用时间戳作为 memcell ID
+- 仅引用对话输入中出现的 memcell ID
+
+<principles>
+- **增量更新**：对话记录中**只包含**已有档案生成之后的新对话，已有档案已经反映了之前的全部内容
+- **基于证据**：仅提取新对话中明确提及或清晰暗示的信息
+- **保守更新**：少量新对话通常不足以带来大的变化，除非新对话明确更新或否定，否则保留已有信息
+- **质量优于数量**：新对话中没有实质内容时，话题列表和角色可以为空
+</principles>
+
+<input>
+- **new_conversation_transcript**: {conversation}
+- **group_id**: {group_id}
+- **group_name**: {group_name}
+- **existing_group_profile**: {existing_profile}
+- **conversation_timespan**: {timespan}
+{speaker_info}
+</input>
+
+<output_format>
+你必须输出一个具有以下结构的单个 JSON 对象：
+
+```json
+{{
+  "topics": [
+    {{
+      "name": "简短的话题名称",
+      "summary": "一句话描述群组在该话题上的讨论（最多 3 句）",
+      "status": "exploring|disagreement|consensus|implemented",
+      "update_type": "new|update",
+      "old_topic_id": "topic_abc12345",
+      "evidences": ["memcell_id_1"],
+      "confidence": "strong|weak"
+    }}
+  ],
+  "summary": "基于已有话题和新话题，一句话描述群组当前阶段的关注点",
+  "subject": "群组长期定位或 not_found",
+  "roles": {{
+    "decision_maker": [
+      {{
+        "speaker": "speaker_id1",
+        "evidences": ["memcell_id_2"],
+        "confidence": "strong|weak"
+      }}
+    ],
+    "opinion_leader": [...],
+    "topic_initiator": [...],
+    "execution_promoter": [...],
+    "core_contributor": [...],
+    "coordinator": [...],
+    "info_summarizer": [...]
+  }}
+}}
+```
+</output_format>
+
+<extraction_rules>
+### 话题（0-{max_topics} 个）
+- 只输出新对话开启或推进的话题；新对话未涉及的已有话题由系统自动保留
+- **"update"**：新对话延续了某个已有话题（将其 id 填入 old_topic_id，并给出更新后的摘要和状态）
+- **"new"**：新出现的实质性讨论线索（old_topic_id=null）
+- **不要生成话题 ID**
+- **名称**：简短短语（2-4 个词）；**摘要**：最多 3 句
+- **状态**："exploring"（收集信息）、"disagreement"（存在分歧）、"consensus"（已达成决定）、"implemented"（已执行完成）
+- 排除行政事务、闲聊、系统通知、后勤协调和简单确认
+
+### 摘要
+- 基于已有话题和新话题，用一句话描述群组当前的关注点
+
+### 主题定位
+- 除非新对话明确与之矛盾，否则保留已有主题定位；仍无法确定时输出 "not_found"
+
+### 角色（7 个关键角色）
+- **decision_maker（决策者）**：做最终决定，批准/拒绝提案
+- **opinion_leader（意见领袖）**：其观点被他人引用和跟随
+- **topic_initiator（话题发起人）**：开启新的讨论线索
+- **execution_promoter（执行推动者）**：推动行动，跟进任务
+- **core_contributor（核心贡献者）**：提供知识、资源和实质性投入
+- **coordinator（协调者）**：促进协作，对齐各方，管理流程
+- **info_summarizer（信息总结者）**：撰写总结、记录和回顾
+- 只输出新对话所支持的角色分配；已有角色分配由系统自动保留
+- 仅使用可用说话者列表中的 speaker_id，每个角色最多 3 人
+- **证据与置信度**：为每个话题和角色分配提供支持的 memcell ID；多个明确信号为 "strong"，证据有限为 "weak"
+</extraction_rules>
+
+现在分析新增对话，仅返回输出格式中指定的 JSON 对象。
+"""
+
 AGGREGATION_PROMPT = """
 你是一位群组档案聚合专家。你的任务是分析多个每日群组档案和对话数据以创建合并的群组档案。
 
@@ -8,6 +8,7 @@ Main business application of the Memsys memory system, including:
 - Full-text writing and editing agent
 - Document management and resource processing services
 """
+
 import argparse
 import os
 import sys
@@ -56,6 +57,13 @@ def parse_args():
         action="store_true",
         help="Skip MongoDB database migrations on startup",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_WORKERS", "1")),
+        help="Number of web worker processes forked from a pre-warmed parent "
+        "(default: WEB_WORKERS or 1, ignored in LongJob mode)",
+    )
     return parser.parse_args()
 
 
@@ -104,6 +112,7 @@ def main():
     logger.info("  🎭 Mock Mode: %s", args.mock)
     logger.info("  🔧 LongJob Mode: %s", args.longjob if args.longjob else "Disabled")
     logger.info("  🔄 Skip Migrations: %s", args.skip_migrations)
+    logger.info("  👷 Workers: %s", args.workers)
 
     # Execute dependency injection and async task setup
     from application_startup import setup_all
@@ -120,6 +129,12 @@ def main():
     if args.longjob:
         logger.info("🔧 Starting LongJob mode: %s", args.longjob)
         os.environ["LONGJOB_NAME"] = args.longjob
+        if args.workers > 1:
+            logger.warning("⚠️ --workers is ignored in LongJob mode, using 1 process")
+            args.workers = 1
+    elif args.workers > 1 and os.environ.pop("LONGJOB_NAME", None):
+        # LongJob consumers run in dedicated --longjob processes, not in every web worker
+        logger.warning("⚠️ LONGJOB_NAME ignored in multi-worker web mode")
 
     from app import app
 
@@ -130,8 +145,16 @@ def main():
 
     # Start service using command line arguments
     try:
-        uvicorn_kwargs = {"host": args.host, "port": args.port}
-        uvicorn.run(app, **uvicorn_kwargs)
+        if args.workers > 1:
+            from core.nlp.warmup import preload_nlp_assets
+            from core.server.prefork import PreforkServer
+
+            # Loaded once here and shared copy-on-write with the forked workers
+            preload_nlp_assets()
+            PreforkServer(app, args.host, args.port, args.workers).run()
+        else:
+            uvicorn_kwargs = {"host": args.host, "port": args.port}
+            uvicorn.run(app, **uvicorn_kwargs)
     except KeyboardInterrupt:
         logger.info("👋 %s stopped", APP_NAME)
     except (OSError, RuntimeError) as e:
@@ -111,7 +111,8 @@ class WorkerSettings:
     health_check_interval = 30
     max_jobs = 10
     job_timeout = 300
-    keep_result = 3600
+    # Shared with the task index, which drops finished tasks with their results
+    keep_result = get_task_manager().keep_result_seconds
 
 
 #  arq task.WorkerSettings
@@ -0,0 +1,181 @@
+"""
+评估自适应并发控制测试
+
+验证 AIMD 限流器：健康时加性增长、429/5xx/超时时乘性回退、同一拥塞周期只回退一次、
+延迟基线随缓慢漂移上移，以及学习到的并发上限可通过 CheckpointManager 持久化并恢复。
+"""
+
+import asyncio
+
+import pytest
+
+from evaluation.src.utils.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    is_overload_error,
+)
+from evaluation.src.utils.checkpoint import CheckpointManager
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestIsOverloadError:
+    """过载错误识别"""
+
+    def test_status_codes(self):
+        assert is_overload_error(HTTPStatusError(429))
+        assert is_overload_error(HTTPStatusError(503))
+        assert not is_overload_error(HTTPStatusError(400))
+
+    def test_timeout_and_messages(self):
+        assert is_overload_error(asyncio.TimeoutError())
+        assert is_overload_error(RuntimeError("Rate limit exceeded, retry later"))
+        assert is_overload_error(RuntimeError("HTTP Error 503: upstream failed"))
+        assert is_overload_error(RuntimeError("Error code: 429 - {'error': ...}"))
+        assert not is_overload_error(ValueError("invalid JSON in response"))
+
+    def test_bare_numbers_are_not_status_codes(self):
+        assert not is_overload_error(ValueError("prompt exceeds 500 tokens"))
+        assert not is_overload_error(KeyError("conversation 502 not found"))
+        assert not is_overload_error(RuntimeError("HTTP Error 400: bad request"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AIMD 限流器"""
+
+    @pytest.mark.asyncio
+    async def test_grows_while_saturated_and_healthy(self):
+        """并发跑满且延迟稳定时逐步增长，且不超过 max_limit"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=6)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.005)
+
+        await asyncio.gather(*(limiter.run(call) for _ in range(200)))
+
+        assert limiter.limit == 6
+        assert peak <= 6
+        assert limiter.in_flight == 0
+
+    def test_no_growth_when_not_saturated(self):
+        """串行调用未用满并发时不增长"""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=32)
+
+        # Fixed latency: the test is about saturation, not latency jitter
+        for _ in range(50):
+            limiter.on_success(0.01)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_backs_off_once_per_congestion_episode(self):
+        """同一批并发请求同时 429 只回退一次，错误照常抛出"""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, max_limit=16)
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            raise HTTPStatusError(429)
+
+        tasks = [asyncio.ensure_future(limiter.run(call)) for _ in range(16)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, HTTPStatusError) for r in results)
+        assert limiter.limit == 8
+        assert limiter.overloads == 16
+        assert limiter.decreases == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_back_off(self):
+        """非过载错误不影响并发上限"""
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        async def call():
+            raise ValueError("bad request payload")
+
+        with pytest.raises(ValueError):
+            await limiter.run(call)
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_slot_context_manager(self):
+        """async with slot() 与 run() 计数一致"""
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        async with limiter.slot():
+            assert limiter.in_flight == 1
+        with pytest.raises(HTTPStatusError):
+            async with limiter.slot():
+                raise HTTPStatusError(503)
+
+        assert limiter.in_flight == 0
+        assert (limiter.successes, limiter.overloads, limiter.limit) == (1, 1, 4)
+
+    def test_backs_off_on_latency_spike(self):
+        """延迟 EWMA 超过基线 latency_tolerance 倍时回退"""
+        limiter = AdaptiveConcurrencyLimiter(initial=10, latency_tolerance=2.0)
+        for _ in range(5):
+            limiter.on_success(0.1)
+        for _ in range(20):
+            limiter.on_success(1.0)
+
+        assert limiter.limit < 10
+        assert limiter.decreases >= 1
+
+    def test_sustained_latency_backs_off_once(self):
+        """回退后延迟仍高说明与并发无关：重新学习基线，不再反复回退"""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, latency_tolerance=2.0)
+        for _ in range(5):
+            limiter.on_success(0.1)
+        for _ in range(200):
+            limiter.on_success(1.0)
+
+        assert limiter.decreases == 1
+        assert limiter.baseline_latency == pytest.approx(1.0)
+
+    def test_baseline_follows_gradual_drift(self):
+        """延迟缓慢上升时基线随之上移，不触发回退"""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, latency_tolerance=2.0)
+        for step in range(2000):
+            limiter.on_success(0.1 + 0.4 * step / 2000)
+
+        assert limiter.decreases == 0
+        assert limiter.baseline_latency > 0.4
+
+    def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=3, min_limit=2)
+        for _ in range(5):
+            limiter.on_overload()
+        assert limiter.limit == 2
+
+
+class TestConcurrencyCheckpoint:
+    """并发状态持久化"""
+
+    def test_save_and_restore(self, tmp_path):
+        manager = CheckpointManager(output_dir=tmp_path, run_name="test")
+        learned = AdaptiveConcurrencyLimiter(initial=8, max_limit=64, name="search")
+        learned.limit = 37
+        manager.save_concurrency_state("search", learned.state())
+        manager.save_concurrency_state("answer", {"limit": 12})
+
+        reloaded = CheckpointManager(output_dir=tmp_path, run_name="test")
+        search = AdaptiveConcurrencyLimiter(initial=8, max_limit=64).restore(
+            reloaded.load_concurrency_state("search")
+        )
+        # 恢复时以当前限流器的上下界为准
+        answer = AdaptiveConcurrencyLimiter(initial=8, max_limit=10).restore(
+            reloaded.load_concurrency_state("answer")
+        )
+
+        assert search.limit == 37
+        assert answer.limit == 10
+        assert reloaded.load_concurrency_state("embedding") is None
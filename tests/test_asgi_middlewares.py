@@ -0,0 +1,198 @@
+"""
+纯 ASGI 中间件测试
+
+验证 DatabaseSessionMiddleware 只在路由首次使用时创建会话（成功提交、异常回滚、流式响应
+结束前提交），AppLogicMiddleware 上报真实状态码，以及请求结束后上下文被还原。
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from core.context.context import (
+    get_current_app_info,
+    get_current_request,
+    get_current_session,
+)
+from core.middleware import app_logic_middleware, database_session_middleware
+
+
+class FakeSession:
+    """记录事务操作的数据库会话"""
+
+    is_active = True
+
+    def __init__(self, events):
+        self.events = events
+
+    async def commit(self):
+        self.events.append("commit")
+
+    async def rollback(self):
+        self.events.append("rollback")
+
+    async def close(self):
+        self.events.append("close")
+
+
+class FakeSessionProvider:
+    def __init__(self):
+        self.events = []
+        self.created = 0
+
+    def create_session(self):
+        self.created += 1
+        return FakeSession(self.events)
+
+
+class FakeAppLogicProvider:
+    def __init__(self):
+        self.completed = []
+
+    def setup_app_context(self, request):
+        return {"path": request.url.path}
+
+    def should_process_request(self, request):
+        return True
+
+    async def on_request_begin(self, request):
+        pass
+
+    async def on_request_complete(self, request, http_code, error_message=None):
+        self.completed.append((request.url.path, http_code, error_message))
+
+
+def build_app(middleware_cls, provider, monkeypatch, module):
+    monkeypatch.setattr(module, "get_bean_by_type", lambda _: provider)
+    app = FastAPI()
+
+    @app.get("/noop")
+    async def noop():
+        return {"ok": True}
+
+    @app.get("/uses-db")
+    async def uses_db():
+        assert get_current_session() is get_current_session()
+        return {"ok": True}
+
+    @app.get("/fails")
+    async def fails():
+        raise RuntimeError("boom")
+
+    @app.get("/db-fails")
+    async def db_fails():
+        get_current_session()
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            get_current_session()
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(chunks())
+
+    @app.post("/created", status_code=201)
+    async def created():
+        return {"ok": True}
+
+    app.add_middleware(middleware_cls)
+    return app
+
+
+async def request(app, method, path):
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path)
+
+
+@pytest.fixture
+def db_app(monkeypatch):
+    provider = FakeSessionProvider()
+    app = build_app(
+        database_session_middleware.DatabaseSessionMiddleware,
+        provider,
+        monkeypatch,
+        database_session_middleware,
+    )
+    return app, provider
+
+
+@pytest.fixture
+def app_logic_app(monkeypatch):
+    provider = FakeAppLogicProvider()
+    app = build_app(
+        app_logic_middleware.AppLogicMiddleware,
+        provider,
+        monkeypatch,
+        app_logic_middleware,
+    )
+    return app, provider
+
+
+class TestDatabaseSessionMiddleware:
+    """延迟创建的数据库会话"""
+
+    @pytest.mark.asyncio
+    async def test_no_session_for_route_without_db(self, db_app):
+        app, provider = db_app
+        response = await request(app, "GET", "/noop")
+        assert response.status_code == 200
+        assert provider.created == 0
+        assert provider.events == []
+
+    @pytest.mark.asyncio
+    async def test_session_created_once_and_committed(self, db_app):
+        app, provider = db_app
+        response = await request(app, "GET", "/uses-db")
+        assert response.status_code == 200
+        assert provider.created == 1
+        assert provider.events == ["commit", "close"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_exception(self, db_app):
+        app, provider = db_app
+        response = await request(app, "GET", "/db-fails")
+        assert response.status_code == 500
+        assert provider.events == ["rollback", "close"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_commits_after_last_chunk(self, db_app):
+        app, provider = db_app
+        response = await request(app, "GET", "/stream")
+        assert response.content == b"ab"
+        assert provider.events == ["commit", "close"]
+
+    @pytest.mark.asyncio
+    async def test_session_cleared_after_request(self, db_app):
+        app, _ = db_app
+        await request(app, "GET", "/uses-db")
+        with pytest.raises(RuntimeError):
+            get_current_session()
+
+
+class TestAppLogicMiddleware:
+    """请求完成回调与上下文"""
+
+    @pytest.mark.asyncio
+    async def test_reports_response_status(self, app_logic_app):
+        app, provider = app_logic_app
+        await request(app, "POST", "/created")
+        await request(app, "GET", "/missing")
+        assert provider.completed == [("/created", 201, None), ("/missing", 404, None)]
+
+    @pytest.mark.asyncio
+    async def test_reports_500_on_exception(self, app_logic_app):
+        app, provider = app_logic_app
+        response = await request(app, "GET", "/fails")
+        assert response.status_code == 500
+        assert provider.completed == [("/fails", 500, "boom")]
+
+    @pytest.mark.asyncio
+    async def test_context_restored_after_request(self, app_logic_app):
+        app, _ = app_logic_app
+        await request(app, "GET", "/noop")
+        assert get_current_request() is None
+        assert get_current_app_info() is None
@@ -8,6 +8,7 @@
 2. 版本管理相关功能测试
 3. ensure_latest 方法测试
 4. 批量查询的 only_latest 功能测试
+5. get_by_user_ids 批量获取最新版本测试
 """
 
 import asyncio
@@ -287,6 +288,50 @@ async def test_batch_query_with_only_latest():
     logger.info("✅ 批量查询 only_latest 功能测试完成")
 
 
+async def test_get_by_user_ids_latest_version():
+    """测试 get_by_user_ids 批量获取每个用户的最新版本"""
+    logger.info("开始测试 get_by_user_ids 批量获取最新版本...")
+
+    repo = get_bean_by_type(CoreMemoryRawRepository)
+    user_ids = [f"test_batch_latest_user_{i}" for i in range(1, 4)]
+    missing_user_id = "test_batch_latest_user_missing"
+
+    try:
+        # 先清理
+        for uid in user_ids + [missing_user_id]:
+            await repo.delete_by_user_id(uid)
+
+        # 每个用户创建不同数量的版本
+        for index, uid in enumerate(user_ids, start=1):
+            for month in range(1, index + 1):
+                await repo.upsert_by_user_id(
+                    uid, {"version": f"20250{month}", "user_name": f"{uid}_{month}"}
+                )
+
+        results = await repo.get_by_user_ids(user_ids + [missing_user_id, user_ids[0]])
+
+        # 不存在的用户不返回，重复的用户ID只返回一次，顺序与请求一致
+        assert list(results.keys()) == user_ids
+        for index, uid in enumerate(user_ids, start=1):
+            assert results[uid].version == f"20250{index}"
+            # 与逐个查询的结果一致
+            single = await repo.get_by_user_id(uid)
+            assert single.version == results[uid].version
+
+        assert await repo.get_by_user_ids([]) == {}
+        logger.info("✅ get_by_user_ids 返回每个用户的最新版本")
+
+        # 清理测试数据
+        for uid in user_ids:
+            await repo.delete_by_user_id(uid)
+
+    except Exception as e:
+        logger.error("❌ 测试 get_by_user_ids 失败: %s", e)
+        raise
+
+    logger.info("✅ get_by_user_ids 测试完成")
+
+
 async def test_profile_fields():
     """测试 profile 相关字段"""
     logger.info("开始测试 profile 相关字段...")
@@ -386,6 +431,7 @@ async def run_all_tests():
         await test_version_management()
         await test_ensure_latest()
         await test_batch_query_with_only_latest()
+        await test_get_by_user_ids_latest_version()
         await test_profile_fields()
         await test_create_without_version_should_fail()
         logger.info("✅ 所有测试完成")
@@ -0,0 +1,117 @@
+"""
+评估 Embedding 索引测试
+
+验证 npy 索引（mmap 矩阵 + offsets 侧车文件）的 MaxSim 结果与旧的逐文档 pickle 检索一致，
+以及旧 pickle 索引仍可加载。
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from evaluation.src.adapters.evermemos.tools.emb_index import (
+    NpyEmbeddingIndex,
+    describe_emb_index_paths,
+    emb_index_exists,
+    load_emb_index,
+    save_emb_index,
+)
+
+
+def legacy_maxsim_search(query_vec, emb_index, top_n):
+    """旧版 search_with_emb_index 的逐文档 MaxSim 逻辑"""
+    query_norm = np.linalg.norm(query_vec)
+    doc_scores = []
+    for item in emb_index:
+        embeddings = item["embeddings"]
+        if embeddings.get("atomic_facts"):
+            vectors = embeddings["atomic_facts"]
+        else:
+            vectors = [
+                embeddings[f]
+                for f in ("subject", "summary", "episode")
+                if f in embeddings
+            ]
+        sims = [
+            np.dot(query_vec, v) / (query_norm * np.linalg.norm(v))
+            for v in vectors
+            if np.linalg.norm(v) > 0
+        ]
+        if sims:
+            doc_scores.append((item["doc"], max(sims)))
+    return sorted(doc_scores, key=lambda x: x[1], reverse=True)[:top_n]
+
+
+def make_doc_embeddings(rng, num_docs=60, dim=16):
+    doc_embeddings = []
+    for i in range(num_docs):
+        if i % 3 == 0:
+            embeddings = {
+                f: rng.normal(size=dim).tolist()
+                for f in ("subject", "summary", "episode")
+            }
+        elif i % 7 == 0:
+            embeddings = {}  # 没有向量的文档不会被检索到
+        else:
+            embeddings = {
+                "atomic_facts": [
+                    rng.normal(size=dim).tolist() for _ in range(rng.integers(1, 6))
+                ]
+            }
+        doc_embeddings.append({"doc": {"event_id": f"e{i}"}, "embeddings": embeddings})
+    # 零向量会被忽略
+    doc_embeddings[1]["embeddings"]["atomic_facts"].append([0.0] * dim)
+    return doc_embeddings
+
+
+class TestNpyEmbeddingIndex:
+    """npy Embedding 索引测试"""
+
+    def test_search_matches_legacy_maxsim(self, tmp_path):
+        """测试 npy 索引的排序和分数与旧实现一致"""
+        rng = np.random.default_rng(0)
+        doc_embeddings = make_doc_embeddings(rng)
+        save_emb_index(doc_embeddings, tmp_path, 0)
+
+        index = load_emb_index(tmp_path, 0)
+        assert isinstance(index, NpyEmbeddingIndex)
+        assert isinstance(index.matrix, np.memmap)
+
+        for _ in range(5):
+            query = rng.normal(size=16)
+            expected = legacy_maxsim_search(query, doc_embeddings, top_n=10)
+            actual = index.search(query, top_n=10)
+            assert [doc["event_id"] for doc, _ in actual] == [
+                doc["event_id"] for doc, _ in expected
+            ]
+            np.testing.assert_allclose(
+                [score for _, score in actual],
+                [score for _, score in expected],
+                rtol=1e-5,
+            )
+
+    def test_top_n_larger_than_index_and_zero_query(self, tmp_path):
+        """测试 top_n 超过文档数及零向量查询"""
+        rng = np.random.default_rng(1)
+        doc_embeddings = make_doc_embeddings(rng, num_docs=5)
+        save_emb_index(doc_embeddings, tmp_path, 0)
+        index = load_emb_index(tmp_path, 0)
+
+        assert len(index.search(rng.normal(size=16), top_n=100)) == len(index)
+        assert index.search(np.zeros(16), top_n=3) == []
+
+    def test_legacy_pickle_still_loads(self, tmp_path):
+        """测试没有 npy 索引时回退加载旧 pickle 索引"""
+        doc_embeddings = [{"doc": {"event_id": "e0"}, "embeddings": {"summary": [1.0]}}]
+        with open(tmp_path / "embedding_index_conv_3.pkl", "wb") as f:
+            pickle.dump(doc_embeddings, f)
+
+        assert emb_index_exists(tmp_path, 3)
+        assert not emb_index_exists(tmp_path, 4)
+        assert load_emb_index(tmp_path, 3) == doc_embeddings
+        assert load_emb_index(tmp_path, 4) is None
+        assert describe_emb_index_paths(tmp_path, 4) == (
+            f"{tmp_path / 'embedding_index_conv_4.npy'} + "
+            "embedding_index_conv_4.meta.json (or legacy embedding_index_conv_4.pkl)"
+        )
@@ -0,0 +1,131 @@
+"""
+离线基准测试假模型服务测试
+
+验证假服务对各类提示词返回可被解析的确定性结果，并且 OpenAIProvider、VectorizeService、
+RerankService 可以直接指向假服务完成调用。
+"""
+
+import importlib
+import json
+
+import numpy as np
+import pytest
+
+from agentic_layer.agentic_utils import (
+    MULTI_QUERY_GENERATION_PROMPT,
+    SUFFICIENCY_CHECK_PROMPT,
+    parse_sufficiency_response,
+)
+from agentic_layer.rerank_service import RerankConfig, RerankProvider, RerankService
+from agentic_layer.vectorize_service import (
+    VectorizeConfig,
+    VectorizeProvider,
+    VectorizeService,
+)
+from devops_scripts.benchmark.fake_model_server import (
+    FakeModelServer,
+    FakeServerConfig,
+    build_chat_response,
+)
+from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.prompts.en import episode_mem_prompts
+
+
+@pytest.mark.parametrize("language", ["en", "zh"])
+def test_chat_response_matches_prompt_format(language):
+    """测试不同提示词得到对应格式的 JSON"""
+    prompts = {
+        name: getattr(
+            importlib.import_module(f"memory_layer.prompts.{language}.{name}"), attr
+        )
+        for name, attr in [
+            ("conv_prompts", "CONV_BOUNDARY_DETECTION_PROMPT"),
+            ("episode_mem_prompts", "EPISODE_GENERATION_PROMPT"),
+            ("event_log_prompts", "EVENT_LOG_PROMPT"),
+            ("foresight_prompts", "FORESIGHT_GENERATION_PROMPT"),
+        ]
+    }
+    config = FakeServerConfig()
+
+    boundary = json.loads(build_chat_response(prompts["conv_prompts"], config))
+    assert boundary["should_end"] is True and boundary["should_wait"] is False
+
+    episode = json.loads(build_chat_response(prompts["episode_mem_prompts"], config))
+    assert episode["title"] and episode["content"] and episode["summary"]
+
+    event_log = json.loads(build_chat_response(prompts["event_log_prompts"], config))
+    assert event_log["event_log"]["time"] and event_log["event_log"]["atomic_fact"]
+
+    foresights = json.loads(build_chat_response(prompts["foresight_prompts"], config))
+    assert len(foresights) == 10 and foresights[0]["duration_days"] == 7
+
+    # 输出是确定性的
+    assert build_chat_response(prompts["episode_mem_prompts"], config) == json.dumps(
+        episode
+    )
+
+
+def test_agentic_prompts():
+    """测试 Agentic 检索的充分性判断与多查询生成"""
+    config = FakeServerConfig(sufficient=False)
+    sufficiency = build_chat_response(SUFFICIENCY_CHECK_PROMPT, config)
+    assert parse_sufficiency_response(sufficiency)[0] is False
+
+    queries = json.loads(build_chat_response(MULTI_QUERY_GENERATION_PROMPT, config))
+    assert len(queries["queries"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_providers_against_fake_server():
+    """测试 LLM、向量化和重排服务指向假服务后可以正常调用"""
+    server = FakeModelServer(
+        FakeServerConfig(
+            chat_latency_ms=0,
+            embedding_latency_ms=0,
+            embedding_latency_per_text_ms=0,
+            rerank_latency_ms=0,
+            rerank_latency_per_doc_ms=0,
+            dimensions=64,
+        )
+    )
+    port = await server.start()
+    base_url = f"http://127.0.0.1:{port}"
+    vectorize = VectorizeService(
+        VectorizeConfig(
+            provider=VectorizeProvider.VLLM,
+            api_key="EMPTY",
+            base_url=f"{base_url}/v1",
+            model="fake-embedding",
+            dimensions=64,
+        )
+    )
+    rerank = RerankService(
+        RerankConfig(
+            provider=RerankProvider.VLLM,
+            api_key="EMPTY",
+            base_url=f"{base_url}/v1/score",
+            model="fake-rerank",
+        )
+    )
+    try:
+        llm = OpenAIProvider(
+            model="fake-chat", api_key="fake", base_url=f"{base_url}/v1"
+        )
+        response = await llm.generate(episode_mem_prompts.EPISODE_GENERATION_PROMPT)
+        assert "title" in json.loads(response)
+
+        vectors = await vectorize.get_embeddings(["alpha", "beta", "alpha"])
+        assert len(vectors) == 3 and vectors[0].shape == (64,)
+        np.testing.assert_allclose(vectors[0], vectors[2])
+
+        hits = [{"episode": "budget review meeting"}, {"episode": "lunch plans"}]
+        reranked = await rerank.rerank_memories("budget meeting", hits)
+        assert reranked[0]["episode"] == "budget review meeting"
+
+        assert server.stats["chat"]["requests"] == 1
+        assert server.stats["embedding"]["items"] == 3
+        assert server.stats["rerank"]["items"] == 2
+    finally:
+        await vectorize.close()
+        await rerank.close()
+        await server.stop()
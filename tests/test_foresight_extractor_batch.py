@@ -0,0 +1,172 @@
+"""
+Foresight 批量生成测试
+
+验证 generate_foresights_for_episodes：LLM 调用并发受限、所有 Episode 的 Foresight 合并为一次向量化调用、
+结果按 Episode 顺序拆分，单个 Episode 失败不影响其他 Episode，以及合并向量化失败后逐个 Episode 回退。
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from memory_layer.memory_extractor import foresight_extractor
+from memory_layer.memory_extractor.foresight_extractor import ForesightExtractor
+
+
+class FakeLLMProvider:
+    """按 Episode 内容返回固定数量 Foresight 的假 LLM，记录最大并发数"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def generate(self, prompt: str, temperature: float = 0.3) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if "episode-broken" in prompt:
+            return "not json"
+        tag = next(
+            word for word in prompt.split() if word.startswith("episode-")
+        ).strip('",.')
+        return json.dumps(
+            [{"content": f"{tag} foresight {i}", "evidence": tag} for i in range(3)]
+        )
+
+
+class FakeVectorizeService:
+    """记录每次 get_embeddings 调用的假向量化服务"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def get_model_name(self):
+        return "fake-embedding"
+
+
+class RejectingVectorizeService(FakeVectorizeService):
+    """拒绝包含指定文本的批次"""
+
+    def __init__(self, rejected_tag):
+        super().__init__()
+        self.rejected_tag = rejected_tag
+
+    async def get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        if any(self.rejected_tag in text for text in texts):
+            raise ValueError("input rejected")
+        return [[float(len(text))] for text in texts]
+
+
+def make_episode(tag: str):
+    return SimpleNamespace(
+        subject=tag,
+        summary=tag,
+        episode=f"content of {tag}",
+        user_id="user_1",
+        ori_event_id_list=[f"event_{tag}"],
+        timestamp=datetime(2025, 1, 1),
+    )
+
+
+@pytest.fixture
+def vectorize_service(monkeypatch):
+    service = FakeVectorizeService()
+    monkeypatch.setattr(foresight_extractor, "get_vectorize_service", lambda: service)
+    return service
+
+
+class TestForesightBatch:
+    """Foresight 批量生成测试"""
+
+    @pytest.mark.asyncio
+    async def test_batch_embeds_once_and_keeps_order(self, vectorize_service):
+        """测试所有 Episode 的 Foresight 只触发一次向量化调用，且结果按输入顺序返回"""
+        llm = FakeLLMProvider()
+        extractor = ForesightExtractor(llm_provider=llm)
+        episodes = [make_episode(f"episode-{i}") for i in range(6)]
+
+        results = await extractor.generate_foresights_for_episodes(
+            episodes, max_concurrency=2
+        )
+
+        assert len(vectorize_service.calls) == 1
+        assert len(vectorize_service.calls[0]) == 18
+        assert llm.max_in_flight == 2
+        for i, items in enumerate(results):
+            assert [item.content for item in items] == [
+                f"episode-{i} foresight {j}" for j in range(3)
+            ]
+            assert all(item.source_episode_id == f"event_episode-{i}" for item in items)
+            assert all(item.vector_model == "fake-embedding" for item in items)
+
+    @pytest.mark.asyncio
+    async def test_failed_episode_does_not_affect_others(
+        self, vectorize_service, monkeypatch
+    ):
+        """测试某个 Episode 重试后仍失败时返回空列表，其他 Episode 正常"""
+        llm = FakeLLMProvider(delay=0)
+        extractor = ForesightExtractor(llm_provider=llm)
+        episodes = [make_episode("episode-0"), make_episode("episode-broken")]
+
+        results = await extractor.generate_foresights_for_episodes(episodes)
+
+        assert len(results[0]) == 3
+        assert results[1] == []
+        assert len(vectorize_service.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_single_episode_api_unchanged(self, vectorize_service):
+        """测试单 Episode 接口仍返回 ForesightItem 列表"""
+        extractor = ForesightExtractor(llm_provider=FakeLLMProvider(delay=0))
+
+        items = await extractor.generate_foresights_for_episode(
+            make_episode("episode-7")
+        )
+
+        assert [item.content for item in items][0] == "episode-7 foresight 0"
+        assert items[0].vector == [float(len("episode-7 foresight 0"))]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_embedding_falls_back_per_episode(self, monkeypatch):
+        """测试合并向量化持续失败时退避重试后逐个 Episode 向量化，只有失败的 Episode 为空"""
+        service = RejectingVectorizeService("episode-bad")
+        monkeypatch.setattr(
+            foresight_extractor, "get_vectorize_service", lambda: service
+        )
+        monkeypatch.setattr(
+            foresight_extractor, "EMBEDDING_RETRY_BACKOFF_SECONDS", 0.01
+        )
+        extractor = ForesightExtractor(llm_provider=FakeLLMProvider(delay=0))
+        episodes = [
+            make_episode("episode-0"),
+            make_episode("episode-bad"),
+            make_episode("episode-2"),
+        ]
+
+        start = time.monotonic()
+        results = await extractor.generate_foresights_for_episodes(episodes)
+
+        # Backoff between the 5 coalesced attempts: 0.01 + 0.02 + 0.04 + 0.08
+        assert time.monotonic() - start >= 0.15
+        assert [len(items) for items in results] == [3, 0, 3]
+        assert [item.content for item in results[2]] == [
+            f"episode-2 foresight {j}" for j in range(3)
+        ]
+        assert results[0][0].vector == [float(len("episode-0 foresight 0"))]
+        # 5 coalesced attempts, then one call per episode
+        assert [len(call) for call in service.calls] == [9] * 5 + [3, 3, 3]
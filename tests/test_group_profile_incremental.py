@@ -0,0 +1,220 @@
+"""
+群组档案增量分析测试
+
+验证 GroupProfileMemoryExtractor 只把档案未处理过的 memcell（包括乱序到达的）发送给 LLM，
+小增量时使用单次合并提示词（内容 + 行为），并在结果中记录已处理 memcell（有上限）、保留已有角色。
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from api_specs.memory_types import MemCell
+from common_utils.datetime_utils import timezone
+from memory_layer.memory_extractor import group_profile_memory_extractor
+from memory_layer.memory_extractor.group_profile_memory_extractor import (
+    LAST_PROCESSED_EVENT_ID_KEY,
+    PROCESSED_FLOOR_TIMESTAMP_KEY,
+    GroupProfileMemoryExtractor,
+    GroupProfileMemoryExtractRequest,
+)
+
+BASE_TIME = datetime(2025, 9, 1, 9, 0, tzinfo=timezone)
+
+
+class RecordingLLMProvider:
+    """记录提示词并返回固定 JSON 的 LLM"""
+
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    async def generate(self, prompt, temperature=None, **kwargs):
+        self.prompts.append(prompt)
+        return json.dumps(self.response, ensure_ascii=False)
+
+
+def make_memcell(index):
+    return MemCell(
+        event_id=f"mc_{index}",
+        user_id_list=["u1", "u2"],
+        original_data=[
+            {
+                "speaker_id": "u1",
+                "speaker_name": "Alice",
+                "content": f"message {index} about the release plan",
+            },
+            {"speaker_id": "u2", "speaker_name": "Bob", "content": f"reply {index}"},
+        ],
+        timestamp=BASE_TIME + timedelta(minutes=index),
+        summary=f"memcell {index}",
+        group_id="g1",
+        participants=["u1", "u2"],
+    )
+
+
+COMBINED_RESPONSE = {
+    "topics": [
+        {
+            "name": "Release plan",
+            "summary": "Planning the release",
+            "status": "exploring",
+            "update_type": "new",
+            "old_topic_id": None,
+            "evidences": ["mc_3"],
+            "confidence": "strong",
+        }
+    ],
+    "summary": "Currently focusing on the release",
+    "subject": "product team",
+    "roles": {
+        "topic_initiator": [
+            {"speaker": "u1", "evidences": ["mc_3"], "confidence": "strong"}
+        ]
+    },
+}
+
+
+def make_extractor(provider, **kwargs):
+    return GroupProfileMemoryExtractor(
+        llm_provider=provider,
+        incremental=True,
+        single_call_max_memcells=kwargs.pop("single_call_max_memcells", 5),
+        single_call_max_chars=100000,
+        **kwargs,
+    )
+
+
+async def extract(extractor, memcells, old_memory_list=None):
+    request = GroupProfileMemoryExtractRequest(
+        memcell_list=memcells,
+        group_id="g1",
+        group_name="Team",
+        old_memory_list=old_memory_list,
+    )
+    return await extractor.extract_memory(request)
+
+
+class TestGroupProfileIncremental:
+    """增量分析与单次合并调用"""
+
+    @pytest.mark.asyncio
+    async def test_small_first_extraction_uses_single_call(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        [profile] = await extract(
+            make_extractor(provider), [make_memcell(i) for i in range(3)]
+        )
+
+        assert len(provider.prompts) == 1
+        assert profile.summary == "Currently focusing on the release"
+        assert [role["user_id"] for role in profile.roles["topic_initiator"]] == ["u1"]
+        assert profile.extend[LAST_PROCESSED_EVENT_ID_KEY] == "mc_2"
+
+    @pytest.mark.asyncio
+    async def test_only_new_memcells_are_sent(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider)
+        [previous] = await extract(extractor, [make_memcell(i) for i in range(3)])
+        previous.roles = {
+            "decision_maker": [
+                {
+                    "user_id": "u2",
+                    "user_name": "Bob",
+                    "confidence": "strong",
+                    "evidences": ["mc_1"],
+                }
+            ]
+        }
+        provider.prompts.clear()
+
+        [profile] = await extract(
+            extractor, [make_memcell(i) for i in range(5)], [previous]
+        )
+
+        [prompt] = provider.prompts
+        assert "MEMCELL_ID: mc_3" in prompt and "MEMCELL_ID: mc_4" in prompt
+        assert "MEMCELL_ID: mc_2" not in prompt
+        assert profile.ori_event_id_list == ["mc_3", "mc_4"]
+        assert profile.extend[LAST_PROCESSED_EVENT_ID_KEY] == "mc_4"
+        # Roles not mentioned by the single call are carried over
+        assert profile.roles["decision_maker"][0]["user_id"] == "u2"
+        assert profile.roles["topic_initiator"][0]["evidences"] == ["mc_3"]
+
+    @pytest.mark.asyncio
+    async def test_no_new_memcells_skips_llm(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider)
+        memcells = [make_memcell(i) for i in range(3)]
+        [previous] = await extract(extractor, memcells)
+        provider.prompts.clear()
+
+        assert await extract(extractor, memcells, [previous]) is None
+        assert provider.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_memcell_is_analyzed(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider)
+        [previous] = await extract(extractor, [make_memcell(i) for i in (0, 2, 3)])
+        provider.prompts.clear()
+
+        # mc_1 arrives late, one memcell at a time as memory_manager delivers them
+        [profile] = await extract(extractor, [make_memcell(1)], [previous])
+
+        [prompt] = provider.prompts
+        assert "MEMCELL_ID: mc_1" in prompt
+        assert profile.ori_event_id_list == ["mc_1"]
+        assert profile.extend[LAST_PROCESSED_EVENT_ID_KEY] == "mc_3"
+        # A replay of mc_1 is skipped
+        assert await extract(extractor, [make_memcell(1)], [profile]) is None
+
+    @pytest.mark.asyncio
+    async def test_processed_memcells_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(group_profile_memory_extractor, "MAX_PROCESSED_MEMCELLS", 2)
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider)
+        [profile] = await extract(extractor, [make_memcell(i) for i in range(4)])
+        provider.prompts.clear()
+
+        assert [event_id for event_id, _ in profile.extend["processed_memcells"]] == [
+            "mc_3",
+            "mc_2",
+        ]
+        # Evicted memcells are behind the floor and stay processed
+        assert profile.extend[PROCESSED_FLOOR_TIMESTAMP_KEY]
+        assert await extract(extractor, [make_memcell(0)], [profile]) is None
+        assert provider.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_large_increment_uses_parallel_analysis(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider, single_call_max_memcells=2)
+        [profile] = await extract(extractor, [make_memcell(i) for i in range(3)])
+
+        assert len(provider.prompts) == 2
+        assert profile.extend[LAST_PROCESSED_EVENT_ID_KEY] == "mc_2"
+
+    @pytest.mark.asyncio
+    async def test_parallel_incremental_update_keeps_existing_roles(self):
+        provider = RecordingLLMProvider(COMBINED_RESPONSE)
+        extractor = make_extractor(provider, single_call_max_memcells=1)
+        [previous] = await extract(extractor, [make_memcell(0)])
+        previous.roles = {
+            "decision_maker": [
+                {
+                    "user_id": "u2",
+                    "user_name": "Bob",
+                    "confidence": "strong",
+                    "evidences": ["mc_0"],
+                }
+            ]
+        }
+        provider.prompts.clear()
+
+        [profile] = await extract(
+            extractor, [make_memcell(i) for i in range(4)], [previous]
+        )
+
+        assert len(provider.prompts) == 2
+        assert profile.roles["decision_maker"][0]["user_id"] == "u2"
@@ -0,0 +1,206 @@
+"""
+LLM 响应缓存测试
+
+验证 OpenAIProvider 对相同请求命中缓存后不再访问模型服务、采样参数不同不会命中、
+重试窗口内的相同请求重新走网络、结构化输出只缓存校验通过的响应并使不合法的缓存失效，
+以及磁盘缓存过期和 Redis 后端（键前缀、跨进程重试检测）。
+"""
+
+import pytest
+
+from devops_scripts.benchmark.fake_model_server import FakeModelServer, FakeServerConfig
+from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.llm.response_cache import (
+    DiskLLMResponseCache,
+    RedisLLMResponseCache,
+    build_cache_key,
+)
+from memory_layer.llm.structured_output import (
+    StructuredOutputError,
+    build_response_format,
+)
+from memory_layer.memory_extractor.episode_memory_extractor import EpisodeOutput
+from memory_layer.prompts.en import episode_mem_prompts
+
+PROMPT = episode_mem_prompts.EPISODE_GENERATION_PROMPT
+
+
+@pytest.fixture
+def fake_server():
+    return FakeModelServer(FakeServerConfig(chat_latency_ms=0))
+
+
+class FakeRedisProvider:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+class TestLLMResponseCache:
+    """响应缓存"""
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_skips_network_on_rerun(self, tmp_path, fake_server):
+        port = await fake_server.start()
+        base_url = f"http://127.0.0.1:{port}/v1"
+        try:
+            first = OpenAIProvider(
+                model="fake-chat",
+                api_key="fake",
+                base_url=base_url,
+                response_cache=DiskLLMResponseCache(str(tmp_path)),
+            )
+            response = await first.generate(PROMPT)
+            assert fake_server.stats["chat"]["requests"] == 1
+
+            # A new process (new cache instance) reruns the same prompt
+            rerun = OpenAIProvider(
+                model="fake-chat",
+                api_key="fake",
+                base_url=base_url,
+                enable_stats=True,
+                response_cache=DiskLLMResponseCache(str(tmp_path)),
+            )
+            assert await rerun.generate(PROMPT) == response
+            assert fake_server.stats["chat"]["requests"] == 1
+            assert rerun.get_current_call_stats()["cached"] is True
+
+            # Different sampling parameters are a different entry
+            await rerun.generate(PROMPT, temperature=0.9)
+            assert fake_server.stats["chat"]["requests"] == 2
+            assert rerun.response_cache.get_stats()["hits"] == 1
+        finally:
+            await fake_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_repeat_within_retry_window_goes_to_network(
+        self, tmp_path, fake_server
+    ):
+        port = await fake_server.start()
+        try:
+            llm = OpenAIProvider(
+                model="fake-chat",
+                api_key="fake",
+                base_url=f"http://127.0.0.1:{port}/v1",
+                response_cache=DiskLLMResponseCache(str(tmp_path)),
+            )
+            await llm.generate(PROMPT)
+            await llm.generate(PROMPT)
+
+            assert fake_server.stats["chat"]["requests"] == 2
+            assert llm.response_cache.get_stats()["retries"] == 1
+        finally:
+            await fake_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_disk_entries_expire(self, tmp_path):
+        cache = DiskLLMResponseCache(
+            str(tmp_path), ttl_seconds=0, retry_window_seconds=0
+        )
+        key = build_cache_key("http://llm", {"model": "m", "messages": []})
+        await cache.set(key, "answer")
+
+        assert await cache.get(key) is None
+        assert not list(tmp_path.rglob("*.json"))
+
+    @pytest.mark.asyncio
+    async def test_structured_output_caches_only_valid_responses(
+        self, tmp_path, fake_server
+    ):
+        port = await fake_server.start()
+        cache = DiskLLMResponseCache(str(tmp_path))
+        try:
+            llm = OpenAIProvider(
+                model="fake-chat",
+                api_key="fake",
+                base_url=f"http://127.0.0.1:{port}/v1",
+                response_cache=cache,
+                structured_output="json_schema",
+            )
+            key = build_cache_key(
+                llm.base_url,
+                llm._build_request_data(
+                    PROMPT,
+                    response_format=build_response_format(EpisodeOutput, "json_schema"),
+                ),
+            )
+            # An invalid response cached earlier (e.g. by an older version)
+            await cache.set(key, '{"title": "t", "cont')
+
+            episode = await llm.generate_structured(PROMPT, EpisodeOutput)
+            assert fake_server.stats["chat"]["requests"] == 1
+            assert cache.get_stats()["invalidations"] == 1
+
+            # The valid response replaced it and is served without the network
+            assert await llm.generate_structured(PROMPT, EpisodeOutput) == episode
+            assert fake_server.stats["chat"]["requests"] == 1
+        finally:
+            await fake_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalid_structured_responses_are_not_cached(self, tmp_path):
+        server = FakeModelServer(FakeServerConfig(chat_latency_ms=0, malformed_rate=1))
+        port = await server.start()
+        try:
+            llm = OpenAIProvider(
+                model="fake-chat",
+                api_key="fake",
+                base_url=f"http://127.0.0.1:{port}/v1",
+                response_cache=DiskLLMResponseCache(str(tmp_path)),
+                structured_output="off",
+            )
+            with pytest.raises(StructuredOutputError):
+                await llm.generate_structured(PROMPT, EpisodeOutput, max_attempts=2)
+
+            assert server.stats["chat"]["requests"] == 2
+            assert not list(tmp_path.rglob("*.json"))
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_redis_backend(self, monkeypatch):
+        fakeredis = pytest.importorskip("fakeredis")
+        monkeypatch.setenv("GLOBAL_REDIS_PREFIX", "tenant_a")
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        cache = RedisLLMResponseCache(
+            redis_provider=FakeRedisProvider(client),
+            ttl_seconds=120,
+            retry_window_seconds=0,
+        )
+        key = build_cache_key("http://llm", {"model": "m", "temperature": 0.3})
+
+        assert await cache.get(key) is None
+        await cache.set(key, "answer")
+
+        assert await cache.get(key) == "answer"
+        assert 0 < await client.ttl(f"tenant_a:llm_response_cache:{key}") <= 120
+        await cache.invalidate(key)
+        assert await cache.get(key) is None
+        assert cache.get_stats() == {
+            "hits": 1,
+            "misses": 2,
+            "retries": 0,
+            "stores": 1,
+            "invalidations": 1,
+            "errors": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_redis_retry_detection_is_shared_by_workers(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        worker_a, worker_b = (
+            RedisLLMResponseCache(
+                redis_provider=FakeRedisProvider(client), retry_window_seconds=60
+            )
+            for _ in range(2)
+        )
+        key = build_cache_key("http://llm", {"model": "m"})
+        await worker_a.set(key, "answer")
+
+        # A retry of the same request in another worker process is still a retry
+        assert await worker_b.get(key) is None
+        assert worker_b.get_stats()["retries"] == 1
+        assert await worker_b.get(key, detect_retry=False) == "answer"
@@ -0,0 +1,231 @@
+"""
+记忆写入队列测试
+
+验证 MEMORIZE_INGEST_MODE=queue 模式下的队列项序列化、分组键与排序键，
+以及消费者的失败重新入队、死信与分组锁（分区重平衡时同一分组不被两个消费者同时处理）。
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from biz_layer.memorize_queue import (
+    DEAD_LETTER_KEY_SUFFIX,
+    MemorizeQueueItem,
+    get_group_key,
+    is_queue_ingest_enabled,
+    memorize_queue_sort_key,
+    UNGROUPED_KEY_PREFIX,
+)
+from core.lock.redis_distributed_lock import RedisDistributedLockManager
+from core.longjob.interfaces import MessageBatch
+from core.queue.redis_group_queue.redis_msg_group_queue_manager import (
+    RedisGroupQueueManager,
+)
+from infra_layer.adapters.input.mq import memorize_queue_consumer
+from infra_layer.adapters.input.mq.memorize_queue_consumer import MemorizeQueueConsumer
+
+MESSAGE = {
+    "group_id": "group_123",
+    "message_id": "msg_001",
+    "create_time": "2025-01-15T10:00:00+08:00",
+    "sender": "user_001",
+    "content": "今天讨论一下新功能的技术方案",
+}
+
+
+class TestMemorizeQueue:
+    """记忆写入队列基础功能测试"""
+
+    def test_item_json_round_trip(self):
+        """测试JSON序列化往返"""
+        item = MemorizeQueueItem(group_key="group_123", message=MESSAGE)
+        restored = MemorizeQueueItem.from_json_str(item.to_json_str())
+        assert restored == item
+
+    def test_item_bson_round_trip(self):
+        """测试BSON序列化往返"""
+        item = MemorizeQueueItem(group_key="group_123", message=MESSAGE)
+        restored = MemorizeQueueItem.from_bson_bytes(item.to_bson_bytes())
+        assert restored == item
+
+    def test_invalid_json_raises_value_error(self):
+        """测试非法JSON抛出ValueError"""
+        with pytest.raises(ValueError):
+            MemorizeQueueItem.from_json_str('{"message": {}}')
+
+    def test_group_key(self):
+        """测试分组键：优先使用group_id，否则按发送者分组"""
+        assert get_group_key(MESSAGE) == "group_123"
+        private_message = {k: v for k, v in MESSAGE.items() if k != "group_id"}
+        assert get_group_key(private_message) == f"{UNGROUPED_KEY_PREFIX}:user_001"
+
+    def test_sort_key_follows_create_time(self):
+        """测试排序键按消息创建时间递增"""
+        earlier = MemorizeQueueItem(group_key="group_123", message=MESSAGE)
+        later = MemorizeQueueItem(
+            group_key="group_123",
+            message={**MESSAGE, "create_time": "2025-01-15T10:00:01+08:00"},
+        )
+        assert memorize_queue_sort_key(later) - memorize_queue_sort_key(earlier) == 1000
+
+    def test_ingest_mode_is_opt_in(self, monkeypatch):
+        """测试队列模式默认关闭"""
+        monkeypatch.delenv("MEMORIZE_INGEST_MODE", raising=False)
+        assert not is_queue_ingest_enabled()
+        monkeypatch.setenv("MEMORIZE_INGEST_MODE", "queue")
+        assert is_queue_ingest_enabled()
+
+
+class FakeRedisProvider:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+def make_message(index: int):
+    return {
+        **MESSAGE,
+        "message_id": f"msg_{index:03d}",
+        "create_time": f"2025-01-15T10:00:{index:02d}+08:00",
+    }
+
+
+async def make_consumer(client, processed, failures):
+    """基于 fakeredis 的消费者，_process_item 记录 message_id，按 failures 中的剩余次数失败"""
+    manager = RedisGroupQueueManager(
+        client,
+        key_prefix="memorize_test",
+        item_class=MemorizeQueueItem,
+        sort_key_func=memorize_queue_sort_key,
+        enable_metrics=False,
+    )
+    await manager.join_consumer()
+    consumer = MemorizeQueueConsumer()
+    consumer._queue_manager = manager
+    consumer._lock_manager = RedisDistributedLockManager(FakeRedisProvider(client))
+
+    async def process_item(item):
+        message_id = item.message["message_id"]
+        processed.append(message_id)
+        if failures.get(message_id, 0) > 0:
+            failures[message_id] -= 1
+            raise RuntimeError("transient error")
+
+    consumer._process_item = process_item
+    return consumer, manager
+
+
+async def deliver(manager, indexes):
+    for index in indexes:
+        item = MemorizeQueueItem(group_key="group_123", message=make_message(index))
+        assert await manager.deliver_message("group_123", item)
+
+
+async def fetch(manager):
+    return await manager.get_messages(
+        score_threshold=0, max_per_partition=10, max_total=200
+    )
+
+
+class TestMemorizeQueueConsumer:
+    """记忆写入队列消费者测试"""
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_requeued_at_head_of_group(self):
+        """测试失败消息与同批次中其后的消息一起回到分组队首，按顺序重试"""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        processed = []
+        consumer, manager = await make_consumer(client, processed, {"msg_001": 1})
+        await deliver(manager, range(3))
+
+        await consumer._handle_message(MessageBatch(data=await fetch(manager)))
+        assert processed == ["msg_000", "msg_001"]
+
+        retried = await fetch(manager)
+        assert [item.message["message_id"] for item in retried] == [
+            "msg_001",
+            "msg_002",
+        ]
+        assert [item.attempts for item in retried] == [1, 0]
+
+        await consumer._handle_message(MessageBatch(data=retried))
+        assert processed == ["msg_000", "msg_001", "msg_001", "msg_002"]
+        assert await fetch(manager) == []
+
+    @pytest.mark.asyncio
+    async def test_message_is_dead_lettered_after_max_attempts(self):
+        """测试超过最大尝试次数后消息进入死信列表，分组继续处理后续消息"""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        processed = []
+        consumer, manager = await make_consumer(client, processed, {"msg_000": 10})
+        consumer._max_attempts = 2
+        await deliver(manager, range(2))
+
+        while items := await fetch(manager):
+            await consumer._handle_message(MessageBatch(data=items))
+
+        assert processed == ["msg_000", "msg_000", "msg_001"]
+        [entry] = await client.lrange(
+            f"{manager.key_prefix}:{DEAD_LETTER_KEY_SUFFIX}", 0, -1
+        )
+        entry = json.loads(entry)
+        assert entry["item"]["message"]["message_id"] == "msg_000"
+        assert entry["item"]["attempts"] == 2
+        assert entry["error"] == "transient error"
+
+    @pytest.mark.asyncio
+    async def test_group_in_flight_elsewhere_is_requeued(self, monkeypatch):
+        """测试分组仍被其他消费者处理时（重平衡），本消费者不处理并将消息放回队列"""
+        fakeredis = pytest.importorskip("fakeredis")
+        monkeypatch.setattr(
+            memorize_queue_consumer, "MEMORIZE_QUEUE_GROUP_LOCK_WAIT_SECONDS", 0.05
+        )
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        processed = []
+        consumer, manager = await make_consumer(client, processed, {})
+        await deliver(manager, range(2))
+        held, release = asyncio.Event(), asyncio.Event()
+
+        async def previous_owner():
+            lock = consumer._lock_manager.get_lock(
+                f"{manager.key_prefix}:group:group_123"
+            )
+            async with lock.acquire() as acquired:
+                assert acquired
+                held.set()
+                await release.wait()
+
+        owner_task = asyncio.create_task(previous_owner())
+        await held.wait()
+        await consumer._handle_message(MessageBatch(data=await fetch(manager)))
+        assert processed == []
+
+        release.set()
+        await owner_task
+        items = await fetch(manager)
+        assert [item.message["message_id"] for item in items] == ["msg_000", "msg_001"]
+        await consumer._handle_message(MessageBatch(data=items))
+        assert processed == ["msg_000", "msg_001"]
+
+    @pytest.mark.asyncio
+    async def test_fetched_batch_reports_oldest_message_time(self):
+        """测试拉取的批次以最早消息的创建时间作为 enqueued_at，用于 lag_seconds 统计"""
+        consumer = MemorizeQueueConsumer()
+        consumer._pending = [
+            MemorizeQueueItem(group_key="group_123", message=make_message(index))
+            for index in (5, 2, 7)
+        ]
+
+        batch = await consumer._fetch_message()
+
+        assert len(batch.data) == 3
+        assert (
+            batch.metadata["enqueued_at"]
+            == memorize_queue_sort_key(batch.data[1]) / 1000
+        )
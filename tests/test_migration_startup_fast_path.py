@@ -0,0 +1,125 @@
+"""
+MongoDB 启动迁移快速路径测试
+
+验证已是最新时不启动 Beanie 子进程，有待执行迁移时只有持有租约的实例执行，
+其他实例等待到 migrations_log 到达最新后直接返回。
+"""
+
+import pytest
+
+from core.oxm.mongo.migration.manager import MigrationManager
+
+
+class FakeMigrationState:
+    """内存中的 migrations_log 与启动租约"""
+
+    def __init__(self, applied, lease_owner=None):
+        self.applied = list(applied)
+        self.lease_owner = lease_owner
+        self.released = []
+        self.migrate_calls = 0
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    def factory(files, state: FakeMigrationState, on_wait=None):
+        for name in files:
+            (tmp_path / name).write_text("class Forward:\n    pass\n")
+        (tmp_path / "__init__.py").write_text("")
+        manager = MigrationManager(
+            uri="mongodb://localhost:27017/test",
+            database="test",
+            migrations_path=tmp_path,
+        )
+
+        def snapshot():
+            current = state.applied[-1] if state.applied else None
+            return set(state.applied), current
+
+        def acquire(owner, ttl):
+            if state.lease_owner in (None, owner):
+                state.lease_owner = owner
+                return True
+            if on_wait:
+                on_wait(state)
+            return False
+
+        def release(owner):
+            state.released.append(owner)
+            if state.lease_owner == owner:
+                state.lease_owner = None
+
+        def run_migration():
+            state.migrate_calls += 1
+            state.applied = sorted(files)
+            return 0
+
+        monkeypatch.setattr(manager, "_snapshot_migration_log", snapshot)
+        monkeypatch.setattr(manager, "_acquire_migration_lease", acquire)
+        monkeypatch.setattr(manager, "_release_migration_lease", release)
+        monkeypatch.setattr(manager, "run_migration", run_migration)
+        monkeypatch.setattr(MigrationManager, "LEASE_POLL_INTERVAL", 0)
+        return manager
+
+    return factory
+
+
+class TestPendingMigrations:
+    """待执行迁移计算"""
+
+    def test_after_current_pointer(self, make_manager):
+        files = ["20250101_a.py", "20250201_b.py", "20250301_c.py"]
+        manager = make_manager(files, FakeMigrationState(["20250101_a.py"]))
+        assert manager.get_pending_migrations() == ["20250201_b.py", "20250301_c.py"]
+
+    def test_first_migration(self, make_manager):
+        manager = make_manager(["20250101_a.py"], FakeMigrationState([]))
+        assert manager.get_pending_migrations() == ["20250101_a.py"]
+
+    def test_no_files(self, make_manager):
+        manager = make_manager([], FakeMigrationState([]))
+        assert manager.get_pending_migrations() == []
+
+
+class TestRunPendingMigrations:
+    """启动迁移"""
+
+    def test_up_to_date_skips_beanie_and_lease(self, make_manager):
+        files = ["20250101_a.py", "20250201_b.py"]
+        state = FakeMigrationState(files)
+        manager = make_manager(files, state)
+
+        assert manager.run_pending_migrations() == 0
+        assert state.migrate_calls == 0
+        assert state.released == []
+
+    def test_pending_runs_under_lease(self, make_manager):
+        files = ["20250101_a.py", "20250201_b.py"]
+        state = FakeMigrationState(files[:1])
+        manager = make_manager(files, state)
+
+        assert manager.run_pending_migrations(lease_ttl=30) == 0
+        assert state.migrate_calls == 1
+        assert state.lease_owner is None
+        assert len(state.released) == 1
+
+    def test_waiter_returns_when_other_instance_finishes(self, make_manager):
+        files = ["20250101_a.py", "20250201_b.py"]
+
+        def other_instance_migrates(state):
+            state.applied = list(files)
+
+        state = FakeMigrationState(files[:1], lease_owner="other-host:1")
+        manager = make_manager(files, state, on_wait=other_instance_migrates)
+
+        assert manager.run_pending_migrations(lease_wait=5) == 0
+        assert state.migrate_calls == 0
+        assert state.lease_owner == "other-host:1"
+
+    def test_waiter_times_out(self, make_manager):
+        files = ["20250101_a.py"]
+        state = FakeMigrationState([], lease_owner="other-host:1")
+        manager = make_manager(files, state)
+
+        assert manager.run_pending_migrations(lease_wait=1) == 1
+        assert state.migrate_calls == 0
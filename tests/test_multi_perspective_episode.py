@@ -0,0 +1,244 @@
+"""
+多视角情景记忆合并抽取测试
+
+验证 MemoryManager.extract_multi_perspective_episodes：一次 LLM 调用同时返回群组与各参与者视角，
+结果按参与者列表校验（丢弃未知 user_id），缺失的参与者单独抽取，解析失败时回退为逐个调用，
+以及大群组的向量化分块并发请求。
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_layer.vectorize_service import VectorizeConfig, VectorizeService
+from api_specs.memory_types import MemCell, RawDataType
+from common_utils.datetime_utils import timezone
+from memory_layer.memory_extractor import episode_memory_extractor
+from memory_layer.memory_extractor.episode_memory_extractor import (
+    EpisodeMemoryExtractor,
+)
+from memory_layer.llm.structured_output import parse_structured_output
+from memory_layer.memory_manager import MemoryManager
+
+
+def episode(title):
+    return {
+        "title": title,
+        "summary": f"{title} summary",
+        "content": f"{title} content",
+    }
+
+
+class ScriptedLLMProvider:
+    """合并提示词返回给定响应，单独调用返回固定结果"""
+
+    def __init__(self, combined_response):
+        self.combined_response = combined_response
+        self.prompts = []
+
+    async def generate(self, prompt, temperature=None, **kwargs):
+        self.prompts.append(prompt)
+        if '"participants": [' in prompt:
+            return self.combined_response
+        return json.dumps(episode("single"))
+
+    async def generate_structured(self, prompt, output_model, **kwargs):
+        return parse_structured_output(await self.generate(prompt), output_model)
+
+
+class FakeVectorizeService:
+    def __init__(self):
+        self.calls = []
+
+    async def get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    async def get_embedding(self, text):
+        self.calls.append([text])
+        return [float(len(text))]
+
+    def get_model_name(self):
+        return "fake-embedding"
+
+
+class FakeEmbeddingsClient:
+    """记录最大并发请求数的假 OpenAI embeddings 客户端"""
+
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.embeddings = self
+
+    async def create(self, model, input, encoding_format, **kwargs):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text))]) for text in input],
+            usage=None,
+        )
+
+
+def make_memcell(user_ids=("u1", "u2", "u3")):
+    return MemCell(
+        event_id="mc_1",
+        user_id_list=list(user_ids),
+        original_data=[
+            {
+                "speaker_id": "u1",
+                "speaker_name": "Alice",
+                "content": "Shall we ship on Friday?",
+                "timestamp": "2025-09-01T09:00:00",
+            },
+            {
+                "speaker_id": "u2",
+                "speaker_name": "Bob",
+                "content": "Yes, I will prepare the notes.",
+                "timestamp": "2025-09-01T09:01:00",
+            },
+            {
+                "speaker_id": "u3",
+                "speaker_name": "Carol",
+                "content": "OK",
+                "timestamp": "2025-09-01T09:02:00",
+            },
+        ],
+        timestamp=datetime(2025, 9, 1, 9, 0, tzinfo=timezone),
+        summary="release planning",
+        group_id="g1",
+        participants=list(user_ids),
+        type=RawDataType.CONVERSATION,
+    )
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    service = FakeVectorizeService()
+    monkeypatch.setattr(
+        episode_memory_extractor, "get_vectorize_service", lambda: service
+    )
+
+    def factory(combined_response):
+        provider = ScriptedLLMProvider(combined_response)
+        manager = MemoryManager.__new__(MemoryManager)
+        manager.llm_provider = provider
+        manager._episode_extractor = EpisodeMemoryExtractor(provider)
+        return manager, provider, service
+
+    return factory
+
+
+async def extract(manager):
+    return await manager.extract_multi_perspective_episodes(
+        memcell=make_memcell(), user_ids=["u1", "u2", "u3"], group_id="g1"
+    )
+
+
+class TestMultiPerspectiveEpisode:
+    """合并抽取与回退"""
+
+    @pytest.mark.asyncio
+    async def test_single_call_returns_all_perspectives(self, make_manager):
+        response = {
+            "group": episode("group"),
+            "participants": [
+                {"user_id": uid, **episode(f"personal {uid}")}
+                for uid in ("u3", "u1", "u2")
+            ],
+        }
+        manager, provider, service = make_manager(
+            f"```json\n{json.dumps(response)}\n```"
+        )
+
+        group, *personal = await extract(manager)
+
+        assert len(provider.prompts) == 1
+        assert "- u1: Alice" in provider.prompts[0]
+        assert group.user_id is None and group.subject == "group"
+        assert [m.user_id for m in personal] == ["u1", "u2", "u3"]
+        assert [m.subject for m in personal] == [
+            "personal u1",
+            "personal u2",
+            "personal u3",
+        ]
+        assert personal[1].user_name == "Bob"
+        assert all(m.extend["vector_model"] == "fake-embedding" for m in personal)
+        # One embedding batch for the four episodes
+        assert [len(call) for call in service.calls] == [4]
+
+    @pytest.mark.asyncio
+    async def test_missing_and_unknown_users_are_validated(self, make_manager):
+        response = {
+            "group": episode("group"),
+            "participants": [
+                {"user_id": "u1", **episode("personal u1")},
+                {"user_id": "intruder", **episode("personal intruder")},
+                {"user_id": "u2", "title": "no content"},
+            ],
+        }
+        manager, provider, _ = make_manager(json.dumps(response))
+
+        group, *personal = await extract(manager)
+
+        # Combined call + separate calls for u2 and u3
+        assert len(provider.prompts) == 3
+        assert group.subject == "group"
+        assert [m.user_id for m in personal] == ["u1", "u2", "u3"]
+        assert [m.subject for m in personal] == ["personal u1", "single", "single"]
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_falls_back_to_per_user_calls(self, make_manager):
+        manager, provider, _ = make_manager("not json at all")
+
+        group, *personal = await extract(manager)
+
+        assert len(provider.prompts) == 5
+        assert group.user_id is None and group.subject == "single"
+        assert [m.user_id for m in personal] == ["u1", "u2", "u3"]
+        assert all(m.subject == "single" for m in personal)
+
+    @pytest.mark.asyncio
+    async def test_large_group_embeds_chunks_concurrently(self, monkeypatch):
+        user_ids = [f"u{i}" for i in range(1, 13)]
+        response = {
+            "group": episode("group"),
+            "participants": [
+                {"user_id": uid, **episode(f"personal {uid}")} for uid in user_ids
+            ],
+        }
+        service = VectorizeService(
+            VectorizeConfig(
+                model="fake-embedding",
+                base_url="http://127.0.0.1",
+                batch_size=4,
+                max_concurrent_requests=4,
+                dimensions=0,
+            )
+        )
+        service.client = FakeEmbeddingsClient()
+        monkeypatch.setattr(
+            episode_memory_extractor, "get_vectorize_service", lambda: service
+        )
+        provider = ScriptedLLMProvider(json.dumps(response))
+        manager = MemoryManager.__new__(MemoryManager)
+        manager.llm_provider = provider
+        manager._episode_extractor = EpisodeMemoryExtractor(provider)
+
+        group, *personal = await manager.extract_multi_perspective_episodes(
+            memcell=make_memcell(user_ids), user_ids=user_ids, group_id="g1"
+        )
+
+        assert [m.user_id for m in personal] == user_ids
+        assert all(m.extend["vector_model"] == "fake-embedding" for m in personal)
+        # 13 texts in chunks of 4, all sent at once
+        assert service.client.requests == 4
+        assert service.client.max_in_flight == 4
@@ -0,0 +1,126 @@
+"""
+Pre-fork 多进程服务测试
+
+在子进程中启动 PreforkServer，验证多个 worker 共享同一监听端口、父进程预加载的状态被
+worker 继承、崩溃的 worker 会被重启，以及 SIGTERM 能优雅停止全部 worker。
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+SERVER_SCRIPT = '''
+import os, sys
+from core.server.prefork import PreforkServer
+
+# Built before fork: workers must see the same object id (copy-on-write)
+PRELOADED = {"parent_pid": os.getpid(), "payload": list(range(1000))}
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    body = ("{\\"pid\\": %d, \\"parent_pid\\": %d, \\"preloaded_id\\": %d}" % (
+        os.getpid(), PRELOADED["parent_pid"], id(PRELOADED))).encode()
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"connection", b"close")]})
+    await send({"type": "http.response.body", "body": body})
+
+PreforkServer.MIN_WORKER_UPTIME = 0
+PreforkServer(app, "127.0.0.1", int(sys.argv[1]), workers=2, graceful_timeout=5,
+              uvicorn_kwargs={"log_level": "warning"}).run()
+'''
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="pre-fork server requires os.fork"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def fetch(port: int) -> dict:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def wait_for_pids(port: int, count: int, timeout: float = 20.0) -> dict:
+    """请求直到见到 count 个不同的 worker pid"""
+    deadline = time.monotonic() + timeout
+    seen = {}
+    while time.monotonic() < deadline:
+        try:
+            result = fetch(port)
+            seen[result["pid"]] = result
+        except OSError:
+            time.sleep(0.1)
+            continue
+        if len(seen) >= count:
+            return seen
+    raise AssertionError(f"saw workers {sorted(seen)}, expected {count}")
+
+
+@pytest.fixture
+def prefork_server():
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER_SCRIPT, str(port)],
+        env=dict(os.environ, PYTHONPATH=str(SRC_DIR)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    yield process, port
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+
+
+class TestPreforkServer:
+    """PreforkServer"""
+
+    def test_workers_share_socket_and_preloaded_state(self, prefork_server):
+        process, port = prefork_server
+        workers = wait_for_pids(port, 2)
+
+        assert process.pid not in workers
+        assert {w["parent_pid"] for w in workers.values()} == {process.pid}
+        assert len({w["preloaded_id"] for w in workers.values()}) == 1
+
+    def test_restarts_crashed_worker_and_stops_gracefully(self, prefork_server):
+        process, port = prefork_server
+        workers = wait_for_pids(port, 2)
+
+        killed = next(iter(workers))
+        os.kill(killed, signal.SIGKILL)
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline:
+            pids = set(wait_for_pids(port, 2))
+            if killed not in pids:
+                break
+        assert killed not in pids
+        assert len(pids) == 2
+
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=15) == 0
+        for pid in pids:
+            with pytest.raises(ProcessLookupError):
+                os.kill(pid, 0)
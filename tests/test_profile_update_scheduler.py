@@ -0,0 +1,148 @@
+"""
+画像更新调度器测试
+
+验证 ProfileUpdateScheduler 按群组在防抖窗口内合并 memcell、最长等待时间上限、
+同一群组抽取串行执行时新到达的 memcell 合并为下一批，以及关闭时 flush_all 处理剩余批次。
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from api_specs.memory_types import MemCell
+from biz_layer import profile_update_scheduler
+from biz_layer.profile_update_scheduler import ProfileUpdateScheduler
+from common_utils.datetime_utils import timezone
+
+BASE_TIME = datetime(2025, 9, 1, 9, 0, tzinfo=timezone)
+
+
+class FakeProfileStorage:
+    def __init__(self):
+        self.loads = []
+        self.saves = []
+
+    async def get_all_profiles(self, group_id="default"):
+        self.loads.append(group_id)
+        return {}
+
+    async def save_profiles(self, profiles, metadata=None):
+        self.saves.append((dict(profiles), metadata))
+        return len(profiles)
+
+
+class FakeProfileManager:
+    """记录每批 memcell 的画像抽取"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = None
+
+    async def extract_profiles(self, memcells, old_profiles, user_id_list, group_id):
+        self.batches.append([m.event_id for m in memcells])
+        if self.release is not None:
+            await self.release.wait()
+        return [{"user_id": user_id} for user_id in user_id_list]
+
+
+def make_memcell(index, participants=("u1", "robot_1")):
+    return MemCell(
+        event_id=f"mc_{index}",
+        user_id_list=list(participants),
+        original_data=[{"speaker_id": participants[0], "content": "hi"}],
+        timestamp=BASE_TIME + timedelta(minutes=index),
+        summary=f"memcell {index}",
+        group_id="g1",
+        participants=list(participants),
+    )
+
+
+@pytest.fixture
+def make_scheduler(monkeypatch):
+    storage = FakeProfileStorage()
+    manager = FakeProfileManager()
+    monkeypatch.setattr(profile_update_scheduler, "get_bean_by_type", lambda _: storage)
+
+    def factory(debounce, max_wait=60):
+        monkeypatch.setenv("PROFILE_UPDATE_DEBOUNCE_SECONDS", str(debounce))
+        monkeypatch.setenv("PROFILE_UPDATE_MAX_WAIT_SECONDS", str(max_wait))
+        scheduler = ProfileUpdateScheduler()
+        monkeypatch.setattr(
+            scheduler, "_get_profile_manager", lambda scenario, config: manager
+        )
+        return scheduler, manager, storage
+
+    return factory
+
+
+async def schedule(scheduler, index, group_id="g1", **kwargs):
+    await scheduler.schedule(
+        group_id=group_id,
+        cluster_id=f"cluster_{index % 2}",
+        memcell=make_memcell(index, **kwargs),
+        memcell_count=index + 1,
+    )
+
+
+class TestProfileUpdateScheduler:
+    """防抖与合并"""
+
+    @pytest.mark.asyncio
+    async def test_debounce_window_coalesces_group_memcells(self, make_scheduler):
+        scheduler, manager, storage = make_scheduler(debounce=0.05)
+        await schedule(scheduler, 0)
+        await schedule(scheduler, 1, participants=("u2",))
+        await schedule(scheduler, 2)
+        await schedule(scheduler, 3, group_id="g2")
+        assert manager.batches == []
+
+        await asyncio.sleep(0.15)
+
+        assert sorted(manager.batches) == [["mc_0", "mc_1", "mc_2"], ["mc_3"]]
+        assert sorted(storage.loads) == ["g1", "g2"]
+        profiles, metadata = next(s for s in storage.saves if s[1]["group_id"] == "g1")
+        assert list(profiles) == ["u1", "u2"]
+        assert metadata["cluster_ids"] == ["cluster_0", "cluster_1"]
+        assert metadata["memcell_count"] == 3
+        assert scheduler.get_stats()["pending_groups"] == 0
+
+    @pytest.mark.asyncio
+    async def test_max_wait_bounds_continuous_traffic(self, make_scheduler):
+        scheduler, manager, _ = make_scheduler(debounce=0.05, max_wait=0.08)
+        for index in range(6):
+            await schedule(scheduler, index)
+            await asyncio.sleep(0.03)
+        await asyncio.sleep(0.1)
+
+        assert len(manager.batches) >= 2
+        assert sum(manager.batches, []) == [f"mc_{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_memcells_arriving_during_extraction_form_next_batch(
+        self, make_scheduler
+    ):
+        scheduler, manager, _ = make_scheduler(debounce=0)
+        manager.release = asyncio.Event()
+        first = asyncio.create_task(schedule(scheduler, 0))
+        await asyncio.sleep(0.01)
+        others = [asyncio.create_task(schedule(scheduler, i)) for i in (1, 2)]
+        await asyncio.sleep(0.01)
+
+        manager.release.set()
+        await asyncio.gather(first, *others)
+
+        assert manager.batches == [["mc_0"], ["mc_1", "mc_2"]]
+        assert scheduler._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_all_extracts_pending_batches(self, make_scheduler):
+        scheduler, manager, storage = make_scheduler(debounce=30)
+        await schedule(scheduler, 0)
+        await schedule(scheduler, 1, group_id="g2")
+
+        await scheduler.flush_all()
+
+        assert sorted(manager.batches) == [["mc_0"], ["mc_1"]]
+        assert len(storage.saves) == 2
+        assert scheduler.get_stats()["extractions"] == 2
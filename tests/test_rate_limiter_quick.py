@@ -8,7 +8,7 @@ import asyncio
 import time
 import pytest
 
-from core.rate_limit.rate_limiter import rate_limit
+from core.rate_limit.rate_limiter import RedisRateLimiter, rate_limit
 
 
 class TestRateLimiterQuick:
@@ -383,6 +383,106 @@ class TestRateLimiterQuick:
         )
 
 
+class StaticRedisProvider:
+    """测试用Redis提供者，直接返回给定客户端"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+async def connect_local_redis() -> StaticRedisProvider:
+    """连接本地Redis（REDIS_HOST/REDIS_PORT），不可用时跳过分布式限流测试"""
+    import os
+    import redis.asyncio as redis_asyncio
+
+    client = redis_asyncio.Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        db=int(os.getenv("REDIS_DB", "0")),
+    )
+    try:
+        await client.ping()
+    except (redis_asyncio.RedisError, OSError):
+        pytest.skip("Redis not available")
+    return StaticRedisProvider(client)
+
+
+class TestDistributedRateLimiter:
+    """基于Redis GCRA的分布式限流测试"""
+
+    @pytest.mark.asyncio
+    async def test_limit_is_shared_across_processes(self):
+        """测试多个限流器实例（模拟多个进程）共享同一个全局限额"""
+        redis_provider = await connect_local_redis()
+        key = f"test_distributed_shared_{time.time_ns()}"
+        limiters = [
+            RedisRateLimiter(key, 20, 1, prefetch=5, redis_provider=redis_provider)
+            for _ in range(2)
+        ]
+
+        async def call(limiter):
+            async with limiter:
+                return time.time()
+
+        start_time = time.time()
+        await asyncio.gather(
+            *(call(limiter) for limiter in limiters for _ in range(15))
+        )
+        total_time = time.time() - start_time
+
+        # 全局每秒20次：突发20次后，剩余10次需要约0.5秒；按进程限流则几乎不等待
+        assert total_time >= 0.4, f"全局限流等待时间不足: {total_time}秒"
+        assert total_time < 1.5, f"全局限流等待时间过长: {total_time}秒"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reduces_round_trips(self):
+        """测试本地预取令牌，热路径无需每次访问Redis"""
+        redis_provider = await connect_local_redis()
+        key = f"test_distributed_prefetch_{time.time_ns()}"
+        limiter = RedisRateLimiter(
+            key, 1000, 1, prefetch=50, redis_provider=redis_provider
+        )
+        fetch_count = 0
+        fetch_tokens = limiter._fetch_tokens
+
+        async def counting_fetch():
+            nonlocal fetch_count
+            fetch_count += 1
+            return await fetch_tokens()
+
+        limiter._fetch_tokens = counting_fetch
+
+        for _ in range(100):
+            await limiter.acquire()
+
+        assert fetch_count <= 4, f"Redis往返次数过多: {fetch_count}"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_limit_when_redis_unavailable(self):
+        """测试Redis不可用时退化为进程内限流，而不是让调用失败"""
+        import redis
+
+        class BrokenRedisProvider:
+            async def get_client(self):
+                raise redis.ConnectionError("连接失败")
+
+        limiter = RedisRateLimiter(
+            "test_distributed_broken", 2, 1, redis_provider=BrokenRedisProvider()
+        )
+
+        start_time = time.time()
+        for _ in range(3):
+            async with limiter:
+                pass
+        total_time = time.time() - start_time
+
+        # 退化后的本地限流仍然生效
+        assert total_time >= 0.4, f"本地限流等待时间不足: {total_time}秒"
+
+
 if __name__ == "__main__":
     # 直接运行快速测试
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,179 @@
+"""
+循环消费者基类测试
+
+验证事件驱动唤醒、并发在途处理、按序确认、吞吐/延迟统计以及吞吐窗口不会无限增长。
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from core.longjob.interfaces import ConsumerConfig, MessageBatch, RetryConfig
+from core.longjob.recycle_consumer_base import RecycleConsumerBase
+
+
+class InMemoryConsumer(RecycleConsumerBase):
+    """基于内存队列的测试消费者，投递消息时调用notify()唤醒"""
+
+    def __init__(self, consumer_config: ConsumerConfig, handle_delay=None):
+        super().__init__(job_id="test_consumer", consumer_config=consumer_config)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.handle_delay = handle_delay or (lambda data: 0)
+        self.handled = []
+        self.acked = []
+        self.has_messages_calls = 0
+
+    def put(self, data, enqueued_at=None):
+        self.queue.put_nowait((data, enqueued_at))
+        self.notify()
+
+    async def _initialize(self) -> None:
+        pass
+
+    async def _cleanup(self) -> None:
+        pass
+
+    async def _has_messages(self) -> bool:
+        self.has_messages_calls += 1
+        return not self.queue.empty()
+
+    async def _fetch_message(self):
+        data, enqueued_at = self.queue.get_nowait()
+        metadata = {"enqueued_at": enqueued_at} if enqueued_at else {}
+        return MessageBatch(data=[data], batch_id=str(data), metadata=metadata)
+
+    async def _handle_message(self, message_batch: MessageBatch) -> None:
+        data = message_batch.data[0]
+        await asyncio.sleep(self.handle_delay(data))
+        if data == "fail":
+            raise ValueError("处理失败")
+        self.handled.append(data)
+
+    async def _ack_message(self, message_batch: MessageBatch, success: bool) -> None:
+        self.acked.append((message_batch.data[0], success))
+
+
+async def wait_until(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "等待超时"
+        await asyncio.sleep(0.01)
+
+
+class TestRecycleConsumerBase:
+    """循环消费者基类测试"""
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_idle_consumer(self):
+        """测试空闲消费者在notify后立即处理，而不是等到idle_wait_timeout"""
+        consumer = InMemoryConsumer(ConsumerConfig(idle_wait_timeout=5.0))
+        await consumer.start()
+        try:
+            await asyncio.sleep(0.2)
+            # 空闲期间不应反复轮询
+            assert consumer.has_messages_calls <= 2
+
+            start = time.monotonic()
+            consumer.put("m1")
+            await wait_until(lambda: consumer.handled == ["m1"])
+            assert time.monotonic() - start < 1.0
+        finally:
+            await consumer.shutdown(timeout=2.0)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_wakes_idle_consumer(self):
+        """测试关闭时立即唤醒空闲消费者"""
+        consumer = InMemoryConsumer(ConsumerConfig(idle_wait_timeout=30.0))
+        await consumer.start()
+        await asyncio.sleep(0.1)
+
+        start = time.monotonic()
+        await consumer.shutdown(timeout=5.0)
+        assert time.monotonic() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_concurrency_with_ordered_ack(self):
+        """测试并发在途处理，乱序完成但按获取顺序确认"""
+        consumer = InMemoryConsumer(
+            ConsumerConfig(max_in_flight=4, idle_wait_timeout=1.0),
+            handle_delay=lambda data: random.uniform(0.01, 0.1),
+        )
+        messages = [f"m{i}" for i in range(20)]
+        for message in messages:
+            consumer.put(message)
+
+        start = time.monotonic()
+        await consumer.start()
+        try:
+            await wait_until(lambda: len(consumer.acked) == len(messages))
+        finally:
+            await consumer.shutdown(timeout=2.0)
+
+        # 串行处理至少需要1秒，4路并发应明显更快
+        assert time.monotonic() - start < 1.0
+        assert sorted(consumer.handled) == sorted(messages)
+        assert [data for data, _ in consumer.acked] == messages
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_acked_in_order(self):
+        """测试失败的消息批次按序确认为失败，不阻塞后续确认"""
+        consumer = InMemoryConsumer(
+            ConsumerConfig(
+                max_in_flight=2,
+                idle_wait_timeout=1.0,
+                retry_config=RetryConfig(max_retries=0),
+            ),
+            handle_delay=lambda data: 0.1 if data == "fail" else 0,
+        )
+        for message in ["fail", "m1", "m2"]:
+            consumer.put(message)
+
+        await consumer.start()
+        try:
+            await wait_until(lambda: len(consumer.acked) == 3)
+        finally:
+            await consumer.shutdown(timeout=2.0)
+
+        assert consumer.acked == [("fail", False), ("m1", True), ("m2", True)]
+        assert consumer.get_stats()["total_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_report_throughput_and_lag(self):
+        """测试统计信息包含吞吐量、延迟与在途数量"""
+        consumer = InMemoryConsumer(ConsumerConfig(max_in_flight=2))
+        await consumer.start()
+        try:
+            for i in range(5):
+                consumer.put(f"m{i}", enqueued_at=time.time() - 2.0)
+            await wait_until(lambda: len(consumer.acked) == 5)
+            stats = consumer.get_stats()
+        finally:
+            await consumer.shutdown(timeout=2.0)
+
+        assert stats["total_processed"] == 5
+        assert stats["total_acked"] == 5
+        assert stats["throughput_per_second"] > 0
+        assert stats["lag_seconds"] >= 2.0
+        assert stats["max_in_flight"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["pending_ack"] == 0
+
+    @pytest.mark.asyncio
+    async def test_completions_are_pruned_without_reading_stats(self):
+        """测试未读取统计信息时，吞吐窗口外的完成记录也会被清理"""
+        consumer = InMemoryConsumer(ConsumerConfig())
+        consumer.THROUGHPUT_WINDOW_SECONDS = 0.05
+        await consumer.start()
+        try:
+            for i in range(5):
+                consumer.put(f"m{i}")
+            await wait_until(lambda: len(consumer.acked) == 5)
+            await asyncio.sleep(0.1)
+            consumer.put("last")
+            await wait_until(lambda: len(consumer.acked) == 6)
+        finally:
+            await consumer.shutdown(timeout=2.0)
+
+        assert len(consumer._recent_completions) == 1
@@ -7,10 +7,25 @@ Redis分布式锁测试
 3. 超时机制
 4. 并发竞争
 5. 装饰器使用
+6. 释放通知唤醒等待者（交接延迟基准）
+7. 租约看门狗续期
+8. 等待者数量超过连接池大小
 """
 
 import asyncio
-from core.lock.redis_distributed_lock import with_distributed_lock, distributed_lock
+import os
+import statistics
+import time
+from unittest import mock
+
+import redis
+
+from component.redis_provider import RedisProvider
+from core.lock.redis_distributed_lock import (
+    RedisDistributedLockManager,
+    with_distributed_lock,
+    distributed_lock,
+)
 
 
 async def test_basic_lock_operations(redis_distributed_lock_manager):
@@ -279,6 +294,170 @@ async def test_blocking_timeout_and_reentry(redis_distributed_lock_manager):
     await final
 
 
+async def test_release_notification_wakes_waiter(redis_distributed_lock_manager):
+    """测试释放锁后等待者被通知立即唤醒，而不是等到重试间隔"""
+    resource = "test_release_notification"
+    holder_ready = asyncio.Event()
+    released_at = {}
+
+    async def holder():
+        lock = redis_distributed_lock_manager.get_lock(resource)
+        async with lock.acquire() as acquired:
+            assert acquired, "持有者应该成功获取锁"
+            holder_ready.set()
+            await asyncio.sleep(0.5)
+        released_at["time"] = time.monotonic()
+
+    async def waiter():
+        await holder_ready.wait()
+        lock = redis_distributed_lock_manager.get_lock(resource)
+        async with lock.acquire(blocking_timeout=5) as acquired:
+            assert acquired, "等待者应该在锁释放后获取到锁"
+            return time.monotonic()
+
+    _, acquired_at = await asyncio.gather(holder(), waiter())
+
+    handoff = acquired_at - released_at["time"]
+    # 轮询模式下最长需要等待一个重试间隔（3秒）
+    assert handoff < 0.5, f"锁交接延迟过高: {handoff:.3f}s"
+
+
+async def test_lock_handoff_latency_benchmark(
+    redis_distributed_lock_manager, workers: int = 8, rounds: int = 20
+):
+    """基准测试：多个协程竞争同一把锁时的交接延迟（释放到下一个持有者获取）"""
+    resource = "test_handoff_benchmark"
+    handoffs = []
+    last_release = {}
+
+    async def worker():
+        lock = redis_distributed_lock_manager.get_lock(resource)
+        for _ in range(rounds):
+            async with lock.acquire(blocking_timeout=30) as acquired:
+                assert acquired, "竞争者应该最终获取到锁"
+                if "time" in last_release:
+                    handoffs.append(time.monotonic() - last_release.pop("time"))
+                await asyncio.sleep(0.005)  # 模拟临界区工作负载
+                last_release["time"] = time.monotonic()
+
+    start = time.monotonic()
+    await asyncio.gather(*(asyncio.create_task(worker()) for _ in range(workers)))
+    elapsed = time.monotonic() - start
+
+    handoffs.sort()
+    p50 = statistics.median(handoffs) * 1000
+    p99 = handoffs[int(len(handoffs) * 0.99) - 1] * 1000
+    print(
+        f"锁交接延迟: workers={workers}, acquisitions={workers * rounds}, "
+        f"p50={p50:.2f}ms, p99={p99:.2f}ms, max={handoffs[-1] * 1000:.2f}ms, "
+        f"throughput={workers * rounds / elapsed:.1f}/s"
+    )
+    assert p50 < 100, f"锁交接延迟中位数过高: {p50:.2f}ms"
+
+
+async def test_lock_watchdog_extends_lease(redis_distributed_lock_manager):
+    """测试看门狗在持有期间续期，释放后停止续期"""
+    resource = "test_watchdog"
+    lock = redis_distributed_lock_manager.get_lock(resource)
+
+    async with lock.acquire(timeout=1, watchdog=True) as acquired:
+        assert acquired, "应该成功获取锁"
+        # 超过锁超时时间，看门狗应保持锁不过期
+        await asyncio.sleep(2.5)
+        assert await lock.is_owned_by_current_coroutine(), "看门狗应该续期锁"
+
+        # 重入不应启动新的看门狗
+        async with lock.acquire(timeout=1, watchdog=True) as reacquired:
+            assert reacquired, "应该支持可重入"
+            assert len(redis_distributed_lock_manager._watchdogs) == 1
+
+    await asyncio.sleep(0)
+    assert not await lock.is_locked(), "锁应该已被释放"
+    assert not redis_distributed_lock_manager._watchdogs, "释放后看门狗应该停止"
+
+
+async def test_lock_watchdog_stops_when_owner_cancelled(redis_distributed_lock_manager):
+    """测试持有者任务被取消后看门狗停止，锁被释放"""
+    resource = "test_watchdog_cancel"
+    holder_ready = asyncio.Event()
+
+    async def holder():
+        async with distributed_lock(resource, timeout=1, watchdog=True) as acquired:
+            assert acquired, "应该成功获取锁"
+            holder_ready.set()
+            await asyncio.sleep(30)
+
+    task = asyncio.create_task(holder())
+    await holder_ready.wait()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert not redis_distributed_lock_manager._watchdogs, "取消后看门狗应该停止"
+    lock = redis_distributed_lock_manager.get_lock(resource)
+    async with lock.acquire(blocking_timeout=0.5) as acquired:
+        assert acquired, "持有者取消后其他协程应该能获取锁"
+
+
+async def test_lock_watchdog_stops_when_release_fails(_redis_distributed_lock_manager):
+    """测试释放锁时 Redis 报错，看门狗仍停止续期，锁随租约过期"""
+    resource = "test_watchdog_release_error"
+    provider = RedisProvider()
+    manager = RedisDistributedLockManager(provider)
+    lock = manager.get_lock(resource)
+
+    async def failing_release(*args, **kwargs):
+        raise redis.ConnectionError("Too many connections")
+
+    try:
+        async with lock.acquire(timeout=1, watchdog=True) as acquired:
+            assert acquired, "应该成功获取锁"
+            assert len(manager._watchdogs) == 1
+            manager._lua_release = failing_release
+
+        await asyncio.sleep(0)
+        assert not manager._watchdogs, "释放失败后看门狗应该停止"
+        await asyncio.sleep(1.2)
+        assert not await manager.is_locked(resource), "锁应该随租约过期"
+    finally:
+        await provider.close()
+
+
+async def test_waiters_beyond_pool_size(_redis_distributed_lock_manager):
+    """测试等待者多于连接池连接数时不会耗尽连接池，持有者仍能访问 Redis 并释放锁"""
+    resource = "test_waiters_beyond_pool"
+    provider = RedisProvider()
+    provider.max_connections = 4
+    with mock.patch.dict(os.environ, {"DISTRIBUTED_LOCK_MAX_BLOCKING_WAITERS": "2"}):
+        manager = RedisDistributedLockManager(provider)
+    holder_ready = asyncio.Event()
+    acquired_by = []
+
+    async def holder():
+        lock = manager.get_lock(resource)
+        async with lock.acquire() as acquired:
+            assert acquired, "持有者应该成功获取锁"
+            holder_ready.set()
+            await asyncio.sleep(0.5)
+            # 等待者阻塞期间，其他 Redis 调用仍能拿到连接
+            assert await lock.is_owned_by_current_coroutine(), "持有者应该仍持有锁"
+
+    async def waiter(waiter_id: int):
+        await holder_ready.wait()
+        lock = manager.get_lock(resource)
+        async with lock.acquire(blocking_timeout=30) as acquired:
+            assert acquired, "等待者应该最终获取到锁"
+            acquired_by.append(waiter_id)
+
+    try:
+        await asyncio.gather(holder(), *(waiter(i) for i in range(10)))
+    finally:
+        await provider.close()
+
+    assert sorted(acquired_by) == list(range(10)), "所有等待者都应该获取到锁"
+    assert not await manager.is_locked(resource), "锁应该已被释放"
+
+
 async def run_all_tests():
     """运行所有测试"""
     from core.di.utils import get_bean_by_type
@@ -298,6 +477,12 @@ async def run_all_tests():
         test_lock_decorator,
         test_force_unlock,
         test_blocking_timeout_and_reentry,  # 更新后的阻塞和可重入测试
+        test_release_notification_wakes_waiter,
+        test_lock_handoff_latency_benchmark,
+        test_lock_watchdog_extends_lease,
+        test_lock_watchdog_stops_when_owner_cancelled,
+        test_lock_watchdog_stops_when_release_fails,
+        test_waiters_beyond_pool_size,
         test_convenient_context_manager,
         test_context_manager_with_timeout,
         test_context_manager_concurrent,
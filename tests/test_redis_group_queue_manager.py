@@ -106,6 +106,78 @@ async def test_message_delivery_limit(manager_factory):
     assert stats["total_rejected_messages"] == 1
 
 
+async def test_batch_delivery_and_retrieval(manager_factory):
+    """测试批量投递与批量获取"""
+    manager = await manager_factory.get_manager_with_config(
+        key_prefix="batch_test_manager", max_total_messages=25, auto_start=False
+    )
+
+    # 批量投递：30条消息分布在5个分组，超过上限的5条应被拒绝
+    items = [
+        (
+            f"batch_group_{i % 5}",
+            SimpleQueueItem(data={"id": i}, item_type="batch_test"),
+        )
+        for i in range(30)
+    ]
+    results = await manager.deliver_messages(items)
+    assert len(results) == 30
+    assert sum(results) == 25, "超过上限的消息应该被拒绝"
+
+    # 重复投递同一批中已存在的消息应被拒绝
+    duplicate_results = await manager.deliver_messages(items[:2])
+    assert duplicate_results == [False, False]
+
+    stats = await manager.get_manager_stats()
+    assert stats["total_delivered_messages"] == 25
+    assert stats["total_rejected_messages"] == 7
+
+    # 每个分区最多取3条，总数最多取10条
+    messages = await manager.get_messages(
+        score_threshold=0, max_per_partition=3, max_total=10
+    )
+    assert 0 < len(messages) <= 10
+
+    # 每个分区返回的消息数不超过max_per_partition
+    count_by_partition = {}
+    for message in messages:
+        partition = manager._hash_group_key_to_partition(
+            f"batch_group_{message.data['id'] % 5}"
+        )
+        count_by_partition[partition] = count_by_partition.get(partition, 0) + 1
+    assert max(count_by_partition.values()) <= 3
+
+
+async def test_blocking_get_messages_wakeup(manager_factory):
+    """测试空闲消费者阻塞等待，投递后立即唤醒"""
+    manager = await manager_factory.get_manager_with_config(
+        key_prefix="blocking_test_manager", auto_start=False
+    )
+    await manager.join_consumer()
+
+    # 清空加入时rebalance产生的唤醒信号
+    await manager.redis_client.delete(manager._get_wakeup_key())
+
+    async def deliver_later():
+        await asyncio.sleep(0.2)
+        await manager.deliver_message(
+            "blocking_group", SimpleQueueItem(data={"id": 1}, item_type="blocking")
+        )
+
+    deliver_task = asyncio.create_task(deliver_later())
+    start = time.time()
+    messages = await manager.get_messages(score_threshold=0, block_timeout=5)
+    elapsed = time.time() - start
+    await deliver_task
+
+    assert len(messages) == 1, "投递后应被唤醒并获取到消息"
+    assert elapsed < 2, f"应在投递后立即唤醒，实际等待 {elapsed:.2f}s"
+
+    # 无消息时等待超时返回空列表
+    messages = await manager.get_messages(score_threshold=0, block_timeout=0.2)
+    assert messages == []
+
+
 async def test_queue_statistics(manager_factory):
     """测试队列统计信息"""
     manager = await manager_factory.get_manager_with_config(
@@ -1138,6 +1210,8 @@ async def run_all_tests():
         test_basic_message_delivery_and_retrieval,
         test_score_logic_with_old_timestamps,
         test_message_delivery_limit,
+        test_batch_delivery_and_retrieval,
+        test_blocking_get_messages_wakeup,
         test_queue_statistics,
         test_improved_stats_functionality,
         test_stats_performance_and_accuracy,
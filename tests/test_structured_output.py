@@ -0,0 +1,181 @@
+"""
+结构化输出测试
+
+验证 OpenAIProvider.generate_structured 发送 json_schema response_format 并校验为 pydantic 模型、
+不合法响应重试后报错、后端拒绝 response_format 时回退为纯提示词（其他 4xx 立即报错、不回退），
+以及边界检测使用结构化输出。
+"""
+
+import pytest
+from aiohttp import web
+
+from devops_scripts.benchmark.fake_model_server import FakeModelServer, FakeServerConfig
+from memory_layer.llm import structured_output
+from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.llm.protocol import LLMError
+from memory_layer.llm.structured_output import (
+    StructuredOutputError,
+    parse_structured_output,
+)
+from memory_layer.memcell_extractor.conv_memcell_extractor import (
+    BoundaryDetectionOutput,
+    ConvMemCellExtractor,
+)
+from memory_layer.memory_extractor.episode_memory_extractor import EpisodeOutput
+from memory_layer.prompts.en import episode_mem_prompts
+
+PROMPT = episode_mem_prompts.EPISODE_GENERATION_PROMPT
+
+
+class RecordingServer(FakeModelServer):
+    """记录 response_format，可选择拒绝带 response_format 的请求"""
+
+    def __init__(
+        self,
+        config,
+        reject_response_format=False,
+        reject_message="response_format is not supported",
+    ):
+        super().__init__(config)
+        self.reject_response_format = reject_response_format
+        self.reject_message = reject_message
+        self.response_formats = []
+
+    async def chat_completions(self, request):
+        body = await request.json()
+        self.response_formats.append(body.get("response_format"))
+        if self.reject_response_format and body.get("response_format"):
+            return web.json_response(
+                {"error": {"message": self.reject_message}}, status=400
+            )
+        return await super().chat_completions(request)
+
+
+@pytest.fixture(autouse=True)
+def unsupported_backends(monkeypatch):
+    backends = set()
+    monkeypatch.setattr(structured_output, "_unsupported_backends", backends)
+    return backends
+
+
+async def start(server, mode):
+    port = await server.start()
+    return OpenAIProvider(
+        model="fake-chat",
+        api_key="fake",
+        base_url=f"http://127.0.0.1:{port}/v1",
+        structured_output=mode,
+    )
+
+
+def test_parse_structured_output_accepts_fenced_and_wrapped_json():
+    fenced = '```json\n{"title": "t", "content": "c"}\n```'
+    wrapped = 'Here you go: {"title": "t", "content": "c", "summary": "s"} Done.'
+
+    assert parse_structured_output(fenced, EpisodeOutput).title == "t"
+    assert parse_structured_output(wrapped, EpisodeOutput).summary == "s"
+    with pytest.raises(StructuredOutputError):
+        parse_structured_output('{"title": "t", "content": ""}', EpisodeOutput)
+    with pytest.raises(StructuredOutputError):
+        parse_structured_output('Sure: {"title": "t", "cont', EpisodeOutput)
+
+
+class TestGenerateStructured:
+    """generate_structured"""
+
+    @pytest.mark.asyncio
+    async def test_json_schema_avoids_malformed_retries(self):
+        server = RecordingServer(FakeServerConfig(chat_latency_ms=0, malformed_rate=1))
+        llm = await start(server, "json_schema")
+        try:
+            episode = await llm.generate_structured(PROMPT, EpisodeOutput)
+
+            assert episode.title and episode.content
+            assert server.stats["chat"]["requests"] == 1
+            [response_format] = server.response_formats
+            assert response_format["type"] == "json_schema"
+            assert response_format["json_schema"]["name"] == "EpisodeOutput"
+            assert "title" in response_format["json_schema"]["schema"]["properties"]
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalid_responses_are_retried_then_raise(self):
+        server = RecordingServer(FakeServerConfig(chat_latency_ms=0, malformed_rate=1))
+        llm = await start(server, "off")
+        try:
+            with pytest.raises(StructuredOutputError):
+                await llm.generate_structured(PROMPT, EpisodeOutput, max_attempts=3)
+
+            assert server.stats["chat"]["requests"] == 3
+            assert server.response_formats == [None, None, None]
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_rejected_response_format_falls_back_to_prompt(
+        self, unsupported_backends
+    ):
+        server = RecordingServer(
+            FakeServerConfig(chat_latency_ms=0), reject_response_format=True
+        )
+        llm = await start(server, "json_schema")
+        try:
+            assert (await llm.generate_structured(PROMPT, EpisodeOutput)).title
+            assert unsupported_backends == {(llm.base_url, "fake-chat")}
+
+            # Later calls go straight to the plain prompt
+            server.response_formats.clear()
+            await llm.generate_structured(PROMPT, EpisodeOutput)
+            assert server.response_formats == [None]
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_other_bad_requests_fail_fast_without_fallback(
+        self, unsupported_backends
+    ):
+        server = RecordingServer(
+            FakeServerConfig(chat_latency_ms=0),
+            reject_response_format=True,
+            reject_message="This model's maximum context length is 8192 tokens",
+        )
+        llm = await start(server, "json_schema")
+        try:
+            with pytest.raises(LLMError) as error:
+                await llm.generate_structured(PROMPT, EpisodeOutput)
+
+            assert error.value.status_code == 400
+            assert not isinstance(error.value, StructuredOutputError)
+            # No retries of a request the backend rejected, backend still supported
+            assert len(server.response_formats) == 1
+            assert unsupported_backends == set()
+        finally:
+            await server.stop()
+
+
+class TestBoundaryStructuredOutput:
+    """边界检测"""
+
+    @pytest.mark.asyncio
+    async def test_boundary_detection_uses_structured_output(self):
+        calls = []
+
+        class FakeLLM:
+            async def generate_structured(self, prompt, output_model, **kwargs):
+                calls.append((output_model, kwargs))
+                if len(calls) == 1:
+                    return output_model(should_end=True, should_wait=False)
+                raise StructuredOutputError("invalid")
+
+        extractor = ConvMemCellExtractor(FakeLLM())
+        history = [{"speaker_name": "Alice", "content": "hi", "timestamp": ""}]
+        new = [{"speaker_name": "Bob", "content": "bye", "timestamp": ""}]
+
+        result = await extractor._detect_boundary(history, new)
+        assert result.should_end is True and result.topic_summary == ""
+        assert calls[0] == (BoundaryDetectionOutput, {"max_attempts": 5})
+
+        result = await extractor._detect_boundary(history, new)
+        assert result.should_wait is True
+        assert result.reasoning == "Failed to parse LLM response"
@@ -0,0 +1,180 @@
+"""
+TaskManager 任务索引测试
+
+使用 fakeredis 运行真实的 arq worker，验证任务入队与状态变化时维护的有序集合索引：
+按状态/用户分页列出、ZCARD 计数、并发状态变化只留在一个状态集合、
+结果过期后计数与列表一致、过期任务在读取时从索引移除。
+"""
+
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+import arq.worker
+from arq import ArqRedis
+from arq.worker import Worker
+
+from core.asynctasks.task_manager import (
+    RetryConfig,
+    TaskFunction,
+    TaskManager,
+    TaskStatus,
+)
+
+
+class PassThroughContextManager:
+    """直接执行任务函数的 ContextManager"""
+
+    async def run_with_full_context(self, func, *args, **kwargs):
+        for key in (
+            "user_data",
+            "auto_inherit_user",
+            "auto_commit",
+            "force_new_session",
+        ):
+            kwargs.pop(key, None)
+        return await func(*args, **kwargs)
+
+
+async def double(value):
+    return value * 2
+
+
+async def explode(value):
+    raise ValueError("boom")
+
+
+@pytest.fixture
+def task_manager(monkeypatch):
+    # fakeredis does not implement INFO, which the worker logs on startup
+    async def no_redis_info(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(arq.worker, "log_redis_info", no_redis_info)
+
+    manager = TaskManager(PassThroughContextManager())
+    manager._pool = ArqRedis(connection_pool=fakeredis.FakeAsyncRedis().connection_pool)
+    for func in (double, explode):
+
+        async def wrapper(*args, _func=func, **kwargs):
+            return await manager.execute_task_with_context(_func, *args, **kwargs)
+
+        manager.register_task(
+            TaskFunction(
+                name=func.__name__,
+                coroutine=wrapper,
+                original_func=func,
+                retry_config=RetryConfig(),
+            )
+        )
+    return manager
+
+
+async def run_worker(manager: TaskManager) -> None:
+    worker = Worker(
+        manager.get_worker_functions(),
+        redis_pool=manager._pool,
+        burst=True,
+        poll_delay=0.01,
+        handle_signals=False,
+    )
+    await worker.main()
+
+
+class TestTaskIndex:
+    """任务索引"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_indexes_pending_tasks(self, task_manager):
+        first = await task_manager.enqueue_task("double", 1, user_id=7)
+        second = await task_manager.enqueue_task("double", 2, user_id=8)
+
+        assert await task_manager.get_task_count() == 2
+        assert await task_manager.get_task_count(TaskStatus.PENDING) == 2
+        assert await task_manager.get_task_count(user_id=7) == 1
+
+        tasks = await task_manager.list_tasks()
+        assert {(task.task_id, task.user_id) for task in tasks} == {
+            (first, 7),
+            (second, 8),
+        }
+        assert {task.status for task in tasks} == {TaskStatus.PENDING}
+
+    @pytest.mark.asyncio
+    async def test_status_changes_move_tasks(self, task_manager):
+        ok = await task_manager.enqueue_task("double", 21, user_id=7)
+        failed = await task_manager.enqueue_task("explode", 1, user_id=7)
+        await run_worker(task_manager)
+
+        assert await task_manager.get_task_count(TaskStatus.PENDING) == 0
+        assert await task_manager.get_task_count(TaskStatus.SUCCESS) == 1
+        assert await task_manager.get_task_count(TaskStatus.FAILED, user_id=7) == 1
+
+        [success] = await task_manager.list_tasks(status=TaskStatus.SUCCESS)
+        assert (success.task_id, success.result) == (ok, 42)
+        [failure] = await task_manager.list_tasks(status=TaskStatus.FAILED, user_id=7)
+        assert (failure.task_id, failure.error) == (failed, "boom")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_moves_leave_one_status(self, task_manager):
+        task_id = await task_manager.enqueue_task("double", 1, user_id=7)
+
+        await asyncio.gather(
+            task_manager._update_task_index_status(task_id, TaskStatus.RUNNING),
+            task_manager._update_task_index_status(task_id, TaskStatus.CANCELLED),
+        )
+
+        counts = {
+            status: await task_manager.get_task_count(status, user_id=7)
+            for status in TaskStatus
+        }
+        assert sum(counts.values()) == 1
+        assert counts[TaskStatus.PENDING] == 0
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, task_manager):
+        task_ids = [await task_manager.enqueue_task("double", i) for i in range(5)]
+
+        first_page = await task_manager.list_tasks(limit=2)
+        second_page = await task_manager.list_tasks(limit=2, offset=2)
+        last_page = await task_manager.list_tasks(limit=2, offset=4)
+
+        listed = [task.task_id for task in first_page + second_page + last_page]
+        assert [len(first_page), len(second_page), len(last_page)] == [2, 2, 1]
+        assert sorted(listed) == sorted(task_ids)
+
+    @pytest.mark.asyncio
+    async def test_expired_job_removed_on_read(self, task_manager):
+        task_id = await task_manager.enqueue_task("double", 1, user_id=7)
+        await run_worker(task_manager)
+        await task_manager._pool.delete(f"arq:result:{task_id}")
+
+        assert await task_manager.list_tasks() == []
+        assert await task_manager.get_task_count() == 0
+        assert await task_manager.get_task_count(TaskStatus.SUCCESS, user_id=7) == 0
+
+    @pytest.mark.asyncio
+    async def test_count_and_list_agree_after_result_expires(self, task_manager):
+        task_manager._keep_result_seconds = 0
+        finished = await task_manager.enqueue_task("double", 1, user_id=7)
+        await run_worker(task_manager)
+        pending = await task_manager.enqueue_task("double", 2, user_id=7)
+        # arq dropped the result after keep_result
+        await task_manager._pool.delete(f"arq:result:{finished}")
+
+        for status in (None, TaskStatus.SUCCESS, TaskStatus.PENDING):
+            count = await task_manager.get_task_count(status, user_id=7)
+            listed = await task_manager.list_tasks(status=status, user_id=7)
+            assert count == len(listed)
+        assert [task.task_id for task in await task_manager.list_tasks()] == [pending]
+        assert await task_manager._pool.zscore("task_index:expiry", finished) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_task_removes_index_entry(self, task_manager):
+        task_id = await task_manager.enqueue_task("double", 1, user_id=7)
+
+        assert await task_manager.delete_task(task_id)
+        assert await task_manager.get_task_count() == 0
+        assert await task_manager.get_task_count(user_id=7) == 0
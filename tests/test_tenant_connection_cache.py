@@ -0,0 +1,180 @@
+"""
+租户连接缓存测试
+
+验证 TenantConnectionCache 的 LRU 容量淘汰、空闲过期、宽限期内重新使用不关闭与命中/淘汰计数，
+以及 TenantAwareMongoClient 在超出预算时关闭旧租户客户端并按需重建。
+"""
+
+import asyncio
+
+import pytest
+
+from core.tenants.tenant_config import get_tenant_config
+from core.tenants.tenant_contextvar import clear_current_tenant, set_current_tenant
+from core.tenants.tenant_models import TenantDetail, TenantInfo
+from core.tenants.tenantize import tenant_connection_cache
+from core.tenants.tenantize.oxm.mongo.tenant_aware_mongo_client import (
+    TenantAwareMongoClient,
+)
+from core.tenants.tenantize.tenant_connection_cache import (
+    TenantConnectionCache,
+    get_all_connection_cache_stats,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(tenant_connection_cache.time, "monotonic", fake)
+    return fake
+
+
+def make_cache(closed, **kwargs):
+    return TenantConnectionCache(
+        name="test", close_func=lambda key, value: closed.append(key), **kwargs
+    )
+
+
+class TestTenantConnectionCache:
+    """LRU/TTL 连接缓存"""
+
+    def test_capacity_evicts_least_recently_used(self):
+        closed = []
+        cache = make_cache(closed, max_size=2)
+        cache.put("a", object())
+        cache.put("b", object())
+        assert cache.get("a") is not None
+        cache.put("c", object())
+
+        assert closed == ["b"]
+        assert "b" not in cache and "a" in cache and "c" in cache
+        stats = cache.stats()
+        assert (stats["hits"], stats["capacity_evictions"], stats["size"]) == (1, 1, 2)
+
+    def test_idle_entries_expire_on_access(self, clock):
+        closed = []
+        cache = make_cache(closed, idle_ttl_seconds=60)
+        cache.put("a", object())
+        cache.put("b", object())
+        clock.now += 30
+        cache.get("b")
+        clock.now += 45
+
+        assert cache.get("a") is None
+        assert closed == ["a"]
+        assert cache.get("b") is not None
+        assert cache.stats()["idle_evictions"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_readmitted_during_grace_is_not_closed(self):
+        closed = []
+        cache = make_cache(closed, max_size=1, close_grace_seconds=0.05)
+        first = object()
+        cache.put("a", first)
+        cache.put("b", object())
+        cache.put("a", first)
+        await asyncio.sleep(0.1)
+
+        assert closed == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_async_close_is_awaited(self):
+        closed = []
+
+        async def close(key, value):
+            closed.append(key)
+
+        cache = TenantConnectionCache(name="test", close_func=close, max_size=1)
+        cache.put("a", object())
+        cache.put("b", object())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert closed == ["a"]
+
+    def test_stats_registry(self):
+        cache = make_cache([], max_size=3)
+        assert cache.stats() in get_all_connection_cache_stats()
+
+
+class FakeDatabase:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+
+class FakeMongoClient:
+    def __init__(self, config):
+        self.host = config["host"]
+        self.closed = False
+
+    def __getitem__(self, name):
+        return FakeDatabase(self, name)
+
+    async def close(self):
+        self.closed = True
+
+
+def tenant(tenant_id, host):
+    return TenantInfo(
+        tenant_id=tenant_id,
+        tenant_detail=TenantDetail(
+            storage_info={
+                "mongodb": {"host": host, "port": 27017, "database": f"{tenant_id}_db"}
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def mongo_client(monkeypatch):
+    monkeypatch.setenv("TENANT_NON_TENANT_MODE", "false")
+    monkeypatch.setenv("TENANT_CONNECTION_CACHE_MAX_SIZE", "1")
+    monkeypatch.setenv("TENANT_CONNECTION_CLOSE_GRACE_SECONDS", "0")
+    get_tenant_config().reload()
+    monkeypatch.setattr(
+        TenantAwareMongoClient,
+        "_create_client_from_config",
+        lambda self, config: FakeMongoClient(config),
+    )
+    yield TenantAwareMongoClient()
+    clear_current_tenant()
+    monkeypatch.undo()
+    get_tenant_config().reload()
+
+
+class TestTenantAwareMongoClientCache:
+    """MongoDB 租户客户端预算"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_and_recreates_tenant_clients(self, mongo_client):
+        tenant_a, tenant_b = tenant("a", "host-a"), tenant("b", "host-b")
+
+        set_current_tenant(tenant_a)
+        client_a = mongo_client.get_real_client()
+        assert mongo_client.get_real_client() is client_a
+        database_a = mongo_client.get_real_database("a_db")
+        assert database_a.client is client_a
+
+        set_current_tenant(tenant_b)
+        client_b = mongo_client.get_real_client()
+        await asyncio.sleep(0)
+        assert client_a.closed and not client_b.closed
+
+        set_current_tenant(tenant_a)
+        recreated = mongo_client.get_real_client()
+        assert recreated is not client_a and recreated.host == "host-a"
+        assert mongo_client.get_real_database("a_db").client is recreated
+
+        stats = mongo_client.get_cache_stats()
+        assert stats["capacity_evictions"] == 2
+        assert stats["hits"] >= 1
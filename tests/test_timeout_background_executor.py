@@ -0,0 +1,89 @@
+"""
+后台执行器测试
+
+验证 timeout_to_background 的有界后台执行器：并发上限、排队、溢出拒绝、优雅排空与持久化移交。
+"""
+
+import asyncio
+
+import pytest
+
+from component.timeout_background import BackgroundTaskExecutor
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    monkeypatch.setenv("TIMEOUT_BACKGROUND_MAX_IN_FLIGHT", "2")
+    monkeypatch.setenv("TIMEOUT_BACKGROUND_MAX_QUEUED", "1")
+    monkeypatch.setenv("TIMEOUT_BACKGROUND_DURABLE_HANDOFF", "true")
+    return BackgroundTaskExecutor()
+
+
+async def start_task(executor, name, duration):
+    assert await executor.acquire()
+    task = asyncio.create_task(asyncio.sleep(duration))
+    executor.track(task, name)
+    return task
+
+
+class TestBackgroundTaskExecutor:
+    """有界后台执行器测试"""
+
+    @pytest.mark.asyncio
+    async def test_overflow_is_rejected(self, executor):
+        """测试超过并发上限后排队，队列满时拒绝"""
+        tasks = [await start_task(executor, f"t{i}", 0.2) for i in range(2)]
+
+        # 第3个请求排队等待空位
+        waiter = asyncio.create_task(executor.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # 队列已满，第4个请求被拒绝
+        assert not await executor.acquire()
+        assert executor.get_stats()["total_rejected"] == 1
+
+        # 前面的任务完成后，排队的请求获得空位
+        await asyncio.gather(*tasks)
+        assert await asyncio.wait_for(waiter, timeout=1.0)
+        assert executor.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_running_tasks(self, executor):
+        """测试排空时等待运行中的任务并拒绝新任务"""
+        task = await start_task(executor, "short", 0.1)
+
+        await executor.drain(timeout=2.0)
+
+        assert task.done() and not task.cancelled()
+        assert not await executor.acquire()
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_hands_off_unfinished_tasks(self, executor):
+        """测试排空超时后取消未完成任务并移交到持久化队列"""
+        handed_off = []
+
+        async def handoff():
+            handed_off.append("long")
+            return "task_long"
+
+        assert await executor.acquire()
+        task = asyncio.create_task(asyncio.sleep(10))
+        executor.track(task, "long", handoff=handoff)
+
+        await executor.drain(timeout=0.1)
+
+        assert task.cancelled()
+        assert handed_off == ["long"]
+        assert executor.get_stats()["total_handed_off"] == 1
+
+    @pytest.mark.asyncio
+    async def test_handoff_disabled_by_default(self, monkeypatch):
+        """测试默认不启用持久化移交"""
+        monkeypatch.delenv("TIMEOUT_BACKGROUND_DURABLE_HANDOFF", raising=False)
+        executor = BackgroundTaskExecutor()
+
+        async def handoff():
+            return "task_id"
+
+        assert await executor.handoff(handoff, "t") is None
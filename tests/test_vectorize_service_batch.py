@@ -0,0 +1,77 @@
+"""
+向量化服务分批测试
+
+验证 VectorizeService.get_embeddings 超过 batch_size 时按块并发请求（受 max_concurrent_requests 限制），
+并按输入顺序返回结果。
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_layer.vectorize_service import VectorizeConfig, VectorizeService
+
+
+class FakeEmbeddingsClient:
+    """记录请求批次与最大并发数的假 OpenAI embeddings 客户端"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.embeddings = self
+
+    async def create(self, model, input, encoding_format, **kwargs):
+        self.batches.append(list(input))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text))]) for text in input],
+            usage=None,
+        )
+
+
+def make_service(batch_size: int = 4, max_concurrent: int = 2):
+    service = VectorizeService(
+        VectorizeConfig(
+            model="fake-embedding",
+            base_url="http://127.0.0.1",
+            batch_size=batch_size,
+            max_concurrent_requests=max_concurrent,
+            dimensions=0,
+        )
+    )
+    service.client = FakeEmbeddingsClient()
+    return service
+
+
+class TestVectorizeServiceBatch:
+    """get_embeddings 分块"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_sent_concurrently_in_order(self):
+        service = make_service(batch_size=4, max_concurrent=2)
+        texts = ["x" * (i + 1) for i in range(10)]
+
+        vectors = await service.get_embeddings(texts)
+
+        assert [len(batch) for batch in service.client.batches] == [4, 4, 2]
+        assert service.client.max_in_flight == 2
+        assert [float(vector[0]) for vector in vectors] == [
+            float(i + 1) for i in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_small_input_is_one_request(self):
+        service = make_service(batch_size=4)
+
+        vectors = await service.get_embeddings(["a", "bb"])
+
+        assert service.client.batches == [["a", "bb"]]
+        assert len(vectors) == 2